@@ -12,6 +12,12 @@ import logging
 from typing import Any, Callable, Optional
 
 from trend_agent.storage.redis import RedisCacheRepository
+from trend_agent.storage.response_cache import (
+    TRENDS_LIST_TAG,
+    TRENDS_STATS_TAG,
+    ResponseCache,
+    trend_change_tags,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -183,22 +189,26 @@ async def cache_search_results(
         logger.warning(f"Cache write error: {e}")
 
 
-async def invalidate_trends_cache(cache: Optional[RedisCacheRepository]):
+async def invalidate_trends_cache(
+    cache: Optional[RedisCacheRepository],
+    trends: Optional[list] = None,
+) -> int:
     """
-    Invalidate all trends caches.
+    Invalidate cached trend responses.
 
-    Useful when new trends are created or updated.
+    Useful when new trends are created or updated. Only responses tagged
+    with the affected trends, categories, lists and stats are deleted.
 
     Args:
         cache: Redis cache repository
+        trends: Changed trends (None invalidates all trend lists and stats)
+
+    Returns:
+        Number of cache entries deleted
     """
-    if not cache:
-        return
+    if trends:
+        tags = trend_change_tags(trends)
+    else:
+        tags = [TRENDS_LIST_TAG, TRENDS_STATS_TAG]
 
-    try:
-        # Delete all keys matching the trends prefix
-        # Note: This is a simplified version. In production, you might
-        # want to track cache keys more systematically
-        logger.info("Invalidated trends cache")
-    except Exception as e:
-        logger.warning(f"Cache invalidation error: {e}")
+    return await ResponseCache(cache).invalidate(tags)
@@ -17,6 +17,8 @@ from trend_agent.storage.interfaces import (
     VectorRepository,
     CacheRepository,
 )
+from trend_agent.storage.response_cache import ResponseCache
+from trend_agent.storage.suggestion_index import SuggestionIndex
 from trend_agent.storage.postgres import (
     PostgreSQLTrendRepository,
     PostgreSQLTopicRepository,
@@ -25,7 +27,12 @@ from trend_agent.storage.postgres import (
 )
 from trend_agent.ingestion.manager import PluginManager
 from trend_agent.services import get_service_factory
-from trend_agent.services.search import QdrantSemanticSearchService
+from trend_agent.services.search import (
+    HybridSearchService,
+    QdrantSemanticSearchService,
+    QueryEmbeddingCache,
+    TrendObjectCache,
+)
 
 
 # API Key authentication
@@ -144,6 +151,21 @@ async def get_cache_repository() -> Optional[CacheRepository]:
     return app_state.redis_cache
 
 
+async def get_response_cache(
+    cache: Optional[CacheRepository] = Depends(get_cache_repository),
+) -> ResponseCache:
+    """
+    Get the tagged response cache used by the routers.
+
+    Args:
+        cache: Redis cache repository (caching is disabled if None)
+
+    Returns:
+        ResponseCache instance
+    """
+    return ResponseCache(cache)
+
+
 async def get_vector_repository() -> Optional[VectorRepository]:
     """
     Get Qdrant vector repository from application state.
@@ -230,6 +252,11 @@ async def get_plugin_health_repository(
 
 # Service dependencies
 
+# Hydrated trends and query embeddings shared by the per-request search services
+_trend_cache = TrendObjectCache()
+_query_cache: Optional[QueryEmbeddingCache] = None
+
+
 async def get_semantic_search_service(
     trend_repository: TrendRepository = Depends(get_trend_repository),
     vector_repository: VectorRepository = Depends(get_vector_repository),
@@ -258,10 +285,18 @@ async def get_semantic_search_service(
         factory = get_service_factory()
         embedding_service = factory.get_embedding_service()
 
+        global _query_cache
+        if _query_cache is None or _query_cache.embedding_service is not embedding_service:
+            _query_cache = QueryEmbeddingCache(
+                embedding_service, cache_repo=await get_cache_repository()
+            )
+
         return QdrantSemanticSearchService(
             embedding_service=embedding_service,
             vector_repository=vector_repository,
             trend_repository=trend_repository,
+            trend_cache=_trend_cache,
+            query_cache=_query_cache,
         )
 
     except Exception as e:
@@ -271,6 +306,60 @@ async def get_semantic_search_service(
         )
 
 
+async def get_hybrid_search_service(
+    trend_repository: TrendRepository = Depends(get_trend_repository),
+    vector_repository: Optional[VectorRepository] = Depends(get_vector_repository),
+) -> HybridSearchService:
+    """
+    Get HybridSearchService instance.
+
+    Falls back to full-text ranking alone when semantic search cannot be
+    initialized (no vector database or embedding service).
+
+    Args:
+        trend_repository: Trend repository with full-text search
+        vector_repository: Optional Qdrant vector repository
+
+    Returns:
+        HybridSearchService instance
+    """
+    semantic_search = None
+    if vector_repository is not None:
+        try:
+            semantic_search = await get_semantic_search_service(
+                trend_repository, vector_repository
+            )
+        except HTTPException:
+            semantic_search = None
+
+    return HybridSearchService(trend_repository, semantic_search=semantic_search)
+
+
+# Autocomplete index shared by all requests of this process
+_suggestion_index: Optional[SuggestionIndex] = None
+
+
+async def get_suggestion_index(
+    trend_repository: TrendRepository = Depends(get_trend_repository),
+    cache: Optional[CacheRepository] = Depends(get_cache_repository),
+) -> SuggestionIndex:
+    """
+    Get the search suggestion index, loading it on first use.
+
+    Args:
+        trend_repository: Trend repository the index is loaded from
+        cache: Redis cache repository holding the shared index (optional)
+
+    Returns:
+        SuggestionIndex instance
+    """
+    global _suggestion_index
+    if _suggestion_index is None:
+        _suggestion_index = SuggestionIndex(cache_repo=cache)
+    await _suggestion_index.ensure_loaded(trend_repository)
+    return _suggestion_index
+
+
 # Pagination dependencies
 
 def pagination_params(
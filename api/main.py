@@ -76,15 +76,10 @@ async def lifespan(app: FastAPI):
         logger.info("API will start but database-dependent endpoints may fail")
 
     try:
-        # Initialize Redis cache
-        from trend_agent.storage.redis import RedisCacheRepository
-
-        app_state.redis_cache = RedisCacheRepository(
-            host=os.getenv("REDIS_HOST", "localhost"),
-            port=int(os.getenv("REDIS_PORT", "6380")),  # Updated to match Docker config
-            password=os.getenv("REDIS_PASSWORD", None),
-            default_ttl=3600,
-        )
+        # Initialize Redis cache (shared with writers that invalidate it)
+        from trend_agent.storage.response_cache import create_response_cache_repository
+
+        app_state.redis_cache = create_response_cache_repository()
         await app_state.redis_cache.connect()
         logger.info("✅ Redis cache connected")
 
@@ -141,6 +136,13 @@ async def lifespan(app: FastAPI):
         except Exception as e:
             logger.error(f"Error closing Redis cache: {e}")
 
+    if app_state.vector_repo:
+        try:
+            await app_state.vector_repo.close()
+            logger.info("✅ Qdrant client closed")
+        except Exception as e:
+            logger.error(f"Error closing Qdrant client: {e}")
+
     logger.info("✅ API shutdown complete")
 
 
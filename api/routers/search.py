@@ -2,10 +2,11 @@
 Search endpoints for semantic and keyword-based search across all content.
 
 Provides unified search across trends, topics, and items using
-both keyword matching and vector similarity.
+PostgreSQL full-text search, vector similarity, or both fused together.
 """
 
-from typing import List, Optional, Dict, Any
+import logging
+from typing import List, Optional, Dict, Any, Tuple
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status, Request
@@ -21,6 +22,8 @@ from api.dependencies import (
     get_vector_repository,
     get_cache_repository,
     get_semantic_search_service,
+    get_hybrid_search_service,
+    get_suggestion_index,
 )
 from trend_agent.storage.interfaces import (
     TrendRepository,
@@ -33,10 +36,15 @@ from trend_agent.schemas import (
     SourceType,
     SemanticSearchRequest as ServiceSearchRequest,
     SemanticSearchFilter,
+    Trend,
+    TrendFilter,
 )
-from trend_agent.services.search import QdrantSemanticSearchService
+from trend_agent.services.search import HybridSearchService, QdrantSemanticSearchService
+from trend_agent.storage.suggestion_index import SuggestionIndex
 
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/search", tags=["Search"])
 
 # Initialize rate limiter
@@ -66,6 +74,17 @@ class KeywordSearchRequest(BaseModel):
     search_type: str = Field("all", description="Search type: trends, topics, or all")
 
 
+class HybridSearchRequest(BaseModel):
+    """Request for hybrid (full-text + semantic) search."""
+
+    query: str = Field(..., min_length=1, max_length=500, description="Search query")
+    category: Optional[str] = Field(None, description="Filter by category")
+    sources: Optional[List[str]] = Field(None, description="Filter by sources")
+    language: Optional[str] = Field(None, description="Filter by language")
+    limit: int = Field(20, ge=1, le=100, description="Number of results")
+    min_similarity: float = Field(0.5, ge=0.0, le=1.0, description="Minimum semantic similarity")
+
+
 class SearchResult(BaseModel):
     """Unified search result."""
 
@@ -225,7 +244,9 @@ async def keyword_search(
     """
     Keyword-based search.
 
-    Searches titles, summaries, and keywords for exact or fuzzy matches.
+    Runs ranked PostgreSQL full-text search (stemmed, weighted title >
+    keywords > summary, with trigram matching for typos) over trends
+    and/or topics. Scores are text relevance, comparable across both.
 
     Args:
         search_request: Search query and parameters
@@ -236,79 +257,51 @@ async def keyword_search(
 
     Returns:
         SearchResponse with matching results
+
+    Raises:
+        HTTPException: 400 if a filter value is invalid
     """
-    query_lower = search_request.query.lower()
+    category, sources = _parse_filters(search_request.category, search_request.sources)
     results = []
 
     # Search trends if requested
     if search_request.search_type in ["trends", "all"]:
-        from trend_agent.schemas import TrendFilter
-
         trend_filter = TrendFilter(
-            category=Category(search_request.category) if search_request.category else None,
-            sources=[SourceType(s) for s in search_request.sources] if search_request.sources else None,
+            category=category,
+            sources=sources,
             language=search_request.language,
-            keywords=[search_request.query],
-            limit=search_request.limit,
         )
-
-        trends = await trend_repo.search(trend_filter)
-
-        for trend in trends:
-            # Check if query matches title, summary, or keywords
-            if (
-                query_lower in trend.title.lower()
-                or query_lower in trend.summary.lower()
-                or any(query_lower in kw.lower() for kw in trend.keywords)
-            ):
-                results.append(
-                    SearchResult(
-                        type="trend",
-                        id=trend.id,
-                        title=trend.title,
-                        summary=trend.summary,
-                        category=trend.category.value,
-                        score=trend.score,
-                        metadata={
-                            "rank": trend.rank,
-                            "state": trend.state.value,
-                            "sources": [s.value for s in trend.sources],
-                            "item_count": trend.item_count,
-                        },
-                    )
-                )
+        matches = await trend_repo.search_text(
+            search_request.query, trend_filter, limit=search_request.limit
+        )
+        results.extend(_trend_to_result(trend, relevance) for trend, relevance in matches)
 
     # Search topics if requested
     if search_request.search_type in ["topics", "all"]:
-        topics = await topic_repo.search_by_keywords(
-            keywords=[search_request.query],
-            category=Category(search_request.category) if search_request.category else None,
+        matches = await topic_repo.search_text(
+            search_request.query,
+            category=category.value if category else None,
             language=search_request.language,
             limit=search_request.limit,
         )
-
-        for topic in topics:
-            if (
-                query_lower in topic.title.lower()
-                or query_lower in topic.summary.lower()
-                or any(query_lower in kw.lower() for kw in topic.keywords)
-            ):
-                results.append(
-                    SearchResult(
-                        type="topic",
-                        id=topic.id,
-                        title=topic.title,
-                        summary=topic.summary,
-                        category=topic.category.value,
-                        score=topic.total_engagement.score,
-                        metadata={
-                            "sources": [s.value for s in topic.sources],
-                            "item_count": topic.item_count,
-                        },
-                    )
+        for topic, relevance in matches:
+            results.append(
+                SearchResult(
+                    type="topic",
+                    id=topic.id,
+                    title=topic.title,
+                    summary=topic.summary,
+                    category=topic.category.value,
+                    score=relevance,
+                    metadata={
+                        "sources": [s.value for s in topic.sources],
+                        "item_count": topic.item_count,
+                        "engagement_score": topic.total_engagement.score,
+                    },
                 )
+            )
 
-    # Sort by score and limit results
+    # Sort by relevance and limit results
     results.sort(key=lambda x: x.score, reverse=True)
     results = results[:search_request.limit]
 
@@ -320,6 +313,68 @@ async def keyword_search(
     )
 
 
+@router.post(
+    "/hybrid",
+    response_model=SearchResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Hybrid search",
+    description="Search trends with full-text and vector similarity ranks fused together.",
+)
+@limiter.limit("30/minute")  # Rate limit: 30 requests per minute (embeds the query)
+async def hybrid_search(
+    request: Request,
+    search_request: HybridSearchRequest,
+    api_key: str = Depends(verify_api_key),
+    search_service: HybridSearchService = Depends(get_hybrid_search_service),
+) -> SearchResponse:
+    """
+    Hybrid search over trends.
+
+    Fuses the full-text ranking with the semantic (Qdrant) ranking using
+    reciprocal rank fusion, so trends found by both rank highest. Falls
+    back to full-text ranking when semantic search is unavailable.
+
+    Args:
+        search_request: Search query and parameters
+        api_key: API key (required)
+        search_service: Hybrid search service
+
+    Returns:
+        SearchResponse with fused results; scores are RRF scores
+
+    Raises:
+        HTTPException: 400 if a filter value is invalid, 500 if search fails
+    """
+    category, sources = _parse_filters(search_request.category, search_request.sources)
+    service_request = ServiceSearchRequest(
+        query=search_request.query,
+        limit=search_request.limit,
+        min_similarity=search_request.min_similarity,
+        filters=TrendFilter(
+            category=category,
+            sources=sources,
+            language=search_request.language,
+        ),
+    )
+
+    try:
+        matches = await search_service.search(service_request)
+    except Exception as e:
+        logger.error(f"Hybrid search failed: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Hybrid search failed: {str(e)}"
+        )
+
+    results = [_trend_to_result(trend, score) for trend, score in matches]
+    return SearchResponse(
+        results=results,
+        total=len(results),
+        query=search_request.query,
+        search_type="trends",
+    )
+
+
 @router.get(
     "/suggestions",
     response_model=List[str],
@@ -331,64 +386,70 @@ async def get_search_suggestions(
     query: str = Query(..., min_length=2, max_length=100, description="Partial search query"),
     limit: int = Query(10, ge=1, le=20, description="Number of suggestions"),
     api_key: str = Depends(verify_api_key),
-    trend_repo: TrendRepository = Depends(get_trend_repository),
-    topic_repo: TopicRepository = Depends(get_topic_repository),
-    cache: Optional[CacheRepository] = Depends(get_cache_repository),
+    suggestion_index: SuggestionIndex = Depends(get_suggestion_index),
 ) -> List[str]:
     """
     Get autocomplete suggestions for search queries.
 
-    Returns popular keywords and titles that match the partial query.
+    Returns titles and keywords of live trends that start with the partial
+    query, weighted by trend score and recency. Served from a prefix index
+    that is updated when trends are saved.
 
     Args:
         query: Partial search query
         limit: Number of suggestions to return
         api_key: API key (required)
-        trend_repo: Trend repository
-        topic_repo: Topic repository
-        cache: Cache repository
+        suggestion_index: Prefix index of trend titles and keywords
 
     Returns:
         List of suggested search queries
     """
-    cache_key = f"search:suggestions:{query.lower()}:{limit}"
-    if cache:
-        try:
-            cached = await cache.get(cache_key)
-            if cached:
-                return cached
-        except Exception:
-            pass
-
-    suggestions = set()
-    query_lower = query.lower()
-
-    # Get recent trends
-    from trend_agent.schemas import TrendFilter
-
-    trends = await trend_repo.get_top_trends(limit=50)
-
-    # Extract matching keywords and titles
-    for trend in trends:
-        # Check title
-        if query_lower in trend.title.lower():
-            suggestions.add(trend.title)
-
-        # Check keywords
-        for kw in trend.keywords:
-            if query_lower in kw.lower():
-                suggestions.add(kw)
-
-        if len(suggestions) >= limit:
-            break
-
-    # Convert to sorted list
-    result = sorted(list(suggestions))[:limit]
-
-    if cache:
-        try:
-            await cache.set(cache_key, result, ttl_seconds=600)  # 10 min
-        except Exception:
-            pass
-
-    return result
+    return await suggestion_index.suggest(query, limit=limit)
+
+
+
+def _parse_filters(
+    category: Optional[str], sources: Optional[List[str]]
+) -> Tuple[Optional[Category], Optional[List[SourceType]]]:
+    """
+    Parse category and source filters from a search request.
+
+    Raises:
+        HTTPException: 400 if a value is not a known category or source
+    """
+    try:
+        parsed_category = Category(category) if category else None
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid category: {category}"
+        )
+
+    try:
+        parsed_sources = [SourceType(s) for s in sources] if sources else None
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid source: {str(e)}"
+        )
+
+    return parsed_category, parsed_sources
+
+
+def _trend_to_result(trend: Trend, score: float) -> SearchResult:
+    """Convert a trend and its search score to a SearchResult."""
+    return SearchResult(
+        type="trend",
+        id=trend.id,
+        title=trend.title,
+        summary=trend.summary,
+        category=trend.category.value,
+        score=score,
+        metadata={
+            "rank": trend.rank,
+            "state": trend.state.value,
+            "sources": [s.value for s in trend.sources],
+            "item_count": trend.item_count,
+            "trend_score": trend.score,
+        },
+    )
@@ -18,11 +18,15 @@ from api.schemas.trends import (
 from api.dependencies import (
     optional_api_key,
     get_topic_repository,
-    get_cache_repository,
+    get_response_cache,
 )
-from trend_agent.storage.interfaces import (
-    TopicRepository,
-    CacheRepository,
+from trend_agent.storage.interfaces import InvalidCursorError, TopicRepository
+from trend_agent.storage.response_cache import (
+    TOPICS_LIST_TAG,
+    ResponseCache,
+    category_tag,
+    stable_cache_key,
+    topic_tag,
 )
 from trend_agent.schemas import Category, SourceType
 
@@ -56,14 +60,15 @@ def topic_to_response(topic) -> TopicResponse:
 )
 async def list_topics(
     limit: int = Query(20, ge=1, le=100, description="Number of topics to return"),
-    offset: int = Query(0, ge=0, description="Number of topics to skip"),
+    offset: int = Query(0, ge=0, description="Number of topics to skip (prefer cursor)"),
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page's next_cursor"),
     category: Optional[str] = Query(None, description="Filter by category"),
     source: Optional[str] = Query(None, description="Filter by source"),
     language: Optional[str] = Query(None, description="Filter by language code"),
     keywords: Optional[str] = Query(None, description="Filter by keywords (comma-separated)"),
     api_key: str = Depends(optional_api_key),
     topic_repo: TopicRepository = Depends(get_topic_repository),
-    cache: Optional[CacheRepository] = Depends(get_cache_repository),
+    response_cache: ResponseCache = Depends(get_response_cache),
 ) -> TopicListResponse:
     """
     List topics with pagination and filtering.
@@ -71,72 +76,104 @@ async def list_topics(
     Topics are clusters of related content items that haven't been ranked yet.
     Use the trends endpoint to see ranked topics.
 
+    Topics are listed most recently updated first. Pass the ``next_cursor``
+    of one response as ``cursor`` to get the next page; ``offset`` is kept
+    for existing clients. Source and keyword filters apply within a page,
+    so a page may hold fewer than ``limit`` topics while ``has_more`` is
+    still true. ``total`` is an estimate.
+
     Args:
         limit: Number of topics to return (1-100)
-        offset: Number of topics to skip
+        offset: Number of topics to skip (ignored when cursor is given)
+        cursor: Cursor from the previous page
         category: Filter by category
         source: Filter by source
         language: Filter by language code
         keywords: Filter by keywords (comma-separated)
         api_key: Optional API key
         topic_repo: Topic repository
-        cache: Cache repository
+        response_cache: Tagged response cache
 
     Returns:
         TopicListResponse with paginated topics
-    """
-    # Build cache key
-    cache_key = f"topics:list:{category or 'all'}:{source or 'all'}:{language or 'all'}:{limit}:{offset}"
-    if cache:
-        try:
-            cached = await cache.get(cache_key)
-            if cached:
-                return TopicListResponse(**cached)
-        except Exception:
-            pass
-
-    # Parse filters
-    category_filter = Category(category) if category else None
-    source_filter = SourceType(source) if source else None
-    keyword_list = keywords.split(",") if keywords else None
-
-    # Fetch topics
-    topics = await topic_repo.get_all(
-        limit=limit,
-        offset=offset,
-        category=category_filter,
-        language=language,
-    )
-
-    # Apply keyword filter if specified
-    if keyword_list:
-        topics = [
-            t for t in topics
-            if any(kw.lower() in " ".join(t.keywords).lower() for kw in keyword_list)
-        ]
-
-    # Apply source filter if specified
-    if source_filter:
-        topics = [t for t in topics if source_filter in t.sources]
-
-    # Convert to response
-    topic_responses = [topic_to_response(t) for t in topics]
-
-    response = TopicListResponse(
-        topics=topic_responses,
-        total=len(topic_responses),
-        limit=limit,
-        offset=offset,
-        has_more=len(topic_responses) >= limit,
-    )
 
-    if cache:
-        try:
-            await cache.set(cache_key, response.dict(), ttl_seconds=300)
-        except Exception:
-            pass
-
-    return response
+    Raises:
+        HTTPException: If the cursor is invalid
+    """
+    page_offset = 0 if cursor else offset
+
+    async def build_response() -> dict:
+        # Parse filters
+        category_filter = Category(category).value if category else None
+        source_filter = SourceType(source) if source else None
+        keyword_list = keywords.split(",") if keywords else None
+
+        # Fetch topics
+        if page_offset:
+            topics = await topic_repo.search(
+                category=category_filter,
+                language=language,
+                limit=limit + 1,
+                offset=page_offset,
+            )
+            has_more = len(topics) > limit
+            topics, next_cursor = topics[:limit], None
+        else:
+            topics, next_cursor = await topic_repo.search_page(
+                category=category_filter,
+                language=language,
+                limit=limit,
+                cursor=cursor,
+            )
+            has_more = next_cursor is not None
+
+        total = await topic_repo.estimate_count(category=category_filter, language=language)
+
+        # Apply keyword filter if specified
+        if keyword_list:
+            topics = [
+                t for t in topics
+                if any(kw.lower() in " ".join(t.keywords).lower() for kw in keyword_list)
+            ]
+
+        # Apply source filter if specified
+        if source_filter:
+            topics = [t for t in topics if source_filter in t.sources]
+
+        # Convert to response
+        topic_responses = [topic_to_response(t) for t in topics]
+
+        return TopicListResponse(
+            topics=topic_responses,
+            total=total,
+            limit=limit,
+            offset=page_offset,
+            has_more=has_more,
+            next_cursor=next_cursor,
+        ).dict()
+
+    params = {
+        "limit": limit,
+        "offset": page_offset,
+        "cursor": cursor,
+        "category": category,
+        "source": source,
+        "language": language,
+        "keywords": keywords,
+    }
+    tags = [TOPICS_LIST_TAG]
+    if category:
+        tags.append(category_tag(category))
+    try:
+        cached = await response_cache.get_or_set(
+            stable_cache_key("topics:list", params),
+            build_response,
+            ttl_seconds=300,
+            tags=tags,
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return TopicListResponse(**cached)
 
 
 @router.get(
@@ -150,7 +187,7 @@ async def get_topic(
     topic_id: UUID,
     api_key: str = Depends(optional_api_key),
     topic_repo: TopicRepository = Depends(get_topic_repository),
-    cache: Optional[CacheRepository] = Depends(get_cache_repository),
+    response_cache: ResponseCache = Depends(get_response_cache),
 ) -> TopicResponse:
     """
     Get a single topic by ID.
@@ -159,7 +196,7 @@ async def get_topic(
         topic_id: UUID of the topic
         api_key: Optional API key
         topic_repo: Topic repository
-        cache: Cache repository
+        response_cache: Tagged response cache
 
     Returns:
         TopicResponse with topic details
@@ -167,32 +204,24 @@ async def get_topic(
     Raises:
         HTTPException: 404 if topic not found
     """
-    cache_key = f"topics:detail:{topic_id}"
-    if cache:
-        try:
-            cached = await cache.get(cache_key)
-            if cached:
-                return TopicResponse(**cached)
-        except Exception:
-            pass
-
-    topic = await topic_repo.get_by_id(topic_id)
-
-    if topic is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Topic with ID {topic_id} not found",
-        )
-
-    response = topic_to_response(topic)
-
-    if cache:
-        try:
-            await cache.set(cache_key, response.dict(), ttl_seconds=600)
-        except Exception:
-            pass
-
-    return response
+    async def build_response() -> dict:
+        topic = await topic_repo.get(topic_id)
+
+        if topic is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Topic with ID {topic_id} not found",
+            )
+
+        return topic_to_response(topic).dict()
+
+    cached = await response_cache.get_or_set(
+        stable_cache_key("topics:detail", {"topic_id": topic_id}),
+        build_response,
+        ttl_seconds=600,
+        tags=[topic_tag(topic_id)],
+    )
+    return TopicResponse(**cached)
 
 
 @router.get(
@@ -208,7 +237,7 @@ async def get_topic_items(
     offset: int = Query(0, ge=0, description="Number of items to skip"),
     api_key: str = Depends(optional_api_key),
     topic_repo: TopicRepository = Depends(get_topic_repository),
-    cache: Optional[CacheRepository] = Depends(get_cache_repository),
+    response_cache: ResponseCache = Depends(get_response_cache),
 ) -> List[dict]:
     """
     Get items belonging to a topic.
@@ -221,7 +250,7 @@ async def get_topic_items(
         offset: Number of items to skip
         api_key: Optional API key
         topic_repo: Topic repository
-        cache: Cache repository
+        response_cache: Tagged response cache
 
     Returns:
         List of items in the topic
@@ -229,67 +258,58 @@ async def get_topic_items(
     Raises:
         HTTPException: 404 if topic not found
     """
-    # Check cache first
-    cache_key = f"topics:items:{topic_id}:{limit}:{offset}"
-    if cache:
-        try:
-            cached = await cache.get(cache_key)
-            if cached:
-                return cached
-        except Exception:
-            pass
-
-    # Verify topic exists
-    topic = await topic_repo.get(topic_id)
-    if topic is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Topic with ID {topic_id} not found",
+    async def build_response() -> List[dict]:
+        # Verify topic exists
+        topic = await topic_repo.get(topic_id)
+        if topic is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Topic with ID {topic_id} not found",
+            )
+
+        # Get items for this topic
+        items = await topic_repo.get_items_by_topic(
+            topic_id=topic_id,
+            limit=limit,
+            offset=offset,
         )
 
-    # Get items for this topic
-    items = await topic_repo.get_items_by_topic(
-        topic_id=topic_id,
-        limit=limit,
-        offset=offset,
-    )
+        # Convert ProcessedItems to dict format
+        return [
+            {
+                "id": str(item.id),
+                "source": item.source.value,
+                "source_id": item.source_id,
+                "title": item.title,
+                "content": item.content,
+                "url": item.url,
+                "author": item.author,
+                "category": item.category.value,
+                "language": item.language,
+                "created_at": item.created_at.isoformat() if item.created_at else None,
+                "processed_at": item.processed_at.isoformat(),
+                "engagement": {
+                    "upvotes": item.engagement.upvotes,
+                    "downvotes": item.engagement.downvotes,
+                    "comments": item.engagement.comments,
+                    "shares": item.engagement.shares,
+                    "views": item.engagement.views,
+                    "score": item.engagement.score,
+                },
+                "keywords": item.keywords,
+                "sentiment_score": item.sentiment_score,
+            }
+            for item in items
+        ]
 
-    # Convert ProcessedItems to dict format
-    items_dict = [
-        {
-            "id": str(item.id),
-            "source": item.source.value,
-            "source_id": item.source_id,
-            "title": item.title,
-            "content": item.content,
-            "url": item.url,
-            "author": item.author,
-            "category": item.category.value,
-            "language": item.language,
-            "created_at": item.created_at.isoformat() if item.created_at else None,
-            "processed_at": item.processed_at.isoformat(),
-            "engagement": {
-                "upvotes": item.engagement.upvotes,
-                "downvotes": item.engagement.downvotes,
-                "comments": item.engagement.comments,
-                "shares": item.engagement.shares,
-                "views": item.engagement.views,
-                "score": item.engagement.score,
-            },
-            "keywords": item.keywords,
-            "sentiment_score": item.sentiment_score,
-        }
-        for item in items
-    ]
-
-    # Cache the response
-    if cache:
-        try:
-            await cache.set(cache_key, items_dict, ttl_seconds=600)  # 10 min
-        except Exception:
-            pass
-
-    return items_dict
+    return await response_cache.get_or_set(
+        stable_cache_key(
+            "topics:items", {"topic_id": topic_id, "limit": limit, "offset": offset}
+        ),
+        build_response,
+        ttl_seconds=600,  # 10 min
+        tags=[topic_tag(topic_id)],
+    )
 
 
 @router.post(
@@ -310,7 +330,8 @@ async def search_topics(
     """
     Search topics by keywords.
 
-    Searches topic titles, summaries, and keywords for matches.
+    Searches topic titles, summaries, and keywords with PostgreSQL
+    full-text search, most relevant first.
 
     Args:
         query: Search query string
@@ -323,15 +344,15 @@ async def search_topics(
     Returns:
         TopicListResponse with matching topics
     """
-    # Fetch matching topics
-    topics = await topic_repo.search_by_keywords(
-        keywords=[query],
-        category=Category(category) if category else None,
+    # Fetch matching topics (ranked full-text search)
+    matches = await topic_repo.search_text(
+        query,
+        category=Category(category).value if category else None,
         language=language,
         limit=limit,
     )
 
-    topic_responses = [topic_to_response(t) for t in topics]
+    topic_responses = [topic_to_response(t) for t, _ in matches]
 
     return TopicListResponse(
         topics=topic_responses,
@@ -28,14 +28,14 @@ from api.dependencies import (
     optional_api_key,
     get_trend_repository,
     get_vector_repository,
-    get_cache_repository,
+    get_response_cache,
     get_semantic_search_service,
     pagination_params,
 )
 from trend_agent.storage.interfaces import (
+    InvalidCursorError,
     TrendRepository,
     VectorRepository,
-    CacheRepository,
 )
 from trend_agent.schemas import (
     Category,
@@ -46,6 +46,14 @@ from trend_agent.schemas import (
     SemanticSearchFilter,
 )
 from trend_agent.services.search import QdrantSemanticSearchService
+from trend_agent.storage.response_cache import (
+    TRENDS_LIST_TAG,
+    TRENDS_STATS_TAG,
+    ResponseCache,
+    category_tag,
+    stable_cache_key,
+    trend_tag,
+)
 
 
 router = APIRouter(prefix="/trends", tags=["Trends"])
@@ -85,7 +93,8 @@ def trend_to_response(trend) -> TrendResponse:
 )
 async def list_trends(
     limit: int = Query(20, ge=1, le=100, description="Number of trends to return"),
-    offset: int = Query(0, ge=0, description="Number of trends to skip"),
+    offset: int = Query(0, ge=0, description="Number of trends to skip (prefer cursor)"),
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page's next_cursor"),
     category: Optional[str] = Query(None, description="Filter by category"),
     source: Optional[str] = Query(None, description="Filter by source"),
     state: Optional[str] = Query(None, description="Filter by trend state"),
@@ -93,7 +102,7 @@ async def list_trends(
     min_score: Optional[float] = Query(None, ge=0.0, le=100.0, description="Minimum score"),
     api_key: str = Depends(optional_api_key),
     trend_repo: TrendRepository = Depends(get_trend_repository),
-    cache: Optional[CacheRepository] = Depends(get_cache_repository),
+    response_cache: ResponseCache = Depends(get_response_cache),
 ) -> TrendListResponse:
     """
     List trends with pagination and filtering.
@@ -101,9 +110,15 @@ async def list_trends(
     Returns a paginated list of trends sorted by rank (highest first).
     Supports filtering by category, source, state, language, and minimum score.
 
+    Pages are fetched by cursor: pass the ``next_cursor`` of one response
+    as ``cursor`` to get the next page, which costs the same at any depth.
+    ``offset`` is still accepted for existing clients, but deep offsets
+    scan and discard every skipped row. ``total`` is an estimate.
+
     Args:
         limit: Number of trends to return (1-100)
-        offset: Number of trends to skip
+        offset: Number of trends to skip (ignored when cursor is given)
+        cursor: Cursor from the previous page
         category: Filter by category (Technology, Politics, etc.)
         source: Filter by source (reddit, hackernews, etc.)
         state: Filter by trend state (emerging, viral, sustained, declining)
@@ -111,10 +126,13 @@ async def list_trends(
         min_score: Minimum trend score (0-100)
         api_key: Optional API key for authentication
         trend_repo: Trend repository dependency
-        cache: Cache repository dependency
+        response_cache: Tagged response cache dependency
 
     Returns:
         TrendListResponse with paginated trends
+
+    Raises:
+        HTTPException: If the cursor is invalid
     """
     # Build filter
     filters = TrendFilter(
@@ -124,42 +142,45 @@ async def list_trends(
         language=language,
         min_score=min_score,
         limit=limit,
-        offset=offset,
+        offset=0 if cursor else offset,
     )
 
-    # Try cache first
-    cache_key = f"trends:list:{hash(filters.json())}"
-    if cache:
-        try:
-            cached = await cache.get(cache_key)
-            if cached:
-                return TrendListResponse(**cached)
-        except Exception:
-            pass  # Continue without cache
-
-    # Fetch from database
-    trends = await trend_repo.search(filters)
-    total = len(trends)  # TODO: Add count method to repository
-
-    # Convert to response models
-    trend_responses = [trend_to_response(t) for t in trends]
-
-    response = TrendListResponse(
-        trends=trend_responses,
-        total=total,
-        limit=limit,
-        offset=offset,
-        has_more=total > (offset + limit),
-    )
+    async def build_response() -> dict:
+        if filters.offset:
+            # Legacy offset paging: one extra row tells whether more follow
+            trends = await trend_repo.search(filters.copy(update={"limit": limit + 1}))
+            has_more = len(trends) > limit
+            trends, next_cursor = trends[:limit], None
+        else:
+            trends, next_cursor = await trend_repo.search_page(filters, cursor=cursor)
+            has_more = next_cursor is not None
 
-    # Cache response
-    if cache:
-        try:
-            await cache.set(cache_key, response.dict(), ttl_seconds=300)  # 5 min cache
-        except Exception:
-            pass
+        # Planner estimate; an exact COUNT(*) would scan every matching row
+        total = await trend_repo.estimate_count(filters)
 
-    return response
+        return TrendListResponse(
+            trends=[trend_to_response(t) for t in trends],
+            total=max(total, filters.offset + len(trends)),
+            limit=limit,
+            offset=filters.offset,
+            has_more=has_more,
+            next_cursor=next_cursor,
+        ).dict()
+
+    # Stable key: identical across API worker processes
+    tags = [TRENDS_LIST_TAG]
+    if filters.category:
+        tags.append(category_tag(filters.category))
+    try:
+        cached = await response_cache.get_or_set(
+            stable_cache_key("trends:list", {**filters.dict(), "cursor": cursor}),
+            build_response,
+            ttl_seconds=300,  # 5 min cache
+            tags=tags,
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return TrendListResponse(**cached)
 
 
 @router.get(
@@ -174,7 +195,7 @@ async def get_top_trends(
     category: Optional[str] = Query(None, description="Filter by category"),
     api_key: str = Depends(optional_api_key),
     trend_repo: TrendRepository = Depends(get_trend_repository),
-    cache: Optional[CacheRepository] = Depends(get_cache_repository),
+    response_cache: ResponseCache = Depends(get_response_cache),
 ) -> TrendListResponse:
     """
     Get top-ranked trends.
@@ -187,42 +208,36 @@ async def get_top_trends(
         category: Optional category filter
         api_key: Optional API key
         trend_repo: Trend repository
-        cache: Cache repository
+        response_cache: Tagged response cache
 
     Returns:
         TrendListResponse with top trends
     """
-    cache_key = f"trends:top:{category or 'all'}:{limit}"
-    if cache:
-        try:
-            cached = await cache.get(cache_key)
-            if cached:
-                return TrendListResponse(**cached)
-        except Exception:
-            pass
-
-    trends = await trend_repo.get_top_trends(
-        limit=limit,
-        category=Category(category) if category else None,
-    )
-
-    trend_responses = [trend_to_response(t) for t in trends]
+    async def build_response() -> dict:
+        trends = await trend_repo.get_top_trends(
+            limit=limit,
+            category=Category(category) if category else None,
+        )
 
-    response = TrendListResponse(
-        trends=trend_responses,
-        total=len(trend_responses),
-        limit=limit,
-        offset=0,
-        has_more=False,
+        trend_responses = [trend_to_response(t) for t in trends]
+        return TrendListResponse(
+            trends=trend_responses,
+            total=len(trend_responses),
+            limit=limit,
+            offset=0,
+            has_more=False,
+        ).dict()
+
+    tags = [TRENDS_LIST_TAG]
+    if category:
+        tags.append(category_tag(category))
+    cached = await response_cache.get_or_set(
+        stable_cache_key("trends:top", {"category": category, "limit": limit}),
+        build_response,
+        ttl_seconds=300,
+        tags=tags,
     )
-
-    if cache:
-        try:
-            await cache.set(cache_key, response.dict(), ttl_seconds=300)
-        except Exception:
-            pass
-
-    return response
+    return TrendListResponse(**cached)
 
 
 @router.get(
@@ -236,7 +251,7 @@ async def get_trend(
     trend_id: UUID,
     api_key: str = Depends(optional_api_key),
     trend_repo: TrendRepository = Depends(get_trend_repository),
-    cache: Optional[CacheRepository] = Depends(get_cache_repository),
+    response_cache: ResponseCache = Depends(get_response_cache),
 ) -> TrendResponse:
     """
     Get a single trend by ID.
@@ -245,7 +260,7 @@ async def get_trend(
         trend_id: UUID of the trend
         api_key: Optional API key
         trend_repo: Trend repository
-        cache: Cache repository
+        response_cache: Tagged response cache
 
     Returns:
         TrendResponse with trend details
@@ -253,32 +268,24 @@ async def get_trend(
     Raises:
         HTTPException: 404 if trend not found
     """
-    cache_key = f"trends:detail:{trend_id}"
-    if cache:
-        try:
-            cached = await cache.get(cache_key)
-            if cached:
-                return TrendResponse(**cached)
-        except Exception:
-            pass
-
-    trend = await trend_repo.get_by_id(trend_id)
-
-    if trend is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Trend with ID {trend_id} not found",
-        )
+    async def build_response() -> dict:
+        trend = await trend_repo.get(trend_id)
 
-    response = trend_to_response(trend)
+        if trend is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Trend with ID {trend_id} not found",
+            )
 
-    if cache:
-        try:
-            await cache.set(cache_key, response.dict(), ttl_seconds=600)  # 10 min
-        except Exception:
-            pass
+        return trend_to_response(trend).dict()
 
-    return response
+    cached = await response_cache.get_or_set(
+        stable_cache_key("trends:detail", {"trend_id": trend_id}),
+        build_response,
+        ttl_seconds=600,  # 10 min
+        tags=[trend_tag(trend_id)],
+    )
+    return TrendResponse(**cached)
 
 
 @router.post(
@@ -411,7 +418,7 @@ async def get_similar_trends(
     api_key: str = Depends(optional_api_key),
     trend_repo: TrendRepository = Depends(get_trend_repository),
     vector_repo: Optional[VectorRepository] = Depends(get_vector_repository),
-    cache: Optional[CacheRepository] = Depends(get_cache_repository),
+    response_cache: ResponseCache = Depends(get_response_cache),
 ) -> TrendListResponse:
     """
     Find similar trends to a given trend.
@@ -425,7 +432,7 @@ async def get_similar_trends(
         api_key: Optional API key
         trend_repo: Trend repository
         vector_repo: Vector repository
-        cache: Cache repository
+        response_cache: Tagged response cache
 
     Returns:
         TrendListResponse with similar trends
@@ -447,17 +454,7 @@ async def get_similar_trends(
             detail="Similarity search is currently unavailable. Vector database not connected.",
         )
 
-    try:
-        # Check cache first
-        cache_key = f"trends:similar:{trend_id}:{limit}:{min_similarity}"
-        if cache:
-            try:
-                cached = await cache.get(cache_key)
-                if cached:
-                    return TrendListResponse(**cached)
-            except Exception:
-                pass
-
+    async def build_response() -> dict:
         # Get the trend's vector from vector repository
         vector_id = f"trend:{trend_id}"
         vector_data = await vector_repo.get(vector_id)
@@ -484,32 +481,32 @@ async def get_similar_trends(
             if match.id != vector_id
         ][:limit]
 
-        # Fetch full trend data
-        similar_trends = []
-        for tid in similar_trend_ids:
-            t = await trend_repo.get(tid)
-            if t:
-                similar_trends.append(t)
+        # Fetch full trend data in one query (keeps similarity order)
+        similar_trends = await trend_repo.get_many(similar_trend_ids)
 
         # Convert to response models
         trend_responses = [trend_to_response(t) for t in similar_trends]
 
-        response = TrendListResponse(
+        return TrendListResponse(
             trends=trend_responses,
             total=len(trend_responses),
             limit=limit,
             offset=0,
             has_more=False,
-        )
+        ).dict()
 
-        # Cache the response
-        if cache:
-            try:
-                await cache.set(cache_key, response.dict(), ttl_seconds=600)  # 10 min
-            except Exception:
-                pass
-
-        return response
+    try:
+        # New or changed trends can change the neighbours, so tag the list too
+        cached = await response_cache.get_or_set(
+            stable_cache_key(
+                "trends:similar",
+                {"trend_id": trend_id, "limit": limit, "min_similarity": min_similarity},
+            ),
+            build_response,
+            ttl_seconds=600,  # 10 min
+            tags=[trend_tag(trend_id), TRENDS_LIST_TAG],
+        )
+        return TrendListResponse(**cached)
 
     except HTTPException:
         raise
@@ -531,7 +528,7 @@ async def get_similar_trends(
 async def get_trend_stats(
     api_key: str = Depends(optional_api_key),
     trend_repo: TrendRepository = Depends(get_trend_repository),
-    cache: Optional[CacheRepository] = Depends(get_cache_repository),
+    response_cache: ResponseCache = Depends(get_response_cache),
 ) -> TrendStatsResponse:
     """
     Get trend statistics and analytics.
@@ -544,76 +541,35 @@ async def get_trend_stats(
     Args:
         api_key: Optional API key
         trend_repo: Trend repository
-        cache: Cache repository
+        response_cache: Tagged response cache
 
     Returns:
         TrendStatsResponse with statistics
     """
-    cache_key = "trends:stats:overview"
-    if cache:
-        try:
-            cached = await cache.get(cache_key)
-            if cached:
-                return TrendStatsResponse(**cached)
-        except Exception:
-            pass
-
-    # Fetch all trends (consider pagination for large datasets)
-    all_trends = await trend_repo.search(TrendFilter(limit=10000))
-
-    # Calculate statistics
-    total_trends = len(all_trends)
-    total_topics = len(set(t.topic_id for t in all_trends))
-    total_items = sum(t.item_count for t in all_trends)
-
-    # Group by category
-    trends_by_category = {}
-    for trend in all_trends:
-        cat = trend.category.value
-        trends_by_category[cat] = trends_by_category.get(cat, 0) + 1
-
-    # Group by state
-    trends_by_state = {}
-    for trend in all_trends:
-        st = trend.state.value
-        trends_by_state[st] = trends_by_state.get(st, 0) + 1
-
-    # Group by source (count unique sources per trend)
-    trends_by_source = {}
-    for trend in all_trends:
-        for source in trend.sources:
-            src = source.value
-            trends_by_source[src] = trends_by_source.get(src, 0) + 1
-
-    # Calculate average engagement
-    if total_trends > 0:
-        avg_upvotes = sum(t.total_engagement.upvotes for t in all_trends) // total_trends
-        avg_comments = sum(t.total_engagement.comments for t in all_trends) // total_trends
-        avg_views = sum(t.total_engagement.views for t in all_trends) // total_trends
-        avg_score = sum(t.total_engagement.score for t in all_trends) / total_trends
-    else:
-        avg_upvotes = avg_comments = avg_views = 0
-        avg_score = 0.0
-
-    response = TrendStatsResponse(
-        total_trends=total_trends,
-        total_topics=total_topics,
-        total_items=total_items,
-        trends_by_category=trends_by_category,
-        trends_by_state=trends_by_state,
-        trends_by_source=trends_by_source,
-        average_engagement=MetricsResponse(
-            upvotes=avg_upvotes,
-            comments=avg_comments,
-            views=avg_views,
-            score=avg_score,
-        ),
+    async def build_response() -> dict:
+        # Aggregate in the database instead of loading every trend
+        stats = await trend_repo.get_aggregate_stats(top_n=0)
+        engagement = stats["avg_engagement"]
+
+        return TrendStatsResponse(
+            total_trends=stats["total_trends"],
+            total_topics=stats["total_topics"],
+            total_items=stats["total_items"],
+            trends_by_category=stats["by_category"],
+            trends_by_state=stats["by_state"],
+            trends_by_source=stats["by_source"],
+            average_engagement=MetricsResponse(
+                upvotes=int(engagement["upvotes"]),
+                comments=int(engagement["comments"]),
+                views=int(engagement["views"]),
+                score=engagement["score"],
+            ),
+        ).dict()
+
+    cached = await response_cache.get_or_set(
+        stable_cache_key("trends:stats:overview"),
+        build_response,
+        ttl_seconds=600,  # 10 min
+        tags=[TRENDS_STATS_TAG],
     )
-
-    if cache:
-        try:
-            await cache.set(cache_key, response.dict(), ttl_seconds=600)  # 10 min
-        except Exception:
-            pass
-
-    return response
+    return TrendStatsResponse(**cached)
@@ -130,20 +130,26 @@ class TrendListResponse(BaseModel):
     """List of trends with pagination."""
 
     trends: List[TrendResponse] = Field(..., description="List of trends")
-    total: int = Field(..., ge=0, description="Total number of trends")
+    total: int = Field(..., ge=0, description="Total number of trends (may be estimated)")
     limit: int = Field(..., ge=1, description="Items per page")
     offset: int = Field(..., ge=0, description="Offset from start")
     has_more: bool = Field(..., description="Whether more trends available")
+    next_cursor: Optional[str] = Field(
+        None, description="Cursor for the next page (pass as ?cursor=); None on the last page"
+    )
 
 
 class TopicListResponse(BaseModel):
     """List of topics with pagination."""
 
     topics: List[TopicResponse] = Field(..., description="List of topics")
-    total: int = Field(..., ge=0, description="Total number of topics")
+    total: int = Field(..., ge=0, description="Total number of topics (may be estimated)")
     limit: int = Field(..., ge=1, description="Items per page")
     offset: int = Field(..., ge=0, description="Offset from start")
     has_more: bool = Field(..., description="Whether more topics available")
+    next_cursor: Optional[str] = Field(
+        None, description="Cursor for the next page (pass as ?cursor=); None on the last page"
+    )
 
 
 class TrendSearchRequest(BaseModel):
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Benchmark CPU executor throughput for the per-item pipeline stages.
+
+Runs normalization and language detection over synthetic HTML items on the
+event loop (inline) and through a CPUExecutor with an increasing number of
+worker processes, and reports items per second and the speed-up over the
+inline run. Worker start-up is excluded by warming the pool first.
+
+Usage:
+    python scripts/benchmark_cpu_executor.py
+    python scripts/benchmark_cpu_executor.py --items 20000 --workers 1 2 4 8 --chunk-size 128
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from trend_agent.processing.cpu_executor import CPUExecutor
+from trend_agent.processing.language import LanguageDetectorStage
+from trend_agent.processing.normalizer import NormalizerStage
+from trend_agent.processing.pipeline import ProcessingPipeline
+
+sys.path.insert(0, str(Path(__file__).parent))
+from benchmark_pipeline_memory import make_raw_items
+
+
+async def run_stages(raw_items, executor):
+    """Normalize and detect languages; return elapsed seconds."""
+    items = ProcessingPipeline()._convert_to_processed_items(raw_items)
+    stages = [
+        NormalizerStage(cpu_executor=executor),
+        LanguageDetectorStage(cpu_executor=executor),
+    ]
+
+    if executor is not None:
+        await executor.start()
+
+    start = time.perf_counter()
+    for stage in stages:
+        items = await stage.process(items)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--items", type=int, default=5000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--chunk-size", type=int, default=64)
+    parser.add_argument("--content-chars", type=int, default=2000)
+    args = parser.parse_args()
+
+    raw_items = list(make_raw_items(args.items, args.content_chars))
+
+    print(f"{'workers':>8} {'seconds':>10} {'items/s':>10} {'speed-up':>9}")
+    print("-" * 41)
+
+    baseline = asyncio.run(run_stages(raw_items, None))
+    print(f"{'inline':>8} {baseline:>10.2f} {args.items / baseline:>10.0f} {1.0:>8.2f}x")
+
+    for workers in args.workers:
+        executor = CPUExecutor(max_workers=workers, chunk_size=args.chunk_size)
+        try:
+            seconds = asyncio.run(run_stages(raw_items, executor))
+        finally:
+            executor.shutdown()
+        print(
+            f"{workers:>8} {seconds:>10.2f} {args.items / seconds:>10.0f} "
+            f"{baseline / seconds:>8.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
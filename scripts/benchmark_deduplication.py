@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Benchmark for near-duplicate detection.
+
+Compares the legacy dense path (full N×N cosine_similarity matrix walked
+with nested Python loops) against the blocked NearDuplicateFinder, with
+and without the LSH pre-filter, on synthetic embeddings with planted
+duplicate clusters.
+
+Usage:
+    python scripts/benchmark_deduplication.py
+    python scripts/benchmark_deduplication.py --sizes 1000 10000 100000 --dimension 384
+"""
+
+import argparse
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from trend_agent.processing.near_duplicates import NearDuplicateFinder
+
+
+def legacy_groups(embeddings, threshold):
+    """Original EmbeddingDeduplicator.find_duplicates grouping."""
+    from sklearn.metrics.pairwise import cosine_similarity
+
+    similarities = cosine_similarity(embeddings)
+    used = set()
+    groups = []
+    for i in range(len(embeddings)):
+        if i in used:
+            continue
+        group = [i]
+        used.add(i)
+        for j in range(i + 1, len(embeddings)):
+            if j in used:
+                continue
+            if similarities[i][j] > threshold:
+                group.append(j)
+                used.add(j)
+        groups.append(group)
+    return groups
+
+
+def make_embeddings(size, dimension, duplicate_ratio=0.2, seed=42):
+    """Random embeddings where a fraction of rows are noisy copies of others."""
+    rng = np.random.default_rng(seed)
+    vectors = rng.standard_normal((size, dimension)).astype(np.float32)
+    n_duplicates = int(size * duplicate_ratio)
+    sources = rng.integers(0, size - n_duplicates, n_duplicates)
+    vectors[size - n_duplicates:] = (
+        vectors[sources] + 0.1 * rng.standard_normal((n_duplicates, dimension))
+    )
+    return vectors[rng.permutation(size)]
+
+
+def measure(fn):
+    """Run fn and return (result, seconds, peak traced MiB)."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = fn()
+    duration = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, duration, peak / (1024 * 1024)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--dimension", type=int, default=384)
+    parser.add_argument("--threshold", type=float, default=0.92)
+    parser.add_argument(
+        "--legacy-max", type=int, default=20000,
+        help="Skip the legacy path above this size (N×N float64 matrix)",
+    )
+    args = parser.parse_args()
+
+    engines = {
+        "blocked": NearDuplicateFinder(dtype=np.float32),
+        "blocked+lsh": NearDuplicateFinder(use_lsh=True, dtype=np.float32),
+    }
+
+    print(f"{'items':>8} {'engine':>12} {'seconds':>10} {'peak MiB':>10} {'groups':>8}  check")
+    print("-" * 64)
+
+    for size in args.sizes:
+        embeddings = make_embeddings(size, args.dimension)
+        reference = None
+
+        if size <= args.legacy_max:
+            reference, seconds, peak = measure(
+                lambda: legacy_groups(embeddings, args.threshold)
+            )
+            print(f"{size:>8} {'legacy':>12} {seconds:>10.2f} {peak:>10.1f} {len(reference):>8}")
+        else:
+            matrix_gib = size * size * 8 / (1024 ** 3)
+            print(f"{size:>8} {'legacy':>12} {'skipped':>10}   (N×N matrix needs {matrix_gib:.0f} GiB)")
+
+        for name, finder in engines.items():
+            groups, seconds, peak = measure(
+                lambda: finder.group(embeddings, args.threshold)
+            )
+            if reference is None:
+                check = ""
+            elif groups == reference:
+                check = "same groups"
+            else:
+                check = "DIFFERENT"
+            print(f"{size:>8} {name:>12} {seconds:>10.2f} {peak:>10.1f} {len(groups):>8}  {check}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Benchmark peak memory of batch vs streaming pipeline execution.
+
+Runs the per-item stages (normalization and language detection) over
+synthetic raw items, once with the whole list materialized up front (batch
+mode) and once with items drawn lazily from a generator in micro-batches
+(streaming mode). Each run happens in a fresh subprocess so the reported
+peak RSS (ru_maxrss) belongs to that run alone.
+
+Usage:
+    python scripts/benchmark_pipeline_memory.py
+    python scripts/benchmark_pipeline_memory.py --sizes 10000 100000 --batch-size 512
+"""
+
+import argparse
+import asyncio
+import json
+import resource
+import subprocess
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from trend_agent.processing.language import LanguageDetectorStage
+from trend_agent.processing.normalizer import NormalizerStage
+from trend_agent.processing.pipeline import ProcessingPipeline
+from trend_agent.schemas import Metrics, PipelineConfig, RawItem, SourceType
+
+WORDS = (
+    "market election climate launch update research football model release "
+    "energy policy startup festival vaccine storm transfer court album"
+).split()
+
+
+def make_raw_items(size, content_chars):
+    """Yield synthetic raw items with a few KiB of HTML content each."""
+    for i in range(size):
+        words = " ".join(WORDS[(i + j) % len(WORDS)] for j in range(12))
+        body = (words + ". ") * (content_chars // (len(words) + 2) + 1)
+        yield RawItem(
+            source=SourceType.RSS,
+            source_id=f"bench-{i}",
+            url=f"https://example.com/items/{i}",
+            title=f"Item {i}: {words}",
+            description=words,
+            content=f"<p>{body[:content_chars]}</p>",
+            published_at=datetime.utcnow(),
+            metrics=Metrics(upvotes=i % 100),
+        )
+
+
+def run_worker(size, mode, batch_size, content_chars):
+    """Run one pipeline execution and print its stats as JSON."""
+    config = PipelineConfig(streaming=mode == "streaming", stream_batch_size=batch_size)
+    pipeline = ProcessingPipeline(config=config)
+    pipeline.add_stage(NormalizerStage())
+    pipeline.add_stage(LanguageDetectorStage())
+
+    items = make_raw_items(size, content_chars)
+    if mode == "batch":
+        items = list(items)
+
+    start = time.perf_counter()
+    result = asyncio.run(pipeline.run(items))
+    duration = time.perf_counter() - start
+
+    stats = result.metadata.get("stream_stats", [])
+    print(json.dumps({
+        "items": result.items_processed,
+        "seconds": duration,
+        # ru_maxrss is reported in KiB on Linux
+        "peak_rss_mib": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        "backpressure_seconds": sum(s["backpressure_seconds"] for s in stats),
+    }))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--batch-size", type=int, default=256)
+    parser.add_argument("--content-chars", type=int, default=2000)
+    parser.add_argument("--worker", choices=["batch", "streaming"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        run_worker(args.sizes[0], args.worker, args.batch_size, args.content_chars)
+        return
+
+    print(f"{'items':>8} {'mode':>10} {'seconds':>10} {'peak RSS MiB':>13} {'backpressure s':>15}")
+    print("-" * 60)
+
+    for size in args.sizes:
+        for mode in ("batch", "streaming"):
+            output = subprocess.run(
+                [
+                    sys.executable, __file__,
+                    "--worker", mode,
+                    "--sizes", str(size),
+                    "--batch-size", str(args.batch_size),
+                    "--content-chars", str(args.content_chars),
+                ],
+                capture_output=True, text=True, check=True,
+            ).stdout
+            stats = json.loads(output.strip().splitlines()[-1])
+            print(
+                f"{size:>8} {mode:>10} {stats['seconds']:>10.2f} "
+                f"{stats['peak_rss_mib']:>13.1f} {stats['backpressure_seconds']:>15.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Benchmark for PostgreSQL write throughput.
+
+Compares rows/sec of the per-row save() loop against the bulk save_batch()
+path (COPY into a staging table + INSERT ... ON CONFLICT) for processed
+items, topics and trends.
+
+Requires a PostgreSQL database with the trend schema loaded. Connection
+settings are read from the same POSTGRES_* environment variables as the
+Celery tasks. Benchmark rows are deleted afterwards.
+
+Usage:
+    python scripts/benchmark_storage_writes.py
+    python scripts/benchmark_storage_writes.py --rows 1000 5000
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from uuid import uuid4
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from trend_agent.schemas import (
+    Category,
+    Metrics,
+    ProcessedItem,
+    SourceType,
+    Topic,
+    Trend,
+    TrendState,
+)
+from trend_agent.storage.postgres import (
+    PostgreSQLConnectionPool,
+    PostgreSQLItemRepository,
+    PostgreSQLTopicRepository,
+    PostgreSQLTrendRepository,
+)
+
+BENCHMARK_MARKER = "write-benchmark"
+
+
+def make_items(count, run_id):
+    """Create synthetic processed items with unique source IDs."""
+    now = datetime.utcnow()
+    return [
+        ProcessedItem(
+            source=SourceType.CUSTOM,
+            source_id=f"{BENCHMARK_MARKER}-{run_id}-{i}",
+            url=f"https://example.com/{run_id}/{i}",
+            title=f"Benchmark item {i}",
+            title_normalized=f"benchmark item {i}",
+            description="Synthetic item used to measure write throughput",
+            content="Lorem ipsum " * 20,
+            content_normalized="lorem ipsum " * 20,
+            language="en",
+            category=Category.TECHNOLOGY,
+            metrics=Metrics(upvotes=i, comments=i // 2),
+            published_at=now,
+            collected_at=now,
+            metadata={"benchmark": BENCHMARK_MARKER},
+        )
+        for i in range(count)
+    ]
+
+
+def make_topics_and_trends(count):
+    """Create synthetic topics and one trend per topic."""
+    now = datetime.utcnow()
+    topics = [
+        Topic(
+            id=uuid4(),
+            title=f"Benchmark topic {i}",
+            summary="Synthetic topic used to measure write throughput",
+            category=Category.TECHNOLOGY,
+            sources=[SourceType.CUSTOM],
+            item_count=3,
+            language="en",
+            keywords=["benchmark", f"topic{i}"],
+            total_engagement=Metrics(upvotes=i),
+            first_seen=now,
+            last_updated=now,
+            metadata={"benchmark": BENCHMARK_MARKER},
+        )
+        for i in range(count)
+    ]
+    trends = [
+        Trend(
+            id=uuid4(),
+            topic_id=topic.id,
+            rank=i + 1,
+            title=topic.title,
+            summary=topic.summary,
+            key_points=["point one", "point two"],
+            category=topic.category,
+            state=TrendState.EMERGING,
+            score=float(count - i),
+            sources=topic.sources,
+            item_count=topic.item_count,
+            velocity=1.0,
+            language="en",
+            keywords=topic.keywords,
+            total_engagement=topic.total_engagement,
+            first_seen=now,
+            last_updated=now,
+            metadata={"benchmark": BENCHMARK_MARKER},
+        )
+        for i, topic in enumerate(topics)
+    ]
+    return topics, trends
+
+
+async def time_loop(save, rows):
+    """Save rows one at a time and return elapsed seconds."""
+    start = time.perf_counter()
+    for row in rows:
+        await save(row)
+    return time.perf_counter() - start
+
+
+async def time_batch(save_batch, rows):
+    """Save rows in one batch and return elapsed seconds."""
+    start = time.perf_counter()
+    await save_batch(rows)
+    return time.perf_counter() - start
+
+
+def report(kind, count, loop_seconds, batch_seconds):
+    """Print one result line."""
+    loop_rate = count / loop_seconds if loop_seconds else float("inf")
+    batch_rate = count / batch_seconds if batch_seconds else float("inf")
+    print(
+        f"{kind:>8} {count:>8} {loop_rate:>14,.0f} {batch_rate:>14,.0f} "
+        f"{batch_rate / loop_rate:>8.1f}x"
+    )
+
+
+async def cleanup(pool):
+    """Delete rows created by the benchmark."""
+    async with pool.acquire() as conn:
+        await conn.execute(
+            "DELETE FROM topics WHERE metadata->>'benchmark' = $1", BENCHMARK_MARKER
+        )
+        await conn.execute(
+            "DELETE FROM processed_items WHERE metadata->>'benchmark' = $1",
+            BENCHMARK_MARKER,
+        )
+
+
+async def run(row_counts):
+    db_pool = PostgreSQLConnectionPool(
+        host=os.getenv("POSTGRES_HOST", "localhost"),
+        port=int(os.getenv("POSTGRES_PORT", "5432")),
+        database=os.getenv("POSTGRES_DB", "trends"),
+        user=os.getenv("POSTGRES_USER", "trend_user"),
+        password=os.getenv("POSTGRES_PASSWORD", "trend_password"),
+    )
+    pool = await db_pool.connect()
+
+    item_repo = PostgreSQLItemRepository(pool)
+    topic_repo = PostgreSQLTopicRepository(pool)
+    trend_repo = PostgreSQLTrendRepository(pool)
+
+    print(f"{'table':>8} {'rows':>8} {'loop rows/s':>14} {'batch rows/s':>14} {'speedup':>9}")
+    print("-" * 58)
+
+    try:
+        for count in row_counts:
+            # Fresh rows for each path so both measure inserts, not updates
+            loop_seconds = await time_loop(item_repo.save, make_items(count, uuid4().hex))
+            batch_seconds = await time_batch(item_repo.save_batch, make_items(count, uuid4().hex))
+            report("items", count, loop_seconds, batch_seconds)
+
+            loop_topics, loop_trends = make_topics_and_trends(count)
+            batch_topics, batch_trends = make_topics_and_trends(count)
+
+            loop_seconds = await time_loop(topic_repo.save, loop_topics)
+            batch_seconds = await time_batch(topic_repo.save_batch, batch_topics)
+            report("topics", count, loop_seconds, batch_seconds)
+
+            loop_seconds = await time_loop(trend_repo.save, loop_trends)
+            batch_seconds = await time_batch(trend_repo.save_batch, batch_trends)
+            report("trends", count, loop_seconds, batch_seconds)
+    finally:
+        await cleanup(pool)
+        await db_pool.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--rows", type=int, nargs="+", default=[100, 1000, 5000])
+    args = parser.parse_args()
+
+    asyncio.run(run(args.rows))
+
+
+if __name__ == "__main__":
+    main()
@@ -35,6 +35,9 @@ CREATE EXTENSION IF NOT EXISTS "uuid-ossp";
 -- Enable pgcrypto for additional crypto functions
 CREATE EXTENSION IF NOT EXISTS "pgcrypto";
 
+-- Enable pg_trgm for fuzzy (trigram) title matching
+CREATE EXTENSION IF NOT EXISTS "pg_trgm";
+
 -- ============================================================================
 -- ENUMS
 -- ============================================================================
@@ -84,6 +87,17 @@ CREATE TYPE processing_status AS ENUM (
     'skipped'
 );
 
+-- ============================================================================
+-- SEARCH HELPERS
+-- ============================================================================
+
+-- array_to_string() is only STABLE; generated columns need an IMMUTABLE
+-- expression, and joining a TEXT[] with a fixed separator is immutable.
+CREATE OR REPLACE FUNCTION search_keywords_text(keywords TEXT[])
+RETURNS TEXT AS $$
+    SELECT coalesce(array_to_string(keywords, ' '), '')
+$$ LANGUAGE sql IMMUTABLE PARALLEL SAFE;
+
 -- ============================================================================
 -- CORE TABLES
 -- ============================================================================
@@ -102,15 +116,22 @@ CREATE TABLE topics (
     first_seen TIMESTAMPTZ NOT NULL DEFAULT NOW(),
     last_updated TIMESTAMPTZ NOT NULL DEFAULT NOW(),
     metadata JSONB DEFAULT '{}',
+    search_vector TSVECTOR GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('english', search_keywords_text(keywords)), 'B') ||
+        setweight(to_tsvector('english', coalesce(summary, '')), 'C')
+    ) STORED,
     CONSTRAINT topics_item_count_check CHECK (item_count >= 0)
 );
 
 CREATE INDEX idx_topics_category ON topics(category);
 CREATE INDEX idx_topics_language ON topics(language);
 CREATE INDEX idx_topics_first_seen ON topics(first_seen DESC);
-CREATE INDEX idx_topics_last_updated ON topics(last_updated DESC);
+CREATE INDEX idx_topics_last_updated_id ON topics(last_updated DESC, id DESC);
 CREATE INDEX idx_topics_keywords ON topics USING GIN(keywords);
 CREATE INDEX idx_topics_metadata ON topics USING GIN(metadata);
+CREATE INDEX idx_topics_search_vector ON topics USING GIN(search_vector);
+CREATE INDEX idx_topics_title_trgm ON topics USING GIN(title gin_trgm_ops);
 
 -- Trends Table
 CREATE TABLE trends (
@@ -134,6 +155,11 @@ CREATE TABLE trends (
     last_updated TIMESTAMPTZ NOT NULL DEFAULT NOW(),
     peak_engagement_at TIMESTAMPTZ,
     metadata JSONB DEFAULT '{}',
+    search_vector TSVECTOR GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('english', search_keywords_text(keywords)), 'B') ||
+        setweight(to_tsvector('english', coalesce(summary, '')), 'C')
+    ) STORED,
     CONSTRAINT trends_rank_check CHECK (rank > 0),
     CONSTRAINT trends_score_check CHECK (score >= 0),
     CONSTRAINT trends_velocity_check CHECK (velocity >= 0)
@@ -149,7 +175,9 @@ CREATE INDEX idx_trends_first_seen ON trends(first_seen DESC);
 CREATE INDEX idx_trends_last_updated ON trends(last_updated DESC);
 CREATE INDEX idx_trends_keywords ON trends USING GIN(keywords);
 CREATE INDEX idx_trends_metadata ON trends USING GIN(metadata);
-CREATE INDEX idx_trends_composite_rank_score ON trends(rank, score DESC);
+CREATE INDEX idx_trends_rank_score_id ON trends(rank, score DESC, id);
+CREATE INDEX idx_trends_search_vector ON trends USING GIN(search_vector);
+CREATE INDEX idx_trends_title_trgm ON trends USING GIN(title gin_trgm_ops);
 
 -- Processed Items Table
 CREATE TABLE processed_items (
@@ -0,0 +1,21 @@
+-- ============================================================================
+-- Keyset pagination migration for existing databases
+-- ============================================================================
+-- Replaces the list ordering indexes with ones that end in the primary key,
+-- matching the ORDER BY of the cursor-paginated trend and topic listings.
+-- Safe to re-run.
+--
+-- Usage:
+--   psql -U trend_user -d trends -f scripts/migrate-keyset-indexes.sql
+-- ============================================================================
+
+-- CONCURRENTLY avoids blocking writes; it cannot run inside a transaction
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_trends_rank_score_id ON trends(rank, score DESC, id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_topics_last_updated_id ON topics(last_updated DESC, id DESC);
+
+DROP INDEX CONCURRENTLY IF EXISTS idx_trends_composite_rank_score;
+DROP INDEX CONCURRENTLY IF EXISTS idx_topics_last_updated;
+
+-- Refresh the statistics used for estimated list totals
+ANALYZE trends;
+ANALYZE topics;
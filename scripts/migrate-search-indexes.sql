@@ -0,0 +1,34 @@
+-- ============================================================================
+-- Full-text search migration for existing databases
+-- ============================================================================
+-- Adds the generated search_vector columns and the full-text / trigram
+-- indexes that init-db.sql creates on fresh installs. Safe to re-run.
+--
+-- Usage:
+--   psql -U trend_user -d trends -f scripts/migrate-search-indexes.sql
+-- ============================================================================
+
+CREATE EXTENSION IF NOT EXISTS "pg_trgm";
+
+CREATE OR REPLACE FUNCTION search_keywords_text(keywords TEXT[])
+RETURNS TEXT AS $$
+    SELECT coalesce(array_to_string(keywords, ' '), '')
+$$ LANGUAGE sql IMMUTABLE PARALLEL SAFE;
+
+-- Adding a stored generated column rewrites the table once
+ALTER TABLE topics ADD COLUMN IF NOT EXISTS search_vector TSVECTOR GENERATED ALWAYS AS (
+    setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+    setweight(to_tsvector('english', search_keywords_text(keywords)), 'B') ||
+    setweight(to_tsvector('english', coalesce(summary, '')), 'C')
+) STORED;
+
+ALTER TABLE trends ADD COLUMN IF NOT EXISTS search_vector TSVECTOR GENERATED ALWAYS AS (
+    setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+    setweight(to_tsvector('english', search_keywords_text(keywords)), 'B') ||
+    setweight(to_tsvector('english', coalesce(summary, '')), 'C')
+) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_topics_search_vector ON topics USING GIN(search_vector);
+CREATE INDEX IF NOT EXISTS idx_topics_title_trgm ON topics USING GIN(title gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_trends_search_vector ON trends USING GIN(search_vector);
+CREATE INDEX IF NOT EXISTS idx_trends_title_trgm ON trends USING GIN(title gin_trgm_ops);
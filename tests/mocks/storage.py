@@ -6,7 +6,7 @@ for use during development and testing.
 """
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID, uuid4
 
 from trend_agent.storage.interfaces import (
@@ -15,6 +15,7 @@ from trend_agent.storage.interfaces import (
     CacheRepository,
     TopicRepository,
 )
+from trend_agent.storage.pagination import decode_cursor, encode_cursor
 from trend_agent.schemas import (
     ProcessedItem,
     Topic,
@@ -24,11 +25,29 @@ from trend_agent.schemas import (
 )
 
 
+def _rank_text(query: str, records: List[Any]) -> List[Tuple[Any, float]]:
+    """Score trends/topics by weighted query term hits (title > keywords > summary)."""
+    terms = query.lower().split()
+    ranked = []
+    for record in records:
+        fields = [
+            (record.title.lower(), 1.0),
+            (" ".join(record.keywords).lower(), 0.4),
+            (record.summary.lower(), 0.1),
+        ]
+        relevance = sum(weight for term in terms for text, weight in fields if term in text)
+        if relevance > 0:
+            ranked.append((record, relevance))
+    ranked.sort(key=lambda pair: pair[1], reverse=True)
+    return ranked
+
+
 class MockTrendRepository(BaseTrendRepository):
     """In-memory mock implementation of TrendRepository."""
 
     def __init__(self):
         self._trends: Dict[UUID, Trend] = {}
+        self.get_many_calls = 0
 
     async def save(self, trend: Trend) -> UUID:
         """Save a trend to in-memory storage."""
@@ -41,6 +60,49 @@ class MockTrendRepository(BaseTrendRepository):
         """Get a trend by ID."""
         return self._trends.get(trend_id)
 
+    async def get_many(
+        self, trend_ids: List[UUID], filters: Optional[TrendFilter] = None
+    ) -> List[Trend]:
+        """Get trends by ID, preserving the order of the IDs."""
+        self.get_many_calls += 1
+        return await self._get_matching(trend_ids, filters)
+
+    async def get_last_updated(
+        self, trend_ids: List[UUID], filters: Optional[TrendFilter] = None
+    ) -> Dict[UUID, datetime]:
+        """Get last_updated timestamps of matching trends."""
+        trends = await self._get_matching(trend_ids, filters)
+        return {t.id: t.last_updated for t in trends}
+
+    async def _get_matching(
+        self, trend_ids: List[UUID], filters: Optional[TrendFilter]
+    ) -> List[Trend]:
+        results = [self._trends[tid] for tid in dict.fromkeys(trend_ids) if tid in self._trends]
+        if filters:
+            results = [t for t in results if self._matches_hit_filter(t, filters)]
+        return results
+
+    @staticmethod
+    def _matches_hit_filter(trend: Trend, filters: TrendFilter) -> bool:
+        """Semantic search hit post-filter (score, last_updated, keywords, sources)."""
+        if filters.min_score is not None and trend.score < filters.min_score:
+            return False
+        if filters.max_score is not None and trend.score > filters.max_score:
+            return False
+        if filters.date_from and trend.last_updated < filters.date_from:
+            return False
+        if filters.date_to and trend.last_updated > filters.date_to:
+            return False
+        if filters.keywords and not any(
+            kw.lower() in trend.title.lower()
+            or any(kw.lower() in tk.lower() for tk in trend.keywords)
+            for kw in filters.keywords
+        ):
+            return False
+        if filters.sources and not any(s in trend.sources for s in filters.sources):
+            return False
+        return True
+
     async def search(self, filters: TrendFilter) -> List[Trend]:
         """Search trends with filters."""
         results = list(self._trends.values())
@@ -68,6 +130,43 @@ class MockTrendRepository(BaseTrendRepository):
 
         return results
 
+    async def search_page(
+        self, filters: TrendFilter, cursor: Optional[str] = None
+    ) -> Tuple[List[Trend], Optional[str]]:
+        """Get a page of trends ordered by (rank, score DESC, id) after a cursor."""
+        matching = await self.search(
+            filters.copy(update={"limit": len(self._trends), "offset": 0})
+        )
+        results = sorted(matching, key=lambda t: (t.rank, -t.score, str(t.id)))
+        if cursor:
+            rank, score, trend_id = decode_cursor("trends", cursor, 3)
+            after = (rank, -score, trend_id)
+            results = [t for t in results if (t.rank, -t.score, str(t.id)) > after]
+
+        page = results[: filters.limit]
+        next_cursor = None
+        if len(results) > filters.limit:
+            last = page[-1]
+            next_cursor = encode_cursor("trends", [last.rank, last.score, str(last.id)])
+        return page, next_cursor
+
+    async def estimate_count(self, filters: Optional[TrendFilter] = None) -> int:
+        """Count matching trends."""
+        if filters is None:
+            return len(self._trends)
+        return len(
+            await self.search(filters.copy(update={"limit": len(self._trends), "offset": 0}))
+        )
+
+    async def search_text(
+        self, query: str, filters: Optional[TrendFilter] = None, limit: int = 20
+    ) -> List[Tuple[Trend, float]]:
+        """Rank trends by query terms found in title, keywords and summary."""
+        candidates = list(self._trends.values())
+        if filters:
+            candidates = await self._get_matching(list(self._trends), filters)
+        return _rank_text(query, candidates)[:limit]
+
     async def update(self, trend_id: UUID, updates: Dict[str, Any]) -> bool:
         """Update a trend."""
         if trend_id not in self._trends:
@@ -107,6 +206,49 @@ class MockTrendRepository(BaseTrendRepository):
 
         return results[:limit]
 
+    async def get_aggregate_stats(
+        self, date_from: Optional[datetime] = None, top_n: int = 10
+    ) -> Dict[str, Any]:
+        """Compute trend statistics in memory."""
+        trends = [
+            t for t in self._trends.values() if date_from is None or t.first_seen >= date_from
+        ]
+        count = len(trends) or 1
+
+        def breakdown(values):
+            counts: Dict[str, int] = {}
+            for value in values:
+                counts[value] = counts.get(value, 0) + 1
+            return counts
+
+        top = sorted(trends, key=lambda t: t.score, reverse=True)[:top_n]
+        return {
+            "total_trends": len(trends),
+            "total_topics": len({t.topic_id for t in trends}),
+            "total_items": sum(t.item_count for t in trends),
+            "by_category": breakdown(t.category.value for t in trends),
+            "by_state": breakdown(t.state.value for t in trends),
+            "by_language": breakdown(t.language or "unknown" for t in trends),
+            "by_source": breakdown(s.value for t in trends for s in t.sources),
+            "avg_score": sum(t.score for t in trends) / count,
+            "avg_velocity": sum(t.velocity for t in trends) / count,
+            "avg_item_count": sum(t.item_count for t in trends) / count,
+            "avg_engagement": {
+                field: sum(getattr(t.total_engagement, field) for t in trends) / count
+                for field in ("upvotes", "comments", "views", "score")
+            },
+            "top_trends": [
+                {
+                    "id": str(t.id),
+                    "title": t.title,
+                    "score": t.score,
+                    "category": t.category.value,
+                    "state": t.state.value,
+                }
+                for t in top
+            ],
+        }
+
 
 class MockTopicRepository:
     """In-memory mock implementation of TopicRepository."""
@@ -143,6 +285,35 @@ class MockTopicRepository:
 
         return results[offset : offset + limit]
 
+    async def search_page(
+        self,
+        category: Optional[str] = None,
+        language: Optional[str] = None,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[Topic], Optional[str]]:
+        """Get a page of topics ordered by (last_updated, id) descending after a cursor."""
+        matching = await self.search(category=category, language=language, limit=len(self._topics))
+        results = sorted(
+            matching, key=lambda t: (t.last_updated.isoformat(), str(t.id)), reverse=True
+        )
+        if cursor:
+            before = tuple(decode_cursor("topics", cursor, 2))
+            results = [t for t in results if (t.last_updated.isoformat(), str(t.id)) < before]
+
+        page = results[:limit]
+        next_cursor = None
+        if len(results) > limit:
+            last = page[-1]
+            next_cursor = encode_cursor("topics", [last.last_updated.isoformat(), str(last.id)])
+        return page, next_cursor
+
+    async def estimate_count(
+        self, category: Optional[str] = None, language: Optional[str] = None
+    ) -> int:
+        """Count matching topics."""
+        return len(await self.search(category=category, language=language, limit=len(self._topics)))
+
     async def update(self, topic_id: UUID, updates: Dict[str, Any]) -> bool:
         """Update a topic."""
         if topic_id not in self._topics:
@@ -162,6 +333,17 @@ class MockTopicRepository:
             return True
         return False
 
+    async def search_text(
+        self,
+        query: str,
+        category: Optional[str] = None,
+        language: Optional[str] = None,
+        limit: int = 20,
+    ) -> List[Tuple[Topic, float]]:
+        """Rank topics by query terms found in title, keywords and summary."""
+        candidates = await self.search(category=category, language=language, limit=len(self._topics))
+        return _rank_text(query, candidates)[:limit]
+
     async def get_by_keyword(self, keyword: str, limit: int = 10) -> List[Topic]:
         """Get topics containing a keyword."""
         results = [
@@ -251,6 +433,30 @@ class MockVectorRepository(BaseVectorRepository):
         """Get total number of vectors."""
         return len(self._vectors)
 
+    async def delete_batch(self, ids: List[str]) -> int:
+        """Delete vectors by ID."""
+        for id in ids:
+            self._vectors.pop(id, None)
+        return len(ids)
+
+    async def scroll_iter(
+        self,
+        batch_size: int = 256,
+        filters: Optional[Dict[str, Any]] = None,
+        with_vectors: bool = True,
+    ):
+        """Stream vectors one page at a time."""
+        page = []
+        for id, (vector, metadata) in list(self._vectors.items()):
+            if filters and not all(metadata.get(k) == v for k, v in filters.items()):
+                continue
+            page.append((id, vector if with_vectors else None, metadata))
+            if len(page) == batch_size:
+                yield page
+                page = []
+        if page:
+            yield page
+
 
 class MockCacheRepository:
     """In-memory mock implementation of CacheRepository."""
@@ -259,6 +465,10 @@ class MockCacheRepository:
         self._cache: Dict[str, Any] = {}
         self._hashes: Dict[str, Dict[str, Any]] = {}
         self._counters: Dict[str, int] = {}
+        self._tags: Dict[str, set] = {}
+        self._generations: Dict[str, int] = {}
+        self._lex: Dict[str, Dict[str, Tuple[str, float]]] = {}
+        self._lex_top_k: Dict[str, int] = {}
 
     async def get(self, key: str) -> Optional[Any]:
         """Get a value from cache."""
@@ -272,6 +482,103 @@ class MockCacheRepository:
         # Note: TTL not implemented in mock
         return True
 
+    async def get_many(self, keys: List[str]) -> List[Optional[Any]]:
+        """Get multiple values from cache."""
+        return [self._cache.get(key) for key in keys]
+
+    async def set_many(
+        self, mapping: Dict[str, Any], ttl_seconds: Optional[int] = None
+    ) -> bool:
+        """Set multiple values in cache."""
+        self._cache.update(mapping)
+        return True
+
+    async def set_if_not_exists(
+        self, key: str, value: Any, ttl_seconds: Optional[int] = None
+    ) -> bool:
+        """Set a value only if the key is absent."""
+        if key in self._cache:
+            return False
+        self._cache[key] = value
+        return True
+
+    async def set_with_tags(
+        self,
+        key: str,
+        value: Any,
+        tags: List[str],
+        ttl_seconds: Optional[int] = None,
+        tag_ttl_seconds: int = 86400,
+        generations: Optional[List[int]] = None,
+    ) -> bool:
+        """Set a value and register its key under each tag."""
+        if generations is not None and await self.get_tag_generations(tags) != generations:
+            return False
+        self._cache[key] = value
+        for tag in tags:
+            self._tags.setdefault(tag, set()).add(key)
+        return True
+
+    async def get_tag_generations(self, tags: List[str]) -> List[int]:
+        """Get how many times each tag has been invalidated."""
+        return [self._generations.get(tag, 0) for tag in tags]
+
+    async def invalidate_tags(self, tags: List[str]) -> int:
+        """Delete all keys registered under the tags and bump their generations."""
+        keys = set()
+        for tag in tags:
+            keys.update(self._tags.pop(tag, set()))
+            self._generations[tag] = self._generations.get(tag, 0) + 1
+        deleted = [key for key in keys if self._cache.pop(key, None) is not None]
+        return len(deleted)
+
+    async def prefix_index_add(
+        self,
+        key: str,
+        entries: Dict[str, Tuple[str, float]],
+        top_k: int = 20,
+        max_prefix_length: int = 10,
+    ) -> int:
+        """Add entries to an existing prefix index; text changes only with a higher weight."""
+        if key not in self._lex:
+            return 0
+        index = self._lex[key]
+        for member, (text, weight) in entries.items():
+            if member not in index or index[member][1] < weight:
+                index[member] = (text, weight)
+        self._lex_top_k[key] = top_k
+        return len(entries)
+
+    async def prefix_index_replace(
+        self,
+        key: str,
+        entries: Dict[str, Tuple[str, float]],
+        top_k: int = 20,
+        max_prefix_length: int = 10,
+    ) -> int:
+        """Replace the entries of a prefix index."""
+        self._lex[key] = dict(entries)
+        self._lex_top_k[key] = top_k
+        return len(entries)
+
+    async def prefix_index_lookup(
+        self, key: str, prefix: str, limit: int, max_prefix_length: int = 10
+    ) -> Optional[List[Tuple[str, str, float]]]:
+        """Get the heaviest entries starting with a prefix (ties in member order)."""
+        if key not in self._lex:
+            return None
+        index = self._lex[key]
+        if len(prefix) <= max_prefix_length:
+            limit = min(limit, self._lex_top_k.get(key, limit))
+        matches = sorted(
+            (m for m in index if m.startswith(prefix)), key=lambda m: (-index[m][1], m)
+        )
+        return [(m, *index[m]) for m in matches[:limit]]
+
+    async def prefix_index_exists(self, key: str) -> bool:
+        """Check if a prefix index has been written."""
+        return key in self._lex
+
     async def delete(self, key: str) -> bool:
         """Delete a key from cache."""
         if key in self._cache:
@@ -308,4 +615,7 @@ class MockCacheRepository:
         self._cache.clear()
         self._hashes.clear()
         self._counters.clear()
+        self._tags.clear()
+        self._lex.clear()
+        self._lex_top_k.clear()
         return True
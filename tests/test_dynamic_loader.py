@@ -5,7 +5,7 @@ Unit tests for dynamic plugin loader.
 import pytest
 import asyncio
 from datetime import datetime
-from unittest.mock import Mock, patch, AsyncMock
+from unittest.mock import patch, AsyncMock
 
 from trend_agent.ingestion.dynamic_loader import (
     DynamicPluginLoader,
@@ -68,11 +68,11 @@ class TestDynamicPluginLoader:
     @pytest.mark.asyncio
     async def test_collect_rss(self, loader, rss_config):
         """Test RSS collection with mocked response."""
-        with patch.object(loader, '_get_http_client') as mock_get_client:
-            # Mock HTTP client
-            mock_client = AsyncMock()
-            mock_response = Mock()
-            mock_response.text = '''<?xml version="1.0"?>
+        fetcher = loader._get_feed_fetcher()
+        with patch.object(fetcher, '_request', new_callable=AsyncMock) as mock_request, \
+                patch.object(fetcher, '_get_cache_repo', new_callable=AsyncMock, return_value=None):
+            # Mock HTTP response
+            body = b'''<?xml version="1.0"?>
 <rss version="2.0">
     <channel>
         <title>Test Feed</title>
@@ -84,17 +84,23 @@ class TestDynamicPluginLoader:
         </item>
     </channel>
 </rss>'''
-            mock_response.raise_for_status = Mock()
-            mock_client.get.return_value = mock_response
-            mock_get_client.return_value = mock_client
+            mock_request.return_value = (200, {'ETag': '"v1"'}, body)
 
             # Create and run collector
-            collector_impl = loader._create_rss_collector(rss_config)
-            items = await collector_impl(rss_config)
+            plugin = loader.create_collector(rss_config)
+            items = await plugin.collect()
 
             assert len(items) > 0
             assert all(isinstance(item, RawItem) for item in items)
 
+            # Items stored: feed state committed
+            await plugin.on_saved(items)
+
+            # Unchanged feed: conditional GET answered with 304
+            mock_request.return_value = (304, {}, b'')
+            assert await plugin.collect() == []
+            assert mock_request.call_args[0][1]['If-None-Match'] == '"v1"'
+
     def test_create_plugin_metadata(self, loader, rss_config):
         """Test plugin metadata creation."""
         plugin = loader.create_collector(rss_config)
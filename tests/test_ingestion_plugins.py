@@ -13,6 +13,7 @@ import asyncio
 import pytest
 from datetime import datetime
 from typing import List
+from unittest.mock import AsyncMock, patch
 
 from trend_agent.ingestion.base import (
     CollectorPlugin,
@@ -525,6 +526,312 @@ async def test_scheduler_integration_with_health():
         await scheduler.shutdown()
 
 
+# ============================================================================
+# Seen-Item Filter Tests
+# ============================================================================
+
+
+class RecordingItemRepository:
+    """Item repository double that records bulk writes."""
+
+    def __init__(self, recent=None, deleted=()):
+        self.recent = recent or []
+        self.deleted = set(deleted)  # source_ids with no row to update
+        self.saved_batches = []
+        self.metric_updates = []
+        self.lookups = []
+
+    async def get_recent_metrics(self, days: int = 7):
+        return self.recent
+
+    async def get_metrics_by_keys(self, keys):
+        self.lookups.append([source_id for _, source_id in keys])
+        wanted = set(keys)
+        return [row for row in self.recent if (row[0], row[1]) in wanted]
+
+    async def save_batch(self, items):
+        self.saved_batches.append([item.source_id for item in items])
+        return [item.id for item in items]
+
+    async def update_metrics_batch(self, items):
+        self.metric_updates.append([item.source_id for item in items])
+        return sum(1 for item in items if item.source_id not in self.deleted)
+
+
+@pytest.mark.asyncio
+async def test_scheduler_skips_already_stored_items():
+    """Repeated polls write only new items; warmed items are skipped."""
+    repo = RecordingItemRepository(
+        recent=[(SourceType.CUSTOM.value, "test-1", Metrics())]
+    )
+    scheduler = DefaultScheduler(storage_repo=repo)
+    plugin = MockSuccessCollector()
+
+    # test-1 is already stored (warmed from the repository)
+    await scheduler._execute_plugin(plugin)
+    assert repo.saved_batches == [["test-2"]]
+
+    # Nothing changed on the second poll
+    await scheduler._execute_plugin(plugin)
+    assert repo.saved_batches == [["test-2"]]
+    assert repo.metric_updates == []
+
+    stats = scheduler.get_ingest_stats()["mock_success"]
+    assert stats["new"] == 1
+    assert stats["unchanged"] == 3
+    assert stats["skip_ratio"] == 0.75
+
+
+@pytest.mark.asyncio
+async def test_seen_filter_routes_metric_changes_to_update():
+    """Items whose metrics changed get a metrics-only update."""
+    from trend_agent.ingestion.converters import batch_raw_to_processed
+    from trend_agent.ingestion.seen_filter import SeenItemFilter, save_collected_items
+
+    repo = RecordingItemRepository()
+    seen = SeenItemFilter(item_repo=repo, capacity=1000)
+    raw_items = await MockSuccessCollector().collect()
+
+    await save_collected_items(repo, batch_raw_to_processed(raw_items), seen_filter=seen)
+    assert repo.saved_batches == [["test-1", "test-2"]]
+
+    raw_items[0] = raw_items[0].model_copy(update={"metrics": Metrics(upvotes=10)})
+    partition = await save_collected_items(
+        repo, batch_raw_to_processed(raw_items), seen_filter=seen
+    )
+
+    assert [item.source_id for item in partition.changed] == ["test-1"]
+    assert [item.source_id for item in partition.unchanged] == ["test-2"]
+    assert repo.metric_updates == [["test-1"]]
+    assert len(repo.saved_batches) == 1
+
+
+@pytest.mark.asyncio
+async def test_seen_filter_upserts_warmed_items_with_changed_metrics():
+    """Warmed entries have no content digest, so a metrics change gets a full upsert."""
+    from trend_agent.ingestion.converters import batch_raw_to_processed
+    from trend_agent.ingestion.seen_filter import SeenItemFilter, save_collected_items
+
+    repo = RecordingItemRepository(
+        recent=[(SourceType.CUSTOM.value, "test-1", Metrics(upvotes=1))]
+    )
+    seen = SeenItemFilter(item_repo=repo, capacity=1000)
+    raw_items = await MockSuccessCollector().collect()
+    raw_items[0] = raw_items[0].model_copy(
+        update={"title": "Edited title", "metrics": Metrics(upvotes=5)}
+    )
+
+    partition = await save_collected_items(
+        repo, batch_raw_to_processed(raw_items), seen_filter=seen
+    )
+
+    assert [item.source_id for item in partition.new] == ["test-1", "test-2"]
+    assert repo.metric_updates == []
+
+    # The stored content is now known: a later metrics change is metrics-only
+    raw_items[0] = raw_items[0].model_copy(update={"metrics": Metrics(upvotes=9)})
+    partition = await save_collected_items(
+        repo, batch_raw_to_processed(raw_items), seen_filter=seen
+    )
+    assert [item.source_id for item in partition.changed] == ["test-1"]
+
+
+@pytest.mark.asyncio
+async def test_seen_filter_looks_up_seen_items_without_fingerprint():
+    """Bloom-positive keys evicted from the fingerprint LRU are resolved in one lookup."""
+    from trend_agent.ingestion.converters import batch_raw_to_processed
+    from trend_agent.ingestion.seen_filter import SeenItemFilter
+
+    repo = RecordingItemRepository(
+        recent=[
+            (SourceType.CUSTOM.value, "test-1", Metrics()),
+            (SourceType.CUSTOM.value, "test-2", Metrics(upvotes=1)),
+        ]
+    )
+    seen = SeenItemFilter(item_repo=repo, capacity=1000, max_fingerprints=1)
+    items = batch_raw_to_processed(await MockSuccessCollector().collect())
+
+    # Only test-2 keeps its fingerprint after warming
+    partition = await seen.partition(items)
+    assert repo.lookups == [["test-1"]]
+    assert [item.source_id for item in partition.unchanged] == ["test-1"]
+    assert [item.source_id for item in partition.new] == ["test-2"]
+
+    # Bloom false positive: no stored row, so a full upsert
+    repo.recent = []
+    seen._fingerprints.clear()
+    partition = await seen.partition(items[:1])
+    assert repo.lookups[-1] == ["test-1"]
+    assert [item.source_id for item in partition.new] == ["test-1"]
+
+
+@pytest.mark.asyncio
+async def test_seen_filter_upserts_items_deleted_before_metrics_update():
+    """Rows deleted since they were seen are rewritten instead of silently dropped."""
+    from trend_agent.ingestion.converters import batch_raw_to_processed
+    from trend_agent.ingestion.seen_filter import SeenItemFilter, save_collected_items
+
+    repo = RecordingItemRepository()
+    seen = SeenItemFilter(item_repo=repo, capacity=1000)
+    raw_items = await MockSuccessCollector().collect()
+    await save_collected_items(repo, batch_raw_to_processed(raw_items), seen_filter=seen)
+
+    # test-1 removed by retention cleanup, then its metrics change
+    repo.deleted.add("test-1")
+    raw_items[0] = raw_items[0].model_copy(update={"metrics": Metrics(upvotes=10)})
+    await save_collected_items(repo, batch_raw_to_processed(raw_items), seen_filter=seen)
+
+    assert repo.metric_updates == [["test-1"]]
+    assert repo.saved_batches[-1] == ["test-1"]
+
+
+# ============================================================================
+# Feed Fetcher Tests
+# ============================================================================
+
+
+def _rss(*items):
+    """Build an RSS document from (guid, pubDate) pairs."""
+    entries = "".join(
+        f"<item><title>Story {guid}</title><link>https://example.com/{guid}</link>"
+        f"<guid>{guid}</guid><pubDate>{date}</pubDate></item>"
+        for guid, date in items
+    )
+    return f'<?xml version="1.0"?><rss version="2.0"><channel><title>Feed</title>{entries}</channel></rss>'
+
+
+@pytest.mark.asyncio
+async def test_feed_fetcher_conditional_get_and_watermark():
+    """Unchanged feeds cost a 304; changed feeds only yield entries past the watermark."""
+    from aiohttp import web
+    from aiohttp.test_utils import TestServer
+    from trend_agent.ingestion.feed_fetcher import IncrementalFeedFetcher
+
+    feed = {"body": _rss(("a", "Mon, 01 Jan 2024 10:00:00 GMT"), ("b", "Mon, 01 Jan 2024 11:00:00 GMT")), "etag": '"v1"'}
+    conditional = []
+
+    async def handler(request):
+        conditional.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == feed["etag"]:
+            return web.Response(status=304)
+        return web.Response(text=feed["body"], content_type="application/rss+xml", headers={"ETag": feed["etag"]})
+
+    app = web.Application()
+    app.router.add_get("/feed", handler)
+
+    async with TestServer(app) as server:
+        url = str(server.make_url("/feed"))
+
+        async with IncrementalFeedFetcher() as fetcher:
+            first = await fetcher.fetch(url)
+            assert first.status == "updated"
+            assert [e.id for e in first.entries] == ["a", "b"]
+            assert await fetcher.commit([first.state_key]) == 1
+
+            second = await fetcher.fetch(url)
+            assert second.status == "not_modified"
+            assert second.entries == []
+            assert conditional == [None, '"v1"']
+
+            # New entry, plus one at the watermark and one older than it
+            feed["body"] = _rss(
+                ("c", "Mon, 01 Jan 2024 12:00:00 GMT"),
+                ("b", "Mon, 01 Jan 2024 11:00:00 GMT"),
+                ("old", "Sun, 31 Dec 2023 09:00:00 GMT"),
+            )
+            feed["etag"] = '"v2"'
+            third = await fetcher.fetch(url)
+            assert [e.id for e in third.entries] == ["c"]
+            await fetcher.commit([third.state_key])
+
+            # Separate state keys poll the same URL independently
+            other = await fetcher.fetch_many([url], state_key_prefix="other")
+            assert len(other[0].entries) == 3
+
+            stats = fetcher.get_stats()
+            assert stats["not_modified"] == 1
+            assert stats["skipped_entries"] == 2
+
+
+@pytest.mark.asyncio
+async def test_feed_fetcher_state_advances_only_on_commit():
+    """Entries of an uncommitted poll (e.g. a failed save) are returned again."""
+    from trend_agent.ingestion.feed_fetcher import IncrementalFeedFetcher
+    from trend_agent.ingestion.plugins.rss import RSSCollector
+
+    body = _rss(("a", "Mon, 01 Jan 2024 10:00:00 GMT")).encode()
+    fetcher = IncrementalFeedFetcher()
+    collector = RSSCollector(feed_urls=["https://example.com/feed"], feed_fetcher=fetcher)
+
+    with patch.object(fetcher, "_request", new_callable=AsyncMock) as mock_request:
+        mock_request.return_value = (200, {"ETag": '"v1"'}, body)
+
+        # Save failed: nothing committed, so the next poll is unconditional
+        assert len(await collector.collect()) == 1
+        assert len(await collector.collect()) == 1
+        assert "If-None-Match" not in mock_request.call_args[0][1]
+
+        await collector.on_saved([])
+        assert fetcher.get_stats()["pending_feeds"] == 0
+
+        mock_request.return_value = (304, {}, b"")
+        assert await collector.collect() == []
+        assert mock_request.call_args[0][1]["If-None-Match"] == '"v1"'
+
+        # A failed poll does not commit the state of an earlier one
+        mock_request.side_effect = RuntimeError("connection reset")
+        await collector.collect()
+        assert await fetcher.commit(["rss:https://example.com/feed"]) == 0
+
+    await fetcher.close()
+
+
+def test_feed_fetcher_state_shared_through_redis_per_event_loop():
+    """A factory-built repository is connected per event loop and shared by workers."""
+    from tests.mocks.storage import MockCacheRepository
+    from trend_agent.ingestion.feed_fetcher import IncrementalFeedFetcher
+
+    repos = []
+
+    def factory():
+        repo = MockCacheRepository()
+        repo._cache = repos[0]._cache if repos else repo._cache  # One Redis instance
+        repo.connect = AsyncMock()
+        repo.close = AsyncMock()
+        repos.append(repo)
+        return repo
+
+    url = "https://example.com/feed"
+    body = _rss(("a", "Mon, 01 Jan 2024 10:00:00 GMT")).encode()
+
+    async def poll(fetcher, response):
+        with patch.object(fetcher, "_request", new_callable=AsyncMock) as mock_request:
+            mock_request.return_value = response
+            result = await fetcher.fetch(url)
+            await fetcher.commit([result.state_key])
+            return result, mock_request.call_args[0][1]
+
+    worker = IncrementalFeedFetcher(cache_repo_factory=factory)
+    result, _ = asyncio.run(poll(worker, (200, {"ETag": '"v1"'}, body)))
+    assert len(result.entries) == 1
+
+    # Each asyncio.run gets its own connection; the previous one is closed
+    body = _rss(("b", "Mon, 01 Jan 2024 11:00:00 GMT"), ("a", "Mon, 01 Jan 2024 10:00:00 GMT")).encode()
+    result, _ = asyncio.run(poll(worker, (200, {"ETag": '"v2"'}, body)))
+    assert [entry.title for entry in result.entries] == ["Story b"]
+    assert len(repos) == 2
+    repos[0].close.assert_awaited_once()
+
+    # Another worker resumes from the committed state
+    other = IncrementalFeedFetcher(cache_repo_factory=factory)
+    result, headers = asyncio.run(poll(other, (304, {}, b"")))
+    assert result.status == "not_modified"
+    assert headers["If-None-Match"] == '"v2"'
+
+    asyncio.run(other.close())
+    repos[-1].close.assert_awaited_once()
+
+
 # ============================================================================
 # Integration Tests
 # ============================================================================
@@ -253,7 +253,7 @@ class TestExtraction:
 
     @pytest.mark.asyncio
     async def test_extract_key_points_with_items(
-        self, mock_llm_service, mock_trend, mock_llm_service
+        self, mock_llm_service, mock_trend
     ):
         """Test extraction with related items."""
         mock_llm_service.generate.return_value = '["Point 1", "Point 2", "Point 3"]'
@@ -421,3 +421,113 @@ class TestContextBuilding:
 
         assert "Related Content:" in context
         assert "Related article title" in context
+
+
+# ============================================================================
+# Concurrent Batch Extraction Tests
+# ============================================================================
+
+
+def _make_trends(count):
+    """Create simple trends for batch tests."""
+    return [
+        Trend(
+            id=uuid4(),
+            topic_id=uuid4(),
+            rank=i,
+            title=f"Trend number {i}",
+            summary=f"Summary {i}",
+            category=Category.TECHNOLOGY,
+            state=TrendState.EMERGING,
+            score=50.0,
+            sources=[SourceType.REDDIT],
+            item_count=10,
+            total_engagement=Metrics(upvotes=100),
+            velocity=10.0,
+            first_seen=datetime.utcnow(),
+            last_updated=datetime.utcnow(),
+            language="en",
+            metadata={},
+        )
+        for i in range(count)
+    ]
+
+
+class TestBatchExtraction:
+    """Tests for concurrent, combined-prompt key point extraction."""
+
+    @pytest.mark.asyncio
+    async def test_executor_bounds_concurrency_and_keeps_order(self):
+        """At most max_concurrency calls run at once; failures use the fallback."""
+        import asyncio
+        from trend_agent.services.llm_batch import LLMBatchExecutor
+
+        in_flight = 0
+        peak = 0
+
+        async def call(i):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if i == 3:
+                raise RuntimeError("rate limited")
+            return i * 10
+
+        executor = LLMBatchExecutor(max_concurrency=2)
+        results = await executor.run(
+            [lambda i=i: call(i) for i in range(6)],
+            fallback=lambda i, error: -i,
+        )
+
+        assert results == [0, 10, 20, -3, 40, 50]
+        assert peak == 2
+        assert executor.get_stats()["failures"] == 1
+
+    @pytest.mark.asyncio
+    async def test_batch_combines_trends_into_one_prompt(self, mock_llm_service):
+        """Trends share prompts; trends missing from a response are retried alone."""
+        import json
+
+        def respond(prompt, **kwargs):
+            if "### Trend" not in prompt:
+                return '["Individually extracted key point"]'
+            # Answer only the first trend of each combined prompt
+            return json.dumps({"1": ["Combined prompt key point"]})
+
+        mock_llm_service.generate.side_effect = respond
+        trends = _make_trends(5)
+
+        extractor = KeyPointExtractor(mock_llm_service, trends_per_prompt=3)
+        results = await extractor.extract_key_points_batch(trends)
+
+        # 2 combined prompts + 3 individual retries
+        assert mock_llm_service.generate.call_count == 5
+        assert results[trends[0].id] == ["Combined prompt key point."]
+        assert results[trends[3].id] == ["Combined prompt key point."]
+        assert results[trends[1].id] == ["Individually extracted key point."]
+        assert set(results) == {trend.id for trend in trends}
+
+    def test_factory_sizes_executor_for_provider(self, mock_llm_service):
+        """The configured provider sets the extractor's concurrency limit."""
+        from trend_agent.services.key_points import get_key_point_extractor
+
+        extractor = get_key_point_extractor(mock_llm_service, provider="anthropic")
+
+        assert extractor._batch_executor.max_concurrency == 4
+
+    def test_standard_pipeline_wires_extractor_into_ranker(self, mock_llm_service):
+        """A key point extractor given to the pipeline is used by its ranker."""
+        from tests.mocks.intelligence import MockEmbeddingService
+        from trend_agent.processing import create_standard_pipeline
+        from trend_agent.services.key_points import get_key_point_extractor
+
+        extractor = get_key_point_extractor(mock_llm_service, provider="openai")
+        pipeline = create_standard_pipeline(
+            MockEmbeddingService(), key_point_extractor=extractor
+        )
+
+        ranker = pipeline._stages[-1]._ranker
+        assert ranker._key_point_extractor is extractor
+        assert ranker._extract_key_points is True
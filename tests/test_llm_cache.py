@@ -0,0 +1,127 @@
+"""
+Unit tests for the LLM response cache.
+
+Tests the Redis and on-disk tiers, the disk size cap, Redis reconnects
+and the OpenAI service integration.
+"""
+
+import os
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from tests.mocks.storage import MockCacheRepository
+from trend_agent.services.llm import OpenAILLMService
+from trend_agent.services.llm_cache import LLMResponseCache
+
+
+def _openai_http_response(content: str, prompt_tokens: int, completion_tokens: int):
+    """Create a mock httpx response in OpenAI chat completion format."""
+    response = MagicMock()
+    response.status_code = 200
+    response.raise_for_status = MagicMock()
+    response.json.return_value = {
+        "choices": [{"message": {"content": content}}],
+        "usage": {"prompt_tokens": prompt_tokens, "completion_tokens": completion_tokens},
+    }
+    return response
+
+
+@pytest.mark.asyncio
+class TestLLMResponseCache:
+    """Tests for caching LLM responses to identical requests."""
+
+    async def test_identical_request_served_from_cache(self, tmp_path):
+        """Repeated low-temperature prompts hit Redis, then disk after Redis loss."""
+        service = OpenAILLMService(
+            api_key="test-key",
+            response_cache=LLMResponseCache(
+                cache_repo=MockCacheRepository(), disk_dir=str(tmp_path)
+            ),
+        )
+        service._client.post = AsyncMock(
+            return_value=_openai_http_response("Cached summary", 100, 50)
+        )
+
+        first = await service.generate("Summarize this", temperature=0.3)
+        second = await service.generate("Summarize this", temperature=0.3)
+
+        assert first == second == "Cached summary"
+        assert service._client.post.call_count == 1
+        stats = service.get_usage_stats()
+        assert stats["cache_tokens_saved"] == 150
+        assert stats["cache_cost_saved_usd"] == pytest.approx(stats["total_cost_usd"])
+        assert stats["cache"]["hits_by_tier"] == {"redis": 1, "disk": 0}
+
+        # A new worker with an empty Redis still finds the response on disk
+        service = OpenAILLMService(
+            api_key="test-key",
+            response_cache=LLMResponseCache(
+                cache_repo=MockCacheRepository(), disk_dir=str(tmp_path)
+            ),
+        )
+        service._client.post = AsyncMock()
+
+        assert await service.generate("Summarize this", temperature=0.3) == "Cached summary"
+        service._client.post.assert_not_called()
+
+    async def test_high_temperature_and_opt_out_bypass_cache(self, tmp_path):
+        """Sampled requests and use_cache=False always call the provider."""
+        service = OpenAILLMService(
+            api_key="test-key",
+            response_cache=LLMResponseCache(disk_dir=str(tmp_path), max_temperature=0.5),
+        )
+        service._client.post = AsyncMock(
+            return_value=_openai_http_response("Fresh text", 10, 10)
+        )
+
+        await service.generate("Write a headline", temperature=0.9)
+        await service.generate("Write a headline", temperature=0.9)
+        await service.generate("Tag this", temperature=0.3, use_cache=False)
+        await service.generate("Tag this", temperature=0.3, use_cache=False)
+
+        assert service._client.post.call_count == 4
+        assert "use_cache" not in service._client.post.call_args.kwargs["json"]
+        assert service.get_usage_stats()["cache"]["cache_skipped"] == 4
+
+    async def test_disk_tier_evicts_least_recently_used_files(self, tmp_path):
+        """The on-disk tier stays under its size cap, dropping unused entries first."""
+        cache = LLMResponseCache(disk_dir=str(tmp_path), max_disk_bytes=2500)
+        response = {"content": "x" * 900, "input_tokens": 1, "output_tokens": 1}
+        keys = [cache.make_key("openai", "m", [{"role": "user", "content": str(i)}], 0, 10)
+                for i in range(3)]
+
+        await cache.set(keys[0], response)
+        await cache.set(keys[1], response)
+        # Make the first entry the most recently used
+        old = time.time() - 100
+        os.utime(cache._disk_path(keys[1]), (old, old))
+        assert (await cache.get(keys[0]))[1] == "disk"
+
+        await cache.set(keys[2], response)
+
+        assert cache._disk_path(keys[0]).exists()
+        assert not cache._disk_path(keys[1]).exists()
+        assert cache._disk_path(keys[2]).exists()
+        assert cache.get_stats()["disk_evicted"] == 1
+
+    async def test_redis_reconnect_after_cooldown(self, monkeypatch):
+        """A failed Redis connection is retried after the cooldown, not disabled for good."""
+        repo = MockCacheRepository()
+        repo.connect = AsyncMock(side_effect=[ConnectionError("down"), None])
+        cache = LLMResponseCache(cache_repo=repo, redis_retry_seconds=30)
+        key = cache.make_key("openai", "m", [{"role": "user", "content": "hi"}], 0, 10)
+
+        clock = [1000.0]
+        monkeypatch.setattr("trend_agent.services.llm_cache.time.monotonic", lambda: clock[0])
+
+        await cache.set(key, {"content": "hello"})
+        await cache.set(key, {"content": "hello"})
+        assert repo.connect.await_count == 1
+        assert await repo.get(key) is None
+
+        clock[0] += 31
+        await cache.set(key, {"content": "hello"})
+        assert repo.connect.await_count == 2
+        assert await repo.get(key) == {"content": "hello"}
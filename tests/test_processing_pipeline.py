@@ -4,9 +4,12 @@ Integration tests for processing pipeline.
 Tests the complete pipeline from raw items to ranked trends using mock services.
 """
 
+import asyncio
+
 import pytest
 from datetime import datetime, timedelta
 from typing import List
+from unittest.mock import ANY, AsyncMock
 
 from trend_agent.processing.pipeline import (
     ProcessingPipeline,
@@ -443,6 +446,528 @@ async def test_pipeline_config_application(embedding_service):
     assert result.status in [ProcessingStatus.COMPLETED, ProcessingStatus.FAILED]
 
 
+# ============================================================================
+# Embedding Cache Tests
+# ============================================================================
+
+
+class CountingEmbeddingService(MockEmbeddingService):
+    """Mock embedding service that counts embedded texts."""
+
+    def __init__(self):
+        super().__init__(dimension=64)
+        self.embedded_texts = 0
+
+    async def embed_batch(self, texts: List[str]) -> List[List[float]]:
+        self.embedded_texts += len(texts)
+        return await super().embed_batch(texts)
+
+
+@pytest.mark.asyncio
+async def test_embedding_cache_shared_across_stages():
+    """Test that dedup and clustering embed each item only once."""
+    from trend_agent.processing.embedding_cache import EmbeddingCache
+    from trend_agent.schemas import ProcessedItem
+
+    service = CountingEmbeddingService()
+    cache = EmbeddingCache(service)
+
+    now = datetime.utcnow()
+    items = [
+        ProcessedItem(
+            source=SourceType.REDDIT,
+            source_id=f"item{i}",
+            url=f"https://example.com/{i}",
+            title=f"Story number {i}",
+            title_normalized=f"story number {i}",
+            published_at=now,
+            collected_at=now,
+            metrics=Metrics(upvotes=i),
+        )
+        for i in range(6)
+    ]
+
+    deduplicator = EmbeddingDeduplicator(service, embedding_cache=cache)
+    unique_items = await deduplicator.remove_duplicates(items)
+    assert service.embedded_texts == len(items)
+    assert all(item.embedding for item in unique_items)
+
+    clusterer = HDBSCANClusterer(service, embedding_cache=cache)
+    await clusterer.cluster(unique_items, min_cluster_size=2)
+    assert service.embedded_texts == len(items)
+
+    stats = cache.get_stats()
+    assert stats["cache_misses"] == len(items)
+    assert stats["hits_by_tier"]["item"] == len(unique_items)
+
+
+@pytest.mark.asyncio
+async def test_embedding_cache_content_addressed():
+    """Test that identical texts are embedded once and served from memory."""
+    from trend_agent.processing.embedding_cache import EmbeddingCache
+
+    service = CountingEmbeddingService()
+    cache = EmbeddingCache(service, max_entries=2)
+
+    first = await cache.embed_texts(["a", "b", "a"])
+    assert service.embedded_texts == 2
+    assert first[0] == first[2]
+
+    second = await cache.embed_texts(["a", "b"])
+    assert service.embedded_texts == 2
+    assert second == first[:2]
+
+    # LRU evicts the least recently used entry
+    await cache.embed_texts(["c"])
+    await cache.embed_texts(["a"])
+    assert service.embedded_texts == 4
+
+
+@pytest.mark.asyncio
+async def test_embedding_cache_reads_redis_in_one_round_trip():
+    """Test that memory misses are read from Redis with a single MGET."""
+    from tests.mocks.storage import MockCacheRepository
+    from trend_agent.processing.embedding_cache import EmbeddingCache
+
+    service = CountingEmbeddingService()
+    cache_repo = MockCacheRepository()
+    vectors = await EmbeddingCache(service, cache_repo=cache_repo).embed_texts(["a", "b"])
+
+    cache_repo.get = AsyncMock(side_effect=AssertionError("one GET per key"))
+    cache_repo.get_many = AsyncMock(wraps=cache_repo.get_many)
+    other = EmbeddingCache(service, cache_repo=cache_repo)
+
+    assert await other.embed_texts(["a", "b", "a", "c"]) == [*vectors, vectors[0], ANY]
+    cache_repo.get_many.assert_awaited_once()
+    assert cache_repo.get_many.await_args.args[0] == [
+        other._generate_cache_key(text) for text in ("a", "b", "c")
+    ]
+    assert service.embedded_texts == 3
+    assert other.get_stats()["hits_by_tier"]["redis"] == 3
+
+
+# ============================================================================
+# Near-Duplicate Engine Tests
+# ============================================================================
+
+
+def _dense_greedy_groups(embeddings, threshold):
+    """Reference implementation: dense similarity matrix + nested loops."""
+    from sklearn.metrics.pairwise import cosine_similarity
+
+    similarities = cosine_similarity(embeddings)
+    used = set()
+    groups = []
+    for i in range(len(embeddings)):
+        if i in used:
+            continue
+        group = [i]
+        used.add(i)
+        for j in range(i + 1, len(embeddings)):
+            if j not in used and similarities[i][j] > threshold:
+                group.append(j)
+                used.add(j)
+        groups.append(group)
+    return groups
+
+
+def _planted_duplicates(n_clusters=40, per_cluster=4, dimension=32, noise=0.15):
+    """Random embeddings with planted near-duplicate clusters."""
+    import numpy as np
+
+    rng = np.random.default_rng(7)
+    centers = rng.standard_normal((n_clusters, dimension))
+    vectors = np.repeat(centers, per_cluster, axis=0)
+    vectors += noise * rng.standard_normal(vectors.shape)
+    return vectors[rng.permutation(len(vectors))].tolist()
+
+
+def test_near_duplicate_finder_matches_dense_groups():
+    """Test that blocked search returns the same groups as the dense path."""
+    from trend_agent.processing.near_duplicates import NearDuplicateFinder
+
+    embeddings = _planted_duplicates()
+    for threshold in (0.8, 0.92, 0.97):
+        expected = _dense_greedy_groups(embeddings, threshold)
+        finder = NearDuplicateFinder(block_size=17)
+        assert finder.group(embeddings, threshold) == expected
+
+
+def test_near_duplicate_finder_transitive_and_lsh():
+    """Test union-find grouping and LSH candidate pre-filter."""
+    from trend_agent.processing.near_duplicates import NearDuplicateFinder
+
+    # a~b and b~c, but a and c are not similar enough
+    embeddings = [[1.0, 0.0], [0.96, 0.28], [0.84, 0.54], [-1.0, 0.0]]
+    finder = NearDuplicateFinder()
+    assert finder.group(embeddings, 0.95) == [[0, 1], [2], [3]]
+    assert finder.group(embeddings, 0.95, transitive=True) == [[0, 1, 2], [3]]
+
+    planted = _planted_duplicates()
+    exact_rows, exact_cols = NearDuplicateFinder().find_pairs(planted, 0.9)
+    lsh_rows, lsh_cols = NearDuplicateFinder(use_lsh=True).find_pairs(planted, 0.9)
+    exact_pairs = set(zip(exact_rows.tolist(), exact_cols.tolist()))
+    lsh_pairs = set(zip(lsh_rows.tolist(), lsh_cols.tolist()))
+    assert lsh_pairs <= exact_pairs
+    assert len(lsh_pairs) >= 0.95 * len(exact_pairs)
+
+
+# ============================================================================
+# Streaming Tests
+# ============================================================================
+
+
+class SlowStage(NormalizerStage):
+    """Per-item stage that yields to the event loop to build up queues."""
+
+    async def process(self, items):
+        await asyncio.sleep(0.01)
+        return await super().process(items)
+
+    def get_stage_name(self) -> str:
+        return "slow"
+
+
+@pytest.mark.asyncio
+async def test_streaming_matches_batch_run(embedding_service, raw_items):
+    """Streaming mode produces the same items and counts as a batch run."""
+    batch_result = await create_minimal_pipeline(embedding_service).run(raw_items)
+    streaming_config = PipelineConfig(streaming=True, stream_batch_size=3)
+    stream_result = await create_minimal_pipeline(
+        embedding_service, config=streaming_config
+    ).run(raw_items)
+
+    assert stream_result.status == ProcessingStatus.COMPLETED
+    assert stream_result.items_collected == batch_result.items_collected
+    assert stream_result.items_deduplicated == batch_result.items_deduplicated
+
+    def titles(result):
+        return [item.title_normalized for item in result.metadata["processed_items"]]
+
+    assert titles(stream_result) == titles(batch_result)
+
+    # Only the leading per-item stage is streamed
+    stats = stream_result.metadata["stream_stats"]
+    assert [s["stage"] for s in stats] == ["normalizer"]
+    assert stats[0]["items_in"] == len(raw_items)
+    assert stats[0]["batches"] == 7
+
+
+@pytest.mark.asyncio
+async def test_streaming_backpressure_and_async_source(fixtures):
+    """A slow stage fills its bounded queue and blocks the producer."""
+    items = fixtures.get_raw_items(40)
+
+    async def source():
+        for item in items:
+            yield item
+
+    pipeline = ProcessingPipeline(
+        config=PipelineConfig(streaming=True, stream_batch_size=2, stream_queue_size=1)
+    )
+    pipeline.add_stage(SlowStage())
+    pipeline.add_stage(LanguageDetectorStage())
+
+    result = await pipeline.run(source())
+
+    assert result.items_collected == 40
+    assert len(result.metadata["processed_items"]) == 40
+    slow_stats, language_stats = result.metadata["stream_stats"]
+    assert slow_stats["max_queue_depth"] == 1
+    assert slow_stats["backpressure_waits"] > 0
+    assert slow_stats["backpressure_seconds"] > 0
+    assert language_stats["items_out"] == 40
+
+
+# ============================================================================
+# CPU Executor Tests
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_cpu_executor_matches_inline_stages(fixtures):
+    """Normalization and language detection give the same results in worker processes."""
+    from trend_agent.processing.cpu_executor import CPUExecutor
+
+    raw = fixtures.get_raw_items(30)
+    pipeline = ProcessingPipeline()
+    inline_items = pipeline._convert_to_processed_items(raw)
+    pooled_items = pipeline._convert_to_processed_items(raw)
+
+    for stage in (NormalizerStage(), LanguageDetectorStage()):
+        inline_items = await stage.process(inline_items)
+
+    executor = CPUExecutor(max_workers=2, chunk_size=4)
+    try:
+        for stage in (
+            NormalizerStage(cpu_executor=executor),
+            LanguageDetectorStage(cpu_executor=executor),
+        ):
+            pooled_items = await stage.process(pooled_items)
+    finally:
+        executor.shutdown()
+
+    for inline, pooled in zip(inline_items, pooled_items):
+        assert pooled.title_normalized == inline.title_normalized
+        assert pooled.content_normalized == inline.content_normalized
+        assert pooled.description == inline.description
+        assert pooled.language == inline.language
+        assert pooled.metadata["language_confidence"] == pytest.approx(
+            inline.metadata["language_confidence"]
+        )
+
+
+@pytest.mark.asyncio
+async def test_cpu_executor_falls_back_to_thread(monkeypatch):
+    """Work still runs when worker processes cannot be started."""
+    from trend_agent.processing import cpu_executor as cpu_executor_module
+    from trend_agent.processing.normalizer import normalize_text_sync
+
+    def refuse(*args, **kwargs):
+        raise AssertionError("daemonic processes are not allowed to have children")
+
+    monkeypatch.setattr(cpu_executor_module, "ProcessPoolExecutor", refuse)
+    executor = cpu_executor_module.CPUExecutor(max_workers=2)
+
+    results = await executor.map(normalize_text_sync, ["  a&amp;b  ", "x\t\ty"])
+
+    assert results == ["a&b", "x y"]
+
+
+# ============================================================================
+# Entity Extraction Tests
+# ============================================================================
+
+
+def _ruler_nlp():
+    """Blank English pipeline with a rule-based entity recognizer."""
+    spacy = pytest.importorskip("spacy")
+    nlp = spacy.blank("en")
+    ruler = nlp.add_pipe("entity_ruler", name="ner")
+    ruler.add_patterns([
+        {"label": "ORG", "pattern": "OpenAI"},
+        {"label": "GPE", "pattern": "Tokyo"},
+    ])
+    return nlp
+
+
+@pytest.mark.asyncio
+async def test_entity_extraction_batched_and_cached():
+    """All item texts go through one nlp.pipe call; repeats hit the cache."""
+    from tests.mocks.storage import MockCacheRepository
+    from trend_agent.processing.entities import EntityExtractor
+    from trend_agent.processing.normalizer import TextNormalizer
+
+    nlp = _ruler_nlp()
+    pipe_calls = []
+    original_pipe = nlp.pipe
+
+    def counting_pipe(texts, **kwargs):
+        texts = list(texts)
+        pipe_calls.append(len(texts))
+        return original_pipe(texts, **kwargs)
+
+    nlp.pipe = counting_pipe
+    cache_repo = MockCacheRepository()
+    extractor = EntityExtractor(nlp=nlp, cache_repo=cache_repo)
+    stage = NormalizerStage(
+        normalizer=TextNormalizer(enable_entity_extraction=True, entity_extractor=extractor)
+    )
+
+    titles = ["OpenAI opens Tokyo office", "Tokyo weather", "OpenAI opens Tokyo office"]
+    items = ProcessingPipeline()._convert_to_processed_items(
+        Fixtures().get_raw_items(len(titles))
+    )
+    for item, title in zip(items, titles):
+        item.title = title
+        item.content = None
+
+    items = await stage.process(items)
+
+    # Duplicate text analyzed once, in a single batch
+    assert pipe_calls == [2]
+    assert items[0].metadata["entities"] == {"ORG": ["OpenAI"], "GPE": ["Tokyo"]}
+    assert items[1].metadata["entities"] == {"GPE": ["Tokyo"]}
+
+    # A fresh extractor reuses the Redis tier instead of running spaCy again
+    extractor = EntityExtractor(nlp=nlp, cache_repo=cache_repo)
+    results = await extractor.extract_batch(["OpenAI opens Tokyo office", "ab"])
+
+    assert pipe_calls == [2]
+    assert results == [{"ORG": ["OpenAI"], "GPE": ["Tokyo"]}, {}]
+    assert extractor.get_stats()["hits_by_tier"]["redis"] == 1
+
+
+@pytest.mark.asyncio
+async def test_entity_extraction_failure_is_not_cached():
+    """A failed nlp.pipe batch returns empty entities without caching them."""
+    from tests.mocks.storage import MockCacheRepository
+    from trend_agent.processing.entities import EntityExtractor
+
+    nlp = _ruler_nlp()
+    original_pipe = nlp.pipe
+    nlp.pipe = lambda texts, **kwargs: (_ for _ in ()).throw(RuntimeError("model crashed"))
+    cache_repo = MockCacheRepository()
+    extractor = EntityExtractor(nlp=nlp, cache_repo=cache_repo)
+
+    assert await extractor.extract_batch(["OpenAI opens Tokyo office"]) == [{}]
+    assert extractor.get_stats()["memory_entries"] == 0
+    assert cache_repo._cache == {}
+
+    # The next call analyzes the text again
+    nlp.pipe = original_pipe
+    results = await extractor.extract_batch(["OpenAI opens Tokyo office"])
+    assert results == [{"ORG": ["OpenAI"], "GPE": ["Tokyo"]}]
+
+
+def _planted_items(prefix, centers, per_center, seed):
+    """Items whose embeddings lie close to the given centers."""
+    import numpy as np
+    from trend_agent.schemas import ProcessedItem
+
+    rng = np.random.default_rng(seed)
+    now = datetime.utcnow()
+    items = []
+    for c, center in enumerate(centers):
+        for i in range(per_center):
+            vector = center + rng.normal(scale=0.01, size=len(center))
+            items.append(
+                ProcessedItem(
+                    source=SourceType.REDDIT,
+                    source_id=f"{prefix}-{c}-{i}",
+                    url=f"https://example.com/{prefix}/{c}/{i}",
+                    title=f"Story {c} update {i}",
+                    title_normalized=f"story {c} update {i}",
+                    published_at=now,
+                    collected_at=now,
+                    metrics=Metrics(upvotes=10),
+                    embedding=vector.tolist(),
+                )
+            )
+    return items
+
+
+@pytest.mark.asyncio
+async def test_incremental_clustering_reuses_known_topics(embedding_service):
+    """A later run attaches matching items to topics from an earlier run."""
+    import numpy as np
+    from tests.mocks.storage import MockCacheRepository
+    from trend_agent.processing.topic_index import TopicIndex
+
+    centers = np.eye(16)[:3] * 10
+    cache_repo = MockCacheRepository()
+
+    clusterer = HDBSCANClusterer(
+        embedding_service, topic_index=TopicIndex(cache_repo=cache_repo)
+    )
+    first = await clusterer.cluster(_planted_items("a", centers[:2], 6, seed=1), 3)
+    first_ids = {t.id for t in first if not t.metadata.get("is_noise_cluster")}
+    assert len(first_ids) == 2
+
+    # Fresh index instance, as in the next processing task run
+    clusterer = HDBSCANClusterer(
+        embedding_service, topic_index=TopicIndex(cache_repo=cache_repo)
+    )
+    second = await clusterer.cluster(_planted_items("b", centers, 4, seed=2), 3)
+
+    existing = [t for t in second if t.metadata.get("is_existing_topic")]
+    new = [t for t in second if not t.metadata.get("is_existing_topic")]
+
+    assert {t.id for t in existing} == first_ids
+    assert all(t.item_count == 10 for t in existing)
+    assert all(t.metadata["items_added"] == 4 for t in existing)
+    assert len(new) == 1 and new[0].item_count == 4
+    assert new[0].id not in first_ids
+
+
+ARTICLE_HTML = (
+    "<html><head><title>Launch</title></head><body><article>"
+    + "<p>The rocket launched on schedule and reached orbit after a short delay. "
+    "Engineers said every stage performed as expected during the flight.</p>" * 5
+    + "</article></body></html>"
+)
+
+
+@pytest.mark.asyncio
+async def test_content_fetch_service_caches_and_revalidates():
+    """Fresh entries skip the network; stale ones are revalidated with a 304."""
+    from aiohttp import web
+    from aiohttp.test_utils import TestServer
+    from trend_agent.processing.content_fetcher import ContentFetchService
+
+    requests = []
+
+    async def article(request):
+        requests.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return web.Response(status=304)
+        return web.Response(text=ARTICLE_HTML, content_type="text/html", headers={"ETag": '"v1"'})
+
+    app = web.Application()
+    app.router.add_get("/{name}", article)
+
+    async with TestServer(app) as server:
+        urls = [str(server.make_url(f"/story{i}")) for i in range(3)]
+
+        async with ContentFetchService(cache_ttl_seconds=3600) as fetcher:
+            results = dict([pair async for pair in fetcher.fetch_many(urls + urls[:1])])
+            assert set(results) == set(urls)
+            assert all("rocket launched" in content for content in results.values())
+            assert len(requests) == 3
+
+            # Fresh cache hit: no request
+            assert await fetcher.fetch(urls[0]) == results[urls[0]]
+            assert len(requests) == 3
+
+        # Stale entries are revalidated with a conditional GET
+        async with ContentFetchService(cache_ttl_seconds=0) as fetcher:
+            assert await fetcher.fetch(urls[0]) == results[urls[0]]
+            assert await fetcher.fetch(urls[0]) == results[urls[0]]
+            assert requests[-2:] == [None, '"v1"']
+            assert fetcher.get_stats()["not_modified"] == 1
+
+
+@pytest.mark.asyncio
+async def test_content_fetch_timeout_excludes_pool_wait():
+    """Requests queued behind a busy per-host pool do not time out while waiting."""
+    from aiohttp import web
+    from aiohttp.test_utils import TestServer
+    from trend_agent.processing.content_fetcher import ContentFetchService
+
+    async def slow_article(request):
+        await asyncio.sleep(0.4)
+        return web.Response(text=ARTICLE_HTML, content_type="text/html")
+
+    app = web.Application()
+    app.router.add_get("/{name}", slow_article)
+
+    async with TestServer(app) as server:
+        urls = [str(server.make_url(f"/slow{i}")) for i in range(3)]
+
+        # Served one at a time: the last request waits 0.8s for the pool
+        async with ContentFetchService(per_host_limit=1, timeout=0.6) as fetcher:
+            results = dict([pair async for pair in fetcher.fetch_many(urls)])
+
+    assert all(results[url] for url in urls)
+
+
+def test_content_fetch_session_closed_when_event_loop_changes():
+    """A session left from a finished event loop is closed, not just dropped."""
+    from trend_agent.processing.content_fetcher import ContentFetchService
+
+    fetcher = ContentFetchService()
+
+    async def get_session():
+        return await fetcher._pool.get()
+
+    first = asyncio.run(get_session())
+    second = asyncio.run(get_session())
+
+    assert first is not second
+    assert first.closed
+    asyncio.run(fetcher.close())
+
+
 # ============================================================================
 # Performance Tests
 # ============================================================================
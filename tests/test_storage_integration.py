@@ -218,6 +218,30 @@ async def test_trend_get_top_trends(trend_repo, fixtures):
         assert top_trends[i].rank <= top_trends[i + 1].rank
 
 
+@pytest.mark.asyncio
+async def test_trend_aggregate_stats_match_loaded_trends(trend_repo, fixtures):
+    """Test SQL aggregation agrees with counting the trends in Python."""
+    for trend in fixtures.get_trends(6):
+        await trend_repo.save(trend)
+
+    stats = await trend_repo.get_aggregate_stats(top_n=3)
+    trends = await trend_repo.search(TrendFilter(limit=100000))
+
+    assert stats["total_trends"] == len(trends)
+    assert sum(stats["by_category"].values()) == len(trends)
+    assert sum(stats["by_state"].values()) == len(trends)
+    assert sum(stats["by_source"].values()) == sum(len(t.sources) for t in trends)
+    assert stats["avg_score"] == pytest.approx(sum(t.score for t in trends) / len(trends))
+
+    scores = [t["score"] for t in stats["top_trends"]]
+    assert len(scores) == 3
+    assert scores == sorted(scores, reverse=True)
+
+    future = await trend_repo.get_aggregate_stats(date_from=datetime.utcnow() + timedelta(days=1))
+    assert future["total_trends"] == 0
+    assert future["by_category"] == {}
+
+
 # ============================================================================
 # PostgreSQL TopicRepository Tests
 # ============================================================================
@@ -343,6 +367,58 @@ async def test_item_batch_save(item_repo, fixtures):
         assert retrieved is not None
 
 
+@pytest.mark.asyncio
+async def test_item_batch_save_upsert_keeps_order(item_repo, fixtures):
+    """Test batch upsert returns existing IDs in input order."""
+    items = fixtures.get_processed_items(4)
+
+    # One item already exists under a different ID
+    existing_id = await item_repo.save(items[2])
+    items[2].id = None
+    items[2].title = "Updated by batch"
+
+    # Repeated (source, source_id) within the batch: last occurrence wins
+    duplicate = items[0].copy(update={"id": None, "title": "Last write"})
+    item_ids = await item_repo.save_batch(items + [duplicate])
+
+    assert len(item_ids) == 5
+    assert item_ids[2] == existing_id
+    assert item_ids[4] == item_ids[0]
+    assert len(set(item_ids)) == 4
+
+    for item, item_id in zip(items[1:], item_ids[1:]):
+        retrieved = await item_repo.get(item_id)
+        assert retrieved.source_id == item.source_id
+    assert (await item_repo.get(existing_id)).title == "Updated by batch"
+    assert (await item_repo.get(item_ids[0])).title == "Last write"
+
+
+@pytest.mark.asyncio
+async def test_topic_and_trend_batch_save(topic_repo, trend_repo, fixtures):
+    """Test batch saving topics and the trends that reference them."""
+    topics = fixtures.get_topics(3)
+    trends = fixtures.get_trends(3)
+    for topic, trend in zip(topics, trends):
+        topic.id = topic.id or uuid4()
+        trend.topic_id = topic.id
+
+    topic_ids = await topic_repo.save_batch(topics)
+    trend_ids = await trend_repo.save_batch(trends)
+
+    assert topic_ids == [topic.id for topic in topics]
+    assert len(trend_ids) == 3
+    for trend, trend_id in zip(trends, trend_ids):
+        retrieved = await trend_repo.get(trend_id)
+        assert retrieved is not None
+        assert retrieved.title == trend.title
+        assert retrieved.topic_id == trend.topic_id
+
+    # Saving again updates in place
+    trends[0].score = trends[0].score + 1
+    assert await trend_repo.save_batch(trends) == trend_ids
+    assert (await trend_repo.get(trend_ids[0])).score == trends[0].score
+
+
 # ============================================================================
 # Qdrant VectorRepository Tests
 # ============================================================================
@@ -561,6 +637,57 @@ async def test_cache_ttl(cache_repo):
     assert new_ttl > 10 and new_ttl <= 20
 
 
+@pytest.mark.asyncio
+async def test_cache_prefix_index(cache_repo, monkeypatch):
+    """Test prefix index weights, version swaps and adds racing a rebuild."""
+    key = "test_suggest"
+
+    # No index: lookups report it missing and adds do not create a partial one
+    assert await cache_repo.prefix_index_lookup(key, "al", 5, 3) is None
+    assert await cache_repo.prefix_index_add(key, {"alpha": ("Alpha", 1.0)}, 2, 3) == 0
+    assert await cache_repo.prefix_index_exists(key) is False
+
+    entries = {"alpha": ("Alpha", 1.0), "alpine": ("Alpine", 3.0), "beta": ("Beta", 2.0)}
+    assert await cache_repo.prefix_index_replace(key, entries, 2, 3) == 3
+    assert await cache_repo.prefix_index_lookup(key, "al", 5, 3) == [
+        ("alpine", "Alpine", 3.0),
+        ("alpha", "Alpha", 1.0),
+    ]
+
+    # The text changes only together with a higher weight; top-k sets are trimmed
+    await cache_repo.prefix_index_add(key, {"alpha": ("ALPHA", 5.0)}, 2, 3)
+    await cache_repo.prefix_index_add(key, {"alpha": ("alpha", 2.0), "alps": ("Alps", 4.0)}, 2, 3)
+    assert await cache_repo.prefix_index_lookup(key, "al", 5, 3) == [
+        ("alpha", "ALPHA", 5.0),
+        ("alps", "Alps", 4.0),
+    ]
+    # Longer prefixes scan every match
+    assert await cache_repo.prefix_index_lookup(key, "alpin", 5, 3) == [("alpine", "Alpine", 3.0)]
+
+    # A rebuild publishes a new version and retires the old one
+    old_version = int(await cache_repo.client.get(f"{key}:version"))
+    await cache_repo.prefix_index_replace(key, {"gamma": ("Gamma", 1.0)}, 2, 3)
+    assert await cache_repo.prefix_index_lookup(key, "al", 5, 3) == []
+    assert 0 < await cache_repo.client.ttl(f"{key}:v{old_version}:weight") <= 60
+
+    # An add racing a rebuild is retried against the new version
+    queue_entries = cache_repo._queue_prefix_entries
+    bases = []
+
+    async def queue_during_rebuild(pipe, base, *args):
+        bases.append(base)
+        if len(bases) == 1:
+            await cache_repo.prefix_index_replace(key, {"delta": ("Delta", 1.0)}, 2, 3)
+        await queue_entries(pipe, base, *args)
+
+    monkeypatch.setattr(cache_repo, "_queue_prefix_entries", queue_during_rebuild)
+    assert await cache_repo.prefix_index_add(key, {"epsilon": ("Epsilon", 2.0)}, 2, 3) == 1
+    assert bases[0] != bases[-1]
+    assert await cache_repo.prefix_index_lookup(key, "e", 5, 3) == [("epsilon", "Epsilon", 2.0)]
+    assert await cache_repo.prefix_index_lookup(key, "d", 5, 3) == [("delta", "Delta", 1.0)]
+    assert await cache_repo.prefix_index_lookup(key, "g", 5, 3) == []
+
+
 # ============================================================================
 # Integration Tests (Cross-repository)
 # ============================================================================
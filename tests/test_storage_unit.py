@@ -7,7 +7,9 @@ They use the mock implementations from tests/mocks/storage.py.
 Run with: pytest tests/test_storage_unit.py -v
 """
 
-from datetime import datetime
+import asyncio
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
 import pytest
@@ -19,7 +21,29 @@ from tests.mocks.storage import (
     MockTrendRepository,
     MockVectorRepository,
 )
-from trend_agent.schemas import Category, TrendFilter, TrendState, VectorMatch
+from trend_agent.schemas import (
+    Category,
+    SemanticSearchRequest,
+    TrendFilter,
+    TrendState,
+    VectorMatch,
+)
+from trend_agent.services.search import (
+    HybridSearchService,
+    QdrantSemanticSearchService,
+    QueryEmbeddingCache,
+    TrendObjectCache,
+)
+from trend_agent.storage.response_cache import (
+    TRENDS_LIST_TAG,
+    ResponseCache,
+    stable_cache_key,
+    trend_change_tags,
+    trend_tag,
+)
+from trend_agent.storage.interfaces import ConnectionError as StorageConnectionError
+from trend_agent.storage.suggestion_index import SuggestionIndex
+from trend_agent.storage.vector_writer import VectorIngestWriter
 
 
 # ============================================================================
@@ -183,6 +207,268 @@ async def test_trend_get_top_trends_sorted_by_rank(trend_repo, fixtures):
         assert top_trends[i].rank <= top_trends[i + 1].rank
 
 
+@pytest.mark.asyncio
+async def test_trend_get_many_preserves_order_and_filters(trend_repo, fixtures):
+    """Test bulk trend fetch keeps ID order and applies filters."""
+    trends = fixtures.get_trends(4)
+    for i, trend in enumerate(trends):
+        trend.score = float(i * 30)
+        await trend_repo.save(trend)
+
+    ids = [trends[2].id, uuid4(), trends[0].id, trends[3].id]
+    results = await trend_repo.get_many(ids)
+    assert [t.id for t in results] == [trends[2].id, trends[0].id, trends[3].id]
+
+    filtered = await trend_repo.get_many(ids, TrendFilter(min_score=50.0))
+    assert [t.id for t in filtered] == [trends[2].id, trends[3].id]
+
+
+@pytest.mark.asyncio
+async def test_semantic_search_hydrates_in_one_query(trend_repo, vector_repo, fixtures):
+    """Test search hydration uses get_many and reuses unchanged cached trends."""
+    trends = fixtures.get_trends(3)
+    for i, trend in enumerate(trends):
+        await trend_repo.save(trend)
+        await vector_repo.upsert(str(trend.id), [1.0, float(i) / 10], {})
+
+    embedding_service = MagicMock()
+    embedding_service.embed = AsyncMock(return_value=[1.0, 0.0])
+    cache = TrendObjectCache()
+    service = QdrantSemanticSearchService(
+        embedding_service=embedding_service,
+        vector_repository=vector_repo,
+        trend_repository=trend_repo,
+        trend_cache=cache,
+    )
+    request = SemanticSearchRequest(query="ai", limit=3, min_similarity=0.0)
+
+    results = await service.search(request)
+    assert [t.id for t in results] == [t.id for t in trends]
+    assert trend_repo.get_many_calls == 1
+
+    # Second search: version check only, every trend served from the cache
+    await service.search(request)
+    assert trend_repo.get_many_calls == 1
+    assert cache.get_stats()["hits"] == 3
+
+    # An updated trend is re-fetched, the others stay cached
+    updated = trends[1].copy(update={"last_updated": datetime.utcnow(), "title": "New"})
+    await trend_repo.save(updated)
+    results = await service.search(request)
+    assert trend_repo.get_many_calls == 2
+    assert results[1].title == "New"
+
+
+@pytest.mark.asyncio
+async def test_trend_get_many_filters_hits_by_substring_and_last_updated():
+    """Test hydration keeps the semantic search post-filter semantics."""
+    from trend_agent.storage.postgres import PostgreSQLTrendRepository
+
+    pool = MagicMock()
+    pool.fetch = AsyncMock(return_value=[])
+    repo = PostgreSQLTrendRepository(pool)
+    since = datetime(2024, 1, 1)
+    ids = [uuid4()]
+
+    await repo.get_many(
+        ids,
+        TrendFilter(category=Category.TECHNOLOGY, keywords=["5%_ai"], date_from=since),
+    )
+
+    sql, *params = pool.fetch.await_args.args
+    assert "last_updated >= $2" in sql and "first_seen" not in sql
+    assert "title ILIKE kw.pattern" in sql and "keywords &&" not in sql
+    assert "category" not in sql
+    assert params == [ids, since, ["%5\\%\\_ai%"]]
+
+
+@pytest.mark.asyncio
+async def test_semantic_search_hit_filters_match_substrings(trend_repo, vector_repo, fixtures):
+    """Test keyword filters match substrings of the title or keywords."""
+    trends = fixtures.get_trends(2)
+    trends[0].title = "Quantum computing milestone"
+    trends[0].keywords = ["physics"]
+    trends[1].title = "Football final"
+    trends[1].keywords = ["sport"]
+    for trend in trends:
+        await trend_repo.save(trend)
+        await vector_repo.upsert(str(trend.id), [1.0, 0.0], {})
+
+    embedding_service = MagicMock()
+    embedding_service.embed = AsyncMock(return_value=[1.0, 0.0])
+    service = QdrantSemanticSearchService(
+        embedding_service=embedding_service,
+        vector_repository=vector_repo,
+        trend_repository=trend_repo,
+    )
+    request = SemanticSearchRequest(
+        query="science", limit=5, min_similarity=0.0,
+        filters=TrendFilter(keywords=["QUANT", "phys"]),
+    )
+
+    results = await service.search(request)
+    assert [t.id for t in results] == [trends[0].id]
+
+
+@pytest.mark.asyncio
+async def test_semantic_search_degrades_when_hydration_fails(vector_repo):
+    """Test a trend database failure returns no hits instead of raising."""
+    trend_id = uuid4()
+    await vector_repo.upsert(str(trend_id), [1.0, 0.0], {})
+    trend_repo = MagicMock()
+    trend_repo.get_many = AsyncMock(side_effect=RuntimeError("db down"))
+
+    embedding_service = MagicMock()
+    embedding_service.embed = AsyncMock(return_value=[1.0, 0.0])
+    service = QdrantSemanticSearchService(
+        embedding_service=embedding_service,
+        vector_repository=vector_repo,
+        trend_repository=trend_repo,
+    )
+
+    request = SemanticSearchRequest(query="ai", limit=3, min_similarity=0.0)
+    assert await service.search(request) == []
+
+
+@pytest.mark.asyncio
+async def test_trend_search_text_uses_indexed_ranked_query():
+    """Test full-text search binds the query once and numbers filters after it."""
+    from trend_agent.storage.postgres import PostgreSQLTrendRepository
+
+    pool = MagicMock()
+    pool.fetch = AsyncMock(return_value=[])
+    repo = PostgreSQLTrendRepository(pool)
+
+    await repo.search_text("ai chips", TrendFilter(category=Category.TECHNOLOGY), limit=5)
+
+    sql, *params = pool.fetch.await_args.args
+    assert "websearch_to_tsquery('english', $1)" in sql
+    assert "search_vector @@ tsq OR $1 <% title" in sql
+    assert "ILIKE" not in sql
+    assert "category = $2" in sql and "LIMIT $3" in sql
+    assert params == ["ai chips", "Technology", 5]
+
+
+@pytest.mark.asyncio
+async def test_trend_search_page_uses_keyset_cursor():
+    """Test trend pages continue after the cursor row instead of using OFFSET."""
+    from trend_agent.storage.interfaces import InvalidCursorError
+    from trend_agent.storage.pagination import encode_cursor
+    from trend_agent.storage.postgres import PostgreSQLTrendRepository
+
+    pool = MagicMock()
+    pool.fetch = AsyncMock(return_value=[])
+    repo = PostgreSQLTrendRepository(pool)
+    last_id = uuid4()
+    cursor = encode_cursor("trends", [3, 42.5, str(last_id)])
+
+    trends, next_cursor = await repo.search_page(
+        TrendFilter(category=Category.TECHNOLOGY, limit=10, offset=500), cursor=cursor
+    )
+
+    sql, *params = pool.fetch.await_args.args
+    assert "OFFSET" not in sql
+    assert "ORDER BY rank, score DESC, id" in sql
+    assert "rank >= $2 AND (rank > $2 OR score < $3 OR (score = $3 AND id > $4))" in sql
+    assert params == ["Technology", 3, 42.5, last_id, 11]
+    assert trends == [] and next_cursor is None
+
+    with pytest.raises(InvalidCursorError):
+        await repo.search_page(TrendFilter(limit=10), cursor=encode_cursor("topics", ["x", "y"]))
+
+
+@pytest.mark.asyncio
+async def test_trend_pages_cover_all_trends_once(trend_repo, fixtures):
+    """Test walking cursor pages returns every trend exactly once, in rank order."""
+    trends = fixtures.get_trends(7)
+    for i, trend in enumerate(trends):
+        trend.rank = 1 + i // 3  # Ties on rank are broken by score, then id
+        await trend_repo.save(trend)
+
+    seen, cursor = [], None
+    while True:
+        page, cursor = await trend_repo.search_page(TrendFilter(limit=3), cursor=cursor)
+        seen.extend(page)
+        if cursor is None:
+            break
+
+    assert sorted(t.id for t in seen) == sorted(t.id for t in trends)
+    assert [t.rank for t in seen] == sorted(t.rank for t in trends)
+    assert await trend_repo.estimate_count() == 7
+
+
+@pytest.mark.asyncio
+async def test_hybrid_search_fuses_lexical_and_semantic_ranks(trend_repo, vector_repo, fixtures):
+    """Test RRF ranks trends found by both retrievers first and survives vector failures."""
+    trends = fixtures.get_trends(3)
+    titles = ["Quantum chip record", "Chip export rules", "Solar storage boom"]
+    for trend, title, vector in zip(trends, titles, [[0.0, 1.0], [1.0, 0.1], [1.0, 0.0]]):
+        trend.title = title
+        trend.keywords = []
+        trend.summary = ""
+        await trend_repo.save(trend)
+        await vector_repo.upsert(str(trend.id), vector, {})
+
+    embedding_service = MagicMock()
+    embedding_service.embed = AsyncMock(return_value=[1.0, 0.0])
+    semantic = QdrantSemanticSearchService(
+        embedding_service=embedding_service,
+        vector_repository=vector_repo,
+        trend_repository=trend_repo,
+    )
+    hybrid = HybridSearchService(trend_repo, semantic_search=semantic)
+    request = SemanticSearchRequest(query="chip", limit=3, min_similarity=0.5)
+
+    # Lexical: trends 0 and 1; semantic: trends 2 and 1
+    results = await hybrid.search(request)
+    assert results[0][0].id == trends[1].id
+    assert {t.id for t, _ in results} == {t.id for t in trends}
+
+    embedding_service.embed = AsyncMock(side_effect=RuntimeError("embedding API down"))
+    semantic.query_cache = QueryEmbeddingCache(embedding_service)
+    results = await hybrid.search(request.copy(update={"query": "solar"}))
+    assert [t.id for t, _ in results] == [trends[2].id]
+    assert hybrid.get_stats()["lexical_only_searches"] == 1
+
+
+@pytest.mark.asyncio
+async def test_query_embedding_cache_coalesces_and_normalizes(cache_repo):
+    """Test concurrent identical queries share one embed call."""
+    release = asyncio.Event()
+
+    async def slow_embed(text):
+        await release.wait()
+        return [float(len(text)), 1.0]
+
+    embedding_service = MagicMock()
+    embedding_service.get_model_name.return_value = "test-model"
+    embedding_service.embed = AsyncMock(side_effect=slow_embed)
+    query_cache = QueryEmbeddingCache(embedding_service, cache_repo=cache_repo)
+
+    waiters = [
+        asyncio.create_task(query_cache.get_embedding(q))
+        for q in ["AI  news", "ai news", " Ai News "]
+    ]
+    await asyncio.sleep(0)
+    release.set()
+    vectors = await asyncio.gather(*waiters)
+
+    assert embedding_service.embed.await_count == 1
+    # Normalization only builds the key: the model sees the query as typed
+    embedding_service.embed.assert_awaited_with("AI  news")
+    assert vectors[0] == vectors[1] == vectors[2]
+    assert await query_cache.get_embedding("AI NEWS") == vectors[0]
+
+    # A fresh process finds the vector in Redis
+    other = QueryEmbeddingCache(embedding_service, cache_repo=cache_repo)
+    assert await other.get_embedding("ai news") == vectors[0]
+    assert embedding_service.embed.await_count == 1
+
+    stats = query_cache.get_stats()
+    assert stats["lookups"] == {"memory": 1, "redis": 0, "coalesced": 2, "miss": 1}
+    assert stats["hit_rate_percent"] == 75.0
+
+
 # ============================================================================
 # TopicRepository Unit Tests
 # ============================================================================
@@ -360,6 +646,169 @@ async def test_vector_count(vector_repo):
     assert count == 5
 
 
+@pytest.mark.asyncio
+async def test_qdrant_repository_streams_pages_with_async_client():
+    """Test QdrantVectorRepository on the async client (in-memory Qdrant)."""
+    from qdrant_client import AsyncQdrantClient
+    from trend_agent.storage.qdrant import QdrantVectorRepository
+
+    repo = QdrantVectorRepository(collection_name="unit", vector_size=3)
+    await repo.client.close()
+    repo.client = AsyncQdrantClient(location=":memory:")
+
+    ids = [str(uuid4()) for _ in range(7)]
+    await repo.upsert_batch(
+        [(vec_id, [1.0, 0.0, float(i)], {"parity": i % 2}) for i, vec_id in enumerate(ids)]
+    )
+
+    pages = [page async for page in repo.scroll_iter(batch_size=3, with_vectors=False)]
+    assert [len(page) for page in pages] == [3, 3, 1]
+    assert all(vector is None for page in pages for _, vector, _ in page)
+
+    matches = await repo.search([1.0, 0.0, 0.0], limit=2, filters={"parity": 1})
+    assert len(matches) == 2
+    assert all(match.metadata["parity"] == 1 for match in matches)
+
+    assert await repo.delete_batch(ids[:2]) == 2
+    assert await repo.count() == 5
+    assert len(await repo.scroll_all(batch_size=2)) == 5
+
+    await repo.close()
+
+
+@pytest.mark.asyncio
+async def test_cleanup_orphaned_embeddings_streams_pages(vector_repo):
+    """Test orphan cleanup checks and deletes one page at a time."""
+    from trend_agent.tasks.scheduler import _cleanup_orphaned_embeddings
+
+    live = {str(uuid4()) for _ in range(3)}
+    orphaned = {str(uuid4()) for _ in range(4)}
+    for vec_id in live | orphaned:
+        await vector_repo.upsert(vec_id, [1.0], {})
+    await vector_repo.upsert("not-a-uuid", [1.0], {})
+
+    pool = MagicMock()
+    page_sizes = []
+
+    async def fetch(query, ids):
+        page_sizes.append(len(ids))
+        return [{"id": str(vec_id)} for vec_id in ids if str(vec_id) not in live]
+
+    pool.fetch = fetch
+
+    cleaned = await _cleanup_orphaned_embeddings(pool, [vector_repo], batch_size=3)
+
+    assert cleaned == 4
+    assert max(page_sizes) <= 3
+    assert await vector_repo.count() == 4
+    assert await vector_repo.get("not-a-uuid") is not None
+
+
+# ============================================================================
+# VectorIngestWriter Unit Tests
+# ============================================================================
+
+
+class FlakyVectorRepository(MockVectorRepository):
+    """Mock vector repository that rejects batches containing bad IDs."""
+
+    def __init__(self, bad_ids=(), delay: float = 0.0):
+        super().__init__()
+        self.bad_ids = set(bad_ids)
+        self.delay = delay
+        self.batch_sizes = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def upsert_batch(self, vectors):
+        self.batch_sizes.append(len(vectors))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            if any(vec_id in self.bad_ids for vec_id, _, _ in vectors):
+                raise RuntimeError("batch rejected")
+            return await super().upsert_batch(vectors)
+        finally:
+            self.in_flight -= 1
+
+
+@pytest.mark.asyncio
+async def test_vector_writer_batches_with_bounded_concurrency():
+    """Test writer groups points into batches and caps in-flight batches."""
+    repo = FlakyVectorRepository(delay=0.01)
+
+    async with VectorIngestWriter(repo, batch_size=10, max_concurrency=2) as writer:
+        for i in range(95):
+            await writer.add(f"vec_{i}", [float(i)], {"index": i})
+
+    assert repo.batch_sizes == [10] * 9 + [5]
+    assert repo.max_in_flight == 2
+    assert await repo.count() == 95
+    assert writer.get_stats()["points_written"] == 95
+    assert writer.failed_ids == []
+
+
+@pytest.mark.asyncio
+async def test_vector_writer_splits_failed_batches():
+    """Test failed batches are split until only bad points fail."""
+    repo = FlakyVectorRepository(bad_ids={"vec_3", "vec_12"})
+    writer = VectorIngestWriter(repo, batch_size=16, max_concurrency=1)
+
+    await writer.add_many((f"vec_{i}", [float(i)], {}) for i in range(16))
+    stats = await writer.close()
+
+    assert sorted(writer.failed_ids) == ["vec_12", "vec_3"]
+    assert stats["points_written"] == 14
+    assert stats["points_failed"] == 2
+    assert stats["splits"] > 0
+    assert await repo.count() == 14
+    assert await repo.get("vec_3") is None
+
+
+class UnreachableVectorRepository(MockVectorRepository):
+    """Mock vector repository that fails with transport errors a number of times."""
+
+    vector_size = 2
+
+    def __init__(self, transport_failures: int):
+        super().__init__()
+        self.transport_failures = transport_failures
+        self.calls = 0
+
+    async def upsert_batch(self, vectors):
+        self.calls += 1
+        if self.calls <= self.transport_failures:
+            raise StorageConnectionError("connection refused")
+        return await super().upsert_batch(vectors)
+
+
+@pytest.mark.asyncio
+async def test_vector_writer_retries_transport_errors_without_splitting():
+    """Test transport errors back off and retry the batch instead of halving it."""
+    repo = UnreachableVectorRepository(transport_failures=2)
+    writer = VectorIngestWriter(repo, batch_size=8, max_retries=3, retry_delay=0)
+
+    # Wrong-dimension points are failed up front rather than skipped by the repository
+    await writer.add_many((f"vec_{i}", [float(i), 1.0], {}) for i in range(7))
+    await writer.add("vec_bad", [1.0, 2.0, 3.0], {})
+    stats = await writer.close()
+
+    assert repo.calls == 3
+    assert stats["splits"] == 0 and stats["retries"] == 2
+    assert stats["points_written"] == 7
+    assert writer.failed_ids == ["vec_bad"]
+
+    down = UnreachableVectorRepository(transport_failures=100)
+    writer = VectorIngestWriter(down, batch_size=8, max_retries=2, retry_delay=0)
+    await writer.add_many((f"vec_{i}", [0.0, 1.0], {}) for i in range(8))
+    stats = await writer.close()
+
+    assert down.calls == 3
+    assert stats["splits"] == 0
+    assert stats["points_failed"] == 8
+
+
 # ============================================================================
 # CacheRepository Unit Tests
 # ============================================================================
@@ -446,6 +895,201 @@ async def test_cache_flush(cache_repo):
     assert await cache_repo.get("key2") is None
 
 
+@pytest.mark.asyncio
+async def test_response_cache_tag_invalidation(cache_repo):
+    """Test stable keys and that invalidation only drops tagged entries."""
+    assert stable_cache_key("trends:list", {"limit": 20, "offset": 0}) == stable_cache_key(
+        "trends:list", {"offset": 0, "limit": 20}
+    )
+
+    response_cache = ResponseCache(cache_repo)
+    trend_id = uuid4()
+    compute = AsyncMock(side_effect=[{"page": 1}, {"trend": 1}, {"page": 2}])
+
+    list_key = stable_cache_key("trends:list", {"limit": 20})
+    detail_key = stable_cache_key("trends:detail", {"trend_id": trend_id})
+    assert await response_cache.get_or_set(list_key, compute, 300, [TRENDS_LIST_TAG]) == {"page": 1}
+    assert await response_cache.get_or_set(detail_key, compute, 300, [trend_tag(trend_id)]) == {"trend": 1}
+    assert await response_cache.get_or_set(list_key, compute, 300, [TRENDS_LIST_TAG]) == {"page": 1}
+    assert compute.await_count == 2
+
+    assert await response_cache.invalidate([TRENDS_LIST_TAG]) == 1
+    assert await cache_repo.exists(detail_key)
+    assert await response_cache.get_or_set(list_key, compute, 300, [TRENDS_LIST_TAG]) == {"page": 2}
+
+
+@pytest.mark.asyncio
+async def test_response_cache_serves_stale_while_refreshing(cache_repo):
+    """Test that a stale entry is served while one background task refreshes it."""
+    response_cache = ResponseCache(cache_repo, stale_seconds=60)
+    await response_cache.get_or_set("stats", AsyncMock(return_value="old"), 300)
+
+    entry = await cache_repo.get("stats")
+    await cache_repo.set("stats", {**entry, "fresh_until": 0})
+
+    compute = AsyncMock(return_value="new")
+    results = await asyncio.gather(
+        *[response_cache.get_or_set("stats", compute, 300) for _ in range(5)]
+    )
+    assert results == ["old"] * 5
+
+    await asyncio.gather(*list(ResponseCache._refresh_tasks))
+    assert compute.await_count == 1
+    assert await response_cache.get_or_set("stats", compute, 300) == "new"
+
+
+@pytest.mark.asyncio
+async def test_response_cache_refresh_does_not_store_invalidated_data(cache_repo):
+    """Test a refresh that raced with an invalidation does not write back stale data."""
+    response_cache = ResponseCache(cache_repo, stale_seconds=60)
+    await response_cache.get_or_set("list", AsyncMock(return_value="old"), 300, [TRENDS_LIST_TAG])
+
+    entry = await cache_repo.get("list")
+    await cache_repo.set_with_tags("list", {**entry, "fresh_until": 0}, [TRENDS_LIST_TAG])
+
+    async def compute_then_invalidate():
+        # New trends are saved while the refresh is computing
+        await response_cache.invalidate([TRENDS_LIST_TAG])
+        return "stale"
+
+    assert await response_cache.get_or_set("list", compute_then_invalidate, 300, [TRENDS_LIST_TAG]) == "old"
+    await asyncio.gather(*list(ResponseCache._refresh_tasks))
+
+    assert await cache_repo.get("list") is None
+    fresh = AsyncMock(return_value="new")
+    assert await response_cache.get_or_set("list", fresh, 300, [TRENDS_LIST_TAG]) == "new"
+    assert await cache_repo.get("list") is not None
+
+
+def test_trend_change_tags_include_assigned_ids(fixtures):
+    """Test trends saved without an ID are tagged by the IDs save_batch returned."""
+    trend = fixtures.get_trends(1)[0]
+    trend.id = None
+    assigned = uuid4()
+
+    assert trend_tag(assigned) in trend_change_tags([trend], [assigned])
+
+
+@pytest.mark.asyncio
+async def test_suggestion_index_ranks_prefix_matches_by_score_and_recency(
+    trend_repo, cache_repo, fixtures
+):
+    """Test suggestions cover all live trends, weighted by score and recency."""
+    now = datetime.utcnow()
+    trends = fixtures.get_trends(4)
+    specs = [
+        ("OpenAI ships new model", ["openai", "LLM"], 50.0, now),
+        ("Open source funding", ["open source"], 90.0, now - timedelta(days=6)),
+        ("Opera strike ends", [], 10.0, now),
+        ("Solar storage boom", ["energy"], 99.0, now),
+    ]
+    for trend, (title, keywords, score, updated) in zip(trends, specs):
+        trend.title, trend.keywords, trend.score = title, keywords, score
+        trend.first_seen = trend.last_updated = updated
+        trend.state = TrendState.VIRAL
+        await trend_repo.save(trend)
+
+    index = SuggestionIndex(cache_repo=cache_repo, half_life_hours=24)
+    await index.ensure_loaded(trend_repo)
+
+    # Ties (a trend's title and its keywords) keep lexicographic order
+    assert await index.suggest("  OPEN", limit=3) == [
+        "openai",
+        "OpenAI ships new model",
+        "open source",
+    ]
+    # A 6-day-old trend decays below a fresh one with a much lower score
+    assert await index.suggest("ope", limit=10) == [
+        "openai",
+        "OpenAI ships new model",
+        "Opera strike ends",
+        "open source",
+        "Open source funding",
+    ]
+
+    # New trends are indexed when saved; a lookup falls back to the local
+    # index when Redis fails
+    trends[3].title, trends[3].last_updated = "Opal mining rush", now
+    await index.add_trends([trends[3]])
+    assert (await index.suggest("opal"))[0] == "Opal mining rush"
+
+    cache_repo.prefix_index_lookup = AsyncMock(side_effect=RuntimeError("redis down"))
+    assert await index.suggest("opal") == ["Opal mining rush"]
+    assert index.get_stats()["lookups"]["memory"] == 1
+
+    # Rebuilding drops dead trends
+    trends[2].state = TrendState.DEAD
+    other = SuggestionIndex(cache_repo=cache_repo)
+    await other.rebuild(trends)
+    assert "Opera strike ends" not in await other.suggest("ope", limit=10)
+
+
+@pytest.mark.asyncio
+async def test_suggestion_index_reseeds_redis_after_index_is_lost(
+    trend_repo, cache_repo, fixtures
+):
+    """Test a lost Redis index is served locally and written back."""
+    now = datetime.utcnow()
+    first, second = fixtures.get_trends(2)
+    for trend, title in ((first, "Quantum chip record"), (second, "Quartz prices")):
+        trend.title, trend.keywords, trend.score = title, [], 10.0
+        trend.first_seen = trend.last_updated = now
+        trend.state = TrendState.VIRAL
+        await trend_repo.save(trend)
+
+    index = SuggestionIndex(cache_repo=cache_repo)
+    await index.ensure_loaded(trend_repo)
+
+    # Redis flushed: the lookup falls back to the local index and re-seeds Redis
+    await cache_repo.flush()
+    assert await index.suggest("qua") == ["Quantum chip record", "Quartz prices"]
+    await index._seed_task
+    assert await cache_repo.prefix_index_exists(index._key)
+    assert await index.suggest("quar") == ["Quartz prices"]
+    assert index.get_stats()["lookups"] == {"redis": 1, "memory": 1}
+
+    # A writer that never loaded the index does not create a partial one
+    await cache_repo.flush()
+    second.title = "Quasar sighting"
+    await SuggestionIndex(cache_repo=cache_repo).add_trends([second])
+    assert not await cache_repo.prefix_index_exists(index._key)
+
+    # A loaded one seeds it with its whole local index
+    await index.add_trends([second])
+    assert await index.suggest("qua", limit=3) == [
+        "Quantum chip record",
+        "Quartz prices",
+        "Quasar sighting",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_suggestion_index_finds_heaviest_terms_among_many_matches(cache_repo, fixtures):
+    """Test lookups rank every match, not only the first ones in member order."""
+    now = datetime.utcnow()
+    light, heavy, update = fixtures.get_trends(3)
+    light.title, light.score = "Alpha 000", 1.0
+    light.keywords = [f"alpha {i:03d}" for i in range(1, 300)]
+    heavy.title, heavy.keywords, heavy.score = "Alpha Zulu launch", ["ALPHA ZULU"], 90.0
+    update.title, update.keywords, update.score = "Alpha zulu rumor", ["alpha zulu"], 5.0
+    for trend in (light, heavy, update):
+        trend.first_seen = trend.last_updated = now
+        trend.state = TrendState.VIRAL
+
+    for repo in (cache_repo, None):
+        index = SuggestionIndex(cache_repo=repo, top_k=5, max_prefix_length=4)
+        await index.rebuild([light, heavy])
+
+        # A lighter entry for an indexed term keeps the heavier display text
+        await index.add_trends([update])
+
+        # Short prefix (top-k list) and long prefix (full scan) agree
+        for prefix in ("alp", "alpha z"):
+            assert await index.suggest(prefix, limit=2) == ["ALPHA ZULU", "Alpha Zulu launch"]
+        assert len(await index.suggest("alp", limit=20)) == 5
+        assert "Alpha zulu rumor" in await index.suggest("alpha zulu r")
+
+
 # ============================================================================
 # Run Tests
 # ============================================================================
@@ -22,6 +22,8 @@ from trend_agent.services.translation_manager import (
     TranslationCache,
     TranslationManager,
 )
+from trend_agent.services.translation_store import DjangoTranslationStore
+from tests.mocks.storage import MockCacheRepository
 
 
 # ============================================================================
@@ -263,6 +265,146 @@ class TestTranslationCache:
         assert cache.ttl == custom_ttl
 
 
+class CountingCacheRepository(MockCacheRepository):
+    """MockCacheRepository that counts round trips."""
+
+    def __init__(self):
+        super().__init__()
+        self.round_trips = 0
+
+    async def get(self, key):
+        self.round_trips += 1
+        return await super().get(key)
+
+    async def set(self, key, value, ttl_seconds=None):
+        self.round_trips += 1
+        return await super().set(key, value, ttl_seconds)
+
+    async def get_many(self, keys):
+        self.round_trips += 1
+        return await super().get_many(keys)
+
+    async def set_many(self, mapping, ttl_seconds=None):
+        self.round_trips += 1
+        return await super().set_many(mapping, ttl_seconds)
+
+
+class InMemoryTranslationStore:
+    """In-memory stand-in for DjangoTranslationStore that counts calls."""
+
+    def __init__(self, rows=None):
+        self.rows = dict(rows or {})
+        self.get_calls = []
+        self.save_calls = 0
+
+    async def get_many(self, source_text_hashes, source_lang, target_lang):
+        self.get_calls.append(list(source_text_hashes))
+        return {h: self.rows[h] for h in source_text_hashes if h in self.rows}
+
+    async def save_many(self, translations, source_lang, target_lang, provider="libretranslate"):
+        self.save_calls += 1
+        self.rows.update(translations)
+        return len(translations)
+
+    def get_stats(self):
+        return {"rows": len(self.rows)}
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.mark.asyncio
+class TestTranslationCacheBatch:
+    """Tests for batched TranslationCache lookups."""
+
+    async def test_batch_round_trips_and_tier_stats(self):
+        """Test get_batch/set_batch use one round trip per tier."""
+        repo = CountingCacheRepository()
+        texts = [f"text {i}" for i in range(200)]
+        store = InMemoryTranslationStore({
+            TranslationCache._hash_text(t, "en", "es"): f"db {t}" for t in texts[100:150]
+        })
+        cache = TranslationCache(repo, db_store=store)
+
+        await cache.set_batch({t: f"es {t}" for t in texts[:100]}, "en", "es")
+        assert repo.round_trips == 1
+        assert store.save_calls == 1
+
+        # Simulate Redis-only entries for the first 100 texts
+        store.rows = {
+            h: v for h, v in store.rows.items() if v.startswith("db ")
+        }
+
+        repo.round_trips = 0
+        results = await cache.get_batch(texts + texts[:10], "en", "es")
+
+        # One MGET, one DB query for the 100 Redis misses, one backfill pipeline
+        assert repo.round_trips == 2
+        assert len(store.get_calls) == 1
+        assert len(store.get_calls[0]) == 100
+
+        assert len(results) == 150
+        assert results["text 5"] == "es text 5"
+        assert results["text 120"] == "db text 120"
+        assert "text 180" not in results
+
+        stats = cache.get_stats()
+        assert stats["hits_by_tier"] == {"redis": 100, "database": 50}
+        assert stats["hit_rate_by_tier"] == {"redis": 50.0, "database": 50.0}
+        assert stats["cache_misses"] == 50
+
+        # Database hits were backfilled into Redis
+        store.rows.clear()
+        results = await cache.get_batch(texts[100:150], "en", "es")
+        assert len(results) == 50
+
+    async def test_single_get_uses_db_store(self):
+        """Test single lookups fall through to the async database store."""
+        store = InMemoryTranslationStore()
+        cache = TranslationCache(MockCacheRepository(), db_store=store)
+
+        assert await cache.set("Hello", "Hola", "en", "es", provider="deepl")
+        assert store.save_calls == 1
+
+        # Redis entry expired: served by the database tier
+        cache.cache_repo._cache.clear()
+        assert await cache.get("Hello", "en", "es") == "Hola"
+        assert cache.get_stats()["hits_by_tier"]["database"] == 1
+
+
+@pytest.mark.asyncio
+async def test_django_translation_store_without_django():
+    """Test the database store disables itself when Django is unavailable."""
+    store = DjangoTranslationStore()
+    with patch(
+        "trend_agent.services.translation_store._load_translated_content_model",
+        side_effect=ImportError("no django"),
+    ):
+        assert await store.get_many(["abc"], "en", "es") == {}
+        assert await store.save_many({"abc": "x"}, "en", "es") == 0
+
+    stats = store.get_stats()
+    assert stats["available"] is False
+    assert stats["calls"] == {"get": 1, "save": 0}
+    await store.close()
+
+
+@pytest.mark.asyncio
+async def test_manager_close_shuts_down_translation_store():
+    """Test closing the manager releases the database store's threads."""
+    store = DjangoTranslationStore()
+    cache = TranslationCache(MockCacheRepository(), db_store=store)
+    manager = TranslationManager(
+        providers={"mock": MockTranslationService()}, cache=cache
+    )
+
+    await manager.close()
+    await manager.close()
+
+    assert store._executor._shutdown
+    assert await store.get_many(["abc"], "en", "es") == {}
+
+
 # ============================================================================
 # TranslationManager Tests
 # ============================================================================
@@ -570,6 +712,61 @@ class TestOpenAITranslationService:
         assert stats["total_output_tokens"] == 50
         assert stats["total_cost_usd"] > 0
 
+    async def test_batch_packed_under_token_budget(self):
+        """Large batches become several concurrent requests within the budget."""
+        import re
+
+        in_flight = 0
+        peak = 0
+        requests = []
+
+        async def fake_call_api(instruction, user_content):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            items = re.findall(r"\[(\d+)\] (\S+)", user_content)
+            requests.append(len(items))
+            return "\n".join(f"[{n}] ES-{text}" for n, text in items)
+
+        service = OpenAITranslationService(
+            api_key="test-key", max_batch_tokens=100, max_concurrent_requests=2
+        )
+        service._call_api = fake_call_api
+        texts = [f"text{i} " + "word " * 20 for i in range(10)]
+        texts[3] = ""
+
+        results = await service.translate_batch(texts, "es", "en")
+
+        assert results[3] == ""
+        assert results[0] == "ES-text0"
+        assert results[9] == "ES-text9"
+        assert len(requests) > 1 and sum(requests) == 9
+        assert peak == 2
+
+    async def test_misaligned_chunk_is_split(self):
+        """Only the request whose numbering came back wrong is retried, in halves."""
+        import re
+
+        async def fake_call_api(instruction, user_content):
+            items = re.findall(r"\[(\d+)\] (\S+)", user_content)
+            if not items:
+                return f"ES-{user_content}"
+            if len(items) == 4:
+                items = items[:3]  # Model dropped an item
+            return "\n".join(f"[{n}] ES-{text}" for n, text in items)
+
+        service = OpenAITranslationService(api_key="test-key")
+        service._call_api = fake_call_api
+
+        results = await service.translate_batch(["a", "b", "c", "d"], "es")
+
+        assert results == ["ES-a", "ES-b", "ES-c", "ES-d"]
+        stats = service.get_usage_stats()
+        assert stats["chunk_splits"] == 1
+        assert stats["total_requests"] == 3
+
 
 # ============================================================================
 # Run Tests
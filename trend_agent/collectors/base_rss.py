@@ -13,6 +13,7 @@ import feedparser
 from bs4 import BeautifulSoup
 
 from trend_agent.ingestion.base import CollectorPlugin
+from trend_agent.ingestion.feed_fetcher import get_feed_fetcher
 from trend_agent.schemas import Metrics, RawItem, SourceType
 
 logger = logging.getLogger(__name__)
@@ -26,6 +27,10 @@ class BaseRSSCollector(CollectorPlugin):
     1. Define metadata
     2. Set rss_url class attribute
     3. Optionally override parse_entry() for custom parsing
+
+    Feeds are polled through the shared IncrementalFeedFetcher, so each
+    collection only returns entries published since the previous one whose
+    items were stored (see on_saved()).
     """
 
     # Subclasses should set this
@@ -148,21 +153,27 @@ class BaseRSSCollector(CollectorPlugin):
         logger.info(f"Collecting from RSS feed: {self.rss_url}")
 
         try:
-            # Parse RSS feed (feedparser is synchronous)
-            feed = feedparser.parse(self.rss_url)
+            # Conditional GET; parsing runs off the event loop
+            result = await get_feed_fetcher().fetch(
+                self.rss_url, state_key=self._feed_state_key()
+            )
 
-            if feed.get('bozo', False):
-                logger.warning(f"RSS feed may have issues: {feed.get('bozo_exception', '')}")
+            if result.status == "error":
+                logger.error(f"Error fetching RSS feed {self.rss_url}: {result.error}")
+                return []
 
             items = []
 
-            # Process entries
-            for entry in feed.entries[:self.max_items]:
+            # Process entries not collected before
+            for entry in result.entries[:self.max_items]:
                 item = await self.parse_entry(entry)
                 if item:
                     items.append(item)
 
-            logger.info(f"Collected {len(items)} items from {self.metadata.name}")
+            logger.info(
+                f"Collected {len(items)} new items from {self.metadata.name} "
+                f"(feed {result.status})"
+            )
             return items
 
         except Exception as e:
@@ -189,6 +200,15 @@ class BaseRSSCollector(CollectorPlugin):
         """Hook called after successful collection."""
         logger.info(f"Successfully collected {len(items)} items from {self.metadata.name}")
 
+    async def on_saved(self, items: List[RawItem]) -> None:
+        """Advance the feed watermark past the stored entries."""
+        if self.rss_url:
+            await get_feed_fetcher().commit([self._feed_state_key()])
+
+    def _feed_state_key(self) -> str:
+        """Key of this collector's feed state in the shared fetcher."""
+        return f"{self.metadata.name}:{self.rss_url}"
+
     async def on_error(self, error: Exception) -> None:
         """Hook called when collection fails."""
         logger.error(f"{self.metadata.name} collection failed: {error}")
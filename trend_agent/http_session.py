@@ -0,0 +1,94 @@
+"""
+Pooled aiohttp session bound to the running event loop.
+
+Used by the content and feed fetchers: one keep-alive connection pool
+with per-host limits, replaced (and closed) whenever the event loop
+changes, e.g. between ``asyncio.run`` calls in Celery tasks.
+"""
+
+import asyncio
+import logging
+from typing import Optional
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+
+class LoopBoundSession:
+    """
+    Lazily created ``aiohttp.ClientSession`` for the running event loop.
+
+    Timeouts apply per socket (connect and read), so time spent queued for
+    a pooled connection behind the per-host limit does not count against
+    a request.
+
+    Example:
+        ```python
+        pool = LoopBoundSession(per_host_limit=4, timeout=10)
+        session = await pool.get()
+        async with session.get(url) as response:
+            ...
+        await pool.close()
+        ```
+    """
+
+    def __init__(self, max_connections: int = 50, per_host_limit: int = 4, timeout: float = 10):
+        """
+        Initialize session pool.
+
+        Args:
+            max_connections: Maximum open connections in the pool
+            per_host_limit: Maximum concurrent connections per host
+            timeout: Connect and socket read timeout in seconds
+        """
+        self._max_connections = max_connections
+        self._per_host_limit = per_host_limit
+        self._timeout = timeout
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def get(self) -> aiohttp.ClientSession:
+        """Get the session of the running event loop, creating it if needed."""
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._loop is not loop:
+            # A session cannot be shared across event loops
+            await self._discard()
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self._max_connections,
+                    limit_per_host=self._per_host_limit,
+                    ttl_dns_cache=300,
+                ),
+                timeout=aiohttp.ClientTimeout(
+                    total=None,
+                    sock_connect=self._timeout,
+                    sock_read=self._timeout,
+                ),
+            )
+            self._loop = loop
+        return self._session
+
+    async def close(self) -> None:
+        """Close the session."""
+        await self._discard()
+
+    async def _discard(self) -> None:
+        """Close the current session, wherever its event loop is."""
+        session, loop = self._session, self._loop
+        self._session = None
+        self._loop = None
+        if session is None or session.closed:
+            return
+
+        if loop is not None and loop is not asyncio.get_running_loop() and loop.is_running():
+            # Still running in another thread: close it there
+            asyncio.run_coroutine_threadsafe(session.close(), loop)
+            return
+
+        try:
+            # The pooled transports are closed synchronously; waiting for
+            # them fails if they belong to a stopped (not closed) loop
+            await session.close()
+        except (RuntimeError, ValueError) as e:
+            logger.debug(f"Closed session of a stopped event loop: {e}")
@@ -31,6 +31,8 @@ from trend_agent.ingestion.rate_limiter import (
     create_rate_limiter,
 )
 from trend_agent.ingestion.scheduler import DefaultScheduler
+from trend_agent.ingestion.feed_fetcher import FeedResult, IncrementalFeedFetcher
+from trend_agent.ingestion.seen_filter import SeenItemFilter
 
 __all__ = [
     # Base classes
@@ -51,4 +53,7 @@ __all__ = [
     "RedisRateLimiter",
     "create_rate_limiter",
     "DefaultScheduler",
+    "IncrementalFeedFetcher",
+    "FeedResult",
+    "SeenItemFilter",
 ]
@@ -69,6 +69,18 @@ class CollectorPlugin(ABC):
         """
         pass
 
+    async def on_saved(self, items: List[RawItem]) -> None:
+        """
+        Hook called after the collected items were stored.
+
+        Override to advance source cursors (e.g. feed watermarks) only
+        once the items they cover are persisted.
+
+        Args:
+            items: The items that were collected
+        """
+        pass
+
     async def on_error(self, error: Exception) -> None:
         """
         Hook called when collection fails.
@@ -15,7 +15,9 @@ import asyncio
 import httpx
 
 from trend_agent.ingestion.base import CollectorPlugin, PluginRegistry
+from trend_agent.ingestion.feed_fetcher import IncrementalFeedFetcher
 from trend_agent.schemas import PluginMetadata, RawItem, SourceType, Metrics
+from trend_agent.storage.response_cache import create_response_cache_repository
 
 logger = logging.getLogger(__name__)
 
@@ -28,16 +30,18 @@ class DynamicCollectorPlugin(CollectorPlugin):
     with the CollectorPlugin interface.
     """
 
-    def __init__(self, source_config: Dict[str, Any], collector_impl):
+    def __init__(self, source_config: Dict[str, Any], collector_impl, saved_impl=None):
         """
         Initialize dynamic collector.
 
         Args:
             source_config: Configuration from CrawlerSource model
             collector_impl: Implementation function/class for collection
+            saved_impl: Optional function called once collected items are stored
         """
         self.source_config = source_config
         self.collector_impl = collector_impl
+        self.saved_impl = saved_impl
 
         # Build metadata from source config
         self.metadata = PluginMetadata(
@@ -70,6 +74,11 @@ class DynamicCollectorPlugin(CollectorPlugin):
             logger.error(f"Collection failed for {self.metadata.name}: {e}", exc_info=True)
             raise
 
+    async def on_saved(self, items: List[RawItem]) -> None:
+        """Let the collector implementation advance its cursor."""
+        if self.saved_impl is not None:
+            await self.saved_impl(self.source_config)
+
 
 class DynamicPluginLoader:
     """
@@ -85,6 +94,7 @@ class DynamicPluginLoader:
         """Initialize the dynamic plugin loader."""
         self._loaded_sources: Dict[int, str] = {}  # source_id -> plugin_name
         self._http_client: Optional[httpx.AsyncClient] = None
+        self._feed_fetcher: Optional[IncrementalFeedFetcher] = None
 
     async def _get_http_client(self) -> httpx.AsyncClient:
         """Get or create HTTP client for making requests."""
@@ -95,10 +105,20 @@ class DynamicPluginLoader:
             )
         return self._http_client
 
+    def _get_feed_fetcher(self) -> IncrementalFeedFetcher:
+        """Get or create the incremental fetcher shared by RSS sources."""
+        if self._feed_fetcher is None:
+            self._feed_fetcher = IncrementalFeedFetcher(
+                cache_repo_factory=create_response_cache_repository,
+            )
+        return self._feed_fetcher
+
     async def close(self):
         """Close resources."""
         if self._http_client:
             await self._http_client.aclose()
+        if self._feed_fetcher:
+            await self._feed_fetcher.close()
 
     def _create_rss_collector(self, config: Dict[str, Any]):
         """
@@ -111,8 +131,7 @@ class DynamicPluginLoader:
             Async collector function
         """
         async def collect_rss(cfg: Dict[str, Any]) -> List[RawItem]:
-            """Collect items from RSS feed."""
-            import feedparser
+            """Collect items from RSS feed published since the last run."""
             from dateutil import parser as date_parser
 
             url = cfg.get('url')
@@ -121,20 +140,19 @@ class DynamicPluginLoader:
                 return []
 
             try:
-                # Fetch RSS feed
-                client = await self._get_http_client()
-
-                # Apply custom headers if configured
-                headers = cfg.get('custom_headers', {})
-
-                response = await client.get(url, headers=headers)
-                response.raise_for_status()
-
-                # Parse RSS feed
-                feed = feedparser.parse(response.text)
+                # Conditional GET with custom headers; parsed off the event loop
+                result = await self._get_feed_fetcher().fetch(
+                    url,
+                    headers=cfg.get('custom_headers') or {},
+                    state_key=_feed_state_key(cfg),
+                )
+                if result.status == "error":
+                    logger.error(f"Failed to fetch RSS feed {url}: {result.error}")
+                    return []
 
+                feed = result.feed
                 items = []
-                for entry in feed.entries:
+                for entry in result.entries:
                     # Extract data from RSS entry
                     try:
                         # Parse published date
@@ -179,6 +197,23 @@ class DynamicPluginLoader:
 
         return collect_rss
 
+    def _create_rss_saved_hook(self, config: Dict[str, Any]):
+        """
+        Create the hook that commits an RSS source's feed state.
+
+        Args:
+            config: Source configuration
+
+        Returns:
+            Async function called once collected items are stored
+        """
+        async def commit_rss(cfg: Dict[str, Any]) -> None:
+            """Advance the feed watermark past the stored entries."""
+            if cfg.get('url'):
+                await self._get_feed_fetcher().commit([_feed_state_key(cfg)])
+
+        return commit_rss
+
     def _create_api_collector(self, config: Dict[str, Any]):
         """
         Create API-based collector implementation.
@@ -346,8 +381,10 @@ class DynamicPluginLoader:
 
         try:
             # Select appropriate collector implementation based on source type
+            saved_impl = None
             if source_type in ['rss', 'google_news', 'bbc', 'reuters', 'ap_news', 'al_jazeera', 'guardian']:
                 collector_impl = self._create_rss_collector(config)
+                saved_impl = self._create_rss_saved_hook(config)
             elif source_type in ['reddit', 'twitter', 'youtube']:
                 collector_impl = self._create_api_collector(config)
             elif source_type == 'custom':
@@ -357,7 +394,7 @@ class DynamicPluginLoader:
                 return None
 
             # Create dynamic plugin
-            plugin = DynamicCollectorPlugin(config, collector_impl)
+            plugin = DynamicCollectorPlugin(config, collector_impl, saved_impl)
 
             logger.info(f"Created dynamic collector: {plugin.metadata.name}")
             return plugin
@@ -508,6 +545,11 @@ class DynamicPluginLoader:
             return False
 
 
+def _feed_state_key(config: Dict[str, Any]) -> str:
+    """Key of an RSS source's feed state in the loader's fetcher."""
+    return f"{config['name']}:{config.get('url')}"
+
+
 # Global instance
 _dynamic_loader: Optional[DynamicPluginLoader] = None
 
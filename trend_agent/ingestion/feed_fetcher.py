@@ -0,0 +1,475 @@
+"""
+Incremental RSS/Atom feed fetching.
+
+Feeds are fetched through one pooled aiohttp session with conditional GETs
+(If-None-Match / If-Modified-Since). Per-feed state records the validators,
+a hash of the last body and a high-watermark of entry timestamps, so a
+poll only yields entries that were not emitted by an earlier poll and an
+unchanged feed costs one 304 (or one hash comparison) instead of a parse.
+
+The state of a poll stays pending until the consumer commits it, so
+entries are only skipped once they have been stored downstream.
+"""
+
+import asyncio
+import calendar
+import hashlib
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from trend_agent.http_session import LoopBoundSession
+from trend_agent.storage.interfaces import CacheRepository
+from trend_agent.storage.response_cache import create_response_cache_repository
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class FeedResult:
+    """Outcome of polling one feed."""
+
+    url: str
+    status: str  # "updated", "not_modified", "unchanged" or "error"
+    entries: List[Any] = field(default_factory=list)  # Entries not seen before
+    feed: Any = None  # Parsed feed (feedparser dict) when the body was parsed
+    error: Optional[str] = None
+    state_key: Optional[str] = None  # Pass to commit() once entries are stored
+
+
+class IncrementalFeedFetcher:
+    """
+    Pooled, incremental feed fetcher.
+
+    Per-feed state (kept in-process, and in Redis if a cache repository is
+    given) holds:
+    - ``etag`` / ``last_modified``: validators sent on the next poll; a 304
+      returns without reading a body
+    - ``content_hash``: a 200 with an identical body is not re-parsed
+    - ``watermark``: newest entry timestamp emitted so far; older entries
+      are dropped, and ``boundary_ids`` / ``undated_ids`` resolve entries
+      at the watermark and entries without a timestamp
+
+    A poll records its state as pending; ``commit()`` makes it the state
+    the next poll starts from. Until then, later polls return the same
+    entries again, so a failed downstream save loses nothing.
+
+    Parsing runs in a thread so feedparser never blocks the event loop.
+
+    Example:
+        ```python
+        fetcher = IncrementalFeedFetcher(cache_repo=redis_repo)
+        results = await fetcher.fetch_many(feed_urls)
+        for result in results:
+            for entry in result.entries:
+                ...
+        # After the entries are stored
+        await fetcher.commit(result.state_key for result in results)
+        ```
+    """
+
+    USER_AGENT = 'Mozilla/5.0 (compatible; TrendBot/1.0)'
+
+    def __init__(
+        self,
+        max_connections: int = 50,
+        per_host_limit: int = 4,
+        timeout: int = 30,
+        cache_repo: Optional[CacheRepository] = None,
+        cache_repo_factory: Optional[Callable[[], CacheRepository]] = None,
+        state_ttl_seconds: int = 2592000,
+        max_tracked_ids: int = 500,
+        incremental: bool = True,
+        key_prefix: str = "feed_state",
+    ):
+        """
+        Initialize feed fetcher.
+
+        Args:
+            max_connections: Maximum open connections in the pool
+            per_host_limit: Maximum concurrent connections per host
+            timeout: Connect and socket read timeout in seconds
+            cache_repo: Optional Redis cache repository shared across workers
+            cache_repo_factory: Optional factory of an unconnected repository,
+                used instead of cache_repo by long-lived fetchers: one is
+                connected per event loop, since Redis clients cannot be
+                shared across loops (e.g. ``asyncio.run`` calls in tasks)
+            state_ttl_seconds: Redis TTL of per-feed state (default: 30 days)
+            max_tracked_ids: Maximum entry IDs remembered per feed
+            incremental: If False, every poll downloads and returns the
+                whole feed (state is still recorded)
+            key_prefix: Prefix for Redis cache keys
+        """
+        self._pool = LoopBoundSession(max_connections, per_host_limit, timeout)
+        self._cache_repo = cache_repo
+        self._cache_repo_factory = cache_repo_factory
+        self._cache_repo_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._state_ttl_seconds = state_ttl_seconds
+        self._max_tracked_ids = max_tracked_ids
+        self._incremental = incremental
+        self._key_prefix = key_prefix
+        self._states: Dict[str, Dict[str, Any]] = {}
+        self._pending: Dict[str, Dict[str, Any]] = {}
+
+        # Stats
+        self._stats = {
+            "updated": 0,
+            "not_modified": 0,
+            "unchanged": 0,
+            "errors": 0,
+            "new_entries": 0,
+            "skipped_entries": 0,
+            "commits": 0,
+        }
+
+    async def __aenter__(self) -> "IncrementalFeedFetcher":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    async def fetch(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        state_key: Optional[str] = None,
+    ) -> FeedResult:
+        """
+        Poll a feed and return the entries not emitted before.
+
+        Args:
+            url: Feed URL
+            headers: Optional extra request headers
+            state_key: Key of the feed state (default: the URL). Consumers
+                polling the same URL independently should pass distinct keys.
+
+        Returns:
+            FeedResult for the feed; its state is pending until committed
+        """
+        key = state_key or url
+        # A new poll supersedes one that was never committed
+        self._pending.pop(key, None)
+        state = await self._get_state(key) or {}
+
+        request_headers = {'User-Agent': self.USER_AGENT, **(headers or {})}
+        if self._incremental:
+            if state.get("etag"):
+                request_headers['If-None-Match'] = state["etag"]
+            if state.get("last_modified"):
+                request_headers['If-Modified-Since'] = state["last_modified"]
+
+        try:
+            status, response_headers, body = await self._request(url, request_headers)
+        except asyncio.TimeoutError:
+            self._stats["errors"] += 1
+            logger.warning(f"Timeout fetching feed {url}")
+            return FeedResult(url=url, status="error", error="timeout")
+        except Exception as e:
+            self._stats["errors"] += 1
+            logger.warning(f"Failed to fetch feed {url}: {e}")
+            return FeedResult(url=url, status="error", error=str(e))
+
+        if status == 304:
+            self._stats["not_modified"] += 1
+            return FeedResult(url=url, status="not_modified", state_key=key)
+
+        if status != 200:
+            self._stats["errors"] += 1
+            logger.warning(f"Failed to fetch feed {url}: HTTP {status}")
+            return FeedResult(url=url, status="error", error=f"HTTP {status}")
+
+        content_hash = hashlib.sha256(body).hexdigest()
+        new_state = {
+            **state,
+            "etag": response_headers.get('ETag'),
+            "last_modified": response_headers.get('Last-Modified'),
+            "content_hash": content_hash,
+            "checked_at": time.time(),
+        }
+
+        if self._incremental and state.get("content_hash") == content_hash:
+            # Server ignored the validators but the feed did not change
+            self._stats["unchanged"] += 1
+            self._pending[key] = new_state
+            return FeedResult(url=url, status="unchanged", state_key=key)
+
+        try:
+            feed = await self._parse(body)
+        except Exception as e:
+            self._stats["errors"] += 1
+            logger.warning(f"Failed to parse feed {url}: {e}")
+            return FeedResult(url=url, status="error", error=str(e))
+
+        if feed.get('bozo', False):
+            logger.warning(f"Feed {url} may have issues: {feed.get('bozo_exception', '')}")
+
+        entries = self._select_new_entries(feed.entries, state, new_state)
+        if not self._incremental:
+            entries = list(feed.entries)
+
+        self._stats["updated"] += 1
+        self._stats["new_entries"] += len(entries)
+        self._stats["skipped_entries"] += len(feed.entries) - len(entries)
+        self._pending[key] = new_state
+
+        return FeedResult(
+            url=url, status="updated", entries=entries, feed=feed, state_key=key
+        )
+
+    async def fetch_many(
+        self,
+        urls: Sequence[str],
+        headers: Optional[Dict[str, str]] = None,
+        state_key_prefix: Optional[str] = None,
+    ) -> List[FeedResult]:
+        """
+        Poll many feeds concurrently over the shared connection pool.
+
+        Args:
+            urls: Feed URLs
+            headers: Optional extra request headers for every feed
+            state_key_prefix: Optional prefix for state keys (see fetch())
+
+        Returns:
+            FeedResults in URL order
+        """
+        return list(
+            await asyncio.gather(
+                *(
+                    self.fetch(
+                        url,
+                        headers=headers,
+                        state_key=f"{state_key_prefix}:{url}" if state_key_prefix else None,
+                    )
+                    for url in urls
+                )
+            )
+        )
+
+    async def commit(self, state_keys: Iterable[Optional[str]]) -> int:
+        """
+        Make the pending state of polled feeds current.
+
+        Call once the entries returned for these feeds have been stored;
+        the next poll then skips them. Keys without pending state are
+        ignored.
+
+        Args:
+            state_keys: State keys from FeedResult.state_key
+
+        Returns:
+            Number of feed states committed
+        """
+        committed = 0
+        for key in state_keys:
+            state = self._pending.pop(key, None) if key else None
+            if state is None:
+                continue
+            await self._set_state(key, state)
+            committed += 1
+
+        self._stats["commits"] += committed
+        return committed
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get fetcher statistics.
+
+        Returns:
+            Dictionary with poll outcome and entry counts
+        """
+        return {
+            **self._stats,
+            "tracked_feeds": len(self._states),
+            "pending_feeds": len(self._pending),
+        }
+
+    async def close(self) -> None:
+        """Close the pooled session and the Redis repository created by the factory."""
+        await self._pool.close()
+        await self._discard_cache_repo()
+
+    async def _request(
+        self, url: str, headers: Dict[str, str]
+    ) -> Tuple[int, Dict[str, Optional[str]], bytes]:
+        """GET a feed; returns (status, validators, body), reading the body only for a 200."""
+        session = await self._pool.get()
+        async with session.get(url, headers=headers) as response:
+            validators = {
+                'ETag': response.headers.get('ETag'),
+                'Last-Modified': response.headers.get('Last-Modified'),
+            }
+            if response.status != 200:
+                return response.status, validators, b""
+            return response.status, validators, await response.read()
+
+    async def _parse(self, body: bytes):
+        """Run feedparser off the event loop."""
+        import feedparser
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, feedparser.parse, body)
+
+    def _select_new_entries(
+        self,
+        entries: Sequence[Any],
+        state: Dict[str, Any],
+        new_state: Dict[str, Any],
+    ) -> List[Any]:
+        """
+        Filter entries against the watermark and record the new watermark.
+
+        Args:
+            entries: Parsed feed entries
+            state: Previous feed state
+            new_state: Feed state being built (updated in place)
+
+        Returns:
+            Entries newer than the previous watermark
+        """
+        watermark = state.get("watermark")
+        boundary_ids = set(state.get("boundary_ids", []))
+        undated_ids = list(state.get("undated_ids", []))
+        seen_undated = set(undated_ids)
+
+        new_entries = []
+        dated: List[Tuple[float, str]] = []
+        for entry in entries:
+            entry_id = _entry_id(entry)
+            timestamp = _entry_timestamp(entry)
+
+            if timestamp is None:
+                if entry_id in seen_undated:
+                    continue
+                undated_ids.append(entry_id)
+                seen_undated.add(entry_id)
+            else:
+                dated.append((timestamp, entry_id))
+                if watermark is not None and (
+                    timestamp < watermark
+                    or (timestamp == watermark and entry_id in boundary_ids)
+                ):
+                    continue
+
+            new_entries.append(entry)
+
+        timestamps = [ts for ts, _ in dated]
+        if watermark is not None:
+            timestamps.append(watermark)
+        newest = max(timestamps, default=None)
+        if newest is not None:
+            at_newest = [entry_id for ts, entry_id in dated if ts == newest]
+            if newest == watermark:
+                at_newest = list(boundary_ids.union(at_newest))
+            new_state["watermark"] = newest
+            new_state["boundary_ids"] = at_newest[-self._max_tracked_ids:]
+        new_state["undated_ids"] = undated_ids[-self._max_tracked_ids:]
+
+        return new_entries
+
+    async def _get_cache_repo(self) -> Optional[CacheRepository]:
+        """Get the Redis repository, connecting one for the running event loop if built by the factory."""
+        if self._cache_repo_factory is None:
+            return self._cache_repo
+
+        loop = asyncio.get_running_loop()
+        if self._cache_repo_loop is not loop:
+            await self._discard_cache_repo()
+            self._cache_repo_loop = loop
+            cache_repo = self._cache_repo_factory()
+            try:
+                await cache_repo.connect()
+                self._cache_repo = cache_repo
+            except Exception as e:
+                # Keep polling with in-process state until the next event loop
+                logger.warning(f"Feed state Redis unavailable, keeping state in process: {e}")
+        return self._cache_repo
+
+    async def _discard_cache_repo(self) -> None:
+        """Close the repository created by the factory."""
+        if self._cache_repo_factory is None:
+            return
+        cache_repo = self._cache_repo
+        self._cache_repo = None
+        self._cache_repo_loop = None
+        if cache_repo is None:
+            return
+        try:
+            await cache_repo.close()
+        except Exception as e:
+            # Its connections belong to an event loop that is gone
+            logger.debug(f"Closed feed state Redis of a previous event loop: {e}")
+
+    async def _get_state(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get feed state from memory, then Redis."""
+        state = self._states.get(key)
+        if state is not None:
+            return state
+
+        cache_repo = await self._get_cache_repo()
+        if cache_repo is None:
+            return None
+        try:
+            state = await cache_repo.get(f"{self._key_prefix}:{key}")
+        except Exception as e:
+            logger.warning(f"Feed state Redis get failed: {e}")
+            return None
+
+        if state is not None:
+            self._states[key] = state
+        return state
+
+    async def _set_state(self, key: str, state: Dict[str, Any]) -> None:
+        """Store feed state in memory and Redis, ignoring cache failures."""
+        self._states[key] = state
+
+        cache_repo = await self._get_cache_repo()
+        if cache_repo is None:
+            return
+        try:
+            await cache_repo.set(
+                f"{self._key_prefix}:{key}", state, ttl_seconds=self._state_ttl_seconds
+            )
+        except Exception as e:
+            logger.warning(f"Feed state Redis set failed: {e}")
+
+
+def _entry_id(entry: Any) -> str:
+    """Stable identifier of a feed entry."""
+    return entry.get('id') or entry.get('link') or entry.get('title', '')
+
+
+def _entry_timestamp(entry: Any) -> Optional[float]:
+    """Entry publication time as a UTC epoch, or None if undated."""
+    for attr in ('published_parsed', 'updated_parsed'):
+        parsed = entry.get(attr)
+        if parsed:
+            try:
+                # feedparser normalizes dates to UTC struct_time
+                return float(calendar.timegm(parsed))
+            except (TypeError, ValueError, OverflowError):
+                continue
+    return None
+
+
+# Shared fetcher used by the RSS collectors
+_default_fetcher: Optional[IncrementalFeedFetcher] = None
+
+
+def get_feed_fetcher() -> IncrementalFeedFetcher:
+    """
+    Get the shared feed fetcher.
+
+    Feed state is kept in the shared Redis instance, so every worker
+    resumes from the same watermarks. Set ``INCREMENTAL_FEEDS=false`` to
+    always return whole feeds.
+    """
+    global _default_fetcher
+    if _default_fetcher is None:
+        _default_fetcher = IncrementalFeedFetcher(
+            cache_repo_factory=create_response_cache_repository,
+            incremental=os.getenv("INCREMENTAL_FEEDS", "true").lower() in ("true", "1", "yes"),
+        )
+    return _default_fetcher
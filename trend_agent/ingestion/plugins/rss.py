@@ -13,6 +13,7 @@ from urllib.parse import urlparse
 from pydantic import HttpUrl
 
 from trend_agent.ingestion.base import CollectorPlugin
+from trend_agent.ingestion.feed_fetcher import IncrementalFeedFetcher, get_feed_fetcher
 from trend_agent.schemas import PluginMetadata, RawItem, SourceType, Metrics
 
 logger = logging.getLogger(__name__)
@@ -26,7 +27,9 @@ class RSSCollector(CollectorPlugin):
     - RSS 2.0
     - Atom 1.0
     - Custom feed formats
-    - Multiple feed sources
+    - Multiple feed sources, polled concurrently with conditional GETs
+      (only entries published since the last stored collection are
+      returned; see on_saved())
     """
 
     metadata = PluginMetadata(
@@ -46,6 +49,7 @@ class RSSCollector(CollectorPlugin):
         self,
         feed_urls: Optional[List[str]] = None,
         max_items_per_feed: int = 50,
+        feed_fetcher: Optional[IncrementalFeedFetcher] = None,
     ):
         """
         Initialize RSS collector.
@@ -53,10 +57,13 @@ class RSSCollector(CollectorPlugin):
         Args:
             feed_urls: List of RSS feed URLs to collect from
             max_items_per_feed: Maximum items to collect per feed (default: 50)
+            feed_fetcher: Optional feed fetcher (default: the shared fetcher)
         """
         super().__init__()
         self._feed_urls = feed_urls or self._get_default_feeds()
         self._max_items_per_feed = max_items_per_feed
+        self._feed_fetcher = feed_fetcher
+        self._uncommitted_feeds: List[str] = []
 
     def _get_default_feeds(self) -> List[str]:
         """Get default RSS feeds to collect from."""
@@ -99,52 +106,37 @@ class RSSCollector(CollectorPlugin):
             List of raw items from RSS feeds
         """
         try:
-            # Import feedparser (lazy import)
-            import feedparser
-            import aiohttp
+            fetcher = self._feed_fetcher or get_feed_fetcher()
+            results = await fetcher.fetch_many(
+                self._feed_urls, state_key_prefix=self.metadata.name
+            )
+            self._uncommitted_feeds = [
+                result.state_key for result in results if result.state_key
+            ]
 
             items = []
+            for result in results:
+                if result.status == "error":
+                    logger.error(f"Failed to fetch RSS feed {result.url}: {result.error}")
+                    continue
 
-            async with aiohttp.ClientSession() as session:
-                for feed_url in self._feed_urls:
-                    feed_items = await self._collect_from_feed(session, feed_url, feedparser)
-                    items.extend(feed_items)
+                for entry in result.entries[: self._max_items_per_feed]:
+                    item = self._parse_entry(entry, result.url, result.feed)
+                    if item:
+                        items.append(item)
 
             logger.info(f"Collected {len(items)} items from {len(self._feed_urls)} RSS feeds")
             return items
 
-        except ImportError:
-            logger.error("feedparser library not installed. Install with: pip install feedparser")
-            return []
         except Exception as e:
             logger.error(f"Failed to collect from RSS feeds: {e}")
             return []
 
-    async def _collect_from_feed(
-        self, session: aiohttp.ClientSession, feed_url: str, feedparser
-    ) -> List[RawItem]:
-        """Collect items from a single RSS feed."""
-        try:
-            # Fetch feed
-            async with session.get(feed_url, timeout=aiohttp.ClientTimeout(total=30)) as response:
-                response.raise_for_status()
-                content = await response.text()
-
-            # Parse feed
-            feed = feedparser.parse(content)
-
-            items = []
-            for entry in feed.entries[: self._max_items_per_feed]:
-                item = self._parse_entry(entry, feed_url, feed)
-                if item:
-                    items.append(item)
-
-            logger.info(f"Fetched {len(items)} items from RSS feed: {feed_url}")
-            return items
-
-        except Exception as e:
-            logger.error(f"Failed to fetch RSS feed {feed_url}: {e}")
-            return []
+    async def on_saved(self, items: List[RawItem]) -> None:
+        """Advance the feed watermarks past the stored entries."""
+        fetcher = self._feed_fetcher or get_feed_fetcher()
+        keys, self._uncommitted_feeds = self._uncommitted_feeds, []
+        await fetcher.commit(keys)
 
     def _parse_entry(
         self, entry: Any, feed_url: str, feed: Any
@@ -18,6 +18,7 @@ from apscheduler.triggers.cron import CronTrigger
 from trend_agent.ingestion.base import CollectorPlugin, PluginRegistry
 from trend_agent.ingestion.interfaces import BaseScheduler
 from trend_agent.ingestion.converters import batch_raw_to_processed
+from trend_agent.ingestion.seen_filter import SeenItemFilter, save_collected_items
 
 logger = logging.getLogger(__name__)
 
@@ -39,7 +40,8 @@ class DefaultScheduler(BaseScheduler):
         self,
         health_checker=None,
         rate_limiter=None,
-        storage_repo=None
+        storage_repo=None,
+        seen_filter: Optional[SeenItemFilter] = None,
     ):
         """
         Initialize the scheduler.
@@ -48,11 +50,16 @@ class DefaultScheduler(BaseScheduler):
             health_checker: Optional HealthChecker instance for tracking
             rate_limiter: Optional RateLimiter for enforcing limits
             storage_repo: Optional storage repository for persisting collected data
+            seen_filter: Optional seen-item filter; defaults to one warmed
+                from storage_repo when a repository is given
         """
         self.scheduler = AsyncIOScheduler()
         self.health_checker = health_checker
         self.rate_limiter = rate_limiter
         self.storage_repo = storage_repo
+        if seen_filter is None and storage_repo is not None:
+            seen_filter = SeenItemFilter(item_repo=storage_repo)
+        self.seen_filter = seen_filter
 
         # Track job IDs for each plugin
         self._plugin_jobs: Dict[str, str] = {}
@@ -293,13 +300,26 @@ class DefaultScheduler(BaseScheduler):
                         # Full processing will happen later in the processing pipeline
                         processed_items = batch_raw_to_processed(validated_items)
 
-                        # Save to database (storage_repo should be ItemRepository)
-                        for item in processed_items:
-                            await self.storage_repo.save(item)
-
-                        logger.info(f"Persisted {len(processed_items)} items from {plugin_name} to database")
+                        # Bulk-write only new or changed items (storage_repo should be ItemRepository)
+                        partition = await save_collected_items(
+                            self.storage_repo,
+                            processed_items,
+                            seen_filter=self.seen_filter,
+                            plugin_name=plugin_name,
+                        )
+
+                        # Items are stored: let the plugin advance its feed watermarks
+                        await plugin.on_saved(validated_items)
+
+                        logger.info(
+                            f"Persisted {len(partition.new) + len(partition.changed)}/"
+                            f"{len(processed_items)} items from {plugin_name} to database"
+                        )
                     except Exception as e:
                         logger.error(f"Failed to persist items from {plugin_name}: {e}", exc_info=True)
+                elif self.storage_repo:
+                    # Nothing to store
+                    await plugin.on_saved(validated_items)
 
                 # Call success hook
                 await plugin.on_success(validated_items)
@@ -330,6 +350,15 @@ class DefaultScheduler(BaseScheduler):
             # Catch-all for any unexpected errors
             logger.error(f"Unexpected error executing {plugin_name}: {e}", exc_info=True)
 
+    def get_ingest_stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Get per-plugin ingest statistics of the seen-item filter.
+
+        Returns:
+            Dictionary of plugin name -> new/changed/unchanged counts and skip ratio
+        """
+        return self.seen_filter.get_stats() if self.seen_filter else {}
+
     def get_active_tasks(self) -> Dict[str, bool]:
         """
         Get status of active tasks.
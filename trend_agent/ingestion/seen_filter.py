@@ -0,0 +1,348 @@
+"""
+Ingest-time filter for items that were already collected.
+
+Most items in a poll of Hacker News, Reddit or an RSS feed were stored by
+the previous poll. The filter sorts each collected batch into new items
+(sent to the bulk writer), items whose metrics changed (a metrics-only
+UPDATE) and unchanged items (skipped), without a database lookup per item.
+"""
+
+import hashlib
+import json
+import logging
+import math
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from trend_agent.schemas import Metrics, ProcessedItem
+
+logger = logging.getLogger(__name__)
+
+
+class BloomFilter:
+    """
+    In-memory Bloom filter over string keys.
+
+    Sized for ``capacity`` keys at a false-positive rate of ``error_rate``;
+    never yields false negatives.
+    """
+
+    def __init__(self, capacity: int = 1_000_000, error_rate: float = 0.01):
+        """
+        Initialize Bloom filter.
+
+        Args:
+            capacity: Expected number of keys
+            error_rate: Target false-positive rate at capacity
+        """
+        self._size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self._hash_count = max(1, round(self._size / capacity * math.log(2)))
+        self._bits = bytearray((self._size + 7) // 8)
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, key: str) -> bool:
+        return all(self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+    def add(self, key: str) -> None:
+        """Add a key to the filter."""
+        for pos in self._positions(key):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+        self._count += 1
+
+    def _positions(self, key: str) -> List[int]:
+        """Bit positions of a key (double hashing over one digest)."""
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self._size for i in range(self._hash_count)]
+
+
+@dataclass
+class SeenPartition:
+    """Collected items split by what needs to be written."""
+
+    new: List[ProcessedItem] = field(default_factory=list)  # Full upsert
+    changed: List[ProcessedItem] = field(default_factory=list)  # Metrics-only update
+    unchanged: List[ProcessedItem] = field(default_factory=list)  # Skipped
+
+    @property
+    def skip_ratio(self) -> float:
+        """Fraction of items that need no write."""
+        total = len(self.new) + len(self.changed) + len(self.unchanged)
+        return len(self.unchanged) / total if total else 0.0
+
+
+class SeenItemFilter:
+    """
+    Seen-set of (source, source_id) with per-item fingerprints.
+
+    A Bloom filter answers "never stored" for most new items without a
+    lookup. Keys it reports as seen are compared against an LRU of recent
+    fingerprints (content digest, metrics digest):
+    - same content and metrics: skipped
+    - same content, different metrics: metrics-only update
+    - content changed: full upsert
+
+    Seen keys with no fingerprint (evicted from the LRU, or Bloom false
+    positives) are resolved with one batched metrics lookup per
+    partition; keys without a stored row get a full upsert.
+
+    Writes are upserts either way, so a wrong answer only costs a write.
+    The filter is warmed from the item repository on first use with the
+    items collected in the last ``warm_days`` days. Warmed and looked-up
+    entries carry no content digest: with the same metrics they are
+    skipped, otherwise they get a full upsert since their content may
+    have changed too.
+
+    Example:
+        ```python
+        seen = SeenItemFilter(item_repo)
+        partition = await seen.partition(items)
+        await item_repo.save_batch(partition.new)
+        await item_repo.update_metrics_batch(partition.changed)
+        seen.mark(partition.new + partition.changed)
+        ```
+    """
+
+    def __init__(
+        self,
+        item_repo=None,
+        capacity: int = 1_000_000,
+        error_rate: float = 0.01,
+        max_fingerprints: int = 200_000,
+        warm_days: int = 7,
+    ):
+        """
+        Initialize seen-item filter.
+
+        Args:
+            item_repo: Optional ItemRepository used to warm the filter and
+                look up seen items that have no fingerprint
+            capacity: Expected number of distinct items
+            error_rate: Bloom filter false-positive rate at capacity
+            max_fingerprints: Recent item fingerprints kept in memory
+            warm_days: Days of collected items loaded when warming
+        """
+        self._item_repo = item_repo
+        self._bloom = BloomFilter(capacity=capacity, error_rate=error_rate)
+        self._fingerprints: "OrderedDict[str, Tuple[Optional[str], str]]" = OrderedDict()
+        self._max_fingerprints = max_fingerprints
+        self._warm_days = warm_days
+        self._loaded = False
+
+        # Stats per plugin: outcome -> count
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    async def load(self) -> None:
+        """Warm the filter from the item repository (once per instance)."""
+        if self._loaded:
+            return
+        self._loaded = True
+
+        if self._item_repo is None:
+            return
+
+        try:
+            rows = await self._item_repo.get_recent_metrics(days=self._warm_days)
+        except Exception as e:
+            logger.warning(f"Failed to warm seen-item filter: {e}")
+            return
+
+        for source, source_id, metrics in rows:
+            key = _item_key(source, source_id)
+            self._bloom.add(key)
+            self._remember(key, None, _metrics_digest(metrics))
+
+        logger.info(f"Warmed seen-item filter with {len(rows)} items")
+
+    async def partition(
+        self, items: List[ProcessedItem], plugin_name: str = ""
+    ) -> SeenPartition:
+        """
+        Split items into new, metrics-changed and unchanged.
+
+        Args:
+            items: Collected items
+            plugin_name: Plugin the items came from (for stats)
+
+        Returns:
+            SeenPartition of the items
+        """
+        await self.load()
+
+        keys = [_item_key(item.source.value, item.source_id) for item in items]
+        await self._lookup_unknown(items, keys)
+
+        result = SeenPartition()
+        batch_keys = set()
+        for item, key in zip(items, keys):
+            if key in batch_keys:
+                # Repeated within the batch; save_batch keeps the last one
+                result.new.append(item)
+                continue
+            batch_keys.add(key)
+
+            known = self._fingerprints.get(key) if key in self._bloom else None
+            if known is None:
+                # Never stored, or a Bloom false positive with no stored row
+                result.new.append(item)
+                continue
+
+            self._fingerprints.move_to_end(key)
+            content_digest, metrics_digest = known
+            if metrics_digest == _metrics_digest(item.metrics) and (
+                content_digest is None or content_digest == _content_digest(item)
+            ):
+                result.unchanged.append(item)
+            elif content_digest == _content_digest(item):
+                result.changed.append(item)
+            else:
+                # Content changed, or unknown for a warmed entry
+                result.new.append(item)
+
+        stats = self._stats.setdefault(plugin_name, {"new": 0, "changed": 0, "unchanged": 0})
+        stats["new"] += len(result.new)
+        stats["changed"] += len(result.changed)
+        stats["unchanged"] += len(result.unchanged)
+
+        return result
+
+    async def _lookup_unknown(self, items: List[ProcessedItem], keys: List[str]) -> None:
+        """Fetch stored metrics of Bloom-positive keys that have no fingerprint."""
+        if self._item_repo is None:
+            return
+
+        unknown = {}
+        for item, key in zip(items, keys):
+            if key not in unknown and key not in self._fingerprints and key in self._bloom:
+                unknown[key] = (item.source.value, item.source_id)
+        if not unknown:
+            return
+
+        try:
+            rows = await self._item_repo.get_metrics_by_keys(list(unknown.values()))
+        except Exception as e:
+            logger.warning(f"Seen-item lookup failed, upserting {len(unknown)} items: {e}")
+            return
+
+        for source, source_id, metrics in rows:
+            self._remember(_item_key(source, source_id), None, _metrics_digest(metrics))
+
+        logger.debug(f"Seen-item lookup: {len(rows)}/{len(unknown)} keys without fingerprint stored")
+
+    def mark(self, items: List[ProcessedItem]) -> None:
+        """
+        Record items as stored.
+
+        Call after a successful write so failed writes are retried.
+
+        Args:
+            items: Items that were written
+        """
+        for item in items:
+            key = _item_key(item.source.value, item.source_id)
+            self._bloom.add(key)
+            self._remember(key, _content_digest(item), _metrics_digest(item.metrics))
+
+    def get_stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Get per-plugin filter statistics.
+
+        Returns:
+            Dictionary of plugin name -> new/changed/unchanged counts and
+            skip ratio
+        """
+        stats = {}
+        for plugin_name, counts in self._stats.items():
+            total = sum(counts.values())
+            stats[plugin_name] = {
+                **counts,
+                "skip_ratio": round(counts["unchanged"] / total, 4) if total else 0.0,
+            }
+        return stats
+
+    def _remember(self, key: str, content_digest: Optional[str], metrics_digest: str) -> None:
+        """Store a fingerprint, evicting the least recently seen beyond the limit."""
+        self._fingerprints[key] = (content_digest, metrics_digest)
+        self._fingerprints.move_to_end(key)
+        while len(self._fingerprints) > self._max_fingerprints:
+            self._fingerprints.popitem(last=False)
+
+
+def _item_key(source: str, source_id: str) -> str:
+    """Seen-set key of an item."""
+    return f"{source}:{source_id}"
+
+
+def _content_digest(item: ProcessedItem) -> str:
+    """Digest of the fields a full upsert would rewrite."""
+    content = "\x1f".join(
+        [str(item.url), item.title, item.description or "", item.content or ""]
+    )
+    return hashlib.blake2b(content.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _metrics_digest(metrics: Metrics) -> str:
+    """Digest of an item's engagement metrics."""
+    payload = json.dumps(metrics.dict(), sort_keys=True)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+async def save_collected_items(
+    item_repo,
+    items: List[ProcessedItem],
+    seen_filter: Optional[SeenItemFilter] = None,
+    plugin_name: str = "",
+) -> SeenPartition:
+    """
+    Persist a collected batch, writing only what changed.
+
+    New items go to ``save_batch``, metrics-only changes to
+    ``update_metrics_batch``; without a filter every item is bulk upserted.
+    If fewer rows than expected take the metrics update (rows deleted
+    since they were seen), the changed items are upserted in full.
+
+    Args:
+        item_repo: ItemRepository to write to
+        items: Collected items
+        seen_filter: Optional seen-item filter
+        plugin_name: Plugin the items came from (for stats)
+
+    Returns:
+        SeenPartition describing what was written
+    """
+    from trend_agent.observability.metrics import record_ingest_items
+
+    if seen_filter is None:
+        partition = SeenPartition(new=list(items))
+    else:
+        partition = await seen_filter.partition(items, plugin_name=plugin_name)
+
+    if partition.new:
+        await item_repo.save_batch(partition.new)
+    if partition.changed:
+        updated = await item_repo.update_metrics_batch(partition.changed)
+        if updated < len(partition.changed):
+            logger.info(
+                f"{plugin_name or 'collection'}: {len(partition.changed) - updated} "
+                f"items missing for metrics update, upserting {len(partition.changed)}"
+            )
+            await item_repo.save_batch(partition.changed)
+
+    if seen_filter is not None:
+        seen_filter.mark(partition.new + partition.changed)
+
+    record_ingest_items(
+        plugin_name, len(partition.new), len(partition.changed), len(partition.unchanged)
+    )
+    logger.info(
+        f"{plugin_name or 'collection'}: {len(partition.new)} new, "
+        f"{len(partition.changed)} metrics updated, {len(partition.unchanged)} unchanged "
+        f"(skip ratio {partition.skip_ratio:.0%})"
+    )
+
+    return partition
@@ -119,6 +119,49 @@ db_connection_pool_available = Gauge(
     registry=metrics_registry,
 )
 
+translation_store_duration = Histogram(
+    "translation_store_duration_seconds",
+    "Persistent translation store call duration in seconds",
+    ["operation"],  # get, save
+    buckets=[0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0],
+    registry=metrics_registry,
+)
+
+translation_store_batch_size = Histogram(
+    "translation_store_batch_size",
+    "Rows per persistent translation store call",
+    ["operation"],  # get, save
+    buckets=[1, 5, 10, 50, 100, 500, 1000, 5000],
+    registry=metrics_registry,
+)
+
+vector_points_written_counter = Counter(
+    "vector_points_written_total",
+    "Vector points sent to the vector database by result",
+    ["result"],  # written, failed
+    registry=metrics_registry,
+)
+
+vector_batch_splits_counter = Counter(
+    "vector_batch_splits_total",
+    "Failed vector upsert batches split for retry",
+    registry=metrics_registry,
+)
+
+pipeline_stage_queue_depth = Gauge(
+    "pipeline_stage_queue_depth",
+    "Micro-batches waiting in a streamed pipeline stage's input queue",
+    ["stage"],
+    registry=metrics_registry,
+)
+
+pipeline_stage_backpressure_seconds = Counter(
+    "pipeline_stage_backpressure_seconds_total",
+    "Time upstream producers spent blocked on a full stage input queue",
+    ["stage"],
+    registry=metrics_registry,
+)
+
 # ============================================================================
 # Business Metrics
 # ============================================================================
@@ -151,6 +194,65 @@ active_trends_gauge = Gauge(
     registry=metrics_registry,
 )
 
+ingest_items_counter = Counter(
+    "ingest_items_total",
+    "Collected items by ingest outcome",
+    ["plugin", "outcome"],  # new, changed (metrics-only update), unchanged (skipped)
+    registry=metrics_registry,
+)
+
+ingest_skip_ratio_gauge = Gauge(
+    "ingest_skip_ratio",
+    "Fraction of the last collection from a plugin that needed no write",
+    ["plugin"],
+    registry=metrics_registry,
+)
+
+# ============================================================================
+# Cache Metrics
+# ============================================================================
+
+embedding_cache_lookups_counter = Counter(
+    "embedding_cache_lookups_total",
+    "Embedding cache lookups by result",
+    ["result"],  # item, memory, redis (hits) or miss
+    registry=metrics_registry,
+)
+
+query_embedding_lookups_counter = Counter(
+    "query_embedding_cache_lookups_total",
+    "Search query embedding lookups by result",
+    ["result"],  # memory, redis, coalesced (hits) or miss
+    registry=metrics_registry,
+)
+
+query_embedding_saved_seconds = Counter(
+    "query_embedding_cache_saved_seconds_total",
+    "Estimated embedding latency avoided by query embedding cache hits",
+    registry=metrics_registry,
+)
+
+llm_cache_lookups_counter = Counter(
+    "llm_cache_lookups_total",
+    "LLM response cache lookups by result",
+    ["provider", "result"],  # redis, disk (hits), miss or skipped
+    registry=metrics_registry,
+)
+
+llm_cache_saved_tokens = Counter(
+    "llm_cache_saved_tokens_total",
+    "LLM tokens not sent to the provider thanks to response cache hits",
+    ["provider"],
+    registry=metrics_registry,
+)
+
+llm_cache_saved_cost = Counter(
+    "llm_cache_saved_cost_usd_total",
+    "Estimated LLM spend avoided by response cache hits",
+    ["provider"],
+    registry=metrics_registry,
+)
+
 # ============================================================================
 # System Metrics
 # ============================================================================
@@ -413,6 +515,25 @@ def record_topic_created(category: str, count: int = 1):
     topics_created_counter.labels(category=category).inc(count)
 
 
+def record_ingest_items(plugin: str, new: int, changed: int, unchanged: int):
+    """
+    Record the ingest outcome of one plugin collection.
+
+    Args:
+        plugin: Plugin name
+        new: Items written with a full upsert
+        changed: Items whose metrics were updated
+        unchanged: Items skipped as already stored
+    """
+    ingest_items_counter.labels(plugin=plugin, outcome="new").inc(new)
+    ingest_items_counter.labels(plugin=plugin, outcome="changed").inc(changed)
+    ingest_items_counter.labels(plugin=plugin, outcome="unchanged").inc(unchanged)
+
+    total = new + changed + unchanged
+    if total:
+        ingest_skip_ratio_gauge.labels(plugin=plugin).set(unchanged / total)
+
+
 def update_active_trends(state: str, count: int):
     """
     Update active trends gauge.
@@ -424,6 +545,100 @@ def update_active_trends(state: str, count: int):
     active_trends_gauge.labels(state=state).set(count)
 
 
+def record_embedding_cache_lookup(result: str, count: int = 1):
+    """
+    Record embedding cache lookups.
+
+    Args:
+        result: Tier that served the vector (item, memory, redis) or "miss"
+        count: Number of lookups
+    """
+    embedding_cache_lookups_counter.labels(result=result).inc(count)
+
+
+def record_query_embedding_lookup(result: str, saved_seconds: float = 0.0):
+    """
+    Record a search query embedding lookup.
+
+    Args:
+        result: Tier that served the vector (memory, redis, coalesced) or "miss"
+        saved_seconds: Estimated embedding latency avoided by this lookup
+    """
+    query_embedding_lookups_counter.labels(result=result).inc()
+    if saved_seconds > 0:
+        query_embedding_saved_seconds.inc(saved_seconds)
+
+
+def record_llm_cache_lookup(
+    provider: str, result: str, tokens_saved: int = 0, cost_saved: float = 0.0
+):
+    """
+    Record an LLM response cache lookup.
+
+    Args:
+        provider: LLM provider (openai, anthropic)
+        result: Tier that served the response (redis, disk), "miss" or "skipped"
+        tokens_saved: Tokens of the cached response not sent to the provider
+        cost_saved: Estimated cost of the cached response in USD
+    """
+    llm_cache_lookups_counter.labels(provider=provider, result=result).inc()
+    if tokens_saved > 0:
+        llm_cache_saved_tokens.labels(provider=provider).inc(tokens_saved)
+    if cost_saved > 0:
+        llm_cache_saved_cost.labels(provider=provider).inc(cost_saved)
+
+
+def record_translation_store_call(operation: str, duration: float, batch_size: int):
+    """
+    Record a persistent translation store call.
+
+    Args:
+        operation: Store operation ("get" or "save")
+        duration: Call duration in seconds
+        batch_size: Number of rows requested or written
+    """
+    translation_store_duration.labels(operation=operation).observe(duration)
+    translation_store_batch_size.labels(operation=operation).observe(batch_size)
+
+
+def record_vector_points(result: str, count: int = 1):
+    """
+    Record vector points sent to the vector database.
+
+    Args:
+        result: Outcome ("written" or "failed")
+        count: Number of points
+    """
+    vector_points_written_counter.labels(result=result).inc(count)
+
+
+def record_vector_batch_split():
+    """Record a failed vector upsert batch being split for retry."""
+    vector_batch_splits_counter.inc()
+
+
+def update_pipeline_queue_depth(stage: str, depth: int):
+    """
+    Update the input queue depth of a streamed pipeline stage.
+
+    Args:
+        stage: Stage name
+        depth: Micro-batches currently queued
+    """
+    pipeline_stage_queue_depth.labels(stage=stage).set(depth)
+
+
+def record_pipeline_backpressure(stage: str, seconds: float):
+    """
+    Record time spent waiting on a full stage input queue.
+
+    Args:
+        stage: Stage whose input queue was full
+        seconds: Time the upstream producer was blocked
+    """
+    pipeline_stage_backpressure_seconds.labels(stage=stage).inc(seconds)
+
+
 def update_db_pool_metrics(size: int, available: int):
     """
     Update database connection pool metrics.
@@ -23,6 +23,7 @@ from trend_agent.storage.qdrant import QdrantVectorRepository
 from trend_agent.storage.redis import RedisCacheRepository
 from trend_agent.ingestion.manager import DefaultPluginManager
 from trend_agent.ingestion.converters import batch_raw_to_processed
+from trend_agent.ingestion.seen_filter import SeenItemFilter, save_collected_items
 from trend_agent.processing import create_standard_pipeline
 from trend_agent.schemas import ProcessedItem, Trend, Topic
 
@@ -81,6 +82,7 @@ class TrendIntelligenceOrchestrator:
         # Storage components (initialized on connect)
         self.db_pool: Optional[PostgreSQLConnectionPool] = None
         self.item_repo: Optional[PostgreSQLItemRepository] = None
+        self.seen_filter: Optional[SeenItemFilter] = None
         self.trend_repo: Optional[PostgreSQLTrendRepository] = None
         self.topic_repo: Optional[PostgreSQLTopicRepository] = None
         self.vector_repo: Optional[QdrantVectorRepository] = None
@@ -107,6 +109,7 @@ class TrendIntelligenceOrchestrator:
         self.db_pool = PostgreSQLConnectionPool(**self.postgres_config)
         await self.db_pool.connect()
         self.item_repo = PostgreSQLItemRepository(self.db_pool.pool)
+        self.seen_filter = SeenItemFilter(item_repo=self.item_repo)
         self.trend_repo = PostgreSQLTrendRepository(self.db_pool.pool)
         self.topic_repo = PostgreSQLTopicRepository(self.db_pool.pool)
         logger.info("✅ PostgreSQL connected")
@@ -151,7 +154,7 @@ class TrendIntelligenceOrchestrator:
         if self.cache_repo:
             await self.cache_repo.close()
         if self.vector_repo:
-            self.vector_repo.client.close()
+            await self.vector_repo.close()
         if self.service_factory:
             await self.service_factory.close()
 
@@ -185,18 +188,21 @@ class TrendIntelligenceOrchestrator:
         # Convert to processed items with minimal processing
         processed_items = batch_raw_to_processed(raw_items)
 
-        # Save to database
-        saved_count = 0
-        for item in processed_items:
-            await self.item_repo.save(item)
-            saved_count += 1
+        # Save new items, update metrics of changed ones, skip the rest
+        partition = await save_collected_items(
+            self.item_repo, processed_items, seen_filter=self.seen_filter, plugin_name=plugin_name
+        )
+
+        # Items are stored: let the plugin advance its feed watermarks
+        await plugin.on_saved(raw_items)
 
         duration = (datetime.utcnow() - start_time).total_seconds()
 
         result = {
             "plugin_name": plugin_name,
             "items_collected": len(raw_items),
-            "items_saved": saved_count,
+            "items_saved": len(partition.new) + len(partition.changed),
+            "items_skipped": len(partition.unchanged),
             "duration_seconds": duration,
             "timestamp": datetime.utcnow().isoformat(),
         }
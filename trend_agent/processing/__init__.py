@@ -46,6 +46,12 @@ from trend_agent.processing.cluster import (
     ClustererStage,
     HDBSCANClusterer,
 )
+from trend_agent.processing.content_fetcher import ContentFetchService, ContentFetchStage
+from trend_agent.processing.cpu_executor import CPUExecutor
+from trend_agent.processing.embedding_cache import EmbeddingCache
+from trend_agent.processing.entities import EntityExtractor
+from trend_agent.processing.near_duplicates import NearDuplicateFinder
+from trend_agent.processing.topic_index import TopicIndex
 from trend_agent.processing.rank import (
     RankerStage,
     CompositeRanker,
@@ -71,12 +77,19 @@ __all__ = [
     "DeduplicatorStage",
     "ClustererStage",
     "RankerStage",
+    "ContentFetchStage",
     # Core implementations
     "TextNormalizer",
     "LanguageDetector",
     "EmbeddingDeduplicator",
     "HDBSCANClusterer",
     "CompositeRanker",
+    "ContentFetchService",
+    "CPUExecutor",
+    "EmbeddingCache",
+    "EntityExtractor",
+    "NearDuplicateFinder",
+    "TopicIndex",
     # Utilities
     "is_cjk",
     "is_rtl",
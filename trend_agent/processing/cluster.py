@@ -9,13 +9,15 @@ import logging
 from collections import Counter
 from datetime import datetime
 from typing import Dict, List, Optional
-from uuid import uuid4
+from uuid import UUID, uuid4
 
 import hdbscan
 import numpy as np
 
 from trend_agent.intelligence.interfaces import BaseEmbeddingService, BaseLLMService
+from trend_agent.processing.embedding_cache import EmbeddingCache
 from trend_agent.processing.interfaces import BaseClusterer, BaseProcessingStage
+from trend_agent.processing.topic_index import TopicIndex
 from trend_agent.schemas import Category, Metrics, ProcessedItem, SourceType, Topic
 
 logger = logging.getLogger(__name__)
@@ -38,6 +40,10 @@ class HDBSCANClusterer(BaseClusterer):
         cluster_selection_epsilon: float = 0.0,
         cluster_selection_method: str = "eom",
         prediction_data: bool = True,
+        embedding_cache: Optional[EmbeddingCache] = None,
+        topic_index: Optional[TopicIndex] = None,
+        assignment_threshold: float = 0.85,
+        min_prediction_strength: float = 0.5,
     ):
         """
         Initialize HDBSCAN clusterer.
@@ -50,6 +56,13 @@ class HDBSCANClusterer(BaseClusterer):
             cluster_selection_epsilon: Distance threshold for cluster merging (default: 0.0)
             cluster_selection_method: Method for selecting clusters: 'eom' or 'leaf' (default: 'eom')
             prediction_data: Whether to generate prediction data for soft clustering (default: True)
+            embedding_cache: Optional shared embedding cache (one is created if None)
+            topic_index: Optional TopicIndex enabling incremental clustering, where
+                items are first assigned to topics from earlier runs
+            assignment_threshold: Minimum cosine similarity to a topic centroid
+                for an item to join that topic (incremental mode)
+            min_prediction_strength: Minimum HDBSCAN approximate_predict strength
+                for an item to join a predicted topic (incremental mode)
         """
         self._embedding_service = embedding_service
         self._llm_service = llm_service
@@ -58,6 +71,10 @@ class HDBSCANClusterer(BaseClusterer):
         self._cluster_selection_epsilon = cluster_selection_epsilon
         self._cluster_selection_method = cluster_selection_method
         self._prediction_data = prediction_data
+        self._embedding_cache = embedding_cache or EmbeddingCache(embedding_service)
+        self._topic_index = topic_index
+        self._assignment_threshold = assignment_threshold
+        self._min_prediction_strength = min_prediction_strength
         self._last_clusterer = None  # Store last clusterer for analysis
 
     async def cluster(
@@ -80,10 +97,16 @@ class HDBSCANClusterer(BaseClusterer):
         Note:
             - Items with cluster label -1 are considered noise and grouped separately
             - Each cluster becomes a Topic with aggregated metadata
+            - With a topic index, items matching known topics update those
+              topics (``metadata["is_existing_topic"]``) and only the rest
+              are clustered into new topics
         """
         if not items:
             return []
 
+        if self._topic_index is not None:
+            return await self._cluster_incremental(items, min_cluster_size)
+
         if len(items) < min_cluster_size:
             logger.info(
                 f"Too few items ({len(items)}) for clustering. "
@@ -91,13 +114,30 @@ class HDBSCANClusterer(BaseClusterer):
             )
             return [await self._create_topic_from_items(items, 0)]
 
-        # Generate embeddings for all items
-        texts = [self._get_text_for_embedding(item) for item in items]
-        embeddings = await self._embedding_service.embed_batch(texts)
+        # Get embeddings for all items (cached vectors are reused)
+        embeddings = await self._embedding_cache.embed_items(
+            items, self._get_text_for_embedding
+        )
+
+        return await self._cluster_embeddings(items, np.array(embeddings), min_cluster_size)
+
+    async def _cluster_embeddings(
+        self,
+        items: List[ProcessedItem],
+        embeddings_array: np.ndarray,
+        min_cluster_size: int,
+    ) -> List[Topic]:
+        """
+        Fit HDBSCAN on embeddings and build one topic per cluster.
 
-        # Convert to numpy array
-        embeddings_array = np.array(embeddings)
+        Args:
+            items: Items to cluster
+            embeddings_array: Item embeddings, row-aligned with items
+            min_cluster_size: Minimum items per cluster
 
+        Returns:
+            List of topics (the noise cluster becomes "Miscellaneous")
+        """
         # Perform HDBSCAN clustering with advanced features
         clusterer = hdbscan.HDBSCAN(
             min_cluster_size=min_cluster_size,
@@ -192,6 +232,130 @@ class HDBSCANClusterer(BaseClusterer):
 
         return topics
 
+    async def _cluster_incremental(
+        self, items: List[ProcessedItem], min_cluster_size: int
+    ) -> List[Topic]:
+        """
+        Assign items to known topics and cluster only the unassigned residue.
+
+        Args:
+            items: Items to cluster
+            min_cluster_size: Minimum items per new cluster
+
+        Returns:
+            Updated existing topics followed by newly created topics
+        """
+        await self._topic_index.load()
+
+        embeddings = np.array(
+            await self._embedding_cache.embed_items(items, self._get_text_for_embedding)
+        )
+        topic_ids, methods = self._topic_index.assign(
+            embeddings,
+            min_similarity=self._assignment_threshold,
+            min_probability=self._min_prediction_strength,
+        )
+
+        assigned: Dict[UUID, List[int]] = {}
+        residue: List[int] = []
+        for i, topic_id in enumerate(topic_ids):
+            if topic_id is None:
+                residue.append(i)
+            else:
+                assigned.setdefault(topic_id, []).append(i)
+
+        # Update known topics in place
+        topics = []
+        for topic_id, positions in assigned.items():
+            topic = self._merge_into_topic(
+                self._topic_index.get(topic_id).topic, [items[i] for i in positions]
+            )
+            topic.metadata.update({
+                "is_existing_topic": True,
+                "items_added": len(positions),
+                "assigned_by": dict(Counter(methods[i] for i in positions)),
+            })
+            self._topic_index.upsert(topic, embeddings[positions])
+            topics.append(topic)
+
+        # Cluster the residue into new topics
+        if residue:
+            residue_items = [items[i] for i in residue]
+            residue_embeddings = embeddings[residue]
+
+            if len(residue_items) < min_cluster_size:
+                new_topics = [await self._create_topic_from_items(residue_items, 0)]
+                labels = np.zeros(len(residue_items), dtype=int)
+            else:
+                new_topics = await self._cluster_embeddings(
+                    residue_items, residue_embeddings, min_cluster_size
+                )
+                labels = self._last_clusterer.labels_
+                self._topic_index.set_model(
+                    self._last_clusterer,
+                    {
+                        topic.metadata["cluster_id"]: topic.id
+                        for topic in new_topics
+                        if not topic.metadata.get("is_noise_cluster")
+                    },
+                )
+
+            for topic in new_topics:
+                # Noise is regrouped every run rather than becoming a known topic
+                if topic.metadata.get("is_noise_cluster"):
+                    continue
+                members = labels == topic.metadata["cluster_id"]
+                self._topic_index.upsert(topic, residue_embeddings[members])
+
+            topics.extend(new_topics)
+
+        await self._topic_index.save()
+
+        logger.info(
+            f"Incremental clustering: {len(items) - len(residue)} items joined "
+            f"{len(assigned)} existing topics, {len(residue)} clustered into "
+            f"{len(topics) - len(assigned)} new topics"
+        )
+
+        return topics
+
+    def _merge_into_topic(self, topic: Topic, items: List[ProcessedItem]) -> Topic:
+        """
+        Fold new items into a known topic's counts, metrics and sources.
+
+        Args:
+            topic: Topic as of the previous run
+            items: Items newly assigned to it
+
+        Returns:
+            Updated copy of the topic (same ID)
+        """
+        engagement = topic.total_engagement
+        total_engagement = Metrics(
+            upvotes=engagement.upvotes + sum(item.metrics.upvotes for item in items),
+            downvotes=engagement.downvotes + sum(item.metrics.downvotes for item in items),
+            comments=engagement.comments + sum(item.metrics.comments for item in items),
+            shares=engagement.shares + sum(item.metrics.shares for item in items),
+            views=engagement.views + sum(item.metrics.views for item in items),
+            score=engagement.score + sum(item.metrics.score for item in items),
+        )
+
+        sources = list(topic.sources)
+        for item in items:
+            if item.source not in sources:
+                sources.append(item.source)
+
+        return topic.model_copy(
+            update={
+                "item_count": topic.item_count + len(items),
+                "total_engagement": total_engagement,
+                "sources": sources,
+                "first_seen": min([topic.first_seen] + [i.published_at for i in items]),
+                "last_updated": max([topic.last_updated] + [i.published_at for i in items]),
+                "metadata": dict(topic.metadata),
+            }
+        )
+
     async def assign_category(self, topic: Topic) -> str:
         """
         Assign a category to a topic using LLM.
@@ -1,16 +1,31 @@
 """
 Content fetcher module for extracting full article content from URLs.
+
+Fetches go through a ContentFetchService, which keeps one keep-alive
+connection pool with per-host limits, caches extracted text by URL,
+revalidates stale entries with conditional GETs, and runs trafilatura off
+the event loop.
 """
 import asyncio
-import aiohttp
+import time
 import trafilatura
-from typing import Optional
+from collections import OrderedDict
+from functools import partial
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Tuple
 import logging
 import re
 from bs4 import BeautifulSoup
 
+from trend_agent.http_session import LoopBoundSession
+from trend_agent.processing.interfaces import BaseProcessingStage
+from trend_agent.schemas import ProcessedItem
+from trend_agent.storage.interfaces import CacheRepository
+
 logger = logging.getLogger(__name__)
 
+# Platform URLs contain navigation boilerplate rather than article content
+SKIP_DOMAINS = ['reddit.com', 'news.ycombinator.com', 'twitter.com', 'x.com', 'news.google.com']
+
 
 def strip_html_tags(text: str) -> str:
     """
@@ -43,89 +58,435 @@ def strip_html_tags(text: str) -> str:
         return text.strip()
 
 
-async def fetch_url_content(url: str, timeout: int = 10) -> Optional[str]:
+def extract_main_content(html: str, max_length: int = 5000) -> Optional[str]:
     """
-    Fetch and extract the main content from a URL.
+    Extract the main article text from HTML with trafilatura.
+
+    Module-level so it can run in a CPUExecutor worker process.
 
     Args:
-        url: The URL to fetch content from
-        timeout: Request timeout in seconds
+        html: Page HTML
+        max_length: Content is truncated to this many characters
 
     Returns:
-        Extracted text content or None if fetch fails
+        Extracted text or None if nothing could be extracted
     """
-    try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                url,
-                timeout=aiohttp.ClientTimeout(total=timeout),
-                headers={'User-Agent': 'Mozilla/5.0 (compatible; TrendBot/1.0)'}
-            ) as response:
+    content = trafilatura.extract(
+        html,
+        include_comments=False,
+        include_tables=False,
+        no_fallback=False
+    )
+
+    # Limit content length to avoid token limits
+    if content and len(content) > max_length:
+        content = content[:max_length] + "..."
+
+    return content or None
+
+
+class ContentFetchService:
+    """
+    Pooled, cached article content fetcher.
+
+    Features:
+    - One aiohttp session per event loop with a keep-alive connection pool
+      (``max_connections`` total, ``per_host_limit`` per host)
+    - URL-keyed cache of extracted text (in-process LRU plus optional Redis)
+    - Fresh entries (younger than ``cache_ttl_seconds``) are served without
+      a request; stale entries are revalidated with If-None-Match /
+      If-Modified-Since, and a 304 reuses the cached text
+    - trafilatura runs in a thread, or in a CPUExecutor if one is given
+    - ``fetch_many`` yields results as they complete
+
+    Example:
+        ```python
+        async with ContentFetchService(cache_repo=redis_repo) as fetcher:
+            async for url, content in fetcher.fetch_many(urls):
+                ...
+        ```
+    """
+
+    USER_AGENT = 'Mozilla/5.0 (compatible; TrendBot/1.0)'
+
+    def __init__(
+        self,
+        max_connections: int = 100,
+        per_host_limit: int = 4,
+        timeout: int = 10,
+        cache_repo: Optional[CacheRepository] = None,
+        cache_ttl_seconds: int = 21600,
+        revalidate_ttl_seconds: int = 604800,
+        max_entries: int = 2048,
+        max_length: int = 5000,
+        cpu_executor=None,
+        key_prefix: str = "content",
+    ):
+        """
+        Initialize content fetch service.
+
+        Args:
+            max_connections: Maximum open connections in the pool
+            per_host_limit: Maximum concurrent connections per host
+            timeout: Connect and socket read timeout in seconds
+            cache_repo: Optional Redis cache repository shared across workers
+            cache_ttl_seconds: Age below which cached text is used without a
+                request (default: 6 hours)
+            revalidate_ttl_seconds: How long entries are kept for conditional
+                GET revalidation (default: 7 days)
+            max_entries: Maximum entries held in the in-process LRU
+            max_length: Extracted content is truncated to this many characters
+            cpu_executor: Optional CPUExecutor for trafilatura extraction
+            key_prefix: Prefix for Redis cache keys
+        """
+        self._pool = LoopBoundSession(
+            max_connections=max_connections, per_host_limit=per_host_limit, timeout=timeout
+        )
+        self._cache_repo = cache_repo
+        self._cache_ttl_seconds = cache_ttl_seconds
+        self._revalidate_ttl_seconds = revalidate_ttl_seconds
+        self._max_entries = max_entries
+        self._max_length = max_length
+        self._cpu_executor = cpu_executor
+        self._key_prefix = key_prefix
+        self._lru: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+        # Stats
+        self._stats = {"cached": 0, "not_modified": 0, "fetched": 0, "failed": 0}
+
+    async def fetch(self, url: str) -> Optional[str]:
+        """
+        Fetch and extract the main content from a URL.
+
+        Args:
+            url: The URL to fetch content from
+
+        Returns:
+            Extracted text content or None if fetch fails
+        """
+        entry = await self._cache_get(url)
+        if entry is not None and time.time() - entry["fetched_at"] < self._cache_ttl_seconds:
+            self._stats["cached"] += 1
+            return entry["content"]
+
+        headers = {'User-Agent': self.USER_AGENT}
+        if entry is not None and entry.get("content"):
+            if entry.get("etag"):
+                headers['If-None-Match'] = entry["etag"]
+            if entry.get("last_modified"):
+                headers['If-Modified-Since'] = entry["last_modified"]
+
+        try:
+            session = await self._pool.get()
+            async with session.get(url, headers=headers) as response:
+                if response.status == 304 and entry is not None:
+                    self._stats["not_modified"] += 1
+                    entry = {**entry, "fetched_at": time.time()}
+                    await self._cache_set(url, entry)
+                    return entry["content"]
+
                 if response.status != 200:
                     logger.warning(f"Failed to fetch {url}: HTTP {response.status}")
+                    self._stats["failed"] += 1
                     return None
 
                 html = await response.text()
+                etag = response.headers.get('ETag')
+                last_modified = response.headers.get('Last-Modified')
+
+        except asyncio.TimeoutError:
+            logger.warning(f"Timeout fetching {url}")
+            self._stats["failed"] += 1
+            return None
+        except Exception as e:
+            logger.warning(f"Error fetching {url}: {str(e)}")
+            self._stats["failed"] += 1
+            return None
+
+        content = await self._extract(html)
+        if not content:
+            logger.warning(f"Could not extract content from {url}")
+
+        self._stats["fetched"] += 1
+        await self._cache_set(url, {
+            "content": content,
+            "etag": etag,
+            "last_modified": last_modified,
+            "fetched_at": time.time(),
+        })
+
+        return content
+
+    async def fetch_many(
+        self, urls: Iterable[str]
+    ) -> AsyncIterator[Tuple[str, Optional[str]]]:
+        """
+        Fetch many URLs concurrently, yielding results as they complete.
+
+        Concurrency is bounded by the connection pool limits.
+
+        Args:
+            urls: URLs to fetch (duplicates are fetched once)
+
+        Yields:
+            (url, content) tuples in completion order; content is None on failure
+        """
+        async def fetch_one(url: str) -> Tuple[str, Optional[str]]:
+            return url, await self.fetch(url)
+
+        tasks = [asyncio.ensure_future(fetch_one(url)) for url in dict.fromkeys(urls)]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get fetch statistics.
+
+        Returns:
+            Dictionary with counts of cache hits, 304 revalidations, full
+            fetches and failures
+        """
+        return {**self._stats, "memory_entries": len(self._lru)}
+
+    async def close(self) -> None:
+        """Close the connection pool."""
+        await self._pool.close()
 
-                # Use trafilatura to extract main content
-                content = trafilatura.extract(
-                    html,
-                    include_comments=False,
-                    include_tables=False,
-                    no_fallback=False
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def _extract(self, html: str) -> Optional[str]:
+        """Run trafilatura off the event loop."""
+        try:
+            if self._cpu_executor is not None:
+                results = await self._cpu_executor.map(
+                    partial(extract_main_content, max_length=self._max_length), [html]
                 )
+                return results[0]
 
-                if content:
-                    # Limit content length to avoid token limits
-                    max_length = 5000
-                    if len(content) > max_length:
-                        content = content[:max_length] + "..."
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                None, extract_main_content, html, self._max_length
+            )
+        except Exception as e:
+            logger.warning(f"Content extraction failed: {e}")
+            return None
 
-                    return content
-                else:
-                    logger.warning(f"Could not extract content from {url}")
-                    return None
+    async def _cache_get(self, url: str) -> Optional[Dict[str, Any]]:
+        """Get a cache entry from the LRU, then Redis."""
+        entry = self._lru.get(url)
+        if entry is not None:
+            self._lru.move_to_end(url)
+            return entry
+
+        if self._cache_repo is None:
+            return None
+
+        try:
+            entry = await self._cache_repo.get(f"{self._key_prefix}:{url}")
+        except Exception as e:
+            logger.warning(f"Content cache Redis get failed: {e}")
+            return None
+
+        if entry is not None:
+            self._lru_put(url, entry)
+        return entry
+
+    async def _cache_set(self, url: str, entry: Dict[str, Any]) -> None:
+        """Store a cache entry in the LRU and Redis, ignoring cache failures."""
+        self._lru_put(url, entry)
+
+        if self._cache_repo is None:
+            return
+        try:
+            await self._cache_repo.set(
+                f"{self._key_prefix}:{url}", entry, ttl_seconds=self._revalidate_ttl_seconds
+            )
+        except Exception as e:
+            logger.warning(f"Content cache Redis set failed: {e}")
+
+    def _lru_put(self, url: str, entry: Dict[str, Any]) -> None:
+        """Insert an entry into the LRU, evicting the oldest entry if full."""
+        self._lru[url] = entry
+        self._lru.move_to_end(url)
+        while len(self._lru) > self._max_entries:
+            self._lru.popitem(last=False)
 
-    except asyncio.TimeoutError:
-        logger.warning(f"Timeout fetching {url}")
-        return None
-    except Exception as e:
-        logger.warning(f"Error fetching {url}: {str(e)}")
-        return None
 
+# Shared service used by the module-level helpers
+_default_service: Optional[ContentFetchService] = None
 
-async def fetch_content_for_topic(topic) -> str:
+
+def get_content_fetch_service() -> ContentFetchService:
+    """Get the shared content fetch service."""
+    global _default_service
+    if _default_service is None:
+        _default_service = ContentFetchService()
+    return _default_service
+
+
+async def fetch_url_content(url: str, timeout: int = 10) -> Optional[str]:
     """
-    Fetch full content for a topic based on its source and URL.
+    Fetch and extract the main content from a URL.
 
     Args:
-        topic: Topic object with source, url, and description fields
+        url: The URL to fetch content from
+        timeout: Request timeout in seconds (used when the shared service
+            is first created)
 
     Returns:
-        Full content text or existing description if fetch fails
+        Extracted text content or None if fetch fails
     """
-    # For Reddit posts with selftext, use the description (cleaned)
+    global _default_service
+    if _default_service is None:
+        _default_service = ContentFetchService(timeout=timeout)
+    return await _default_service.fetch(url)
+
+
+def _content_url(topic) -> Optional[str]:
+    """Get the external article URL worth fetching for a topic, if any."""
+    # For Reddit posts with selftext, the description is the content
     if topic.source == 'reddit' and topic.description:
-        return strip_html_tags(topic.description)
+        return None
 
-    # Don't scrape social media platform URLs - they contain navigation boilerplate
-    # Only fetch external article content
     if topic.url:
-        # Skip reddit.com, news.ycombinator.com, news.google.com, and other platform URLs
-        skip_domains = ['reddit.com', 'news.ycombinator.com', 'twitter.com', 'x.com', 'news.google.com']
         url_str = str(topic.url)  # Convert HttpUrl to string
-        if not any(domain in url_str for domain in skip_domains):
-            content = await fetch_url_content(url_str)
-            if content:
-                return content
+        if not any(domain in url_str for domain in SKIP_DOMAINS):
+            return url_str
 
+    return None
+
+
+def _fallback_content(topic) -> str:
+    """Content for a topic when nothing could be fetched."""
     # Fallback to description if available (strip HTML tags)
     if topic.description:
         cleaned = strip_html_tags(topic.description)
         # If after stripping HTML we have very little content, use title
-        if len(cleaned) < 20:
+        if len(cleaned) < 20 and topic.source != 'reddit':
             return topic.title
         return cleaned
 
     # Last resort: just use the title
     return topic.title
+
+
+async def fetch_content_for_topic(topic, service: Optional[ContentFetchService] = None) -> str:
+    """
+    Fetch full content for a topic based on its source and URL.
+
+    Args:
+        topic: Topic object with source, url, and description fields
+        service: Content fetch service (shared service if None)
+
+    Returns:
+        Full content text or existing description if fetch fails
+    """
+    url = _content_url(topic)
+    if url:
+        content = await (service or get_content_fetch_service()).fetch(url)
+        if content:
+            return content
+
+    return _fallback_content(topic)
+
+
+async def fetch_content_for_topics(
+    topics: List[Any], service: Optional[ContentFetchService] = None
+) -> AsyncIterator[Tuple[Any, str]]:
+    """
+    Fetch full content for many topics concurrently.
+
+    Args:
+        topics: Topic objects with source, url, and description fields
+        service: Content fetch service (shared service if None)
+
+    Yields:
+        (topic, content) tuples as each topic's content becomes available
+    """
+    service = service or get_content_fetch_service()
+
+    by_url: Dict[str, List[Any]] = {}
+    for topic in topics:
+        url = _content_url(topic)
+        if url:
+            by_url.setdefault(url, []).append(topic)
+        else:
+            yield topic, _fallback_content(topic)
+
+    async for url, content in service.fetch_many(by_url):
+        for topic in by_url[url]:
+            yield topic, content or _fallback_content(topic)
+
+
+class ContentFetchStage(BaseProcessingStage):
+    """
+    Processing stage that fills in article content for items with little text.
+
+    Items whose content is shorter than ``min_content_length`` and whose URL
+    points at an external article are fetched concurrently through a
+    ContentFetchService; the extracted text becomes the item's content.
+    """
+
+    per_item = True
+
+    def __init__(
+        self,
+        fetcher: Optional[ContentFetchService] = None,
+        min_content_length: int = 200,
+    ):
+        """
+        Initialize content fetch stage.
+
+        Args:
+            fetcher: ContentFetchService instance (shared service if None)
+            min_content_length: Items with less content than this are fetched
+        """
+        self._fetcher = fetcher or get_content_fetch_service()
+        self._min_content_length = min_content_length
+
+    async def process(self, items: List[ProcessedItem]) -> List[ProcessedItem]:
+        """
+        Fetch content for items that need it.
+
+        Args:
+            items: Items to process
+
+        Returns:
+            Items with content filled in where it could be fetched
+        """
+        by_url: Dict[str, List[ProcessedItem]] = {}
+        for item in items:
+            if len(item.content or "") >= self._min_content_length:
+                continue
+            url = str(item.url)
+            if not any(domain in url for domain in SKIP_DOMAINS):
+                by_url.setdefault(url, []).append(item)
+
+        fetched = 0
+        async for url, content in self._fetcher.fetch_many(by_url):
+            if not content:
+                continue
+            for item in by_url[url]:
+                item.content = content
+                item.metadata["content_fetched"] = True
+                fetched += 1
+
+        logger.info(f"Fetched content for {fetched}/{len(items)} items")
+        return items
+
+    def get_stage_name(self) -> str:
+        """
+        Get the name of this processing stage.
+
+        Returns:
+            Stage name
+        """
+        return "content_fetcher"
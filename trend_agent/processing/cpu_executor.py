@@ -0,0 +1,187 @@
+"""
+CPU executor for processing pipeline.
+
+This module provides a process pool that CPU-bound per-item stages
+(normalization, language detection, cross-language normalization) dispatch
+work to, so HTML parsing, NER and langdetect run on every core instead of
+serially on the asyncio event loop.
+"""
+
+import asyncio
+import logging
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+
+class CPUExecutor:
+    """
+    Process pool with chunked work units and warm workers.
+
+    Payloads are split into chunks of ``chunk_size`` so each round trip to a
+    worker amortizes pickling over many items. Workers preload langdetect's
+    language profiles when they start, so no work unit pays the
+    profile-loading cost.
+
+    If worker processes cannot be started (e.g. inside a daemonic process)
+    or the pool breaks, work falls back to a thread so the event loop stays
+    responsive.
+
+    Example:
+        ```python
+        executor = CPUExecutor(max_workers=4)
+        pipeline = create_standard_pipeline(embedding_service, cpu_executor=executor)
+        result = await pipeline.run(raw_items)
+        executor.shutdown()
+        ```
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        chunk_size: int = 64,
+        mp_context=None,
+    ):
+        """
+        Initialize CPU executor.
+
+        Args:
+            max_workers: Worker processes (default: number of CPUs)
+            chunk_size: Payloads per work unit sent to a worker
+            mp_context: Optional multiprocessing context (e.g. spawn)
+        """
+        self._max_workers = max_workers or os.cpu_count() or 1
+        self._chunk_size = max(1, chunk_size)
+        self._mp_context = mp_context
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._warm_up: List[Future] = []
+        self._inline = False
+
+    @property
+    def max_workers(self) -> int:
+        """Number of worker processes."""
+        return self._max_workers
+
+    async def start(self) -> None:
+        """
+        Start the worker processes and wait until they are warm.
+
+        Called automatically by map(); call it up front to pay the start-up
+        cost before the first batch arrives.
+        """
+        if self._inline:
+            return
+
+        if self._pool is None:
+            try:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self._max_workers,
+                    mp_context=self._mp_context,
+                    initializer=_init_worker,
+                )
+                # One no-op per worker makes the pool start all of them
+                self._warm_up = [
+                    self._pool.submit(_ping) for _ in range(self._max_workers)
+                ]
+            except Exception as e:
+                self._fall_back(e)
+                return
+
+            logger.info(
+                f"Starting CPU executor with {self._max_workers} workers "
+                f"(chunk_size={self._chunk_size})"
+            )
+
+        try:
+            await asyncio.gather(*(asyncio.wrap_future(f) for f in self._warm_up))
+        except Exception as e:
+            self._fall_back(e)
+
+    async def map(self, fn: Callable[[Any], Any], payloads: Sequence[Any]) -> List[Any]:
+        """
+        Apply fn to every payload in the worker processes.
+
+        Args:
+            fn: Picklable module-level function taking one payload
+            payloads: Work items
+
+        Returns:
+            Results in payload order
+        """
+        if not payloads:
+            return []
+
+        await self.start()
+
+        chunks = [
+            list(payloads[i:i + self._chunk_size])
+            for i in range(0, len(payloads), self._chunk_size)
+        ]
+
+        try:
+            results = await self._run_chunks(fn, chunks)
+        except BrokenProcessPool as e:
+            self._fall_back(e)
+            results = await self._run_chunks(fn, chunks)
+
+        return [result for chunk in results for result in chunk]
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stop the worker processes.
+
+        Args:
+            wait: Wait for running work units to finish
+        """
+        if self._pool is not None:
+            self._pool.shutdown(wait=wait)
+            self._pool = None
+            self._warm_up = []
+
+    async def _run_chunks(
+        self, fn: Callable[[Any], Any], chunks: List[List[Any]]
+    ) -> List[List[Any]]:
+        """Run chunks on the pool, or on a thread after falling back."""
+        loop = asyncio.get_running_loop()
+        if self._inline:
+            return [
+                await loop.run_in_executor(None, _run_chunk, fn, chunk) for chunk in chunks
+            ]
+
+        return await asyncio.gather(*(
+            loop.run_in_executor(self._pool, _run_chunk, fn, chunk) for chunk in chunks
+        ))
+
+    def _fall_back(self, error: Exception) -> None:
+        """Switch to running work units on a thread."""
+        logger.warning(
+            f"CPU executor worker processes unavailable ({error}); "
+            "running work units in a thread instead"
+        )
+        self.shutdown(wait=False)
+        self._inline = True
+
+
+# ============================================================================
+# Worker Process Functions
+# ============================================================================
+
+
+def _init_worker() -> None:
+    """Preload language profiles in a new worker."""
+    from trend_agent.processing.language import warm_language_profiles
+
+    warm_language_profiles()
+
+
+def _ping() -> int:
+    """No-op work unit used to start and warm a worker."""
+    return os.getpid()
+
+
+def _run_chunk(fn: Callable[[Any], Any], chunk: List[Any]) -> List[Any]:
+    """Apply fn to every payload in a chunk."""
+    return [fn(payload) for payload in chunk]
@@ -6,13 +6,15 @@ similarity with configurable thresholds.
 """
 
 import logging
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 from sklearn.metrics.pairwise import cosine_similarity
 
 from trend_agent.intelligence.interfaces import BaseEmbeddingService
+from trend_agent.processing.embedding_cache import EmbeddingCache
 from trend_agent.processing.interfaces import BaseDeduplicator, BaseProcessingStage
+from trend_agent.processing.near_duplicates import NearDuplicateFinder
 from trend_agent.schemas import ProcessedItem, Topic, Trend, Metrics, SourceType
 
 logger = logging.getLogger(__name__)
@@ -30,6 +32,8 @@ class EmbeddingDeduplicator(BaseDeduplicator):
         self,
         embedding_service: BaseEmbeddingService,
         default_threshold: float = 0.92,
+        embedding_cache: Optional[EmbeddingCache] = None,
+        duplicate_finder: Optional[NearDuplicateFinder] = None,
     ):
         """
         Initialize deduplicator.
@@ -37,9 +41,14 @@ class EmbeddingDeduplicator(BaseDeduplicator):
         Args:
             embedding_service: Service for generating embeddings
             default_threshold: Default similarity threshold (0-1)
+            embedding_cache: Optional shared embedding cache (one is created if None)
+            duplicate_finder: Optional near-duplicate search engine (blocked exact
+                search if None)
         """
         self._embedding_service = embedding_service
         self._default_threshold = default_threshold
+        self._embedding_cache = embedding_cache or EmbeddingCache(embedding_service)
+        self._duplicate_finder = duplicate_finder or NearDuplicateFinder()
 
     async def find_duplicates(
         self, items: List[ProcessedItem], threshold: float = 0.92
@@ -63,41 +72,20 @@ class EmbeddingDeduplicator(BaseDeduplicator):
         if not items or len(items) < 2:
             return {}
 
-        # Generate embeddings for all items
-        texts = [self._get_text_for_embedding(item) for item in items]
-        embeddings = await self._embedding_service.embed_batch(texts)
-
-        # Convert to numpy array for sklearn
-        embeddings_array = np.array(embeddings)
+        # Get embeddings for all items (cached vectors are reused)
+        embeddings = await self._embedding_cache.embed_items(
+            items, self._get_text_for_embedding
+        )
 
-        # Calculate pairwise similarities
-        similarities = cosine_similarity(embeddings_array)
+        # Find duplicate groups (first index of each group is the representative)
+        index_groups = self._duplicate_finder.group(embeddings, threshold)
 
-        # Find duplicate groups
         duplicate_groups: Dict[str, List[ProcessedItem]] = {}
-        used_indices = set()
-
-        for i in range(len(items)):
-            if i in used_indices:
-                continue
-
-            # This item will be the representative
-            representative = items[i]
-            group = [representative]
-            used_indices.add(i)
-
-            # Find all duplicates of this item
-            for j in range(i + 1, len(items)):
-                if j in used_indices:
-                    continue
-
-                if similarities[i][j] > threshold:
-                    group.append(items[j])
-                    used_indices.add(j)
-
+        for group in index_groups:
             # Only add to result if there are duplicates
             if len(group) > 1:
-                duplicate_groups[representative.source_id] = group
+                representative = items[group[0]]
+                duplicate_groups[representative.source_id] = [items[i] for i in group]
 
         logger.info(
             f"Found {len(duplicate_groups)} duplicate groups "
@@ -122,32 +110,14 @@ class EmbeddingDeduplicator(BaseDeduplicator):
         if not items or len(items) < 2:
             return items
 
-        # Generate embeddings for all items
-        texts = [self._get_text_for_embedding(item) for item in items]
-        embeddings = await self._embedding_service.embed_batch(texts)
-
-        # Convert to numpy array for sklearn
-        embeddings_array = np.array(embeddings)
-
-        # Calculate pairwise similarities
-        similarities = cosine_similarity(embeddings_array)
-
-        # Track which items to keep
-        used_indices = set()
-        unique_items = []
-
-        for i in range(len(items)):
-            if i in used_indices:
-                continue
-
-            # Keep this item (first occurrence)
-            unique_items.append(items[i])
-            used_indices.add(i)
+        # Get embeddings for all items (cached vectors are reused)
+        embeddings = await self._embedding_cache.embed_items(
+            items, self._get_text_for_embedding
+        )
 
-            # Mark all duplicates as used
-            for j in range(i + 1, len(items)):
-                if similarities[i][j] > threshold:
-                    used_indices.add(j)
+        # Keep the first occurrence (representative) of each group
+        index_groups = self._duplicate_finder.group(embeddings, threshold)
+        unique_items = [items[group[0]] for group in index_groups]
 
         duplicates_removed = len(items) - len(unique_items)
         logger.info(
@@ -157,6 +127,24 @@ class EmbeddingDeduplicator(BaseDeduplicator):
 
         return unique_items
 
+    async def find_duplicate_pairs(
+        self, items: List[ProcessedItem], threshold: float = 0.92
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find all index pairs (i < j) of items above the similarity threshold.
+
+        Args:
+            items: Items to check for duplicates
+            threshold: Similarity threshold (0-1), default 0.92
+
+        Returns:
+            Tuple of (rows, cols) index arrays into items
+        """
+        embeddings = await self._embedding_cache.embed_items(
+            items, self._get_text_for_embedding
+        )
+        return self._duplicate_finder.find_pairs(embeddings, threshold)
+
     async def is_duplicate(
         self, item1: ProcessedItem, item2: ProcessedItem, threshold: float = 0.92
     ) -> bool:
@@ -171,11 +159,10 @@ class EmbeddingDeduplicator(BaseDeduplicator):
         Returns:
             True if items are duplicates (similarity > threshold)
         """
-        # Generate embeddings
-        text1 = self._get_text_for_embedding(item1)
-        text2 = self._get_text_for_embedding(item2)
-
-        embeddings = await self._embedding_service.embed_batch([text1, text2])
+        # Get embeddings (cached vectors are reused)
+        embeddings = await self._embedding_cache.embed_items(
+            [item1, item2], self._get_text_for_embedding
+        )
 
         # Calculate similarity
         similarity = cosine_similarity([embeddings[0]], [embeddings[1]])[0][0]
@@ -284,20 +271,21 @@ class DeduplicatorStage(BaseProcessingStage):
             True if no duplicates found above threshold
 
         Note:
-            This is an expensive operation (O(n²)), use sparingly
-        """
-        # For validation, we check if any pairs are duplicates
-        # This is expensive, so we only do it when explicitly requested
-        for i in range(len(items)):
-            for j in range(i + 1, len(items)):
-                if await self._deduplicator.is_duplicate(
-                    items[i], items[j], threshold=self._threshold
-                ):
-                    logger.error(
-                        f"Validation failed: found duplicate pair: "
-                        f"{items[i].source_id} and {items[j].source_id}"
-                    )
-                    return False
+            Uses the deduplicator's blocked neighbour search, so memory stays
+            bounded; embeddings are served from the shared cache
+        """
+        if len(items) < 2:
+            return True
+
+        rows, cols = await self._deduplicator.find_duplicate_pairs(
+            items, threshold=self._threshold
+        )
+        if len(rows) > 0:
+            logger.error(
+                f"Validation failed: found duplicate pair: "
+                f"{items[int(rows[0])].source_id} and {items[int(cols[0])].source_id}"
+            )
+            return False
 
         logger.info(f"Validation passed: no duplicates found among {len(items)} items")
         return True
@@ -445,6 +433,8 @@ class CrossSourceDeduplicator:
         self,
         embedding_service: BaseEmbeddingService,
         threshold: float = 0.88,  # Slightly lower for cross-source (more lenient)
+        embedding_cache: Optional[EmbeddingCache] = None,
+        duplicate_finder: Optional[NearDuplicateFinder] = None,
     ):
         """
         Initialize cross-source deduplicator.
@@ -452,9 +442,14 @@ class CrossSourceDeduplicator:
         Args:
             embedding_service: Service for generating embeddings
             threshold: Similarity threshold for cross-source matching (default: 0.88)
+            embedding_cache: Optional shared embedding cache (one is created if None)
+            duplicate_finder: Optional near-duplicate search engine (blocked exact
+                search if None)
         """
         self._embedding_service = embedding_service
         self._threshold = threshold
+        self._embedding_cache = embedding_cache or EmbeddingCache(embedding_service)
+        self._duplicate_finder = duplicate_finder or NearDuplicateFinder()
     
     async def merge_cross_source_items(
         self, items: List[ProcessedItem], threshold: Optional[float] = None
@@ -474,33 +469,16 @@ class CrossSourceDeduplicator:
         
         threshold = threshold or self._threshold
         
-        # Generate embeddings
-        texts = [self._get_text_for_embedding(item) for item in items]
-        embeddings = await self._embedding_service.embed_batch(texts)
-        embeddings_array = np.array(embeddings)
-        
-        # Calculate similarities
-        similarities = cosine_similarity(embeddings_array)
+        # Get embeddings (cached vectors are reused)
+        embeddings = await self._embedding_cache.embed_items(
+            items, self._get_text_for_embedding
+        )
         
         # Group similar items
         merged_items = []
-        used_indices = set()
         
-        for i in range(len(items)):
-            if i in used_indices:
-                continue
-            
-            # Find all items similar to this one
-            similar_group = [items[i]]
-            used_indices.add(i)
-            
-            for j in range(i + 1, len(items)):
-                if j in used_indices:
-                    continue
-                
-                if similarities[i][j] > threshold:
-                    similar_group.append(items[j])
-                    used_indices.add(j)
+        for group in self._duplicate_finder.group(embeddings, threshold):
+            similar_group = [items[i] for i in group]
             
             # Merge the group into a single item
             merged_item = self._merge_items(similar_group)
@@ -534,31 +512,13 @@ class CrossSourceDeduplicator:
         
         # Generate embeddings from topic summaries
         texts = [f"{topic.title} {topic.summary}" for topic in topics]
-        embeddings = await self._embedding_service.embed_batch(texts)
-        embeddings_array = np.array(embeddings)
-        
-        # Calculate similarities
-        similarities = cosine_similarity(embeddings_array)
+        embeddings = await self._embedding_cache.embed_texts(texts)
         
         # Group similar topics
         merged_topics = []
-        used_indices = set()
         
-        for i in range(len(topics)):
-            if i in used_indices:
-                continue
-            
-            # Find all topics similar to this one
-            similar_group = [topics[i]]
-            used_indices.add(i)
-            
-            for j in range(i + 1, len(topics)):
-                if j in used_indices:
-                    continue
-                
-                if similarities[i][j] > threshold:
-                    similar_group.append(topics[j])
-                    used_indices.add(j)
+        for group in self._duplicate_finder.group(embeddings, threshold):
+            similar_group = [topics[i] for i in group]
             
             # Merge the group
             merged_topic = self._merge_topics(similar_group)
@@ -592,31 +552,13 @@ class CrossSourceDeduplicator:
         
         # Generate embeddings from trend summaries
         texts = [f"{trend.title} {trend.summary}" for trend in trends]
-        embeddings = await self._embedding_service.embed_batch(texts)
-        embeddings_array = np.array(embeddings)
-        
-        # Calculate similarities
-        similarities = cosine_similarity(embeddings_array)
+        embeddings = await self._embedding_cache.embed_texts(texts)
         
         # Group similar trends
         merged_trends = []
-        used_indices = set()
         
-        for i in range(len(trends)):
-            if i in used_indices:
-                continue
-            
-            # Find all trends similar to this one
-            similar_group = [trends[i]]
-            used_indices.add(i)
-            
-            for j in range(i + 1, len(trends)):
-                if j in used_indices:
-                    continue
-                
-                if similarities[i][j] > threshold:
-                    similar_group.append(trends[j])
-                    used_indices.add(j)
+        for group in self._duplicate_finder.group(embeddings, threshold):
+            similar_group = [trends[i] for i in group]
             
             # Merge the group
             merged_trend = self._merge_trends(similar_group)
@@ -0,0 +1,251 @@
+"""
+Shared embedding cache for processing pipeline.
+
+This module provides a content-addressed embedding cache that deduplication,
+clustering and cross-source merging consult before calling the embedding
+service, so one pipeline run pays for each distinct text only once.
+"""
+
+import hashlib
+import logging
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional
+
+from trend_agent.intelligence.interfaces import BaseEmbeddingService
+from trend_agent.observability.metrics import record_embedding_cache_lookup
+from trend_agent.schemas import ProcessedItem
+from trend_agent.storage.interfaces import CacheRepository
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingCache:
+    """
+    Content-addressed embedding cache with an in-process LRU and optional Redis tier.
+
+    Lookup order for each text:
+    1. Vector already attached to the item (``ProcessedItem.embedding``)
+    2. In-process LRU keyed by hash of (model, text)
+    3. Redis cache (if a cache repository is configured)
+    4. Embedding service (misses are embedded in a single batch call)
+
+    Vectors are written back to every tier and onto ``ProcessedItem.embedding``
+    so later stages and the persistence step reuse them.
+
+    Example:
+        ```python
+        cache = EmbeddingCache(embedding_service, cache_repo=redis_repo)
+        deduplicator = EmbeddingDeduplicator(embedding_service, embedding_cache=cache)
+        clusterer = HDBSCANClusterer(embedding_service, embedding_cache=cache)
+        ```
+    """
+
+    def __init__(
+        self,
+        embedding_service: BaseEmbeddingService,
+        cache_repo: Optional[CacheRepository] = None,
+        max_entries: int = 10000,
+        ttl_seconds: int = 86400,
+        key_prefix: str = "embedding",
+    ):
+        """
+        Initialize embedding cache.
+
+        Args:
+            embedding_service: Service used to embed cache misses
+            cache_repo: Optional Redis cache repository for cross-run reuse
+            max_entries: Maximum vectors held in the in-process LRU
+            ttl_seconds: Redis TTL in seconds (default: 1 day)
+            key_prefix: Prefix for Redis cache keys
+        """
+        self._embedding_service = embedding_service
+        self._cache_repo = cache_repo
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._key_prefix = key_prefix
+        self._lru: "OrderedDict[str, List[float]]" = OrderedDict()
+
+        # Stats
+        self._hits: Dict[str, int] = {"item": 0, "memory": 0, "redis": 0}
+        self._misses = 0
+
+    @property
+    def embedding_service(self) -> BaseEmbeddingService:
+        """Get the underlying embedding service."""
+        return self._embedding_service
+
+    async def embed_texts(self, texts: List[str]) -> List[List[float]]:
+        """
+        Get embeddings for texts, embedding only the ones not cached.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            Embedding vectors in input order
+        """
+        if not texts:
+            return []
+
+        keys = [self._generate_cache_key(text) for text in texts]
+        vectors: List[Optional[List[float]]] = [None] * len(texts)
+
+        # Step 1: In-process LRU
+        for i, key in enumerate(keys):
+            cached = self._lru_get(key)
+            if cached is not None:
+                vectors[i] = cached
+                self._record_hit("memory")
+
+        # Step 2: Redis (one MGET for the distinct keys missing from memory)
+        if self._cache_repo is not None:
+            missing_keys = list(dict.fromkeys(
+                key for i, key in enumerate(keys) if vectors[i] is None
+            ))
+            try:
+                found = await self._cache_repo.get_many(missing_keys) if missing_keys else []
+            except Exception as e:
+                logger.warning(f"Embedding cache Redis get failed: {e}")
+                found = []
+
+            cached_by_key = {key: cached for key, cached in zip(missing_keys, found) if cached}
+            for key, cached in cached_by_key.items():
+                self._lru_put(key, cached)
+            for i, key in enumerate(keys):
+                if vectors[i] is None and key in cached_by_key:
+                    vectors[i] = cached_by_key[key]
+                    self._record_hit("redis")
+
+        # Step 3: Embed remaining misses in one batch (deduplicated by key)
+        miss_positions: Dict[str, List[int]] = {}
+        for i, key in enumerate(keys):
+            if vectors[i] is None:
+                miss_positions.setdefault(key, []).append(i)
+
+        if miss_positions:
+            miss_keys = list(miss_positions.keys())
+            miss_texts = [texts[miss_positions[key][0]] for key in miss_keys]
+            embeddings = await self._embedding_service.embed_batch(miss_texts)
+
+            for key, embedding in zip(miss_keys, embeddings):
+                for i in miss_positions[key]:
+                    vectors[i] = embedding
+                self._lru_put(key, embedding)
+                await self._redis_put(key, embedding)
+
+            self._misses += len(miss_keys)
+            record_embedding_cache_lookup("miss", len(miss_keys))
+
+            logger.debug(
+                f"Embedding cache: {len(texts) - sum(len(p) for p in miss_positions.values())}"
+                f"/{len(texts)} hits, embedded {len(miss_keys)} texts"
+            )
+
+        return vectors
+
+    async def embed_items(
+        self,
+        items: List[ProcessedItem],
+        text_fn: Callable[[ProcessedItem], str],
+    ) -> List[List[float]]:
+        """
+        Get embeddings for items, reusing vectors already attached to them.
+
+        Args:
+            items: Items to embed
+            text_fn: Function that extracts the embedding text from an item
+
+        Returns:
+            Embedding vectors in input order
+
+        Note:
+            Vectors are written back onto ``item.embedding``
+        """
+        if not items:
+            return []
+
+        vectors: List[Optional[List[float]]] = [None] * len(items)
+        pending_indices = []
+        pending_texts = []
+
+        for i, item in enumerate(items):
+            if item.embedding:
+                vectors[i] = item.embedding
+                self._record_hit("item")
+            else:
+                pending_indices.append(i)
+                pending_texts.append(text_fn(item))
+
+        if pending_texts:
+            embeddings = await self.embed_texts(pending_texts)
+            for i, embedding in zip(pending_indices, embeddings):
+                vectors[i] = embedding
+                items[i].embedding = list(embedding)
+
+        return vectors
+
+    def get_stats(self) -> Dict:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with per-tier hit counts, misses and hit rate
+        """
+        total_hits = sum(self._hits.values())
+        total_requests = total_hits + self._misses
+        hit_rate = (total_hits / total_requests * 100) if total_requests > 0 else 0
+
+        return {
+            "hits_by_tier": dict(self._hits),
+            "cache_hits": total_hits,
+            "cache_misses": self._misses,
+            "total_requests": total_requests,
+            "hit_rate_percent": round(hit_rate, 2),
+            "memory_entries": len(self._lru),
+        }
+
+    def clear(self) -> None:
+        """Clear the in-process LRU (Redis entries expire via TTL)."""
+        self._lru.clear()
+
+    def _generate_cache_key(self, text: str) -> str:
+        """
+        Generate content-addressed cache key for a text.
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            Cache key string
+        """
+        model = self._embedding_service.get_model_name()
+        text_hash = hashlib.sha256(f"{model}|{text}".encode("utf-8")).hexdigest()
+        return f"{self._key_prefix}:{model}:{text_hash}"
+
+    def _lru_get(self, key: str) -> Optional[List[float]]:
+        """Get a vector from the LRU and mark it as recently used."""
+        vector = self._lru.get(key)
+        if vector is not None:
+            self._lru.move_to_end(key)
+        return vector
+
+    def _lru_put(self, key: str, vector: List[float]) -> None:
+        """Insert a vector into the LRU, evicting the oldest entry if full."""
+        self._lru[key] = vector
+        self._lru.move_to_end(key)
+        while len(self._lru) > self._max_entries:
+            self._lru.popitem(last=False)
+
+    async def _redis_put(self, key: str, vector: List[float]) -> None:
+        """Write a vector to Redis, ignoring cache failures."""
+        if self._cache_repo is None:
+            return
+        try:
+            await self._cache_repo.set(key, list(vector), ttl_seconds=self._ttl_seconds)
+        except Exception as e:
+            logger.warning(f"Embedding cache Redis set failed: {e}")
+
+    def _record_hit(self, tier: str) -> None:
+        """Record a cache hit for a tier."""
+        self._hits[tier] += 1
+        record_embedding_cache_lookup(tier)
@@ -0,0 +1,333 @@
+"""
+Batched named entity extraction for processing pipeline.
+
+This module loads spaCy models once per process with only the components
+NER needs, runs item texts through ``nlp.pipe`` in batches, and caches the
+extracted entities by text hash so re-processed items are not analyzed again.
+"""
+
+import asyncio
+import hashlib
+import logging
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+from trend_agent.storage.interfaces import CacheRepository
+
+logger = logging.getLogger(__name__)
+
+# spaCy models loaded in this process, keyed by model name (None if unavailable)
+_spacy_models: Dict[str, Any] = {}
+
+
+def load_spacy_model(model_name: str):
+    """
+    Load a spaCy model for NER once per process.
+
+    Components NER does not depend on (tagger, parser, lemmatizer, ...) are
+    disabled, and the model is warmed with a short document so the first
+    real batch does not pay lazy initialization.
+
+    Args:
+        model_name: spaCy model to load (e.g. en_core_web_sm)
+
+    Returns:
+        Loaded spaCy pipeline, or None if spaCy or the model is unavailable
+    """
+    if model_name not in _spacy_models:
+        try:
+            import spacy
+
+            nlp = spacy.load(model_name)
+            for name in _components_unused_by_ner(nlp):
+                nlp.disable_pipe(name)
+            nlp("Warm up the entity recognizer.")
+
+            _spacy_models[model_name] = nlp
+            logger.info(
+                f"Loaded spaCy model: {model_name} "
+                f"(enabled components: {', '.join(nlp.pipe_names)})"
+            )
+        except (ImportError, OSError) as e:
+            logger.warning(
+                f"Failed to load spaCy model '{model_name}': {e}. "
+                "Entity extraction will be disabled."
+            )
+            _spacy_models[model_name] = None
+
+    return _spacy_models[model_name]
+
+
+def _components_unused_by_ner(nlp) -> List[str]:
+    """
+    Get pipeline components that the NER component does not depend on.
+
+    Args:
+        nlp: spaCy pipeline
+
+    Returns:
+        Component names that can be disabled
+    """
+    needed = {"ner"}
+    for name, component in nlp.pipeline:
+        # Shared embedding layers (tok2vec/transformer) NER listens to
+        if "ner" in getattr(component, "listening_components", []):
+            needed.add(name)
+
+    return [name for name in nlp.pipe_names if name not in needed]
+
+
+def entities_from_doc(doc) -> Dict[str, List[str]]:
+    """
+    Group a document's entities by type.
+
+    Args:
+        doc: spaCy Doc
+
+    Returns:
+        Dictionary mapping entity types to unique entity texts, e.g.
+        {"PERSON": ["Jane Smith"], "ORG": ["Google"]}
+    """
+    entities: Dict[str, List[str]] = {}
+    for ent in doc.ents:
+        entity_text = ent.text.strip()
+        texts = entities.setdefault(ent.label_, [])
+
+        # Avoid duplicates
+        if entity_text and entity_text not in texts:
+            texts.append(entity_text)
+
+    return {label: texts for label, texts in entities.items() if texts}
+
+
+class EntityExtractor:
+    """
+    Batched spaCy NER with a content-addressed cache.
+
+    Lookup order for each text:
+    1. In-process LRU keyed by hash of (model, text)
+    2. Redis cache (if a cache repository is configured)
+    3. spaCy ``nlp.pipe`` over all remaining misses in one call
+
+    Example:
+        ```python
+        extractor = EntityExtractor(cache_repo=redis_repo, batch_size=64)
+        normalizer = TextNormalizer(
+            enable_entity_extraction=True, entity_extractor=extractor
+        )
+        ```
+    """
+
+    def __init__(
+        self,
+        spacy_model: str = "en_core_web_sm",
+        nlp=None,
+        batch_size: int = 64,
+        n_process: int = 1,
+        cache_repo: Optional[CacheRepository] = None,
+        max_entries: int = 10000,
+        ttl_seconds: int = 604800,
+        key_prefix: str = "entities",
+        max_length: int = 10000,
+    ):
+        """
+        Initialize entity extractor.
+
+        Args:
+            spacy_model: spaCy model to load (ignored if nlp is given)
+            nlp: Optional already-loaded spaCy pipeline
+            batch_size: Texts per nlp.pipe batch
+            n_process: Processes nlp.pipe uses (1 = in-process)
+            cache_repo: Optional Redis cache repository for cross-run reuse
+            max_entries: Maximum results held in the in-process LRU
+            ttl_seconds: Redis TTL in seconds (default: 7 days)
+            key_prefix: Prefix for Redis cache keys
+            max_length: Texts are truncated to this many characters
+        """
+        self._nlp = nlp if nlp is not None else load_spacy_model(spacy_model)
+        self._model_id = self._get_model_id(spacy_model)
+        self._batch_size = batch_size
+        self._n_process = n_process
+        self._cache_repo = cache_repo
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._key_prefix = key_prefix
+        self._max_length = max_length
+        self._lru: "OrderedDict[str, Dict[str, List[str]]]" = OrderedDict()
+
+        # Stats
+        self._hits: Dict[str, int] = {"memory": 0, "redis": 0}
+        self._misses = 0
+
+    @property
+    def available(self) -> bool:
+        """Whether a spaCy model is loaded."""
+        return self._nlp is not None
+
+    async def extract_batch(self, texts: List[str]) -> List[Dict[str, List[str]]]:
+        """
+        Extract entities for many texts, analyzing only the ones not cached.
+
+        Args:
+            texts: Texts to analyze
+
+        Returns:
+            Entity dictionaries in input order ({} for short or empty texts)
+        """
+        results: List[Optional[Dict[str, List[str]]]] = [None] * len(texts)
+        if not self.available:
+            return [{} for _ in texts]
+
+        # Skip texts too short to contain entities
+        keys: List[Optional[str]] = []
+        for i, text in enumerate(texts):
+            if not text or len(text.strip()) < 3:
+                results[i] = {}
+                keys.append(None)
+            else:
+                keys.append(self._generate_cache_key(text[:self._max_length]))
+
+        # Step 1: In-process LRU
+        for i, key in enumerate(keys):
+            if key is None:
+                continue
+            cached = self._lru_get(key)
+            if cached is not None:
+                results[i] = cached
+                self._hits["memory"] += 1
+
+        # Step 2: Redis (one MGET for every LRU miss)
+        if self._cache_repo is not None:
+            pending = [i for i, key in enumerate(keys) if key and results[i] is None]
+            if pending:
+                try:
+                    cached_values = await self._cache_repo.get_many(
+                        [keys[i] for i in pending]
+                    )
+                except Exception as e:
+                    logger.warning(f"Entity cache Redis get failed: {e}")
+                    cached_values = [None] * len(pending)
+
+                for i, cached in zip(pending, cached_values):
+                    if cached is not None:
+                        results[i] = cached
+                        self._lru_put(keys[i], cached)
+                        self._hits["redis"] += 1
+
+        # Step 3: Run remaining misses through nlp.pipe (deduplicated by key)
+        miss_positions: Dict[str, List[int]] = {}
+        for i, key in enumerate(keys):
+            if key and results[i] is None:
+                miss_positions.setdefault(key, []).append(i)
+
+        if miss_positions:
+            miss_keys = list(miss_positions.keys())
+            miss_texts = [
+                texts[miss_positions[key][0]][:self._max_length] for key in miss_keys
+            ]
+
+            loop = asyncio.get_running_loop()
+            extracted = await loop.run_in_executor(None, self._pipe, miss_texts)
+            self._misses += len(miss_keys)
+
+            if extracted is None:
+                # Failed batch: return empty entities but cache nothing, so
+                # the texts are analyzed again next time
+                for positions in miss_positions.values():
+                    for i in positions:
+                        results[i] = {}
+                return results
+
+            for key, entities in zip(miss_keys, extracted):
+                for i in miss_positions[key]:
+                    results[i] = entities
+                self._lru_put(key, entities)
+
+            await self._redis_put(dict(zip(miss_keys, extracted)))
+
+            logger.debug(
+                f"Entity cache: {len(texts) - sum(len(p) for p in miss_positions.values())}"
+                f"/{len(texts)} hits, analyzed {len(miss_keys)} texts"
+            )
+
+        return results
+
+    def get_stats(self) -> Dict:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with per-tier hit counts, misses and hit rate
+        """
+        total_hits = sum(self._hits.values())
+        total_requests = total_hits + self._misses
+        hit_rate = (total_hits / total_requests * 100) if total_requests > 0 else 0
+
+        return {
+            "hits_by_tier": dict(self._hits),
+            "cache_hits": total_hits,
+            "cache_misses": self._misses,
+            "total_requests": total_requests,
+            "hit_rate_percent": round(hit_rate, 2),
+            "memory_entries": len(self._lru),
+        }
+
+    def clear(self) -> None:
+        """Clear the in-process LRU (Redis entries expire via TTL)."""
+        self._lru.clear()
+
+    def _pipe(self, texts: List[str]) -> Optional[List[Dict[str, List[str]]]]:
+        """Run texts through nlp.pipe and group the entities of each doc (None on failure)."""
+        try:
+            return [
+                entities_from_doc(doc)
+                for doc in self._nlp.pipe(
+                    texts, batch_size=self._batch_size, n_process=self._n_process
+                )
+            ]
+        except Exception as e:
+            logger.error(f"Entity extraction failed: {e}", exc_info=True)
+            return None
+
+    def _get_model_id(self, spacy_model: str) -> str:
+        """Identify the model (name and version) for cache keys."""
+        if self._nlp is None:
+            return spacy_model
+        meta = self._nlp.meta
+        return f"{meta.get('lang', '')}_{meta.get('name', spacy_model)}-{meta.get('version', '')}"
+
+    def _generate_cache_key(self, text: str) -> str:
+        """
+        Generate content-addressed cache key for a text.
+
+        Args:
+            text: Text to analyze
+
+        Returns:
+            Cache key string
+        """
+        text_hash = hashlib.sha256(f"{self._model_id}|{text}".encode("utf-8")).hexdigest()
+        return f"{self._key_prefix}:{self._model_id}:{text_hash}"
+
+    def _lru_get(self, key: str) -> Optional[Dict[str, List[str]]]:
+        """Get a result from the LRU and mark it as recently used."""
+        entities = self._lru.get(key)
+        if entities is not None:
+            self._lru.move_to_end(key)
+        return entities
+
+    def _lru_put(self, key: str, entities: Dict[str, List[str]]) -> None:
+        """Insert a result into the LRU, evicting the oldest entry if full."""
+        self._lru[key] = entities
+        self._lru.move_to_end(key)
+        while len(self._lru) > self._max_entries:
+            self._lru.popitem(last=False)
+
+    async def _redis_put(self, mapping: Dict[str, Dict[str, List[str]]]) -> None:
+        """Write results to Redis in one round trip, ignoring cache failures."""
+        if self._cache_repo is None or not mapping:
+            return
+        try:
+            await self._cache_repo.set_many(mapping, ttl_seconds=self._ttl_seconds)
+        except Exception as e:
+            logger.warning(f"Entity cache Redis set failed: {e}")
@@ -24,6 +24,10 @@ class ProcessingStage(Protocol):
 
     Each stage accepts a list of items and returns a processed list.
     Stages should be stateless and composable.
+
+    Stages that transform each item independently may set a ``per_item``
+    attribute to True so a streaming pipeline can feed them micro-batches
+    instead of the whole item set.
     """
 
     async def process(self, items: List[ProcessedItem]) -> List[ProcessedItem]:
@@ -372,6 +376,9 @@ class BasePipeline(ABC):
 class BaseProcessingStage(ABC):
     """Abstract base class for processing stage implementations."""
 
+    # True when process() handles each item independently of the others
+    per_item: bool = False
+
     @abstractmethod
     async def process(self, items: List[ProcessedItem]) -> List[ProcessedItem]:
         pass
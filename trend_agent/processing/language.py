@@ -6,7 +6,8 @@ with support for batch processing and confidence scoring.
 """
 
 import logging
-from typing import List, Optional
+from functools import partial
+from typing import List, Optional, Tuple
 
 from langdetect import DetectorFactory, LangDetectException, detect, detect_langs
 
@@ -19,6 +20,49 @@ DetectorFactory.seed = 0
 logger = logging.getLogger(__name__)
 
 
+def detect_language_sync(text: str, default_language: str = "en") -> Tuple[str, float]:
+    """
+    Detect the language of text with its confidence.
+
+    Args:
+        text: Text to analyze (minimum 3 characters recommended)
+        default_language: Language returned when detection is not possible
+
+    Returns:
+        Tuple of (ISO 639-1 language code, confidence 0-1)
+    """
+    if not text or len(text.strip()) < 3:
+        logger.warning(f"Text too short for language detection: '{text[:50]}'")
+        return default_language, 0.0
+
+    try:
+        # Use detect_langs to get confidence scores
+        langs = detect_langs(text)
+        if not langs:
+            return default_language, 0.0
+
+        # Get top result
+        top_lang = langs[0]
+
+        logger.debug(
+            f"Detected language: {top_lang.lang} "
+            f"(confidence: {top_lang.prob:.2f})"
+        )
+
+        return top_lang.lang, top_lang.prob
+
+    except LangDetectException as e:
+        logger.warning(f"Language detection failed: {e}. Using default '{default_language}'")
+        return default_language, 0.0
+
+
+def warm_language_profiles() -> None:
+    """Load langdetect's language profiles so the first detection is fast."""
+    from langdetect.detector_factory import init_factory
+
+    init_factory()
+
+
 class LanguageDetector:
     """
     Language detector implementing the LanguageDetector interface.
@@ -45,33 +89,10 @@ class LanguageDetector:
         Raises:
             ValueError: If text is empty or too short
         """
-        if not text or len(text.strip()) < 3:
-            logger.warning(f"Text too short for language detection: '{text[:50]}'")
-            self._last_confidence = 0.0
-            return self._default_language
-
-        try:
-            # Use detect_langs to get confidence scores
-            langs = detect_langs(text)
-            if not langs:
-                self._last_confidence = 0.0
-                return self._default_language
-
-            # Get top result
-            top_lang = langs[0]
-            self._last_confidence = top_lang.prob
-
-            logger.debug(
-                f"Detected language: {top_lang.lang} "
-                f"(confidence: {self._last_confidence:.2f})"
-            )
-
-            return top_lang.lang
-
-        except LangDetectException as e:
-            logger.warning(f"Language detection failed: {e}. Using default '{self._default_language}'")
-            self._last_confidence = 0.0
-            return self._default_language
+        language, self._last_confidence = detect_language_sync(
+            text, self._default_language
+        )
+        return language
 
     async def detect_batch(self, texts: List[str]) -> List[str]:
         """
@@ -123,14 +144,22 @@ class LanguageDetectorStage(BaseProcessingStage):
     updating the item's language field.
     """
 
-    def __init__(self, detector: Optional[LanguageDetector] = None):
+    per_item = True
+
+    def __init__(
+        self,
+        detector: Optional[LanguageDetector] = None,
+        cpu_executor=None,
+    ):
         """
         Initialize language detector stage.
 
         Args:
             detector: LanguageDetector instance (creates new if None)
+            cpu_executor: Optional CPUExecutor to run detection off the event loop
         """
         self._detector = detector or LanguageDetector()
+        self._cpu_executor = cpu_executor
 
     async def process(self, items: List[ProcessedItem]) -> List[ProcessedItem]:
         """
@@ -146,24 +175,23 @@ class LanguageDetectorStage(BaseProcessingStage):
             Language is detected from title + description + content (if available).
             Prioritizes longer text for better accuracy.
         """
-        for item in items:
-            # Build text for detection (prioritize longer text)
-            text_parts = []
-
-            if item.title:
-                text_parts.append(item.title)
-
-            if item.description:
-                text_parts.append(item.description)
+        if self._cpu_executor is not None and type(self._detector) is LanguageDetector:
+            results = await self._cpu_executor.map(
+                partial(
+                    detect_language_sync,
+                    default_language=self._detector._default_language,
+                ),
+                [self._detection_text(item) for item in items],
+            )
+            for item, (language, confidence) in zip(items, results):
+                item.language = language
+                item.metadata["language_confidence"] = confidence
 
-            # Use normalized content if available (cleaner)
-            if item.content_normalized:
-                text_parts.append(item.content_normalized[:500])  # Limit to 500 chars
-            elif item.content:
-                text_parts.append(item.content[:500])
+            logger.info(f"Language detection completed for {len(items)} items")
+            return items
 
-            # Combine text
-            combined_text = " ".join(text_parts)
+        for item in items:
+            combined_text = self._detection_text(item)
 
             # Detect language
             detected_lang = await self._detector.detect(combined_text)
@@ -180,6 +208,34 @@ class LanguageDetectorStage(BaseProcessingStage):
         logger.info(f"Language detection completed for {len(items)} items")
         return items
 
+    @staticmethod
+    def _detection_text(item: ProcessedItem) -> str:
+        """
+        Build the text used to detect an item's language.
+
+        Args:
+            item: Item to analyze
+
+        Returns:
+            Title, description and up to 500 chars of content
+        """
+        # Build text for detection (prioritize longer text)
+        text_parts = []
+
+        if item.title:
+            text_parts.append(item.title)
+
+        if item.description:
+            text_parts.append(item.description)
+
+        # Use normalized content if available (cleaner)
+        if item.content_normalized:
+            text_parts.append(item.content_normalized[:500])  # Limit to 500 chars
+        elif item.content:
+            text_parts.append(item.content[:500])
+
+        return " ".join(text_parts)
+
     async def validate(self, items: List[ProcessedItem]) -> bool:
         """
         Validate that all items have language field set.
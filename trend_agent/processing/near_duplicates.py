@@ -0,0 +1,336 @@
+"""
+Near-duplicate detection engine for processing pipeline.
+
+This module provides thresholded cosine-similarity neighbour search that
+works block by block instead of materializing a dense N×N similarity
+matrix, with an optional random-hyperplane LSH pre-filter for very large
+batches.
+"""
+
+import logging
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class UnionFind:
+    """
+    Disjoint-set forest with path compression and union by size.
+
+    Used to merge similar pairs into connected groups.
+    """
+
+    def __init__(self, size: int):
+        """
+        Initialize union-find structure.
+
+        Args:
+            size: Number of elements
+        """
+        self._parent = list(range(size))
+        self._size = [1] * size
+
+    def find(self, x: int) -> int:
+        """
+        Find the root of an element.
+
+        Args:
+            x: Element index
+
+        Returns:
+            Root element index
+        """
+        root = x
+        while self._parent[root] != root:
+            root = self._parent[root]
+
+        # Path compression
+        while self._parent[x] != root:
+            self._parent[x], x = root, self._parent[x]
+
+        return root
+
+    def union(self, a: int, b: int) -> int:
+        """
+        Merge the sets containing two elements.
+
+        Args:
+            a: First element index
+            b: Second element index
+
+        Returns:
+            Root of the merged set
+        """
+        root_a = self.find(a)
+        root_b = self.find(b)
+        if root_a == root_b:
+            return root_a
+
+        if self._size[root_a] < self._size[root_b]:
+            root_a, root_b = root_b, root_a
+
+        self._parent[root_b] = root_a
+        self._size[root_a] += self._size[root_b]
+        return root_a
+
+
+class NearDuplicateFinder:
+    """
+    Blocked, vectorized near-duplicate finder for embedding vectors.
+
+    Similarities are computed tile by tile (block_size × block_size), so
+    memory stays bounded regardless of batch size. Only pairs above the
+    threshold are kept, as sparse neighbour lists.
+
+    Grouping modes:
+    - Greedy (default): the first item of each group claims every later
+      unclaimed item above the threshold. This matches the groups produced
+      by the original dense-matrix implementation exactly.
+    - Transitive: pairs are merged with union-find into connected components.
+
+    An optional random-hyperplane LSH pre-filter restricts exact similarity
+    checks to candidate pairs that share a bucket in at least one band.
+    This makes the search sub-quadratic but approximate: a true pair is
+    missed with small probability.
+
+    Example:
+        ```python
+        finder = NearDuplicateFinder(block_size=2048)
+        groups = finder.group(embeddings, threshold=0.92)
+        # [[0, 3], [1], [2, 5, 7], ...] - first index is the representative
+        ```
+    """
+
+    def __init__(
+        self,
+        block_size: int = 2048,
+        use_lsh: bool = False,
+        lsh_bands: int = 32,
+        lsh_bits_per_band: int = 12,
+        seed: int = 42,
+        dtype: type = np.float64,
+    ):
+        """
+        Initialize near-duplicate finder.
+
+        Args:
+            block_size: Rows/columns per similarity tile
+            use_lsh: Enable random-hyperplane LSH candidate pre-filter
+            lsh_bands: Number of LSH bands (more bands = higher recall)
+            lsh_bits_per_band: Hyperplanes per band (more bits = fewer candidates)
+            seed: Random seed for hyperplane generation
+            dtype: Floating point type for similarity computation
+        """
+        if block_size < 1:
+            raise ValueError("block_size must be positive")
+
+        self._block_size = block_size
+        self._use_lsh = use_lsh
+        self._lsh_bands = lsh_bands
+        self._lsh_bits_per_band = lsh_bits_per_band
+        self._seed = seed
+        self._dtype = dtype
+
+    def find_pairs(
+        self, embeddings: List[List[float]], threshold: float
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find all index pairs (i < j) with cosine similarity above threshold.
+
+        Args:
+            embeddings: Embedding vectors
+            threshold: Similarity threshold (0-1)
+
+        Returns:
+            Tuple of (rows, cols) index arrays sorted by row, then column
+        """
+        vectors = self._normalize(embeddings)
+        n = vectors.shape[0]
+
+        if n < 2:
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty
+
+        if self._use_lsh:
+            rows, cols = self._lsh_pairs(vectors, threshold)
+        else:
+            rows, cols = self._blocked_pairs(vectors, threshold)
+
+        order = np.lexsort((cols, rows))
+        return rows[order], cols[order]
+
+    def group(
+        self,
+        embeddings: List[List[float]],
+        threshold: float,
+        transitive: bool = False,
+    ) -> List[List[int]]:
+        """
+        Group near-duplicate items.
+
+        Args:
+            embeddings: Embedding vectors
+            threshold: Similarity threshold (0-1)
+            transitive: Merge pairs into connected components (union-find)
+                instead of greedy first-representative assignment
+
+        Returns:
+            Groups of indices (including singletons), ordered by their
+            representative (first) index
+        """
+        n = len(embeddings)
+        if n == 0:
+            return []
+
+        rows, cols = self.find_pairs(embeddings, threshold)
+
+        if transitive:
+            return self._transitive_groups(n, rows, cols)
+
+        return self._greedy_groups(n, rows, cols)
+
+    def _normalize(self, embeddings: List[List[float]]) -> np.ndarray:
+        """L2-normalize vectors (zero vectors stay zero, like sklearn)."""
+        vectors = np.asarray(embeddings, dtype=self._dtype)
+        if vectors.ndim != 2:
+            vectors = vectors.reshape(len(embeddings), -1)
+
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return vectors / norms
+
+    def _blocked_pairs(
+        self, vectors: np.ndarray, threshold: float
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Exact thresholded search over upper-triangular tiles."""
+        n = vectors.shape[0]
+        block = self._block_size
+        all_rows = []
+        all_cols = []
+
+        for row_start in range(0, n, block):
+            row_end = min(row_start + block, n)
+            row_block = vectors[row_start:row_end]
+
+            for col_start in range(row_start, n, block):
+                col_end = min(col_start + block, n)
+                similarities = row_block @ vectors[col_start:col_end].T
+
+                local_rows, local_cols = np.nonzero(similarities > threshold)
+                global_rows = local_rows + row_start
+                global_cols = local_cols + col_start
+
+                # Keep strictly upper-triangular pairs (i < j)
+                upper = global_cols > global_rows
+                all_rows.append(global_rows[upper])
+                all_cols.append(global_cols[upper])
+
+        rows = np.concatenate(all_rows).astype(np.int64)
+        cols = np.concatenate(all_cols).astype(np.int64)
+        return rows, cols
+
+    def _lsh_pairs(
+        self, vectors: np.ndarray, threshold: float
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Approximate search: exact check of LSH candidate pairs only."""
+        n, dimension = vectors.shape
+        rng = np.random.default_rng(self._seed)
+        planes = rng.standard_normal(
+            (dimension, self._lsh_bands * self._lsh_bits_per_band)
+        ).astype(self._dtype)
+        weights = 1 << np.arange(self._lsh_bits_per_band, dtype=np.int64)
+
+        # Band signatures computed block by block to bound memory
+        signatures = np.empty((n, self._lsh_bands), dtype=np.int64)
+        for start in range(0, n, self._block_size):
+            end = min(start + self._block_size, n)
+            bits = (vectors[start:end] @ planes) > 0
+            bits = bits.reshape(end - start, self._lsh_bands, self._lsh_bits_per_band)
+            signatures[start:end] = bits.astype(np.int64) @ weights
+
+        # Candidate pairs: items sharing a bucket in any band
+        candidate_keys = []
+        for band in range(self._lsh_bands):
+            order = np.argsort(signatures[:, band], kind="stable")
+            sorted_sigs = signatures[order, band]
+
+            # Buckets are contiguous after sorting: pair each position with the
+            # one `offset` places later until no bucket is that large
+            for offset in range(1, n):
+                same = sorted_sigs[:-offset] == sorted_sigs[offset:]
+                if not same.any():
+                    break
+                first = order[:-offset][same]
+                second = order[offset:][same]
+                candidate_keys.append(
+                    np.minimum(first, second) * n + np.maximum(first, second)
+                )
+
+        if not candidate_keys:
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty
+
+        keys = np.unique(np.concatenate(candidate_keys))
+        rows = keys // n
+        cols = keys % n
+
+        # Exact verification in chunks sized like one similarity tile
+        keep = np.zeros(len(keys), dtype=bool)
+        chunk = max(1, self._block_size * self._block_size // dimension)
+        for start in range(0, len(keys), chunk):
+            end = min(start + chunk, len(keys))
+            similarities = np.einsum(
+                "ij,ij->i", vectors[rows[start:end]], vectors[cols[start:end]]
+            )
+            keep[start:end] = similarities > threshold
+
+        logger.debug(
+            f"LSH pre-filter: {len(keys)} candidate pairs "
+            f"({len(keys) / max(1, n * (n - 1) // 2):.2%} of all pairs), "
+            f"{int(keep.sum())} above threshold"
+        )
+
+        return rows[keep], cols[keep]
+
+    def _greedy_groups(
+        self, n: int, rows: np.ndarray, cols: np.ndarray
+    ) -> List[List[int]]:
+        """First-representative grouping over sparse neighbour lists."""
+        # CSR-style offsets into the (row-sorted) pair arrays
+        offsets = np.searchsorted(rows, np.arange(n + 1))
+        cols_list = cols.tolist()
+        used = [False] * n
+        groups = []
+
+        for i in range(n):
+            if used[i]:
+                continue
+
+            used[i] = True
+            group = [i]
+
+            for j in cols_list[offsets[i]:offsets[i + 1]]:
+                if not used[j]:
+                    used[j] = True
+                    group.append(j)
+
+            groups.append(group)
+
+        return groups
+
+    def _transitive_groups(
+        self, n: int, rows: np.ndarray, cols: np.ndarray
+    ) -> List[List[int]]:
+        """Connected-component grouping with union-find."""
+        union_find = UnionFind(n)
+        for i, j in zip(rows.tolist(), cols.tolist()):
+            union_find.union(i, j)
+
+        components: Dict[int, List[int]] = {}
+        for i in range(n):
+            components.setdefault(union_find.find(i), []).append(i)
+
+        # Indices are appended in ascending order, so group[0] is the minimum
+        return sorted(components.values(), key=lambda group: group[0])
@@ -8,16 +8,93 @@ and named entity extraction capabilities.
 import html
 import logging
 import re
-from typing import Dict, List, Optional
+import unicodedata
+from typing import Dict, List, Optional, Tuple
 
 from bs4 import BeautifulSoup
 
+from trend_agent.processing.entities import EntityExtractor
 from trend_agent.processing.interfaces import BaseNormalizer, BaseProcessingStage
 from trend_agent.schemas import ProcessedItem
 
 logger = logging.getLogger(__name__)
 
 
+# ============================================================================
+# Synchronous Normalization Helpers
+# ============================================================================
+
+
+def normalize_text_sync(text: str) -> str:
+    """
+    Normalize text content (see TextNormalizer.normalize_text).
+
+    Args:
+        text: Text to normalize
+
+    Returns:
+        Normalized text
+    """
+    if not text:
+        return ""
+
+    # Decode HTML entities
+    text = html.unescape(text)
+
+    # Remove control characters (except newline and tab)
+    text = re.sub(r"[\x00-\x08\x0B-\x0C\x0E-\x1F\x7F]", "", text)
+
+    # Normalize Unicode (NFKC - compatible composition)
+    text = unicodedata.normalize("NFKC", text)
+
+    # Normalize whitespace
+    # Replace multiple spaces with single space
+    text = re.sub(r"[ \t]+", " ", text)
+
+    # Replace multiple newlines with double newline (preserve paragraphs)
+    text = re.sub(r"\n{3,}", "\n\n", text)
+
+    # Remove leading/trailing whitespace from each line
+    lines = [line.strip() for line in text.split("\n")]
+    text = "\n".join(lines)
+
+    # Final trim
+    return text.strip()
+
+
+def clean_html_sync(html_content: str) -> str:
+    """
+    Clean HTML content to plain text (see TextNormalizer.clean_html).
+
+    Args:
+        html_content: HTML content to clean
+
+    Returns:
+        Clean, normalized text without HTML tags
+    """
+    if not html_content:
+        return ""
+
+    try:
+        # Parse HTML with BeautifulSoup
+        soup = BeautifulSoup(html_content, "html.parser")
+
+        # Remove unwanted elements
+        for element in soup(["script", "style", "meta", "link", "noscript"]):
+            element.decompose()
+
+        # Get text with some structure preserved
+        text = soup.get_text(separator="\n", strip=True)
+
+        # Further normalize the extracted text
+        return normalize_text_sync(text)
+
+    except Exception as e:
+        logger.error(f"HTML cleaning failed: {e}", exc_info=True)
+        # Fallback: regex-based tag removal
+        return normalize_text_sync(re.sub(r"<[^>]+>", "", html_content))
+
+
 class TextNormalizer(BaseNormalizer):
     """
     Text normalizer implementing the Normalizer interface.
@@ -30,6 +107,7 @@ class TextNormalizer(BaseNormalizer):
         self,
         enable_entity_extraction: bool = False,
         spacy_model: str = "en_core_web_sm",
+        entity_extractor: Optional[EntityExtractor] = None,
     ):
         """
         Initialize text normalizer.
@@ -37,26 +115,20 @@ class TextNormalizer(BaseNormalizer):
         Args:
             enable_entity_extraction: Enable named entity extraction (requires spaCy)
             spacy_model: spaCy model to use for NER (default: en_core_web_sm)
+            entity_extractor: Optional EntityExtractor (e.g. with a Redis cache);
+                created from spacy_model if None
 
         Note:
             Entity extraction is optional and requires spaCy to be installed.
             If disabled, extract_entities() will return empty dict.
         """
         self._enable_entity_extraction = enable_entity_extraction
-        self._nlp = None
+        self._entity_extractor = None
 
         # Load spaCy model if entity extraction is enabled
         if self._enable_entity_extraction:
-            try:
-                import spacy
-
-                self._nlp = spacy.load(spacy_model)
-                logger.info(f"Loaded spaCy model: {spacy_model}")
-            except (ImportError, OSError) as e:
-                logger.warning(
-                    f"Failed to load spaCy model '{spacy_model}': {e}. "
-                    "Entity extraction will be disabled."
-                )
+            self._entity_extractor = entity_extractor or EntityExtractor(spacy_model)
+            if not self._entity_extractor.available:
                 self._enable_entity_extraction = False
 
     async def normalize_text(self, text: str) -> str:
@@ -79,35 +151,7 @@ class TextNormalizer(BaseNormalizer):
         Note:
             Preserves language-specific characters (CJK, RTL, accents, etc.)
         """
-        if not text:
-            return ""
-
-        # Decode HTML entities
-        text = html.unescape(text)
-
-        # Remove control characters (except newline and tab)
-        text = re.sub(r"[\x00-\x08\x0B-\x0C\x0E-\x1F\x7F]", "", text)
-
-        # Normalize Unicode (NFKC - compatible composition)
-        import unicodedata
-
-        text = unicodedata.normalize("NFKC", text)
-
-        # Normalize whitespace
-        # Replace multiple spaces with single space
-        text = re.sub(r"[ \t]+", " ", text)
-
-        # Replace multiple newlines with double newline (preserve paragraphs)
-        text = re.sub(r"\n{3,}", "\n\n", text)
-
-        # Remove leading/trailing whitespace from each line
-        lines = [line.strip() for line in text.split("\n")]
-        text = "\n".join(lines)
-
-        # Final trim
-        text = text.strip()
-
-        return text
+        return normalize_text_sync(text)
 
     async def extract_entities(self, text: str) -> Dict[str, List[str]]:
         """
@@ -130,41 +174,25 @@ class TextNormalizer(BaseNormalizer):
             Requires spaCy to be enabled. Returns empty dict if disabled.
             Entity types: PERSON, ORG, GPE, LOC, DATE, TIME, MONEY, etc.
         """
-        if not self._enable_entity_extraction or not self._nlp:
-            return {}
-
-        if not text or len(text.strip()) < 3:
-            return {}
-
-        try:
-            # Limit text length for performance (spaCy can be slow on large texts)
-            max_length = 10000
-            if len(text) > max_length:
-                text = text[:max_length]
-                logger.debug(f"Truncated text to {max_length} chars for entity extraction")
-
-            # Process text with spaCy
-            doc = self._nlp(text)
+        return (await self.extract_entities_batch([text]))[0]
 
-            # Group entities by type
-            entities: Dict[str, List[str]] = {}
-            for ent in doc.ents:
-                entity_type = ent.label_
-                entity_text = ent.text.strip()
+    async def extract_entities_batch(self, texts: List[str]) -> List[Dict[str, List[str]]]:
+        """
+        Extract named entities from many texts in one spaCy nlp.pipe pass.
 
-                if entity_type not in entities:
-                    entities[entity_type] = []
+        Args:
+            texts: Texts to analyze
 
-                # Avoid duplicates
-                if entity_text and entity_text not in entities[entity_type]:
-                    entities[entity_type].append(entity_text)
+        Returns:
+            Entity dictionaries in input order (empty if extraction is disabled)
 
-            logger.debug(f"Extracted {sum(len(v) for v in entities.values())} entities")
-            return entities
+        Note:
+            Results are cached by text hash, so repeated texts are analyzed once.
+        """
+        if not self._enable_entity_extraction:
+            return [{} for _ in texts]
 
-        except Exception as e:
-            logger.error(f"Entity extraction failed: {e}", exc_info=True)
-            return {}
+        return await self._entity_extractor.extract_batch(texts)
 
     async def clean_html(self, html_content: str) -> str:
         """
@@ -181,31 +209,7 @@ class TextNormalizer(BaseNormalizer):
             - Preserves paragraph structure
             - Handles malformed HTML gracefully
         """
-        if not html_content:
-            return ""
-
-        try:
-            # Parse HTML with BeautifulSoup
-            soup = BeautifulSoup(html_content, "html.parser")
-
-            # Remove unwanted elements
-            for element in soup(["script", "style", "meta", "link", "noscript"]):
-                element.decompose()
-
-            # Get text with some structure preserved
-            # get_text() with separator preserves some readability
-            text = soup.get_text(separator="\n", strip=True)
-
-            # Further normalize the extracted text
-            text = await self.normalize_text(text)
-
-            return text
-
-        except Exception as e:
-            logger.error(f"HTML cleaning failed: {e}", exc_info=True)
-            # Fallback: regex-based tag removal
-            text = re.sub(r"<[^>]+>", "", html_content)
-            return await self.normalize_text(text)
+        return clean_html_sync(html_content)
 
 
 class NormalizerStage(BaseProcessingStage):
@@ -219,10 +223,13 @@ class NormalizerStage(BaseProcessingStage):
     4. Stores normalized text in separate fields
     """
 
+    per_item = True
+
     def __init__(
         self,
         normalizer: Optional[TextNormalizer] = None,
         extract_entities: bool = False,
+        cpu_executor=None,
     ):
         """
         Initialize normalizer stage.
@@ -230,10 +237,13 @@ class NormalizerStage(BaseProcessingStage):
         Args:
             normalizer: TextNormalizer instance (creates new if None)
             extract_entities: Enable entity extraction (requires spaCy)
+            cpu_executor: Optional CPUExecutor to run normalization off the
+                event loop (used with the built-in TextNormalizer only)
         """
         self._normalizer = normalizer or TextNormalizer(
             enable_entity_extraction=extract_entities
         )
+        self._cpu_executor = cpu_executor
 
     async def process(self, items: List[ProcessedItem]) -> List[ProcessedItem]:
         """
@@ -250,6 +260,9 @@ class NormalizerStage(BaseProcessingStage):
             - Stores entities in metadata if extraction is enabled
             - Cleans HTML if content appears to contain HTML tags
         """
+        if self._cpu_executor is not None and type(self._normalizer) is TextNormalizer:
+            return await self._process_in_executor(items)
+
         for item in items:
             # Normalize title
             if item.title:
@@ -281,25 +294,69 @@ class NormalizerStage(BaseProcessingStage):
                 )
                 item.description = normalized_desc
 
-            # Extract entities if enabled
-            if self._normalizer._enable_entity_extraction:
-                # Combine title + content for entity extraction
-                text_for_entities = item.title_normalized or ""
-                if item.content_normalized:
-                    text_for_entities += " " + item.content_normalized[:1000]
+        await self._extract_entities(items)
 
-                entities = await self._normalizer.extract_entities(text_for_entities)
+        logger.info(f"Normalization completed for {len(items)} items")
+        return items
 
-                if entities:
-                    item.metadata["entities"] = entities
-                    logger.debug(
-                        f"Item {item.source_id}: extracted "
-                        f"{sum(len(v) for v in entities.values())} entities"
-                    )
+    async def _process_in_executor(
+        self, items: List[ProcessedItem]
+    ) -> List[ProcessedItem]:
+        """
+        Normalize items in the CPU executor's worker processes.
+
+        Only the text fields travel to the workers; results are written back
+        onto the items in order.
+
+        Args:
+            items: Items to process
+
+        Returns:
+            Items with normalized text fields updated
+        """
+        results = await self._cpu_executor.map(
+            normalize_item_fields,
+            [(item.title, item.content, item.description) for item in items],
+        )
+
+        for item, (title, content, description) in zip(items, results):
+            item.title_normalized = title
+            item.content_normalized = content
+            item.description = description
+
+        await self._extract_entities(items)
 
         logger.info(f"Normalization completed for {len(items)} items")
         return items
 
+    async def _extract_entities(self, items: List[ProcessedItem]) -> None:
+        """
+        Extract entities for all items in one batch, if enabled.
+
+        Args:
+            items: Normalized items (entities are stored in metadata)
+        """
+        if not self._normalizer._enable_entity_extraction:
+            return
+
+        # Combine title + content for entity extraction
+        texts = []
+        for item in items:
+            text_for_entities = item.title_normalized or ""
+            if item.content_normalized:
+                text_for_entities += " " + item.content_normalized[:1000]
+            texts.append(text_for_entities)
+
+        batch_entities = await self._normalizer.extract_entities_batch(texts)
+
+        for item, entities in zip(items, batch_entities):
+            if entities:
+                item.metadata["entities"] = entities
+                logger.debug(
+                    f"Item {item.source_id}: extracted "
+                    f"{sum(len(v) for v in entities.values())} entities"
+                )
+
     async def validate(self, items: List[ProcessedItem]) -> bool:
         """
         Validate that all items have normalized text.
@@ -370,6 +427,38 @@ class NormalizerStage(BaseProcessingStage):
         return False
 
 
+def normalize_item_fields(
+    fields: Tuple[Optional[str], Optional[str], Optional[str]],
+) -> Tuple[str, Optional[str], Optional[str]]:
+    """
+    Normalize one item's text fields (CPU executor work unit).
+
+    Mirrors NormalizerStage.process for a single item so it can run in a
+    worker process. Entity extraction runs afterwards in one nlp.pipe batch.
+
+    Args:
+        fields: (title, content, description)
+
+    Returns:
+        (title_normalized, content_normalized, description)
+    """
+    title, content, description = fields
+
+    title_normalized = normalize_text_sync(title) if title else ""
+
+    content_normalized = None
+    if content:
+        if NormalizerStage._contains_html(content):
+            content_normalized = clean_html_sync(content)
+        else:
+            content_normalized = normalize_text_sync(content)
+
+    if description:
+        description = normalize_text_sync(description)
+
+    return title_normalized, content_normalized, description
+
+
 # ============================================================================
 # Utility Functions
 # ============================================================================
@@ -5,12 +5,29 @@ This module provides the main pipeline orchestrator that coordinates
 all processing stages from raw items to ranked trends.
 """
 
+import asyncio
 import logging
 import time
+from dataclasses import asdict, dataclass
 from datetime import datetime
-from typing import List, Optional
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sized,
+    Tuple,
+    Union,
+)
 from uuid import uuid4
 
+from trend_agent.observability.metrics import (
+    record_pipeline_backpressure,
+    update_pipeline_queue_depth,
+)
 from trend_agent.processing.interfaces import BasePipeline, ProcessingStage
 from trend_agent.schemas import (
     PipelineConfig,
@@ -24,6 +41,36 @@ from trend_agent.schemas import (
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class StageStreamStats:
+    """Queue and backpressure counters for one streamed pipeline stage."""
+
+    stage: str
+    batches: int = 0
+    items_in: int = 0
+    items_out: int = 0
+    max_queue_depth: int = 0
+    backpressure_waits: int = 0  # Batches that found the input queue full
+    backpressure_seconds: float = 0.0  # Upstream time blocked on the full queue
+    busy_seconds: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a plain dictionary."""
+        return asdict(self)
+
+
+async def _iterate_items(
+    items: Union[Iterable[RawItem], AsyncIterable[RawItem]]
+) -> AsyncIterator[RawItem]:
+    """Iterate a sync or async iterable of raw items."""
+    if hasattr(items, "__aiter__"):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
+
+
 class ProcessingPipeline(BasePipeline):
     """
     Main processing pipeline orchestrator.
@@ -36,6 +83,8 @@ class ProcessingPipeline(BasePipeline):
     5. Ranking (score and rank trends)
 
     The pipeline is composable - stages can be added/removed dynamically.
+    With PipelineConfig.streaming, per-item stages run over bounded queues in
+    micro-batches and only the set-level stages gather the full item set.
     """
 
     def __init__(self, config: Optional[PipelineConfig] = None):
@@ -82,11 +131,19 @@ class ProcessingPipeline(BasePipeline):
         return False
 
     async def run(
-        self, items: List[RawItem], config: Optional[PipelineConfig] = None
+        self,
+        items: Union[Iterable[RawItem], AsyncIterable[RawItem]],
+        config: Optional[PipelineConfig] = None,
     ) -> PipelineResult:
         """
         Run the complete processing pipeline.
 
+        With ``config.streaming`` enabled, the leading per-item stages
+        (normalization, language detection, translation) run concurrently
+        over bounded queues of ``stream_batch_size`` micro-batches, and
+        ``items`` may be any iterable or async iterable. Set-level stages
+        (deduplication, clustering, ranking) always see the full item set.
+
         Args:
             items: Raw items to process
             config: Optional pipeline configuration (overrides instance config)
@@ -104,15 +161,16 @@ class ProcessingPipeline(BasePipeline):
         start_time = time.time()
         started_at = datetime.utcnow()
 
+        items_collected = len(items) if isinstance(items, Sized) else 0
         logger.info(
-            f"Starting pipeline execution with {len(items)} raw items, "
-            f"{len(self._stages)} stages"
+            f"Starting pipeline execution with {items_collected} raw items, "
+            f"{len(self._stages)} stages (streaming={pipeline_config.streaming})"
         )
 
         # Initialize result
         result = PipelineResult(
             status=ProcessingStatus.IN_PROGRESS,
-            items_collected=len(items),
+            items_collected=items_collected,
             items_processed=0,
             items_deduplicated=0,
             topics_created=0,
@@ -123,46 +181,45 @@ class ProcessingPipeline(BasePipeline):
         )
 
         try:
-            # Step 1: Convert RawItem to ProcessedItem
-            processed_items = self._convert_to_processed_items(items)
-            result.items_processed = len(processed_items)
-
-            logger.info(f"Converted {len(processed_items)} items to ProcessedItem format")
-
-            # Step 2: Run through all stages
-            current_items = processed_items
-
-            for stage in self._stages:
-                stage_name = stage.get_stage_name()
-                logger.info(f"Running stage: {stage_name}")
-
-                try:
-                    stage_start = time.time()
+            remaining_stages = self._stages
+            stream_stats: List[StageStreamStats] = []
+
+            if pipeline_config.streaming:
+                # Step 1+2a: Convert and run per-item stages in micro-batches
+                streamed_stages = self._leading_per_item_stages()
+                remaining_stages = self._stages[len(streamed_stages):]
+                stream_stats = [
+                    StageStreamStats(stage=stage.get_stage_name())
+                    for stage in streamed_stages
+                ]
+                current_items, items_collected = await self._stream_stages(
+                    items, streamed_stages, stream_stats, pipeline_config, result.errors
+                )
+                result.items_collected = items_collected
+                result.items_processed = items_collected
 
-                    # Execute stage
-                    current_items = await stage.process(current_items)
+                logger.info(
+                    f"Streamed {items_collected} items through "
+                    f"{len(streamed_stages)} per-item stages"
+                )
+            else:
+                # Step 1: Convert RawItem to ProcessedItem
+                current_items = self._convert_to_processed_items(items)
+                result.items_processed = len(current_items)
 
-                    # Validate stage output (optional but recommended)
-                    if hasattr(stage, "validate"):
-                        is_valid = await stage.validate(current_items)
-                        if not is_valid:
-                            error_msg = f"Stage validation failed: {stage_name}"
-                            logger.warning(error_msg)
-                            result.errors.append(error_msg)
+                logger.info(f"Converted {len(current_items)} items to ProcessedItem format")
 
-                    stage_duration = time.time() - stage_start
-                    logger.info(
-                        f"Stage {stage_name} completed in {stage_duration:.2f}s"
-                    )
+            # Step 2: Run the remaining stages over the full item set
+            for stage in remaining_stages:
+                logger.info(f"Running stage: {stage.get_stage_name()}")
+                stage_start = time.time()
 
-                except Exception as e:
-                    error_msg = f"Stage {stage_name} failed: {str(e)}"
-                    logger.error(error_msg, exc_info=True)
-                    result.errors.append(error_msg)
+                current_items = await self._run_stage(stage, current_items, result.errors)
 
-                    # Decide whether to continue or fail
-                    # For now, continue with partial results
-                    continue
+                logger.info(
+                    f"Stage {stage.get_stage_name()} completed in "
+                    f"{time.time() - stage_start:.2f}s"
+                )
 
             # Step 3: Extract final results from metadata
             trends = self._extract_trends(current_items)
@@ -171,12 +228,18 @@ class ProcessingPipeline(BasePipeline):
             result.items_deduplicated = len(current_items)
 
             # Extract topics count from metadata if available
+            topics = []
             if current_items and "_clustered_topics" in current_items[0].metadata:
                 topics = current_items[0].metadata["_clustered_topics"]
                 result.topics_created = len(topics)
 
             result.trends_created = len(trends)
 
+            # Drop the stage hand-off keys so enriched items stay JSON-serializable
+            if current_items:
+                current_items[0].metadata.pop("_clustered_topics", None)
+                current_items[0].metadata.pop("_ranked_trends", None)
+
             # Complete timing
             result.duration_seconds = time.time() - start_time
             result.completed_at = datetime.utcnow()
@@ -194,8 +257,16 @@ class ProcessingPipeline(BasePipeline):
                     f"Pipeline completed successfully in {result.duration_seconds:.2f}s"
                 )
 
-            # Store trends in result metadata
-            result.metadata = {"trends": trends}
+            # Store trends, topics and enriched items (with embeddings) in result metadata
+            result.metadata = {
+                "trends": trends,
+                "_clustered_topics": topics,
+                "processed_items": current_items,
+            }
+            if pipeline_config.streaming:
+                result.metadata["stream_stats"] = [
+                    stats.to_dict() for stats in stream_stats
+                ]
 
         except Exception as e:
             # Critical failure
@@ -208,6 +279,183 @@ class ProcessingPipeline(BasePipeline):
 
         return result
 
+    async def _run_stage(
+        self,
+        stage: ProcessingStage,
+        items: List[ProcessedItem],
+        errors: List[str],
+    ) -> List[ProcessedItem]:
+        """
+        Run one stage over a list of items.
+
+        Failures are recorded in ``errors`` and the input items are passed
+        on unchanged, so the pipeline continues with partial results.
+
+        Args:
+            stage: Stage to execute
+            items: Stage input
+            errors: Error list to append to (each message recorded once)
+
+        Returns:
+            Stage output, or the input items if the stage failed
+        """
+        stage_name = stage.get_stage_name()
+
+        try:
+            output = await stage.process(items)
+
+            # Some stages wrap their items in a PipelineResult
+            if isinstance(output, PipelineResult):
+                output = output.metadata.get("processed_items", [])
+
+            # Validate stage output (optional but recommended)
+            if hasattr(stage, "validate"):
+                is_valid = await stage.validate(output)
+                if not is_valid:
+                    error_msg = f"Stage validation failed: {stage_name}"
+                    logger.warning(error_msg)
+                    if error_msg not in errors:
+                        errors.append(error_msg)
+
+            return output
+
+        except Exception as e:
+            error_msg = f"Stage {stage_name} failed: {str(e)}"
+            logger.error(error_msg, exc_info=True)
+            if error_msg not in errors:
+                errors.append(error_msg)
+            return items
+
+    def _leading_per_item_stages(self) -> List[ProcessingStage]:
+        """
+        Get the per-item stages that precede the first set-level stage.
+
+        Returns:
+            Stages that can be streamed in micro-batches
+        """
+        stages = []
+        for stage in self._stages:
+            if not getattr(stage, "per_item", False):
+                break
+            stages.append(stage)
+        return stages
+
+    async def _stream_stages(
+        self,
+        items: Union[Iterable[RawItem], AsyncIterable[RawItem]],
+        stages: List[ProcessingStage],
+        stats: List[StageStreamStats],
+        config: PipelineConfig,
+        errors: List[str],
+    ) -> Tuple[List[ProcessedItem], int]:
+        """
+        Convert raw items and run per-item stages over bounded queues.
+
+        A producer converts raw items in micro-batches and each stage runs as
+        its own worker reading from a bounded input queue, so at most
+        ``stream_queue_size`` batches wait in front of any stage. A full
+        queue blocks the upstream worker (backpressure) instead of letting
+        converted items pile up.
+
+        Args:
+            items: Raw items (iterable or async iterable)
+            stages: Per-item stages to stream, in order
+            stats: One StageStreamStats per stage, updated in place
+            config: Pipeline configuration with batch and queue sizes
+            errors: Error list shared with the pipeline result
+
+        Returns:
+            Tuple of (processed items, raw items consumed)
+        """
+        batch_size = max(1, config.stream_batch_size)
+        queues = [
+            asyncio.Queue(maxsize=max(1, config.stream_queue_size)) for _ in stages
+        ]
+        output: List[ProcessedItem] = []
+        collected = 0
+
+        async def emit(index: int, batch: List[ProcessedItem]) -> None:
+            """Hand a batch to stage ``index``, or to the output past the last stage."""
+            if index == len(stages):
+                output.extend(batch)
+                return
+
+            queue = queues[index]
+            stage_stats = stats[index]
+            if queue.full():
+                stage_stats.backpressure_waits += 1
+                wait_start = time.perf_counter()
+                await queue.put(batch)
+                stage_stats.backpressure_seconds += time.perf_counter() - wait_start
+            else:
+                queue.put_nowait(batch)
+
+            depth = queue.qsize()
+            stage_stats.max_queue_depth = max(stage_stats.max_queue_depth, depth)
+            update_pipeline_queue_depth(stage_stats.stage, depth)
+
+        async def produce() -> None:
+            nonlocal collected
+            batch: List[RawItem] = []
+            async for raw_item in _iterate_items(items):
+                batch.append(raw_item)
+                if len(batch) >= batch_size:
+                    collected += len(batch)
+                    await emit(0, self._convert_to_processed_items(batch))
+                    batch = []
+            if batch:
+                collected += len(batch)
+                await emit(0, self._convert_to_processed_items(batch))
+            if stages:
+                await queues[0].put(None)
+
+        async def work(index: int) -> None:
+            stage = stages[index]
+            stage_stats = stats[index]
+            queue = queues[index]
+
+            while True:
+                batch = await queue.get()
+                update_pipeline_queue_depth(stage_stats.stage, queue.qsize())
+                if batch is None:
+                    break
+
+                stage_stats.batches += 1
+                stage_stats.items_in += len(batch)
+                busy_start = time.perf_counter()
+                batch = await self._run_stage(stage, batch, errors)
+                stage_stats.busy_seconds += time.perf_counter() - busy_start
+                stage_stats.items_out += len(batch)
+
+                await emit(index + 1, batch)
+
+            if index + 1 < len(stages):
+                await queues[index + 1].put(None)
+
+        tasks = [asyncio.create_task(produce())]
+        tasks.extend(asyncio.create_task(work(i)) for i in range(len(stages)))
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            # Stop the remaining workers if the producer or a worker raised
+            for task in tasks:
+                task.cancel()
+
+        for stage_stats in stats:
+            if stage_stats.backpressure_seconds:
+                record_pipeline_backpressure(
+                    stage_stats.stage, stage_stats.backpressure_seconds
+                )
+            logger.info(
+                f"Stage {stage_stats.stage} streamed {stage_stats.items_in} items "
+                f"in {stage_stats.batches} batches "
+                f"(busy {stage_stats.busy_seconds:.2f}s, "
+                f"max queue depth {stage_stats.max_queue_depth}, "
+                f"backpressure {stage_stats.backpressure_seconds:.2f}s)"
+            )
+
+        return output, collected
+
     def get_stages(self) -> List[str]:
         """
         Get names of all stages in the pipeline.
@@ -217,7 +465,9 @@ class ProcessingPipeline(BasePipeline):
         """
         return [stage.get_stage_name() for stage in self._stages]
 
-    def _convert_to_processed_items(self, raw_items: List[RawItem]) -> List[ProcessedItem]:
+    def _convert_to_processed_items(
+        self, raw_items: Iterable[RawItem]
+    ) -> List[ProcessedItem]:
         """
         Convert RawItem objects to ProcessedItem objects.
 
@@ -285,6 +535,12 @@ def create_standard_pipeline(
     config: Optional[PipelineConfig] = None,
     translation_manager=None,
     enable_translation: bool = None,
+    embedding_cache=None,
+    cpu_executor=None,
+    entity_extractor=None,
+    topic_index=None,
+    content_fetcher=None,
+    key_point_extractor=None,
 ) -> ProcessingPipeline:
     """
     Create a standard processing pipeline with all stages.
@@ -295,6 +551,15 @@ def create_standard_pipeline(
         config: Optional pipeline configuration
         translation_manager: Optional translation manager for translation stage
         enable_translation: Whether to enable translation (reads ENABLE_TRANSLATION env if None)
+        embedding_cache: Optional EmbeddingCache shared by deduplication and clustering
+        cpu_executor: Optional CPUExecutor for normalization and language detection
+        entity_extractor: Optional EntityExtractor; enables spaCy entity extraction
+        topic_index: Optional TopicIndex; enables incremental clustering against
+            topics from earlier runs
+        content_fetcher: Optional ContentFetchService; adds a stage that fetches
+            article content for items with little text
+        key_point_extractor: Optional KeyPointExtractor; the ranker extracts
+            key points for all ranked trends in one batch
 
     Returns:
         Configured processing pipeline
@@ -311,9 +576,10 @@ def create_standard_pipeline(
         DeduplicatorStage,
         EmbeddingDeduplicator,
     )
+    from trend_agent.processing.embedding_cache import EmbeddingCache
     from trend_agent.processing.language import LanguageDetectorStage
-    from trend_agent.processing.normalizer import NormalizerStage
-    from trend_agent.processing.rank import RankerStage
+    from trend_agent.processing.normalizer import NormalizerStage, TextNormalizer
+    from trend_agent.processing.rank import CompositeRanker, RankerStage
     from trend_agent.processing.translation import TranslationStage
 
     pipeline = ProcessingPipeline(config=config)
@@ -321,12 +587,30 @@ def create_standard_pipeline(
     # Use config values if available
     cfg = config or PipelineConfig()
 
+    # Shared embedding cache so each item is embedded once per run
+    embedding_cache = embedding_cache or EmbeddingCache(embedding_service)
+
+    # Stage 0: Article content for items with little text (optional)
+    if content_fetcher is not None:
+        from trend_agent.processing.content_fetcher import ContentFetchStage
+
+        pipeline.add_stage(ContentFetchStage(fetcher=content_fetcher))
+
     # Stage 1: Normalization
-    normalizer_stage = NormalizerStage(extract_entities=False)  # Disable spaCy by default
+    normalizer = None
+    if entity_extractor is not None:
+        normalizer = TextNormalizer(
+            enable_entity_extraction=True, entity_extractor=entity_extractor
+        )
+    normalizer_stage = NormalizerStage(
+        normalizer=normalizer,
+        extract_entities=False,  # Disable spaCy unless an extractor is given
+        cpu_executor=cpu_executor,
+    )
     pipeline.add_stage(normalizer_stage)
 
     # Stage 2: Language Detection
-    language_stage = LanguageDetectorStage()
+    language_stage = LanguageDetectorStage(cpu_executor=cpu_executor)
     pipeline.add_stage(language_stage)
 
     # Stage 2.5: Translation (optional, if enabled)
@@ -351,7 +635,9 @@ def create_standard_pipeline(
         logger.warning("Translation enabled but no translation_manager provided - skipping translation stage")
 
     # Stage 3: Deduplication
-    deduplicator = EmbeddingDeduplicator(embedding_service)
+    deduplicator = EmbeddingDeduplicator(
+        embedding_service, embedding_cache=embedding_cache
+    )
     deduplicator_stage = DeduplicatorStage(
         deduplicator=deduplicator,
         threshold=cfg.deduplication_threshold,
@@ -363,6 +649,8 @@ def create_standard_pipeline(
         embedding_service=embedding_service,
         llm_service=llm_service,
         min_cluster_size=cfg.min_cluster_size,
+        embedding_cache=embedding_cache,
+        topic_index=topic_index,
     )
     clusterer_stage = ClustererStage(
         clusterer=clusterer,
@@ -372,7 +660,13 @@ def create_standard_pipeline(
     pipeline.add_stage(clusterer_stage)
 
     # Stage 5: Ranking
+    ranker = None
+    if key_point_extractor is not None:
+        ranker = CompositeRanker(
+            key_point_extractor=key_point_extractor, extract_key_points=True
+        )
     ranker_stage = RankerStage(
+        ranker=ranker,
         max_trends=cfg.max_trends_per_category,
         enable_source_diversity=cfg.source_diversity_enabled,
         max_percentage_per_source=cfg.max_percentage_per_source,
@@ -390,6 +684,7 @@ def create_standard_pipeline(
 def create_minimal_pipeline(
     embedding_service,
     config: Optional[PipelineConfig] = None,
+    cpu_executor=None,
 ) -> ProcessingPipeline:
     """
     Create a minimal pipeline with only essential stages.
@@ -399,6 +694,7 @@ def create_minimal_pipeline(
     Args:
         embedding_service: Embedding service
         config: Optional pipeline configuration
+        cpu_executor: Optional CPUExecutor for normalization
 
     Returns:
         Configured minimal pipeline
@@ -408,22 +704,28 @@ def create_minimal_pipeline(
         DeduplicatorStage,
         EmbeddingDeduplicator,
     )
+    from trend_agent.processing.embedding_cache import EmbeddingCache
     from trend_agent.processing.normalizer import NormalizerStage
 
     pipeline = ProcessingPipeline(config=config)
     cfg = config or PipelineConfig()
+    embedding_cache = EmbeddingCache(embedding_service)
 
     # Stage 1: Normalization
-    pipeline.add_stage(NormalizerStage())
+    pipeline.add_stage(NormalizerStage(cpu_executor=cpu_executor))
 
     # Stage 2: Deduplication
-    deduplicator = EmbeddingDeduplicator(embedding_service)
+    deduplicator = EmbeddingDeduplicator(
+        embedding_service, embedding_cache=embedding_cache
+    )
     pipeline.add_stage(
         DeduplicatorStage(deduplicator=deduplicator, threshold=cfg.deduplication_threshold)
     )
 
     # Stage 3: Clustering
-    clusterer = HDBSCANClusterer(embedding_service=embedding_service)
+    clusterer = HDBSCANClusterer(
+        embedding_service=embedding_service, embedding_cache=embedding_cache
+    )
     pipeline.add_stage(
         ClustererStage(
             clusterer=clusterer,
@@ -124,20 +124,21 @@ class CompositeRanker(BaseRanker):
             # Determine state using sophisticated state service
             trend.state = await self._state_service.analyze_trend(trend)
 
-            # Extract key points if enabled
-            if self._extract_key_points and self._key_point_extractor:
-                try:
-                    trend.key_points = await self._key_point_extractor.extract_key_points(
-                        trend
-                    )
-                except Exception as e:
-                    logger.warning(
-                        f"Failed to extract key points for '{trend.title[:50]}': {e}"
-                    )
-                    trend.key_points = []
-
             trends.append(trend)
 
+        # Extract key points if enabled (concurrently, bounded by the extractor)
+        if self._extract_key_points and self._key_point_extractor:
+            try:
+                key_points = await self._key_point_extractor.extract_key_points_batch(
+                    trends
+                )
+            except Exception as e:
+                logger.warning(f"Failed to extract key points: {e}")
+                key_points = {}
+
+            for trend in trends:
+                trend.key_points = key_points.get(trend.id, [])
+
         # Apply advanced ranking adjustments
         if self._enable_temporal_decay:
             trends = self._apply_temporal_decay(trends)
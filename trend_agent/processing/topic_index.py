@@ -0,0 +1,237 @@
+"""
+Persisted topic index for incremental clustering.
+
+This module keeps the centroids of known topics and the most recently
+fitted HDBSCAN model, so each clustering run can attach new items to
+topics created by earlier runs instead of rebuilding every topic from
+scratch.
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+
+import numpy as np
+
+from trend_agent.schemas import Topic
+from trend_agent.storage.interfaces import CacheRepository
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class IndexedTopic:
+    """A known topic with the centroid of its items' embeddings."""
+
+    topic: Topic
+    centroid: np.ndarray  # Unit-normalized mean of member embeddings
+    vector_count: int  # Embeddings averaged into the centroid
+
+
+class TopicIndex:
+    """
+    Centroid index of known topics plus the last fitted HDBSCAN model.
+
+    The index is stored as a single pickled value in the cache repository
+    (Redis), so every processing worker sees the topics of earlier runs.
+    Without a repository it lives only as long as the instance.
+
+    Assignment of new embeddings:
+    1. ``approximate_predict`` against the stored HDBSCAN model
+       (fitted with ``prediction_data=True``)
+    2. Nearest centroid by cosine similarity, above a threshold
+
+    Example:
+        ```python
+        index = TopicIndex(cache_repo=redis_repo)
+        clusterer = HDBSCANClusterer(embedding_service, topic_index=index)
+        ```
+    """
+
+    def __init__(
+        self,
+        cache_repo: Optional[CacheRepository] = None,
+        key: str = "topic_index:v1",
+        max_topics: int = 5000,
+        ttl_seconds: int = 604800,
+    ):
+        """
+        Initialize topic index.
+
+        Args:
+            cache_repo: Optional cache repository used to persist the index
+            key: Cache key holding the index
+            max_topics: Topics kept; the least recently updated are evicted
+            ttl_seconds: Cache TTL in seconds (default: 7 days)
+        """
+        self._cache_repo = cache_repo
+        self._key = key
+        self._max_topics = max_topics
+        self._ttl_seconds = ttl_seconds
+        self._topics: Dict[UUID, IndexedTopic] = {}
+        self._model = None
+        self._model_topic_ids: Dict[int, UUID] = {}
+        self._loaded = False
+
+    def __len__(self) -> int:
+        return len(self._topics)
+
+    def get(self, topic_id: UUID) -> Optional[IndexedTopic]:
+        """Get an indexed topic by ID."""
+        return self._topics.get(topic_id)
+
+    async def load(self) -> None:
+        """Load the persisted index (once per instance)."""
+        if self._loaded:
+            return
+        self._loaded = True
+
+        if self._cache_repo is None:
+            return
+
+        try:
+            state = await self._cache_repo.get(self._key)
+        except Exception as e:
+            logger.warning(f"Failed to load topic index: {e}")
+            return
+
+        if state:
+            self._topics = state["topics"]
+            self._model = state["model"]
+            self._model_topic_ids = state["model_topic_ids"]
+            logger.info(
+                f"Loaded topic index with {len(self._topics)} topics "
+                f"(model: {'yes' if self._model is not None else 'no'})"
+            )
+
+    async def save(self) -> None:
+        """Persist the index, ignoring cache failures."""
+        if self._cache_repo is None:
+            return
+
+        state = {
+            "topics": self._topics,
+            "model": self._model,
+            "model_topic_ids": self._model_topic_ids,
+        }
+        try:
+            await self._cache_repo.set(self._key, state, ttl_seconds=self._ttl_seconds)
+        except Exception as e:
+            logger.warning(f"Failed to save topic index: {e}")
+
+    def assign(
+        self,
+        embeddings: np.ndarray,
+        min_similarity: float = 0.85,
+        min_probability: float = 0.5,
+    ) -> Tuple[List[Optional[UUID]], List[str]]:
+        """
+        Assign embeddings to known topics.
+
+        Args:
+            embeddings: Item embeddings (n x d)
+            min_similarity: Minimum cosine similarity to a centroid
+            min_probability: Minimum HDBSCAN membership strength
+
+        Returns:
+            Tuple of (topic ID or None per row, assignment method per row:
+            "prediction", "centroid" or "")
+        """
+        n = len(embeddings)
+        topic_ids: List[Optional[UUID]] = [None] * n
+        methods = [""] * n
+        if n == 0 or not self._topics:
+            return topic_ids, methods
+
+        # Step 1: Approximate prediction against the stored HDBSCAN model
+        if self._model is not None:
+            try:
+                import hdbscan
+
+                labels, strengths = hdbscan.approximate_predict(self._model, embeddings)
+                for i, (label, strength) in enumerate(zip(labels, strengths)):
+                    topic_id = self._model_topic_ids.get(int(label))
+                    if topic_id in self._topics and strength >= min_probability:
+                        topic_ids[i] = topic_id
+                        methods[i] = "prediction"
+            except Exception as e:
+                logger.warning(f"HDBSCAN approximate prediction failed: {e}")
+
+        # Step 2: Nearest centroid for the rest
+        pending = [i for i in range(n) if topic_ids[i] is None]
+        if pending:
+            index_ids = list(self._topics.keys())
+            centroids = np.stack([self._topics[t].centroid for t in index_ids])
+            vectors = _normalize(embeddings[pending])
+            similarities = vectors @ centroids.T
+            best = similarities.argmax(axis=1)
+
+            for row, i in enumerate(pending):
+                if similarities[row, best[row]] >= min_similarity:
+                    topic_ids[i] = index_ids[best[row]]
+                    methods[i] = "centroid"
+
+        return topic_ids, methods
+
+    def upsert(self, topic: Topic, embeddings: np.ndarray) -> None:
+        """
+        Add a topic or fold new member embeddings into its centroid.
+
+        Args:
+            topic: Current state of the topic
+            embeddings: Embeddings of the items added in this run
+        """
+        if len(embeddings) == 0:
+            return
+
+        total = np.asarray(embeddings, dtype=np.float32).sum(axis=0)
+        entry = self._topics.get(topic.id)
+        if entry is None:
+            count = len(embeddings)
+        else:
+            # Running mean over all member embeddings seen so far
+            total = total + entry.centroid * entry.vector_count
+            count = entry.vector_count + len(embeddings)
+
+        self._topics[topic.id] = IndexedTopic(
+            topic=topic,
+            centroid=_normalize(total[np.newaxis, :])[0],
+            vector_count=count,
+        )
+        self._evict()
+
+    def set_model(self, model, label_topic_ids: Dict[int, UUID]) -> None:
+        """
+        Store the latest fitted HDBSCAN model for approximate prediction.
+
+        Args:
+            model: HDBSCAN fitted with prediction_data=True
+            label_topic_ids: Cluster label -> topic ID
+        """
+        self._model = model
+        self._model_topic_ids = dict(label_topic_ids)
+
+    def remove(self, topic_id: UUID) -> None:
+        """Drop a topic from the index."""
+        self._topics.pop(topic_id, None)
+
+    def _evict(self) -> None:
+        """Evict the least recently updated topics beyond max_topics."""
+        overflow = len(self._topics) - self._max_topics
+        if overflow <= 0:
+            return
+
+        oldest = sorted(
+            self._topics.items(), key=lambda entry: entry[1].topic.last_updated
+        )[:overflow]
+        for topic_id, _ in oldest:
+            del self._topics[topic_id]
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    """L2-normalize rows, leaving zero rows unchanged."""
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
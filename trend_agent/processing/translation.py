@@ -6,11 +6,16 @@ with caching and multi-provider support.
 """
 
 import logging
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from trend_agent.processing.interfaces import BaseProcessingStage
 from trend_agent.schemas import ProcessedItem, PipelineResult
 
+try:
+    from unidecode import unidecode
+except ImportError:
+    unidecode = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -51,6 +56,8 @@ class TranslationStage(BaseProcessingStage):
         ```
     """
 
+    per_item = True
+
     def __init__(
         self,
         translation_manager,  # TranslationManager
@@ -263,20 +270,24 @@ class CrossLanguageNormalizer(BaseProcessingStage):
         ```
     """
 
-    def __init__(self):
-        """Initialize cross-language normalizer."""
-        super().__init__()
+    per_item = True
+
+    def __init__(self, cpu_executor=None):
+        """
+        Initialize cross-language normalizer.
 
-        # Try to import transliteration library
-        try:
-            from unidecode import unidecode
+        Args:
+            cpu_executor: Optional CPUExecutor to run transliteration off the event loop
+        """
+        super().__init__()
+        self._cpu_executor = cpu_executor
 
-            self.unidecode = unidecode
-        except ImportError:
+        # Transliteration library is optional
+        self.unidecode = unidecode
+        if unidecode is None:
             logger.warning(
                 "unidecode not installed. Latin normalization will be limited."
             )
-            self.unidecode = None
 
         logger.info("Initialized CrossLanguageNormalizer")
 
@@ -293,6 +304,17 @@ class CrossLanguageNormalizer(BaseProcessingStage):
         if not items:
             return self._create_empty_result()
 
+        if self._cpu_executor is not None:
+            results = await self._cpu_executor.map(
+                latin_fields, [(item.title, item.description) for item in items]
+            )
+            for item, (title_latin, description_latin) in zip(items, results):
+                if title_latin is not None:
+                    item.metadata["normalized_title_latin"] = title_latin
+                if description_latin is not None:
+                    item.metadata["normalized_description_latin"] = description_latin
+            return self._create_result(items)
+
         normalized_items = []
 
         for item in items:
@@ -313,18 +335,22 @@ class CrossLanguageNormalizer(BaseProcessingStage):
                 logger.error(f"Normalization failed for item {item.id}: {e}")
                 normalized_items.append(item)
 
-        logger.info(f"Normalized {len(normalized_items)} items for cross-language comparison")
+        return self._create_result(normalized_items)
+
+    def _create_result(self, items: List[ProcessedItem]) -> PipelineResult:
+        """Wrap normalized items in a PipelineResult."""
+        logger.info(f"Normalized {len(items)} items for cross-language comparison")
 
         return PipelineResult(
             status="completed",
             items_collected=len(items),
-            items_processed=len(normalized_items),
+            items_processed=len(items),
             items_deduplicated=0,
             topics_created=0,
             trends_created=0,
             duration_seconds=0.0,
             started_at=self._get_current_time(),
-            metadata={"processed_items": normalized_items},
+            metadata={"processed_items": items},
         )
 
     def _normalize_to_latin(self, text: str) -> str:
@@ -340,20 +366,7 @@ class CrossLanguageNormalizer(BaseProcessingStage):
         Returns:
             Normalized Latin text
         """
-        if not text:
-            return ""
-
-        # Convert to lowercase
-        normalized = text.lower()
-
-        # Transliterate to Latin if available
-        if self.unidecode:
-            normalized = self.unidecode(normalized)
-
-        # Remove extra whitespace
-        normalized = " ".join(normalized.split())
-
-        return normalized
+        return normalize_to_latin(text)
 
     def _create_empty_result(self) -> PipelineResult:
         """Create empty result."""
@@ -376,3 +389,46 @@ class CrossLanguageNormalizer(BaseProcessingStage):
         from datetime import datetime
 
         return datetime.utcnow()
+
+
+def normalize_to_latin(text: str) -> str:
+    """
+    Lowercase, transliterate (if unidecode is installed) and collapse whitespace.
+
+    Args:
+        text: Text to normalize
+
+    Returns:
+        Normalized Latin text
+    """
+    if not text:
+        return ""
+
+    # Convert to lowercase
+    normalized = text.lower()
+
+    # Transliterate to Latin if available
+    if unidecode:
+        normalized = unidecode(normalized)
+
+    # Remove extra whitespace
+    return " ".join(normalized.split())
+
+
+def latin_fields(
+    fields: Tuple[Optional[str], Optional[str]]
+) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Normalize an item's title and description to Latin (CPU executor work unit).
+
+    Args:
+        fields: (title, description)
+
+    Returns:
+        (normalized title, normalized description), None where the field is empty
+    """
+    title, description = fields
+    return (
+        normalize_to_latin(title) if title else None,
+        normalize_to_latin(description) if description else None,
+    )
@@ -252,6 +252,9 @@ class PipelineConfig(BaseModel):
     max_trends_per_category: int = 10
     source_diversity_enabled: bool = True
     max_percentage_per_source: float = 0.20
+    streaming: bool = False  # Stream per-item stages in micro-batches
+    stream_batch_size: int = 256
+    stream_queue_size: int = 4  # Batches buffered between streamed stages
 
     class Config:
         frozen = True
@@ -4,7 +4,7 @@ AI Services for the Trend Intelligence Platform.
 This package provides production-ready implementations of AI services:
 - Embedding generation (OpenAI)
 - LLM operations (OpenAI, Anthropic)
-- Semantic search (Qdrant)
+- Semantic search (Qdrant) and hybrid lexical + semantic search
 - Translation (OpenAI, LibreTranslate, DeepL)
 - Trend state management (lifecycle tracking)
 - Alert notifications (Email, Slack)
@@ -17,16 +17,19 @@ from trend_agent.services.factory import (
     close_global_factory,
 )
 from trend_agent.services.llm import AnthropicLLMService, OpenAILLMService
-from trend_agent.services.search import QdrantSemanticSearchService
+from trend_agent.services.search import HybridSearchService, QdrantSemanticSearchService
 from trend_agent.services.trend_states import TrendStateService, get_trend_state_service
 from trend_agent.services.alerts import AlertService, get_alert_service
 from trend_agent.services.key_points import KeyPointExtractor, TopicKeyPointExtractor, get_key_point_extractor
+from trend_agent.services.llm_batch import LLMBatchExecutor
+from trend_agent.services.llm_cache import LLMResponseCache
 
 __all__ = [
     "OpenAIEmbeddingService",
     "OpenAILLMService",
     "AnthropicLLMService",
     "QdrantSemanticSearchService",
+    "HybridSearchService",
     "TrendStateService",
     "get_trend_state_service",
     "AlertService",
@@ -34,6 +37,8 @@ __all__ = [
     "KeyPointExtractor",
     "TopicKeyPointExtractor",
     "get_key_point_extractor",
+    "LLMBatchExecutor",
+    "LLMResponseCache",
     "ServiceFactory",
     "get_service_factory",
     "close_global_factory",
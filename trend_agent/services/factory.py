@@ -234,6 +234,7 @@ class ServiceFactory:
             model=model,
             max_retries=max_retries,
             timeout=timeout,
+            response_cache=self._create_llm_response_cache(),
         )
 
     def _create_anthropic_llm_service(self) -> AnthropicLLMService:
@@ -252,6 +253,35 @@ class ServiceFactory:
             model=model,
             max_retries=max_retries,
             timeout=timeout,
+            response_cache=self._create_llm_response_cache(),
+        )
+
+    def _create_llm_response_cache(self):
+        """
+        Create the LLM response cache (Redis plus on-disk tier).
+
+        Returns:
+            LLMResponseCache instance, or None if disabled via LLM_CACHE_ENABLED
+        """
+        enabled = self.config.get("llm_cache_enabled")
+        if enabled is None:
+            enabled = os.getenv("LLM_CACHE_ENABLED", "true").lower() in ("true", "1", "yes")
+        if not enabled:
+            return None
+
+        from trend_agent.services.llm_cache import LLMResponseCache
+
+        disk_dir = self.config.get("llm_cache_dir") or os.getenv(
+            "LLM_CACHE_DIR", os.path.expanduser("~/.cache/trend_agent/llm")
+        )
+
+        return LLMResponseCache(
+            cache_repo=self.get_redis_repository(),
+            disk_dir=disk_dir,
+            ttl_seconds=int(os.getenv("LLM_CACHE_TTL", "86400")),
+            disk_ttl_seconds=int(os.getenv("LLM_CACHE_DISK_TTL", "604800")),
+            max_disk_bytes=int(os.getenv("LLM_CACHE_DISK_MAX_MB", "256")) * 1024 * 1024,
+            max_temperature=float(os.getenv("LLM_CACHE_MAX_TEMPERATURE", "0.5")),
         )
 
     def _create_free_llm_service(self):
@@ -433,12 +463,22 @@ class ServiceFactory:
         )
         max_retries = self.config.get("openai_max_retries", 3)
         timeout = self.config.get("openai_timeout", 30)
+        max_batch_tokens = int(
+            self.config.get("openai_translation_batch_tokens")
+            or os.getenv("OPENAI_TRANSLATION_BATCH_TOKENS", "1500")
+        )
+        max_concurrent_requests = int(
+            self.config.get("openai_translation_concurrency")
+            or os.getenv("OPENAI_TRANSLATION_CONCURRENCY", "4")
+        )
 
         return OpenAITranslationService(
             api_key=api_key,
             model=model,
             max_retries=max_retries,
             timeout=timeout,
+            max_batch_tokens=max_batch_tokens,
+            max_concurrent_requests=max_concurrent_requests,
         )
 
     def _create_libretranslate_service(self) -> LibreTranslateService:
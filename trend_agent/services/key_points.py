@@ -12,6 +12,7 @@ from uuid import UUID
 
 from trend_agent.schemas import Trend, Topic, ProcessedItem
 from trend_agent.intelligence.interfaces import BaseLLMService
+from trend_agent.services.llm_batch import LLMBatchExecutor
 from trend_agent.storage.interfaces import ItemRepository
 
 logger = logging.getLogger(__name__)
@@ -52,6 +53,8 @@ Output format: Return ONLY a JSON array of strings, e.g.:
         max_items_per_trend: int = 20,
         min_points: int = 3,
         max_points: int = 5,
+        batch_executor: Optional[LLMBatchExecutor] = None,
+        trends_per_prompt: int = 4,
     ):
         """
         Initialize key point extractor.
@@ -62,12 +65,18 @@ Output format: Return ONLY a JSON array of strings, e.g.:
             max_items_per_trend: Maximum items to include in analysis
             min_points: Minimum number of key points to extract
             max_points: Maximum number of key points to extract
+            batch_executor: Executor bounding concurrent LLM calls in batch
+                extraction (a default-sized one is created if None)
+            trends_per_prompt: Trends combined into one LLM prompt in batch
+                extraction (1 = one prompt per trend)
         """
         self._llm_service = llm_service
         self._item_repo = item_repo
         self._max_items_per_trend = max_items_per_trend
         self._min_points = min_points
         self._max_points = max_points
+        self._batch_executor = batch_executor or LLMBatchExecutor()
+        self._trends_per_prompt = max(1, trends_per_prompt)
 
     async def extract_key_points(
         self, trend: Trend, items: Optional[List[ProcessedItem]] = None
@@ -118,7 +127,12 @@ Output format: Return ONLY a JSON array of strings, e.g.:
         self, trends: List[Trend]
     ) -> Dict[UUID, List[str]]:
         """
-        Extract key points for multiple trends.
+        Extract key points for multiple trends concurrently.
+
+        Trends are grouped ``trends_per_prompt`` at a time into one prompt,
+        and the prompts run concurrently through the batch executor. Trends
+        missing from a combined response are retried with their own prompt;
+        trends whose extraction fails get fallback key points.
 
         Args:
             trends: List of trends to analyze
@@ -126,19 +140,40 @@ Output format: Return ONLY a JSON array of strings, e.g.:
         Returns:
             Dictionary mapping trend IDs to key points
         """
-        results = {}
+        if not trends:
+            return {}
+
+        groups = [
+            trends[i:i + self._trends_per_prompt]
+            for i in range(0, len(trends), self._trends_per_prompt)
+        ]
+        group_results = await self._batch_executor.run(
+            [lambda group=group: self._extract_group(group) for group in groups],
+            fallback=lambda i, error: [None] * len(groups[i]),
+        )
 
-        for trend in trends:
-            try:
-                key_points = await self.extract_key_points(trend)
+        results: Dict[UUID, List[str]] = {}
+        retry = []
+        for group, key_points_list in zip(groups, group_results):
+            for trend, key_points in zip(group, key_points_list):
+                if key_points is None:
+                    retry.append(trend)
+                else:
+                    results[trend.id] = key_points
+
+        # Trends the combined prompts did not cover get their own prompt
+        if retry:
+            retried = await self._batch_executor.run(
+                [lambda trend=trend: self.extract_key_points(trend) for trend in retry],
+                fallback=lambda i, error: self._generate_fallback_key_points(retry[i]),
+            )
+            for trend, key_points in zip(retry, retried):
                 results[trend.id] = key_points
-            except Exception as e:
-                logger.error(
-                    f"Failed to extract key points for trend {trend.id}: {e}"
-                )
-                results[trend.id] = self._generate_fallback_key_points(trend)
 
-        logger.info(f"Extracted key points for {len(results)}/{len(trends)} trends")
+        logger.info(
+            f"Extracted key points for {len(results)}/{len(trends)} trends "
+            f"({len(groups)} combined prompts, {len(retry)} retried individually)"
+        )
 
         return results
 
@@ -233,6 +268,86 @@ Extract the most important points about this trend. Focus on:
 
 Return your response as a JSON array of {self._min_points}-{self._max_points} strings."""
 
+    async def _extract_group(self, trends: List[Trend]) -> List[Optional[List[str]]]:
+        """
+        Extract key points for several trends with one LLM call.
+
+        Args:
+            trends: Trends to analyze together
+
+        Returns:
+            Key points per trend, or None where the response had none
+        """
+        if len(trends) == 1:
+            return [await self.extract_key_points(trends[0])]
+
+        contexts = [await self._build_context(trend) for trend in trends]
+        response = await self._llm_service.generate(
+            prompt=self._create_batch_extraction_prompt(contexts),
+            system_prompt=self.SYSTEM_PROMPT,
+            max_tokens=500 * len(trends),
+            temperature=0.3,
+        )
+
+        return [
+            self._validate_key_points(points) if points else None
+            for points in self._parse_batch_response(response, len(trends))
+        ]
+
+    def _create_batch_extraction_prompt(self, contexts: List[str]) -> str:
+        """
+        Create LLM prompt extracting key points for several trends at once.
+
+        Args:
+            contexts: Context string per trend
+
+        Returns:
+            Formatted prompt string
+        """
+        sections = "\n\n".join(
+            f"### Trend {i}\n{context}" for i, context in enumerate(contexts, 1)
+        )
+        return f"""Analyze these {len(contexts)} trending topics and extract {self._min_points}-{self._max_points} key points for each:
+
+{sections}
+
+For each trend, focus on what is happening, why it matters, and key facts or developments.
+
+Return ONLY a JSON object mapping each trend number to a JSON array of {self._min_points}-{self._max_points} strings, e.g.:
+{{"1": ["First point", "Second point"], "2": ["First point", "Second point"]}}"""
+
+    def _parse_batch_response(self, response: str, count: int) -> List[List[str]]:
+        """
+        Parse a combined LLM response into key points per trend.
+
+        Args:
+            response: LLM response text
+            count: Number of trends in the prompt
+
+        Returns:
+            Key point strings per trend (empty where missing)
+        """
+        import json
+        import re
+
+        parsed: Dict[str, Any] = {}
+        match = re.search(r'\{.*\}', response, re.DOTALL)
+        if match:
+            try:
+                parsed = json.loads(match.group(0))
+            except json.JSONDecodeError:
+                logger.warning("Failed to parse JSON object from combined LLM response")
+
+        results = []
+        for i in range(1, count + 1):
+            points = parsed.get(str(i)) if isinstance(parsed, dict) else None
+            if isinstance(points, list):
+                results.append([str(point).strip() for point in points if point])
+            else:
+                results.append([])
+
+        return results
+
     def _parse_response(self, response: str) -> List[str]:
         """
         Parse LLM response into key points list.
@@ -434,6 +549,7 @@ Return as JSON array of strings."""
 def get_key_point_extractor(
     llm_service: BaseLLMService,
     item_repo: Optional[ItemRepository] = None,
+    provider: Optional[str] = None,
 ) -> KeyPointExtractor:
     """
     Factory function to create KeyPointExtractor.
@@ -441,8 +557,14 @@ def get_key_point_extractor(
     Args:
         llm_service: LLM service for extraction
         item_repo: Optional item repository
+        provider: Optional LLM provider name used to size concurrent requests
 
     Returns:
         KeyPointExtractor instance
     """
-    return KeyPointExtractor(llm_service=llm_service, item_repo=item_repo)
+    batch_executor = LLMBatchExecutor.for_provider(provider) if provider else None
+    return KeyPointExtractor(
+        llm_service=llm_service,
+        item_repo=item_repo,
+        batch_executor=batch_executor,
+    )
@@ -23,6 +23,7 @@ from trend_agent.observability.metrics import (
     api_request_counter,
     api_request_duration,
 )
+from trend_agent.services.llm_cache import LLMResponseCache
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +40,7 @@ class OpenAILLMService(BaseLLMService):
     - Automatic retry with exponential backoff
     - Streaming support for long-running operations
     - Cost tracking per request
+    - Optional response cache for identical low-temperature requests
     - Prometheus metrics integration
     - Structured output parsing
 
@@ -89,6 +91,7 @@ class OpenAILLMService(BaseLLMService):
         model: str = DEFAULT_MODEL,
         max_retries: int = 3,
         timeout: int = 60,
+        response_cache: Optional[LLMResponseCache] = None,
     ):
         """
         Initialize OpenAI LLM service.
@@ -98,6 +101,7 @@ class OpenAILLMService(BaseLLMService):
             model: Model name to use
             max_retries: Maximum retry attempts
             timeout: Request timeout in seconds
+            response_cache: Optional cache for responses to identical requests
 
         Raises:
             ValueError: If API key is missing or model unsupported
@@ -122,6 +126,7 @@ class OpenAILLMService(BaseLLMService):
         self._total_cost = 0.0
         self._total_input_tokens = 0
         self._total_output_tokens = 0
+        self._response_cache = response_cache
 
         self._client = httpx.AsyncClient(
             timeout=timeout,
@@ -389,6 +394,16 @@ Tags:"""
         Raises:
             LLMError: If all retries fail
         """
+        cached, cache_key = None, None
+        if self._response_cache is not None:
+            cached, cache_key = await self._response_cache.lookup(
+                "openai", self.model, messages, temperature, max_tokens, kwargs
+            )
+            if cached is not None:
+                return cached
+        else:
+            kwargs.pop("use_cache", None)
+
         start_time = time.time()
         last_error = None
 
@@ -437,12 +452,16 @@ Tags:"""
                     f"${cost:.6f}, {duration:.2f}s)"
                 )
 
-                return {
+                result = {
                     "content": content,
                     "input_tokens": input_tokens,
                     "output_tokens": output_tokens,
                     "cost": cost,
                 }
+                if cache_key is not None:
+                    await self._response_cache.set(cache_key, result)
+
+                return result
 
             except httpx.HTTPStatusError as e:
                 last_error = e
@@ -489,13 +508,19 @@ Tags:"""
 
     def get_usage_stats(self) -> dict:
         """Get usage statistics."""
-        return {
+        stats = {
             "total_input_tokens": self._total_input_tokens,
             "total_output_tokens": self._total_output_tokens,
             "total_tokens": self._total_input_tokens + self._total_output_tokens,
             "total_cost_usd": self._total_cost,
             "model": self.model,
         }
+        if self._response_cache is not None:
+            saved = self._response_cache.get_savings("openai")
+            stats["cache_tokens_saved"] = saved["tokens"]
+            stats["cache_cost_saved_usd"] = saved["cost_usd"]
+            stats["cache"] = self._response_cache.get_stats()
+        return stats
 
     async def close(self):
         """Close the HTTP client."""
@@ -561,6 +586,7 @@ class AnthropicLLMService(BaseLLMService):
         model: str = DEFAULT_MODEL,
         max_retries: int = 3,
         timeout: int = 60,
+        response_cache: Optional[LLMResponseCache] = None,
     ):
         """Initialize Anthropic LLM service."""
         self.api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
@@ -583,6 +609,7 @@ class AnthropicLLMService(BaseLLMService):
         self._total_cost = 0.0
         self._total_input_tokens = 0
         self._total_output_tokens = 0
+        self._response_cache = response_cache
 
         self._client = httpx.AsyncClient(
             timeout=timeout,
@@ -737,6 +764,16 @@ Tags:"""
         **kwargs: Any,
     ) -> Dict[str, Any]:
         """Internal method to call Anthropic API with retry logic."""
+        cached, cache_key = None, None
+        if self._response_cache is not None:
+            cached, cache_key = await self._response_cache.lookup(
+                "anthropic", self.model, messages, temperature, max_tokens, kwargs
+            )
+            if cached is not None:
+                return cached
+        else:
+            kwargs.pop("use_cache", None)
+
         start_time = time.time()
         last_error = None
 
@@ -785,12 +822,16 @@ Tags:"""
                     f"${cost:.6f}, {duration:.2f}s)"
                 )
 
-                return {
+                result = {
                     "content": content,
                     "input_tokens": input_tokens,
                     "output_tokens": output_tokens,
                     "cost": cost,
                 }
+                if cache_key is not None:
+                    await self._response_cache.set(cache_key, result)
+
+                return result
 
             except httpx.HTTPStatusError as e:
                 last_error = e
@@ -838,13 +879,19 @@ Tags:"""
 
     def get_usage_stats(self) -> dict:
         """Get usage statistics."""
-        return {
+        stats = {
             "total_input_tokens": self._total_input_tokens,
             "total_output_tokens": self._total_output_tokens,
             "total_tokens": self._total_input_tokens + self._total_output_tokens,
             "total_cost_usd": self._total_cost,
             "model": self.model,
         }
+        if self._response_cache is not None:
+            saved = self._response_cache.get_savings("anthropic")
+            stats["cache_tokens_saved"] = saved["tokens"]
+            stats["cache_cost_saved_usd"] = saved["cost_usd"]
+            stats["cache"] = self._response_cache.get_stats()
+        return stats
 
     async def close(self):
         """Close the HTTP client."""
@@ -0,0 +1,170 @@
+"""
+Concurrent LLM call execution.
+
+This module provides a bounded executor for fanning out many independent
+LLM requests (key points, summaries) at once while staying within the
+provider's concurrency and request-rate limits.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Conservative defaults per provider: (concurrent requests, requests per minute)
+PROVIDER_LIMITS: Dict[str, Dict[str, int]] = {
+    "openai": {"max_concurrency": 8, "requests_per_minute": 500},
+    "anthropic": {"max_concurrency": 4, "requests_per_minute": 50},
+}
+DEFAULT_LIMITS = {"max_concurrency": 4, "requests_per_minute": 60}
+
+
+class LLMBatchExecutor:
+    """
+    Run LLM calls concurrently with a concurrency cap and request pacing.
+
+    A semaphore limits requests in flight, and request starts are spaced
+    at least ``60 / requests_per_minute`` seconds apart so a burst does not
+    trip the provider's rate limiter. Results come back in call order; a
+    failed call is replaced by its fallback instead of failing the batch.
+
+    Example:
+        ```python
+        executor = LLMBatchExecutor.for_provider("openai")
+        results = await executor.run(
+            [lambda t=t: llm.summarize(t) for t in texts],
+            fallback=lambda i, error: texts[i][:200],
+        )
+        ```
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 4,
+        requests_per_minute: Optional[int] = None,
+    ):
+        """
+        Initialize LLM batch executor.
+
+        Args:
+            max_concurrency: Maximum requests in flight at once
+            requests_per_minute: Optional cap on request starts per minute
+
+        Raises:
+            ValueError: If a limit is not positive
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be positive")
+        if requests_per_minute is not None and requests_per_minute < 1:
+            raise ValueError("requests_per_minute must be positive")
+
+        self._max_concurrency = max_concurrency
+        self._interval = 60.0 / requests_per_minute if requests_per_minute else 0.0
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._pace_lock = asyncio.Lock()
+        self._next_start = 0.0
+
+        # Stats
+        self._calls = 0
+        self._failures = 0
+
+    @classmethod
+    def for_provider(
+        cls,
+        provider: str,
+        max_concurrency: Optional[int] = None,
+        requests_per_minute: Optional[int] = None,
+    ) -> "LLMBatchExecutor":
+        """
+        Create an executor sized from a provider's limits.
+
+        Args:
+            provider: LLM provider name (openai, anthropic, ...)
+            max_concurrency: Override for the provider's concurrency limit
+            requests_per_minute: Override for the provider's request rate
+
+        Returns:
+            LLMBatchExecutor instance
+        """
+        limits = PROVIDER_LIMITS.get(provider.lower(), DEFAULT_LIMITS)
+        return cls(
+            max_concurrency=max_concurrency or limits["max_concurrency"],
+            requests_per_minute=requests_per_minute or limits["requests_per_minute"],
+        )
+
+    @property
+    def max_concurrency(self) -> int:
+        """Maximum requests in flight at once."""
+        return self._max_concurrency
+
+    async def run(
+        self,
+        calls: Sequence[Callable[[], Awaitable[T]]],
+        fallback: Callable[[int, Exception], T],
+    ) -> List[T]:
+        """
+        Run calls concurrently within the configured limits.
+
+        Args:
+            calls: Zero-argument coroutine functions, one per request
+            fallback: Called with (call index, error) to produce the result
+                of a failed call
+
+        Returns:
+            Results in call order
+        """
+        if not calls:
+            return []
+
+        return list(
+            await asyncio.gather(
+                *(self._run_one(i, call, fallback) for i, call in enumerate(calls))
+            )
+        )
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get executor statistics.
+
+        Returns:
+            Dictionary with call and failure counts
+        """
+        return {
+            "calls": self._calls,
+            "failures": self._failures,
+            "max_concurrency": self._max_concurrency,
+        }
+
+    async def _run_one(
+        self,
+        index: int,
+        call: Callable[[], Awaitable[T]],
+        fallback: Callable[[int, Exception], T],
+    ) -> T:
+        """Run one call under the semaphore, falling back on failure."""
+        async with self._semaphore:
+            await self._pace()
+            self._calls += 1
+            try:
+                return await call()
+            except Exception as e:
+                self._failures += 1
+                logger.warning(f"LLM call {index} failed, using fallback: {e}")
+                return fallback(index, e)
+
+    async def _pace(self) -> None:
+        """Wait until the next request start slot."""
+        if not self._interval:
+            return
+
+        async with self._pace_lock:
+            now = time.monotonic()
+            wait = self._next_start - now
+            self._next_start = max(now, self._next_start) + self._interval
+
+        if wait > 0:
+            await asyncio.sleep(wait)
@@ -0,0 +1,389 @@
+"""
+LLM response cache.
+
+This module caches LLM completions by the exact request that produced
+them, so re-running the same prompt (e.g. reprocessing unchanged trends
+every cycle) is served from Redis or local disk instead of the provider.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from trend_agent.observability.metrics import record_llm_cache_lookup
+from trend_agent.storage.interfaces import CacheRepository
+
+logger = logging.getLogger(__name__)
+
+
+class LLMResponseCache:
+    """
+    Content-addressed cache for LLM completions.
+
+    Keys hash (provider, model, messages, temperature, max_tokens, extra
+    request parameters), so any change to the request is a miss.
+
+    Lookup order:
+    1. Redis (shared across workers, short TTL)
+    2. On-disk JSON files (survive Redis eviction and restarts, longer TTL)
+
+    The disk tier is bounded: files unused for ``disk_ttl_seconds`` are
+    swept, and when the directory grows past ``max_disk_bytes`` the least
+    recently used files are removed. If Redis cannot be reached, the tier
+    is skipped and reconnecting is retried after ``redis_retry_seconds``.
+
+    Requests sampled above ``max_temperature`` are not cached, since
+    their output is meant to vary between calls.
+
+    Example:
+        ```python
+        cache = LLMResponseCache(cache_repo=redis_repo, disk_dir=".cache/llm")
+        service = OpenAILLMService(api_key="sk-...", response_cache=cache)
+        ```
+    """
+
+    def __init__(
+        self,
+        cache_repo: Optional[CacheRepository] = None,
+        disk_dir: Optional[str] = None,
+        ttl_seconds: int = 86400,
+        disk_ttl_seconds: int = 604800,
+        max_disk_bytes: int = 256 * 1024 * 1024,
+        max_temperature: float = 0.5,
+        key_prefix: str = "llm",
+        redis_retry_seconds: float = 60.0,
+    ):
+        """
+        Initialize LLM response cache.
+
+        Args:
+            cache_repo: Optional Redis cache repository
+            disk_dir: Optional directory for the on-disk tier
+            ttl_seconds: Redis TTL in seconds (default: 1 day)
+            disk_ttl_seconds: On-disk TTL in seconds since last use (default: 7 days)
+            max_disk_bytes: Size cap of the on-disk tier (default: 256 MB)
+            max_temperature: Highest sampling temperature that is cached
+            key_prefix: Prefix for cache keys
+            redis_retry_seconds: Delay before reconnecting after a failed
+                Redis connection
+        """
+        self._cache_repo = cache_repo
+        self._disk_dir = Path(disk_dir) if disk_dir else None
+        self._ttl_seconds = ttl_seconds
+        self._disk_ttl_seconds = disk_ttl_seconds
+        self._max_disk_bytes = max_disk_bytes
+        self._max_temperature = max_temperature
+        self._key_prefix = key_prefix
+        self._redis_retry_seconds = redis_retry_seconds
+        self._redis_ready = cache_repo is not None and not hasattr(cache_repo, "connect")
+        self._redis_retry_at = 0.0
+
+        # Disk usage estimate since the last sweep (None = not swept yet)
+        self._disk_bytes: Optional[int] = None
+        self._last_sweep = 0.0
+        self._sweep_lock = threading.Lock()
+
+        # Stats
+        self._hits: Dict[str, int] = {"redis": 0, "disk": 0}
+        self._misses = 0
+        self._skipped = 0
+        self._evicted = 0
+        self._saved: Dict[str, Dict[str, float]] = {}
+
+    def is_cacheable(self, temperature: float) -> bool:
+        """Whether a request at this temperature may be served from cache."""
+        return temperature <= self._max_temperature
+
+    def make_key(
+        self,
+        provider: str,
+        model: str,
+        messages: List[Dict[str, str]],
+        temperature: float,
+        max_tokens: int,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """
+        Generate content-addressed cache key for a request.
+
+        Args:
+            provider: LLM provider name
+            model: Model name
+            messages: Chat messages
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+            params: Additional request parameters
+
+        Returns:
+            Cache key string
+        """
+        request = json.dumps(
+            {
+                "provider": provider,
+                "model": model,
+                "messages": messages,
+                "temperature": temperature,
+                "max_tokens": max_tokens,
+                "params": params or {},
+            },
+            sort_keys=True,
+            ensure_ascii=False,
+            default=str,
+        )
+        request_hash = hashlib.sha256(request.encode("utf-8")).hexdigest()
+        return f"{self._key_prefix}:{provider}:{model}:{request_hash}"
+
+    async def lookup(
+        self,
+        provider: str,
+        model: str,
+        messages: List[Dict[str, str]],
+        temperature: float,
+        max_tokens: int,
+        params: Dict[str, Any],
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """
+        Look up an LLM request, recording metrics and saved usage.
+
+        Args:
+            provider: LLM provider name
+            model: Model name
+            messages: Chat messages
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+            params: Additional request parameters; a ``use_cache=False``
+                entry is removed and bypasses the cache
+
+        Returns:
+            Tuple of (cached response marked ``cached=True`` or None, key to
+            cache the response under or None if the request is not cacheable)
+        """
+        use_cache = params.pop("use_cache", True)
+        if not use_cache or not self.is_cacheable(temperature):
+            self.record_skip()
+            record_llm_cache_lookup(provider, "skipped")
+            return None, None
+
+        key = self.make_key(provider, model, messages, temperature, max_tokens, params)
+        cached, tier = await self.get(key)
+        if cached is None:
+            record_llm_cache_lookup(provider, tier)
+            return None, key
+
+        tokens = cached.get("input_tokens", 0) + cached.get("output_tokens", 0)
+        cost = cached.get("cost", 0.0)
+        saved = self._saved.setdefault(provider, {"tokens": 0, "cost_usd": 0.0})
+        saved["tokens"] += tokens
+        saved["cost_usd"] += cost
+        record_llm_cache_lookup(provider, tier, tokens_saved=tokens, cost_saved=cost)
+
+        return {**cached, "cached": True}, None
+
+    def get_savings(self, provider: str) -> Dict[str, float]:
+        """
+        Get the usage served from cache for a provider.
+
+        Args:
+            provider: LLM provider name
+
+        Returns:
+            Dictionary with tokens and cost_usd saved
+        """
+        return dict(self._saved.get(provider, {"tokens": 0, "cost_usd": 0.0}))
+
+    async def get(self, key: str) -> Tuple[Optional[Dict[str, Any]], str]:
+        """
+        Get a cached response.
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            Tuple of (cached response or None, tier that served it: "redis",
+            "disk" or "miss")
+        """
+        if await self._ensure_redis():
+            try:
+                cached = await self._cache_repo.get(key)
+            except Exception as e:
+                logger.warning(f"LLM cache Redis get failed: {e}")
+                cached = None
+            if cached is not None:
+                self._hits["redis"] += 1
+                return cached, "redis"
+
+        if self._disk_dir is not None:
+            loop = asyncio.get_running_loop()
+            cached = await loop.run_in_executor(None, self._disk_get, key)
+            if cached is not None:
+                self._hits["disk"] += 1
+                await self._redis_set(key, cached)
+                return cached, "disk"
+
+        self._misses += 1
+        return None, "miss"
+
+    async def set(self, key: str, response: Dict[str, Any]) -> None:
+        """
+        Cache a response in every tier, ignoring cache failures.
+
+        Args:
+            key: Cache key from make_key()
+            response: Response dictionary (content and usage)
+        """
+        await self._redis_set(key, response)
+
+        if self._disk_dir is not None:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self._disk_set, key, response)
+
+    def record_skip(self) -> None:
+        """Count a request that bypassed the cache."""
+        self._skipped += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with per-tier hit counts, misses, skips and hit rate
+        """
+        total_hits = sum(self._hits.values())
+        total_requests = total_hits + self._misses
+        hit_rate = (total_hits / total_requests * 100) if total_requests > 0 else 0
+
+        return {
+            "hits_by_tier": dict(self._hits),
+            "cache_hits": total_hits,
+            "cache_misses": self._misses,
+            "cache_skipped": self._skipped,
+            "hit_rate_percent": round(hit_rate, 2),
+            "disk_evicted": self._evicted,
+        }
+
+    async def _ensure_redis(self) -> bool:
+        """Connect the Redis repository on first use; retry failures after a cooldown."""
+        if self._redis_ready:
+            return True
+        if self._cache_repo is None or time.monotonic() < self._redis_retry_at:
+            return False
+
+        try:
+            await self._cache_repo.connect()
+            self._redis_ready = True
+        except Exception as e:
+            logger.warning(
+                f"Redis not available for LLM cache, retrying in "
+                f"{self._redis_retry_seconds:.0f}s: {e}"
+            )
+            self._redis_retry_at = time.monotonic() + self._redis_retry_seconds
+
+        return self._redis_ready
+
+    async def _redis_set(self, key: str, response: Dict[str, Any]) -> None:
+        """Write a response to Redis, ignoring cache failures."""
+        if not await self._ensure_redis():
+            return
+        try:
+            await self._cache_repo.set(key, response, ttl_seconds=self._ttl_seconds)
+        except Exception as e:
+            logger.warning(f"LLM cache Redis set failed: {e}")
+
+    def _disk_path(self, key: str) -> Path:
+        """Path of the file holding a key (sharded by hash prefix)."""
+        request_hash = key.rsplit(":", 1)[-1]
+        return self._disk_dir / request_hash[:2] / f"{request_hash}.json"
+
+    def _disk_get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Read a response from disk if present and not expired."""
+        path = self._disk_path(key)
+        try:
+            if time.time() - path.stat().st_mtime > self._disk_ttl_seconds:
+                path.unlink(missing_ok=True)
+                return None
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"LLM cache disk read failed: {e}")
+            return None
+
+        # Files are shared by all key prefixes; only serve an exact key match
+        if entry.get("key") != key:
+            return None
+
+        # The modification time doubles as last-use time for expiry and LRU
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return entry["response"]
+
+    def _disk_set(self, key: str, response: Dict[str, Any]) -> None:
+        """Write a response to disk atomically."""
+        path = self._disk_path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"key": key, "response": response}, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"LLM cache disk write failed: {e}")
+            return
+
+        if self._disk_bytes is not None:
+            try:
+                self._disk_bytes += path.stat().st_size
+            except OSError:
+                pass
+
+        # Sweep on first write, when over the cap, and at least hourly
+        # (other processes may write to the same directory)
+        if (
+            self._disk_bytes is None
+            or self._disk_bytes > self._max_disk_bytes
+            or time.time() - self._last_sweep > 3600
+        ):
+            self._sweep_disk()
+
+    def _sweep_disk(self) -> None:
+        """Delete expired files, then least recently used ones above the size cap."""
+        if not self._sweep_lock.acquire(blocking=False):
+            return  # Another thread is already sweeping
+        try:
+            now = time.time()
+            files = []
+            for path in self._disk_dir.glob("*/*.json"):
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                if now - stat.st_mtime > self._disk_ttl_seconds:
+                    path.unlink(missing_ok=True)
+                    self._evicted += 1
+                else:
+                    files.append((stat.st_mtime, stat.st_size, path))
+
+            total = sum(size for _, size, _ in files)
+            files.sort(key=lambda f: f[0])
+            for _, size, path in files:
+                if total <= self._max_disk_bytes:
+                    break
+                path.unlink(missing_ok=True)
+                total -= size
+                self._evicted += 1
+
+            self._disk_bytes = total
+            self._last_sweep = now
+        except OSError as e:
+            logger.warning(f"LLM cache disk sweep failed: {e}")
+        finally:
+            self._sweep_lock.release()
@@ -1,13 +1,19 @@
 """
-Qdrant Semantic Search Service implementation.
+Qdrant semantic and hybrid search service implementations.
 
 Provides production-ready semantic search using Qdrant vector database,
-combining embedding generation, vector similarity search, and trend retrieval.
+combining embedding generation, vector similarity search, and trend retrieval,
+and hybrid search that fuses it with PostgreSQL full-text ranking.
 """
 
+import asyncio
+import hashlib
 import logging
 import time
-from typing import Dict, List, Optional
+import unicodedata
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
 from uuid import UUID
 
 from trend_agent.intelligence.interfaces import (
@@ -17,8 +23,10 @@ from trend_agent.intelligence.interfaces import (
 from trend_agent.observability.metrics import (
     api_request_counter,
     api_request_duration,
+    record_query_embedding_lookup,
 )
 from trend_agent.storage.interfaces import (
+    CacheRepository,
     TrendRepository,
     VectorRepository,
 )
@@ -32,6 +40,260 @@ from trend_agent.schemas import (
 logger = logging.getLogger(__name__)
 
 
+class TrendObjectCache:
+    """
+    In-process LRU of hydrated Trend objects.
+
+    Entries are keyed by trend ID and ``last_updated``, so a cached trend is
+    only served while the database row has not changed since it was loaded.
+    Callers check freshness with ``TrendRepository.get_last_updated``, which
+    is much cheaper than fetching and decoding full rows.
+
+    Example:
+        ```python
+        cache = TrendObjectCache(max_entries=1024)
+        cache.put(trend)
+        trend = cache.get(trend.id, trend.last_updated)
+        ```
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        """
+        Initialize trend cache.
+
+        Args:
+            max_entries: Maximum trends held in memory
+        """
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[UUID, Tuple[datetime, Trend]]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def __contains__(self, trend_id: UUID) -> bool:
+        return trend_id in self._entries
+
+    def get(self, trend_id: UUID, last_updated: datetime) -> Optional[Trend]:
+        """
+        Get a cached trend if it is still at the given version.
+
+        Args:
+            trend_id: Trend ID
+            last_updated: Current last_updated timestamp of the trend
+
+        Returns:
+            The cached trend, or None if missing or stale
+        """
+        entry = self._entries.get(trend_id)
+        if entry is None or entry[0] != last_updated:
+            self._misses += 1
+            return None
+
+        self._entries.move_to_end(trend_id)
+        self._hits += 1
+        return entry[1]
+
+    def put(self, trend: Trend) -> None:
+        """
+        Cache a trend loaded from the database.
+
+        Args:
+            trend: Trend to cache (ignored if it has no ID)
+        """
+        if trend.id is None:
+            return
+        self._entries[trend.id] = (trend.last_updated, trend)
+        self._entries.move_to_end(trend.id)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached trends."""
+        self._entries.clear()
+
+    def get_stats(self) -> Dict:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with size, hits, misses and hit rate
+        """
+        lookups = self._hits + self._misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self._max_entries,
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": round(self._hits / lookups * 100, 2) if lookups else 0,
+        }
+
+
+class QueryEmbeddingCache:
+    """
+    Embedding cache for search queries with request coalescing.
+
+    Cache keys use the normalized query (Unicode NFKC, collapsed whitespace,
+    case-folded) so trivially different spellings share one vector, while
+    the embedding model is always given the query as typed. Lookup order:
+    1. In-process LRU
+    2. Redis cache (if a cache repository is configured)
+    3. Embedding service
+
+    Concurrent lookups of the same query while it is being loaded share a
+    single in-flight Redis read / embed call (single-flight).
+
+    Example:
+        ```python
+        query_cache = QueryEmbeddingCache(embedding_service, cache_repo=redis_repo)
+        vector = await query_cache.get_embedding("Latest AI breakthroughs")
+        ```
+    """
+
+    def __init__(
+        self,
+        embedding_service,  # Type: EmbeddingService
+        cache_repo: Optional[CacheRepository] = None,
+        max_entries: int = 2048,
+        ttl_seconds: int = 86400,
+        key_prefix: str = "query_embedding",
+    ):
+        """
+        Initialize query embedding cache.
+
+        Args:
+            embedding_service: Service used to embed cache misses
+            cache_repo: Optional Redis cache repository shared between workers
+            max_entries: Maximum vectors held in the in-process LRU
+            ttl_seconds: Redis TTL in seconds (default: 1 day)
+            key_prefix: Prefix for Redis cache keys
+        """
+        self.embedding_service = embedding_service
+        self._cache_repo = cache_repo
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._key_prefix = key_prefix
+        self._lru: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+        # Stats
+        self._lookups: Dict[str, int] = {"memory": 0, "redis": 0, "coalesced": 0, "miss": 0}
+        self._embed_seconds = 0.0
+        self._saved_seconds = 0.0
+
+    @staticmethod
+    def normalize(query: str) -> str:
+        """
+        Normalize a search query into its cache key text.
+
+        Args:
+            query: Raw query text
+
+        Returns:
+            Normalized query text (never sent to the embedding model)
+        """
+        return " ".join(unicodedata.normalize("NFKC", query).split()).casefold()
+
+    async def get_embedding(self, query: str) -> List[float]:
+        """
+        Get the embedding of a search query.
+
+        Args:
+            query: Query text
+
+        Returns:
+            Embedding vector of the query
+        """
+        key = self._generate_cache_key(self.normalize(query))
+
+        vector = self._lru.get(key)
+        if vector is not None:
+            self._lru.move_to_end(key)
+            self._record("memory")
+            return vector
+
+        pending = self._inflight.get(key)
+        if pending is not None:
+            self._record("coalesced")
+            return await asyncio.shield(pending)
+
+        task = asyncio.ensure_future(self._load(key, query))
+        self._inflight[key] = task
+        task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+    def get_stats(self) -> Dict:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with lookups per result, hit rate and saved latency
+        """
+        total = sum(self._lookups.values())
+        hits = total - self._lookups["miss"]
+        return {
+            "lookups": dict(self._lookups),
+            "hit_rate_percent": round(hits / total * 100, 2) if total else 0,
+            "avg_embed_ms": round(self._avg_embed_seconds() * 1000, 2),
+            "saved_seconds": round(self._saved_seconds, 3),
+            "memory_entries": len(self._lru),
+        }
+
+    def clear(self) -> None:
+        """Clear the in-process LRU (Redis entries expire via TTL)."""
+        self._lru.clear()
+
+    async def _load(self, key: str, query: str) -> List[float]:
+        """Load a vector from Redis or the embedding service (single-flight body)."""
+        if self._cache_repo is not None:
+            try:
+                cached = await self._cache_repo.get(key)
+            except Exception as e:
+                logger.warning(f"Query embedding cache Redis get failed: {e}")
+                cached = None
+
+            if cached:
+                self._lru_put(key, cached)
+                self._record("redis")
+                return cached
+
+        start = time.perf_counter()
+        vector = await self.embedding_service.embed(query)
+        self._embed_seconds += time.perf_counter() - start
+        self._record("miss")
+
+        self._lru_put(key, vector)
+        if self._cache_repo is not None:
+            try:
+                await self._cache_repo.set(key, list(vector), ttl_seconds=self._ttl_seconds)
+            except Exception as e:
+                logger.warning(f"Query embedding cache Redis set failed: {e}")
+
+        return vector
+
+    def _record(self, result: str) -> None:
+        """Record a lookup, crediting hits with the average embed latency."""
+        self._lookups[result] += 1
+        saved = self._avg_embed_seconds() if result != "miss" else 0.0
+        self._saved_seconds += saved
+        record_query_embedding_lookup(result, saved)
+
+    def _avg_embed_seconds(self) -> float:
+        misses = self._lookups["miss"]
+        return self._embed_seconds / misses if misses else 0.0
+
+    def _generate_cache_key(self, text: str) -> str:
+        """Generate a cache key for a normalized query."""
+        model = self.embedding_service.get_model_name()
+        text_hash = hashlib.sha256(f"{model}|{text}".encode("utf-8")).hexdigest()
+        return f"{self._key_prefix}:{model}:{text_hash}"
+
+    def _lru_put(self, key: str, vector: List[float]) -> None:
+        """Insert a vector into the LRU, evicting the oldest entry if full."""
+        self._lru[key] = vector
+        self._lru.move_to_end(key)
+        while len(self._lru) > self._max_entries:
+            self._lru.popitem(last=False)
+
+
 class QdrantSemanticSearchService(BaseSemanticSearchService):
     """
     Qdrant-based semantic search service for trend discovery.
@@ -89,6 +351,8 @@ class QdrantSemanticSearchService(BaseSemanticSearchService):
         trend_repository: TrendRepository,
         default_limit: int = 20,
         default_min_similarity: float = 0.7,
+        trend_cache: Optional[TrendObjectCache] = None,
+        query_cache: Optional[QueryEmbeddingCache] = None,
     ):
         """
         Initialize Qdrant semantic search service.
@@ -99,6 +363,9 @@ class QdrantSemanticSearchService(BaseSemanticSearchService):
             trend_repository: PostgreSQL trend repository
             default_limit: Default maximum results to return
             default_min_similarity: Default minimum similarity threshold
+            trend_cache: Optional cache of hydrated trends (share one across
+                service instances to reuse it between requests)
+            query_cache: Optional query embedding cache (shared like trend_cache)
 
         Raises:
             ValueError: If any required service is None
@@ -115,6 +382,8 @@ class QdrantSemanticSearchService(BaseSemanticSearchService):
         self.trend_repository = trend_repository
         self.default_limit = default_limit
         self.default_min_similarity = default_min_similarity
+        self.trend_cache = trend_cache or TrendObjectCache()
+        self.query_cache = query_cache or QueryEmbeddingCache(embedding_service)
 
         # Metrics tracking
         self._total_searches = 0
@@ -130,7 +399,7 @@ class QdrantSemanticSearchService(BaseSemanticSearchService):
         Perform semantic search for trends using natural language query.
 
         This method:
-        1. Converts query text to embedding vector
+        1. Converts query text to embedding vector (via the query cache)
         2. Searches Qdrant for similar vectors
         3. Fetches full Trend objects from database
         4. Applies metadata filters
@@ -157,9 +426,9 @@ class QdrantSemanticSearchService(BaseSemanticSearchService):
                 f"limit={request.limit} min_similarity={request.min_similarity}"
             )
 
-            # Step 1: Generate embedding from query text
+            # Step 1: Generate embedding from query text (cached, coalesced)
             try:
-                query_embedding = await self.embedding_service.embed(request.query)
+                query_embedding = await self.query_cache.get_embedding(request.query)
             except Exception as e:
                 logger.error(f"Failed to generate query embedding: {e}")
                 raise SearchError(f"Embedding generation failed: {e}") from e
@@ -431,10 +700,15 @@ class QdrantSemanticSearchService(BaseSemanticSearchService):
 
         This method:
         1. Extracts trend IDs from vector matches
-        2. Fetches trends from PostgreSQL
-        3. Applies additional filters (date, score, etc.)
+        2. Serves unchanged trends from the in-process trend cache
+        3. Fetches the rest from PostgreSQL in a single query, with the
+           remaining filters (date, score, keywords, sources) applied in SQL
         4. Preserves similarity-based ranking
 
+        If the trends cannot be loaded the error is logged and no trends
+        are returned, so a database hiccup degrades the search instead of
+        failing it.
+
         Args:
             vector_matches: List of vector search results
             filters: Optional additional filters to apply
@@ -445,84 +719,52 @@ class QdrantSemanticSearchService(BaseSemanticSearchService):
         if not vector_matches:
             return []
 
-        # Extract trend IDs from vector matches
-        trend_ids = [UUID(match.id) for match in vector_matches]
-
-        # Fetch trends from database
-        trends = []
-        for trend_id in trend_ids:
-            try:
-                trend = await self.trend_repository.get(trend_id)
-                if trend:
-                    trends.append(trend)
-                else:
-                    logger.warning(
-                        f"Trend {trend_id} found in vector DB but not in PostgreSQL"
-                    )
-            except Exception as e:
-                logger.error(f"Failed to fetch trend {trend_id}: {e}")
-                # Continue with other trends
+        # Extract trend IDs from vector matches (ranked by similarity)
+        trend_ids = list(dict.fromkeys(UUID(match.id) for match in vector_matches))
 
-        # Apply additional filters if provided
-        if filters:
-            trends = self._apply_trend_filters(trends, filters)
+        try:
+            if not any(trend_id in self.trend_cache for trend_id in trend_ids):
+                # Nothing cached: one query for rows and filtering
+                trends = await self.trend_repository.get_many(trend_ids, filters)
+                for trend in trends:
+                    self.trend_cache.put(trend)
+            else:
+                trends = await self._fetch_with_cache(trend_ids, filters)
+        except Exception as e:
+            logger.error(f"Failed to fetch {len(trend_ids)} trends: {e}")
+            return []
 
-        # Preserve ranking from vector similarity
-        # (Trends are already in the correct order based on trend_ids order)
+        if len(trends) < len(trend_ids) and not filters:
+            logger.warning(
+                f"{len(trend_ids) - len(trends)} trends found in vector DB "
+                f"but not in PostgreSQL"
+            )
 
         return trends
 
-    def _apply_trend_filters(
-        self, trends: List[Trend], filters: TrendFilter
+    async def _fetch_with_cache(
+        self, trend_ids: List[UUID], filters: Optional[TrendFilter]
     ) -> List[Trend]:
-        """
-        Apply TrendFilter criteria to a list of trends.
-
-        Filters that couldn't be applied at the vector level (date ranges,
-        score ranges, keyword matching) are applied here.
-
-        Args:
-            trends: List of trends to filter
-            filters: Filter criteria
-
-        Returns:
-            Filtered list of trends
-        """
-        filtered = trends
-
-        # Score range filters
-        if filters.min_score is not None:
-            filtered = [t for t in filtered if t.score >= filters.min_score]
+        """Load trends, hydrating only those missing or changed since cached."""
+        versions = await self.trend_repository.get_last_updated(trend_ids, filters)
 
-        if filters.max_score is not None:
-            filtered = [t for t in filtered if t.score <= filters.max_score]
-
-        # Date range filters
-        if filters.date_from:
-            filtered = [t for t in filtered if t.last_updated >= filters.date_from]
-
-        if filters.date_to:
-            filtered = [t for t in filtered if t.last_updated <= filters.date_to]
-
-        # Keyword filters (check if any keyword appears in title or keywords list)
-        if filters.keywords:
-            filtered = [
-                t
-                for t in filtered
-                if any(
-                    kw.lower() in t.title.lower()
-                    or any(kw.lower() in tk.lower() for tk in t.keywords)
-                    for kw in filters.keywords
-                )
-            ]
+        found: Dict[UUID, Trend] = {}
+        stale: List[UUID] = []
+        for trend_id in trend_ids:
+            if trend_id not in versions:
+                continue  # Missing or filtered out
+            cached = self.trend_cache.get(trend_id, versions[trend_id])
+            if cached is not None:
+                found[trend_id] = cached
+            else:
+                stale.append(trend_id)
 
-        # Source filters (check if trend has any of the requested sources)
-        if filters.sources:
-            filtered = [
-                t for t in filtered if any(src in t.sources for src in filters.sources)
-            ]
+        if stale:
+            for trend in await self.trend_repository.get_many(stale):
+                self.trend_cache.put(trend)
+                found[trend.id] = trend
 
-        return filtered
+        return [found[trend_id] for trend_id in trend_ids if trend_id in found]
 
     def _record_metrics(
         self, operation: str, duration: float, result_count: int, status_code: int
@@ -565,6 +807,8 @@ class QdrantSemanticSearchService(BaseSemanticSearchService):
             "embedding_dimension": self.embedding_service.get_dimension(),
             "default_limit": self.default_limit,
             "default_min_similarity": self.default_min_similarity,
+            "trend_cache": self.trend_cache.get_stats(),
+            "query_cache": self.query_cache.get_stats(),
         }
 
     async def close(self):
@@ -582,3 +826,151 @@ class QdrantSemanticSearchService(BaseSemanticSearchService):
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
         await self.close()
+
+
+def reciprocal_rank_fusion(
+    rankings: List[List[Trend]], k: int = 60
+) -> List[Tuple[Trend, float]]:
+    """
+    Fuse ranked trend lists with reciprocal rank fusion.
+
+    Each trend scores ``sum(1 / (k + rank))`` over the lists it appears in
+    (rank starts at 1), so only positions matter and scores from different
+    retrievers never need to be put on a common scale.
+
+    Args:
+        rankings: Ranked trend lists, best first
+        k: Damping constant; larger values flatten the head of each list
+
+    Returns:
+        List of (trend, fused score) tuples, best first
+    """
+    scores: Dict[UUID, float] = {}
+    trends: Dict[UUID, Trend] = {}
+    for ranking in rankings:
+        for rank, trend in enumerate(ranking, start=1):
+            scores[trend.id] = scores.get(trend.id, 0.0) + 1.0 / (k + rank)
+            trends.setdefault(trend.id, trend)
+
+    ordered = sorted(scores, key=scores.__getitem__, reverse=True)
+    return [(trends[trend_id], scores[trend_id]) for trend_id in ordered]
+
+
+class HybridSearchService:
+    """
+    Hybrid lexical + semantic trend search.
+
+    Runs PostgreSQL full-text search (``TrendRepository.search_text``) and,
+    when available, Qdrant semantic search concurrently, then fuses both
+    rankings with reciprocal rank fusion. Exact names and rare terms come
+    from the lexical side, paraphrases from the vector side.
+
+    If the semantic side is unavailable or fails, results fall back to the
+    lexical ranking alone.
+
+    Example:
+        ```python
+        hybrid = HybridSearchService(trend_repo, semantic_search=search)
+        results = await hybrid.search(SemanticSearchRequest(query="gpt-5 launch"))
+        for trend, score in results:
+            print(trend.title, score)
+        ```
+    """
+
+    def __init__(
+        self,
+        trend_repository: TrendRepository,
+        semantic_search: Optional[QdrantSemanticSearchService] = None,
+        rrf_k: int = 60,
+        candidate_multiplier: int = 3,
+    ):
+        """
+        Initialize hybrid search service.
+
+        Args:
+            trend_repository: Trend repository with full-text search
+            semantic_search: Optional semantic search service
+            rrf_k: Reciprocal rank fusion damping constant
+            candidate_multiplier: Candidates fetched from each retriever per
+                requested result
+
+        Raises:
+            ValueError: If trend_repository is None
+        """
+        if not trend_repository:
+            raise ValueError("trend_repository is required")
+
+        self.trend_repository = trend_repository
+        self.semantic_search = semantic_search
+        self.rrf_k = rrf_k
+        self.candidate_multiplier = candidate_multiplier
+
+        # Stats
+        self._searches = 0
+        self._semantic_fallbacks = 0
+
+    async def search(self, request: SemanticSearchRequest) -> List[Tuple[Trend, float]]:
+        """
+        Search trends with fused lexical and semantic ranking.
+
+        Args:
+            request: Search request; ``min_similarity`` applies to the
+                semantic side only
+
+        Returns:
+            List of (trend, fused score) tuples, best first
+
+        Raises:
+            SearchError: If the query is empty or lexical search fails
+        """
+        if not request.query or not request.query.strip():
+            raise SearchError("Search query cannot be empty")
+
+        start_time = time.time()
+        candidates = request.limit * self.candidate_multiplier
+
+        lexical_task = self.trend_repository.search_text(
+            request.query, request.filters, limit=candidates
+        )
+        if self.semantic_search is None:
+            lexical, semantic = await lexical_task, None
+        else:
+            semantic_request = request.copy(update={"limit": candidates})
+            lexical, semantic = await asyncio.gather(
+                lexical_task,
+                self.semantic_search.search(semantic_request),
+                return_exceptions=True,
+            )
+            if isinstance(lexical, BaseException):
+                raise SearchError(f"Lexical search failed: {lexical}") from lexical
+
+        if isinstance(semantic, BaseException):
+            logger.warning(f"Semantic search failed, using lexical ranking only: {semantic}")
+            semantic = None
+        if semantic is None:
+            self._semantic_fallbacks += 1
+
+        rankings = [[trend for trend, _ in lexical]]
+        if semantic:
+            rankings.append(semantic)
+        results = reciprocal_rank_fusion(rankings, k=self.rrf_k)[: request.limit]
+
+        self._searches += 1
+        logger.info(
+            f"Hybrid search: {len(lexical)} lexical + {len(semantic or [])} semantic "
+            f"candidates -> {len(results)} results in {time.time() - start_time:.2f}s"
+        )
+        return results
+
+    def get_stats(self) -> Dict:
+        """
+        Get hybrid search statistics.
+
+        Returns:
+            Dictionary with search and lexical-only fallback counts
+        """
+        return {
+            "total_searches": self._searches,
+            "lexical_only_searches": self._semantic_fallbacks,
+            "rrf_k": self.rrf_k,
+        }
@@ -68,7 +68,7 @@ class OpenAITranslationService(BaseTranslationService):
     - Preserves formatting and structure
     - Cost tracking per character
     - Automatic language detection
-    - Batch translation support
+    - Batch translation packed into token-budgeted, concurrent requests
     - Retry logic with exponential backoff
 
     Pricing (GPT-4-turbo):
@@ -120,6 +120,8 @@ class OpenAITranslationService(BaseTranslationService):
         model: str = DEFAULT_MODEL,
         max_retries: int = 3,
         timeout: int = 30,
+        max_batch_tokens: int = 1500,
+        max_concurrent_requests: int = 4,
     ):
         """
         Initialize OpenAI translation service.
@@ -129,6 +131,9 @@ class OpenAITranslationService(BaseTranslationService):
             model: Model to use for translation
             max_retries: Maximum retry attempts
             timeout: Request timeout in seconds
+            max_batch_tokens: Token budget for the texts packed into one
+                request (the translation comes back at a similar size)
+            max_concurrent_requests: Maximum batch requests in flight at once
         """
         import os
 
@@ -139,11 +144,16 @@ class OpenAITranslationService(BaseTranslationService):
         self.model = model
         self.max_retries = max_retries
         self.timeout = timeout
+        self.max_batch_tokens = max_batch_tokens
+        self._semaphore = asyncio.Semaphore(max_concurrent_requests)
+        self._encoding = None  # tiktoken encoding, loaded on first use
 
         # Cost tracking
         self._total_cost = 0.0
         self._total_chars = 0
         self._total_translations = 0
+        self._total_requests = 0
+        self._chunk_splits = 0
 
         # HTTP client
         self._client = httpx.AsyncClient(
@@ -193,13 +203,18 @@ class OpenAITranslationService(BaseTranslationService):
         """
         Translate multiple texts.
 
+        Texts are packed into numbered requests of at most ``max_batch_tokens``
+        input tokens, which run concurrently (up to ``max_concurrent_requests``).
+        If a response does not contain exactly one translation per number,
+        only that request is split in half and retried.
+
         Args:
             texts: List of texts to translate
             target_language: Target language code
             source_language: Source language code (auto-detect if None)
 
         Returns:
-            List of translated texts
+            List of translated texts (empty texts are returned unchanged)
 
         Raises:
             TranslationError: If translation fails
@@ -208,54 +223,26 @@ class OpenAITranslationService(BaseTranslationService):
             return []
 
         # Filter empty texts
-        valid_texts = [t for t in texts if t and t.strip()]
-        if not valid_texts:
+        positions = [i for i, t in enumerate(texts) if t and t.strip()]
+        if not positions:
             return texts
 
+        valid_texts = [texts[i] for i in positions]
         start_time = time.time()
 
         try:
-            # Build translation prompt
-            target_lang_name = LANGUAGE_NAMES.get(target_language, target_language)
-
-            if source_language:
-                source_lang_name = LANGUAGE_NAMES.get(source_language, source_language)
-                instruction = (
-                    f"Translate the following text from {source_lang_name} "
-                    f"to {target_lang_name}. "
-                    f"Preserve formatting, tone, and meaning. "
-                    f"Return only the translated text."
-                )
-            else:
-                instruction = (
-                    f"Translate the following text to {target_lang_name}. "
-                    f"Preserve formatting, tone, and meaning. "
-                    f"Return only the translated text."
-                )
+            instruction = self._build_instruction(target_language, source_language)
+            chunks = self._pack_chunks(valid_texts)
 
-            # Combine texts for batch translation
-            if len(valid_texts) == 1:
-                user_content = valid_texts[0]
-            else:
-                # Use numbered list for multiple texts
-                user_content = "\n\n".join(
-                    f"[{i+1}] {text}" for i, text in enumerate(valid_texts)
-                )
-                instruction += (
-                    " Translate each numbered item and keep the same numbering."
-                )
+            chunk_results = await asyncio.gather(*(
+                self._translate_chunk([valid_texts[i] for i in chunk], instruction)
+                for chunk in chunks
+            ))
 
-            # Call OpenAI API
-            response_text = await self._call_api(instruction, user_content)
-
-            # Parse response
-            if len(valid_texts) == 1:
-                translated = [response_text.strip()]
-            else:
-                # Extract numbered translations
-                translated = self._parse_numbered_response(
-                    response_text, len(valid_texts)
-                )
+            translated = list(texts)
+            for chunk, results in zip(chunks, chunk_results):
+                for i, result in zip(chunk, results):
+                    translated[positions[i]] = result
 
             # Track stats
             total_chars = sum(len(t) for t in valid_texts)
@@ -273,7 +260,7 @@ class OpenAITranslationService(BaseTranslationService):
 
             logger.debug(
                 f"Translated {len(valid_texts)} texts to {target_language} "
-                f"in {duration:.2f}s"
+                f"in {len(chunks)} requests, {duration:.2f}s"
             )
 
             return translated
@@ -286,6 +273,124 @@ class OpenAITranslationService(BaseTranslationService):
             logger.error(f"Translation failed: {e}")
             raise TranslationError(f"Translation failed: {e}") from e
 
+    def _build_instruction(
+        self, target_language: str, source_language: Optional[str]
+    ) -> str:
+        """Build the system instruction for a translation request."""
+        target_lang_name = LANGUAGE_NAMES.get(target_language, target_language)
+
+        if source_language:
+            source_lang_name = LANGUAGE_NAMES.get(source_language, source_language)
+            return (
+                f"Translate the following text from {source_lang_name} "
+                f"to {target_lang_name}. "
+                f"Preserve formatting, tone, and meaning. "
+                f"Return only the translated text."
+            )
+
+        return (
+            f"Translate the following text to {target_lang_name}. "
+            f"Preserve formatting, tone, and meaning. "
+            f"Return only the translated text."
+        )
+
+    async def _translate_chunk(self, texts: List[str], instruction: str) -> List[str]:
+        """
+        Translate texts with one request, splitting it if the response is misaligned.
+
+        Args:
+            texts: Texts packed into this request
+            instruction: System instruction
+
+        Returns:
+            Translations in input order
+        """
+        if len(texts) == 1:
+            async with self._semaphore:
+                response_text = await self._call_api(instruction, texts[0])
+            self._total_requests += 1
+            return [response_text.strip()]
+
+        # Use numbered list for multiple texts
+        user_content = "\n\n".join(f"[{i+1}] {text}" for i, text in enumerate(texts))
+        numbered_instruction = instruction + (
+            f" Translate each of the {len(texts)} numbered items and keep "
+            f"the same [n] numbering, one item per line."
+        )
+
+        async with self._semaphore:
+            response_text = await self._call_api(numbered_instruction, user_content)
+        self._total_requests += 1
+
+        items = self._parse_numbered_items(response_text)
+        if sorted(items) == list(range(1, len(texts) + 1)):
+            return [items[n] for n in range(1, len(texts) + 1)]
+
+        # Misaligned response: retry only this chunk, in two halves
+        logger.warning(
+            f"Expected {len(texts)} numbered translations, got {len(items)}; "
+            "splitting the request"
+        )
+        self._chunk_splits += 1
+        middle = len(texts) // 2
+        first, second = await asyncio.gather(
+            self._translate_chunk(texts[:middle], instruction),
+            self._translate_chunk(texts[middle:], instruction),
+        )
+        return first + second
+
+    def _pack_chunks(self, texts: List[str]) -> List[List[int]]:
+        """
+        Pack texts into requests under the token budget.
+
+        Args:
+            texts: Texts to translate
+
+        Returns:
+            Index lists, one per request, in input order (a text over the
+            budget on its own gets its own request)
+        """
+        chunks: List[List[int]] = []
+        current: List[int] = []
+        current_tokens = 0
+
+        for i, text in enumerate(texts):
+            tokens = self._estimate_tokens(text) + 4  # "[n] " prefix and separator
+            if current and current_tokens + tokens > self.max_batch_tokens:
+                chunks.append(current)
+                current, current_tokens = [], 0
+            current.append(i)
+            current_tokens += tokens
+
+        if current:
+            chunks.append(current)
+
+        return chunks
+
+    def _estimate_tokens(self, text: str) -> int:
+        """
+        Count the tokens of a text with tiktoken, or estimate them.
+
+        Without tiktoken, ASCII text is counted at ~4 characters per token
+        and other characters (CJK, Cyrillic, ...) at one token each.
+        """
+        if self._encoding is None:
+            try:
+                import tiktoken
+
+                try:
+                    self._encoding = tiktoken.encoding_for_model(self.model)
+                except KeyError:
+                    self._encoding = tiktoken.get_encoding("cl100k_base")
+            except Exception:
+                self._encoding = False
+
+        if self._encoding:
+            return len(self._encoding.encode(text))
+
+        ascii_chars = sum(1 for c in text if c.isascii())
+        return ascii_chars // 4 + (len(text) - ascii_chars) + 1
+
     async def detect_language(self, text: str) -> str:
         """
         Detect the language of text.
@@ -412,35 +517,35 @@ class OpenAITranslationService(BaseTranslationService):
         output_cost = (output_tokens / 1000) * costs["output"]
         return input_cost + output_cost
 
-    def _parse_numbered_response(self, response: str, expected_count: int) -> List[str]:
-        """Parse numbered translation response."""
-        lines = response.strip().split("\n")
-        translations = []
+    def _parse_numbered_items(self, response: str) -> Dict[int, str]:
+        """
+        Parse a numbered response into translations keyed by item number.
+
+        Args:
+            response: Response with items like "[1] text", "1. text" or "1) text"
+
+        Returns:
+            Dictionary mapping item numbers to translations
+        """
+        import re
+
+        items: Dict[int, str] = {}
+        current = None
 
-        for line in lines:
+        for line in response.strip().split("\n"):
             line = line.strip()
             if not line:
                 continue
 
-            # Try to extract numbered item: [1] text or 1. text or 1) text
-            import re
-
-            match = re.match(r"^\[?(\d+)\]?[\.\)]\s*(.*)", line)
+            match = re.match(r"^\[(\d+)\]\s*(.*)|^(\d+)[\.\)]\s*(.*)", line)
             if match:
-                translations.append(match.group(2).strip())
-            elif translations:
+                current = int(match.group(1) or match.group(3))
+                items[current] = (match.group(2) or match.group(4) or "").strip()
+            elif current is not None:
                 # Continuation of previous item
-                translations[-1] += " " + line
-
-        # Fallback if parsing failed
-        if len(translations) != expected_count:
-            logger.warning(
-                f"Expected {expected_count} translations, got {len(translations)}"
-            )
-            # Return split by double newline
-            translations = [t.strip() for t in response.split("\n\n") if t.strip()]
+                items[current] += " " + line
 
-        return translations[:expected_count]
+        return items
 
     def get_usage_stats(self) -> Dict:
         """Get usage statistics."""
@@ -451,6 +556,8 @@ class OpenAITranslationService(BaseTranslationService):
         return {
             "total_translations": self._total_translations,
             "total_characters": self._total_chars,
+            "total_requests": self._total_requests,
+            "chunk_splits": self._chunk_splits,
             "total_cost_usd": self._total_cost,
             "avg_cost_per_char": avg_cost_per_char,
             "model": self.model,
@@ -8,130 +8,18 @@ automatic fallback, and Redis-based + database caching to minimize costs.
 import hashlib
 import logging
 from typing import Dict, List, Optional
-from asgiref.sync import sync_to_async
 
 from trend_agent.intelligence.interfaces import TranslationError
 from trend_agent.observability.metrics import api_request_counter
+from trend_agent.services.translation_store import DjangoTranslationStore
 from trend_agent.storage.interfaces import CacheRepository
 
 logger = logging.getLogger(__name__)
 
 
-def get_db_translation(source_text_hash: str, source_lang: Optional[str], target_lang: str) -> Optional[str]:
-    """
-    Get translation from database cache.
-
-    This function is designed to work both inside and outside Django context.
-    Returns None if Django is not available or translation not found.
-
-    Args:
-        source_text_hash: MD5 hash of source text
-        source_lang: Source language code
-        target_lang: Target language code
-
-    Returns:
-        Cached translation or None
-    """
-    try:
-        # Import Django models (will fail if Django not configured)
-        try:
-            from web_interface.trends_viewer.models import TranslatedContent
-        except ImportError:
-            # Try alternate import path (when running inside web container)
-            from trends_viewer.models import TranslatedContent
-
-        # Query database
-        cached = TranslatedContent.objects.filter(
-            source_text_hash=source_text_hash,
-            source_language=source_lang or 'auto',
-            target_language=target_lang
-        ).first()
-
-        if cached:
-            logger.info(
-                f"[DB CACHE] ✓ HIT - Found translation in database "
-                f"(hash: {source_text_hash[:8]}..., {source_lang or 'auto'} -> {target_lang}, provider: {cached.provider})"
-            )
-            return cached.translated_text
-
-        logger.debug(
-            f"[DB CACHE] ✗ MISS - Translation not in database "
-            f"(hash: {source_text_hash[:8]}..., {source_lang or 'auto'} -> {target_lang})"
-        )
-        return None
-
-    except ImportError:
-        # Django not available - skip database cache
-        logger.debug("Database cache not available (Django not configured)")
-        return None
-    except Exception as e:
-        logger.warning(f"Database cache lookup failed: {e}")
-        return None
-
-
-def save_db_translation(
-    source_text: str,
-    source_text_hash: str,
-    translation: str,
-    source_lang: Optional[str],
-    target_lang: str,
-    provider: str = 'libretranslate'
-) -> bool:
-    """
-    Save translation to database cache.
-
-    This function is designed to work both inside and outside Django context.
-    Returns False if Django is not available or save fails.
-
-    Args:
-        source_text: Original text (for logging)
-        source_text_hash: MD5 hash of source text
-        translation: Translated text
-        source_lang: Source language code
-        target_lang: Target language code
-        provider: Provider name
-
-    Returns:
-        True if saved successfully
-    """
-    try:
-        # Import Django models (will fail if Django not configured)
-        try:
-            from web_interface.trends_viewer.models import TranslatedContent
-        except ImportError:
-            # Try alternate import path (when running inside web container)
-            from trends_viewer.models import TranslatedContent
-
-        # Create or update translation record
-        obj, created = TranslatedContent.objects.update_or_create(
-            source_text_hash=source_text_hash,
-            source_language=source_lang or 'auto',
-            target_language=target_lang,
-            defaults={
-                'translated_text': translation,
-                'provider': provider,
-            }
-        )
-
-        action = "CREATED" if created else "UPDATED"
-        logger.info(
-            f"[DB CACHE] ✓ {action} - Saved translation to database "
-            f"(hash: {source_text_hash[:8]}..., {source_lang or 'auto'} -> {target_lang}, provider: {provider})"
-        )
-        return True
-
-    except ImportError:
-        # Django not available - skip database cache
-        logger.debug("Database cache not available (Django not configured)")
-        return False
-    except Exception as e:
-        logger.warning(f"Database cache save failed: {e}")
-        return False
-
-
 class TranslationCache:
     """
-    Redis-based translation cache.
+    Two-tier translation cache: Redis in front of a persistent database store.
 
     Caches translations to avoid redundant API calls and reduce costs.
     Uses a hash of (text + source_lang + target_lang) as cache key.
@@ -139,8 +27,8 @@ class TranslationCache:
     Features:
     - Automatic cache key generation
     - Configurable TTL
-    - Batch caching support
-    - Cache hit/miss tracking
+    - Batch caching support (MGET + pipelined SETEX, one DB query per batch)
+    - Per-tier cache hit/miss tracking
 
     Example:
         ```python
@@ -162,6 +50,7 @@ class TranslationCache:
         cache_repo: CacheRepository,
         ttl_seconds: int = 604800,  # 7 days default
         key_prefix: str = "translation",
+        db_store: Optional[DjangoTranslationStore] = None,
     ):
         """
         Initialize translation cache.
@@ -170,14 +59,18 @@ class TranslationCache:
             cache_repo: Redis cache repository
             ttl_seconds: Cache TTL in seconds (default: 7 days)
             key_prefix: Prefix for cache keys
+            db_store: Persistent database tier (default: DjangoTranslationStore)
         """
         self.cache_repo = cache_repo
         self.ttl_seconds = ttl_seconds
         self.key_prefix = key_prefix
+        self.db_store = db_store or DjangoTranslationStore()
 
         # Stats
         self._cache_hits = 0
         self._cache_misses = 0
+        self._tier_lookups = {"redis": 0, "database": 0}
+        self._tier_hits = {"redis": 0, "database": 0}
 
         logger.info(
             f"Initialized TranslationCache (ttl={ttl_seconds}s, prefix={key_prefix})"
@@ -211,11 +104,13 @@ class TranslationCache:
         cache_key = self._generate_cache_key(text, source_lang, target_lang)
 
         # Step 1: Check Redis cache (fast)
+        self._tier_lookups["redis"] += 1
         try:
             cached = await self.cache_repo.get(cache_key)
 
             if cached:
                 self._cache_hits += 1
+                self._tier_hits["redis"] += 1
                 logger.debug(f"[REDIS CACHE] HIT: {cache_key[:50]}...")
                 return cached
 
@@ -223,15 +118,14 @@ class TranslationCache:
             logger.warning(f"Redis cache get failed: {e}")
 
         # Step 2: Check Database cache (persistent)
-        # Generate MD5 hash for database lookup
-        source = source_lang or "auto"
-        hash_input = f"{text}|{source}|{target_lang}".encode("utf-8")
-        text_hash = hashlib.md5(hash_input).hexdigest()
+        text_hash = self._hash_text(text, source_lang, target_lang)
 
-        # CRITICAL FIX: Wrap sync database call in async context
-        db_cached = await sync_to_async(get_db_translation)(text_hash, source_lang, target_lang)
+        self._tier_lookups["database"] += 1
+        db_found = await self.db_store.get_many([text_hash], source_lang, target_lang)
+        db_cached = db_found.get(text_hash)
         if db_cached:
             self._cache_hits += 1
+            self._tier_hits["database"] += 1
             # Populate Redis cache for faster future lookups
             try:
                 await self.cache_repo.set(cache_key, db_cached, ttl_seconds=self.ttl_seconds)
@@ -283,21 +177,13 @@ class TranslationCache:
             logger.warning(f"Redis cache set failed: {e}")
 
         # Save to Database cache (persistent)
-        source = source_lang or "auto"
-        hash_input = f"{text}|{source}|{target_lang}".encode("utf-8")
-        text_hash = hashlib.md5(hash_input).hexdigest()
-
-        # Wrap sync function in async context
-        db_success = await sync_to_async(save_db_translation)(
-            source_text=text,
-            source_text_hash=text_hash,
-            translation=translation,
-            source_lang=source_lang,
-            target_lang=target_lang,
-            provider=provider
+        text_hash = self._hash_text(text, source_lang, target_lang)
+
+        db_saved = await self.db_store.save_many(
+            {text_hash: translation}, source_lang, target_lang, provider
         )
 
-        if db_success:
+        if db_saved:
             success = True
 
         return success
@@ -311,6 +197,10 @@ class TranslationCache:
         """
         Get cached translations for multiple texts.
 
+        Uses one Redis MGET for all texts and a single database query for
+        the Redis misses; database hits are written back to Redis in one
+        pipelined round trip.
+
         Args:
             texts: List of texts to look up
             source_lang: Source language code
@@ -319,13 +209,61 @@ class TranslationCache:
         Returns:
             Dictionary mapping text to cached translation
         """
+        unique_texts = list(dict.fromkeys(t for t in texts if t and t.strip()))
+        if not unique_texts:
+            return {}
+
         cached_translations = {}
 
-        for text in texts:
-            cached = await self.get(text, source_lang, target_lang)
-            if cached:
-                cached_translations[text] = cached
+        # Step 1: Redis MGET
+        keys = [self._generate_cache_key(t, source_lang, target_lang) for t in unique_texts]
+        self._tier_lookups["redis"] += len(unique_texts)
+        try:
+            values = await self.cache_repo.get_many(keys)
+        except Exception as e:
+            logger.warning(f"Redis cache batch get failed: {e}")
+            values = [None] * len(unique_texts)
+
+        redis_misses = []
+        for text, value in zip(unique_texts, values):
+            if value:
+                cached_translations[text] = value
+            else:
+                redis_misses.append(text)
+        self._tier_hits["redis"] += len(cached_translations)
+
+        # Step 2: Single database query for Redis misses
+        if redis_misses:
+            hashes = {
+                self._hash_text(t, source_lang, target_lang): t for t in redis_misses
+            }
+            self._tier_lookups["database"] += len(redis_misses)
+            db_found = await self.db_store.get_many(
+                list(hashes.keys()), source_lang, target_lang
+            )
+
+            backfill = {}
+            for text_hash, translation in db_found.items():
+                text = hashes.get(text_hash)
+                if text and translation:
+                    cached_translations[text] = translation
+                    backfill[self._generate_cache_key(text, source_lang, target_lang)] = translation
+            self._tier_hits["database"] += len(backfill)
+
+            # Populate Redis cache for faster future lookups
+            if backfill:
+                try:
+                    await self.cache_repo.set_many(backfill, ttl_seconds=self.ttl_seconds)
+                except Exception as e:
+                    logger.warning(f"Failed to populate Redis from database: {e}")
+
+        self._cache_hits += len(cached_translations)
+        self._cache_misses += len(unique_texts) - len(cached_translations)
 
+        logger.debug(
+            f"Translation cache batch: {len(cached_translations)}/{len(unique_texts)} hits "
+            f"({source_lang or 'auto'} -> {target_lang})"
+        )
         return cached_translations
 
     async def set_batch(
@@ -338,6 +276,9 @@ class TranslationCache:
         """
         Cache multiple translations.
 
+        Writes all translations to Redis with one pipelined SETEX round trip
+        and to the database store in one bulk insert.
+
         Args:
             translations: Dictionary mapping original text to translation
             source_lang: Source language code
@@ -347,13 +288,34 @@ class TranslationCache:
         Returns:
             Number of translations successfully cached
         """
-        cached_count = 0
+        valid = {text: tr for text, tr in translations.items() if text and tr}
+        if not valid:
+            return 0
 
-        for text, translation in translations.items():
-            if await self.set(text, translation, source_lang, target_lang, provider):
-                cached_count += 1
+        redis_success = False
+        try:
+            await self.cache_repo.set_many(
+                {
+                    self._generate_cache_key(text, source_lang, target_lang): translation
+                    for text, translation in valid.items()
+                },
+                ttl_seconds=self.ttl_seconds,
+            )
+            redis_success = True
+        except Exception as e:
+            logger.warning(f"Redis cache batch set failed: {e}")
+
+        db_saved = await self.db_store.save_many(
+            {
+                self._hash_text(text, source_lang, target_lang): translation
+                for text, translation in valid.items()
+            },
+            source_lang,
+            target_lang,
+            provider,
+        )
 
-        return cached_count
+        return len(valid) if redis_success else db_saved
 
     def _generate_cache_key(
         self,
@@ -376,29 +338,54 @@ class TranslationCache:
             Cache key string
         """
         source = source_lang or "auto"
-        # Create hash of text + languages
-        hash_input = f"{text}|{source}|{target_lang}".encode("utf-8")
-        text_hash = hashlib.md5(hash_input).hexdigest()
+        text_hash = self._hash_text(text, source_lang, target_lang)
 
         return f"{self.key_prefix}:{source}:{target_lang}:{text_hash}"
 
+    @staticmethod
+    def _hash_text(text: str, source_lang: Optional[str], target_lang: str) -> str:
+        """
+        Hash (text + source_lang + target_lang) for cache keys and DB lookups.
+
+        Args:
+            text: Text to translate
+            source_lang: Source language (or None for "auto")
+            target_lang: Target language
+
+        Returns:
+            MD5 hex digest
+        """
+        source = source_lang or "auto"
+        hash_input = f"{text}|{source}|{target_lang}".encode("utf-8")
+        return hashlib.md5(hash_input).hexdigest()
+
     def get_stats(self) -> Dict:
         """
         Get cache statistics.
 
         Returns:
-            Dictionary with hit/miss counts and hit rate
+            Dictionary with hit/miss counts, overall and per-tier hit rates
         """
         total_requests = self._cache_hits + self._cache_misses
         hit_rate = (
             (self._cache_hits / total_requests * 100) if total_requests > 0 else 0
         )
 
+        # Per-tier hit rate = hits served by a tier / lookups that reached it
+        tier_hit_rates = {
+            tier: round(self._tier_hits[tier] / lookups * 100, 2) if lookups > 0 else 0
+            for tier, lookups in self._tier_lookups.items()
+        }
+
         return {
             "cache_hits": self._cache_hits,
             "cache_misses": self._cache_misses,
             "total_requests": total_requests,
             "hit_rate_percent": round(hit_rate, 2),
+            "hits_by_tier": dict(self._tier_hits),
+            "lookups_by_tier": dict(self._tier_lookups),
+            "hit_rate_by_tier": tier_hit_rates,
+            "database_store": self.db_store.get_stats(),
         }
 
     async def clear(self) -> bool:
@@ -412,6 +399,10 @@ class TranslationCache:
             logger.error(f"Failed to clear cache: {e}")
             return False
 
+    async def close(self) -> None:
+        """Release the database tier's worker threads."""
+        await self.db_store.close()
+
 
 class TranslationManager:
     """
@@ -792,7 +783,7 @@ class TranslationManager:
         }
 
     async def close(self):
-        """Close all providers."""
+        """Close all providers and the translation cache."""
         for name, provider in self.providers.items():
             try:
                 if hasattr(provider, "close"):
@@ -801,6 +792,12 @@ class TranslationManager:
             except Exception as e:
                 logger.warning(f"Error closing provider {name}: {e}")
 
+        if self.cache:
+            try:
+                await self.cache.close()
+            except Exception as e:
+                logger.warning(f"Error closing translation cache: {e}")
+
         logger.info(
             f"Closed TranslationManager "
             f"(total_translations={self._total_translations})"
@@ -0,0 +1,259 @@
+"""
+Persistent translation store for TranslationCache.
+
+Provides the database tier behind the Redis translation cache. Django ORM
+calls run on a dedicated thread pool so lookups and writes never block the
+event loop of the API, Celery tasks or the processing pipeline.
+"""
+
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+from trend_agent.observability.metrics import record_translation_store_call
+
+logger = logging.getLogger(__name__)
+
+
+def _load_translated_content_model():
+    """Import the TranslatedContent model (raises if Django is unavailable)."""
+    try:
+        from web_interface.trends_viewer.models import TranslatedContent
+    except ImportError:
+        # Alternate import path (when running inside web container)
+        from trends_viewer.models import TranslatedContent
+    return TranslatedContent
+
+
+class DjangoTranslationStore:
+    """
+    Async adapter over the Django ``TranslatedContent`` table.
+
+    All ORM work runs on a small dedicated thread pool. Lookups are one
+    ``source_text_hash__in`` query per chunk and writes are one bulk insert
+    per chunk that updates rows that already exist, like ``update_or_create``.
+
+    If Django is not configured, the store disables itself after the first
+    failed model import and every call returns an empty result.
+
+    Example:
+        ```python
+        store = DjangoTranslationStore()
+        found = await store.get_many([text_hash], source_lang="en", target_lang="es")
+        await store.save_many({text_hash: "Hola"}, "en", "es", provider="deepl")
+        ```
+    """
+
+    def __init__(self, max_workers: int = 2, batch_size: int = 500):
+        """
+        Initialize translation store.
+
+        Args:
+            max_workers: Threads used for database calls
+            batch_size: Maximum hashes per query / rows per insert
+        """
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="translation-store"
+        )
+        self._batch_size = batch_size
+        self._available: Optional[bool] = None
+        self._closed = False
+
+        # Stats
+        self._calls = {"get": 0, "save": 0}
+        self._rows = {"get": 0, "save": 0}
+        self._seconds = {"get": 0.0, "save": 0.0}
+
+    async def get_many(
+        self,
+        source_text_hashes: List[str],
+        source_lang: Optional[str],
+        target_lang: str,
+    ) -> Dict[str, str]:
+        """
+        Look up translations by source text hash.
+
+        Args:
+            source_text_hashes: MD5 hashes of source texts
+            source_lang: Source language code (None for "auto")
+            target_lang: Target language code
+
+        Returns:
+            Dictionary mapping found hashes to translated text
+        """
+        if not source_text_hashes:
+            return {}
+
+        found = await self._run(
+            "get",
+            len(source_text_hashes),
+            self._get_many_sync,
+            source_text_hashes,
+            source_lang or "auto",
+            target_lang,
+        )
+        return found or {}
+
+    async def save_many(
+        self,
+        translations: Dict[str, str],
+        source_lang: Optional[str],
+        target_lang: str,
+        provider: str = "libretranslate",
+    ) -> int:
+        """
+        Insert or update translations.
+
+        Args:
+            translations: Dictionary mapping source text hash to translation
+            source_lang: Source language code (None for "auto")
+            target_lang: Target language code
+            provider: Translation provider used
+
+        Returns:
+            Number of rows written
+        """
+        if not translations:
+            return 0
+
+        saved = await self._run(
+            "save",
+            len(translations),
+            self._save_many_sync,
+            translations,
+            source_lang or "auto",
+            target_lang,
+            provider,
+        )
+        return saved or 0
+
+    def get_stats(self) -> Dict:
+        """
+        Get store statistics.
+
+        Returns:
+            Dictionary with calls, rows and average latency per operation
+        """
+        return {
+            "available": self._available,
+            "calls": dict(self._calls),
+            "rows": dict(self._rows),
+            "avg_latency_ms": {
+                op: round(self._seconds[op] / self._calls[op] * 1000, 2) if self._calls[op] else 0
+                for op in self._calls
+            },
+        }
+
+    async def close(self) -> None:
+        """
+        Shut down the worker threads.
+
+        Waits for in-flight database calls to finish. Calls made after
+        close return an empty result. Safe to call multiple times.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        await asyncio.get_running_loop().run_in_executor(
+            None, self._executor.shutdown, True
+        )
+
+    async def _run(self, operation: str, batch_size: int, func, *args):
+        """Run a sync ORM function on the store's thread pool with metrics."""
+        if self._available is False or self._closed:
+            return None
+
+        loop = asyncio.get_running_loop()
+        start = time.perf_counter()
+        try:
+            return await loop.run_in_executor(self._executor, func, *args)
+        except Exception as e:
+            if self._available is False:
+                # Django not configured - database tier disabled
+                return None
+            logger.warning(f"[DB CACHE] Translation store {operation} failed: {e}")
+            return None
+        finally:
+            duration = time.perf_counter() - start
+            self._calls[operation] += 1
+            self._rows[operation] += batch_size
+            self._seconds[operation] += duration
+            record_translation_store_call(operation, duration, batch_size)
+
+    def _model(self):
+        """Get the model class, disabling the store if Django is unavailable."""
+        try:
+            model = _load_translated_content_model()
+        except Exception as e:
+            if self._available is None:
+                logger.debug(f"Database translation cache not available: {e}")
+            self._available = False
+            raise
+        self._available = True
+        return model
+
+    def _get_many_sync(
+        self, source_text_hashes: List[str], source_lang: str, target_lang: str
+    ) -> Dict[str, str]:
+        """Chunked ``source_text_hash__in`` lookup (worker thread)."""
+        TranslatedContent = self._model()
+
+        from django.db import close_old_connections
+
+        close_old_connections()
+
+        found: Dict[str, str] = {}
+        for start in range(0, len(source_text_hashes), self._batch_size):
+            chunk = source_text_hashes[start:start + self._batch_size]
+            rows = TranslatedContent.objects.filter(
+                source_text_hash__in=chunk,
+                source_language=source_lang,
+                target_language=target_lang,
+            ).values_list("source_text_hash", "translated_text")
+            found.update(rows)
+
+        logger.debug(
+            f"[DB CACHE] Lookup: {len(found)}/{len(source_text_hashes)} hits "
+            f"({source_lang} -> {target_lang})"
+        )
+        return found
+
+    def _save_many_sync(
+        self,
+        translations: Dict[str, str],
+        source_lang: str,
+        target_lang: str,
+        provider: str,
+    ) -> int:
+        """Bulk insert, updating existing rows on conflict (worker thread)."""
+        TranslatedContent = self._model()
+
+        from django.db import close_old_connections
+
+        close_old_connections()
+
+        objects = [
+            TranslatedContent(
+                source_text_hash=text_hash,
+                source_language=source_lang,
+                target_language=target_lang,
+                translated_text=translation,
+                provider=provider,
+            )
+            for text_hash, translation in translations.items()
+        ]
+        TranslatedContent.objects.bulk_create(
+            objects,
+            batch_size=self._batch_size,
+            update_conflicts=True,
+            unique_fields=["source_text_hash", "source_language", "target_language"],
+            update_fields=["translated_text", "provider", "updated_at"],
+        )
+
+        logger.info(
+            f"[DB CACHE] Saved {len(objects)} translations "
+            f"({source_lang} -> {target_lang}, provider: {provider})"
+        )
+        return len(objects)
@@ -12,11 +12,15 @@ from trend_agent.storage.interfaces import (
     StorageError,
     ConnectionError,
     IntegrityError,
+    InvalidCursorError,
     NotFoundError,
     TopicRepository,
     TrendRepository,
     VectorRepository,
 )
+from trend_agent.storage.response_cache import ResponseCache, stable_cache_key
+from trend_agent.storage.suggestion_index import SuggestionIndex
+from trend_agent.storage.vector_writer import VectorIngestWriter
 
 # Concrete implementations (conditional imports for parallel development)
 try:
@@ -53,6 +57,7 @@ __all__ = [
     "StorageError",
     "ConnectionError",
     "IntegrityError",
+    "InvalidCursorError",
     "NotFoundError",
     # PostgreSQL implementations
     "PostgreSQLConnectionPool",
@@ -63,4 +68,11 @@ __all__ = [
     "QdrantVectorRepository",
     # Redis implementation
     "RedisCacheRepository",
+    # Vector ingest
+    "VectorIngestWriter",
+    # Response cache
+    "ResponseCache",
+    "stable_cache_key",
+    # Search autocomplete
+    "SuggestionIndex",
 ]
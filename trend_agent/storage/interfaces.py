@@ -8,10 +8,11 @@ while ensuring compatibility.
 
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Protocol
+from typing import Any, AsyncIterator, Dict, List, Optional, Protocol, Tuple
 from uuid import UUID
 
 from trend_agent.schemas import (
+    Metrics,
     ProcessedItem,
     Topic,
     Trend,
@@ -43,6 +44,21 @@ class TrendRepository(Protocol):
         """
         ...
 
+    async def save_batch(self, trends: List[Trend]) -> List[UUID]:
+        """
+        Save multiple trends in a single round-trip.
+
+        Args:
+            trends: The trends to save
+
+        Returns:
+            UUIDs of the saved trends, in input order
+
+        Raises:
+            StorageError: If save operation fails
+        """
+        ...
+
     async def get(self, trend_id: UUID) -> Optional[Trend]:
         """
         Retrieve a trend by ID.
@@ -55,6 +71,38 @@ class TrendRepository(Protocol):
         """
         ...
 
+    async def get_many(
+        self, trend_ids: List[UUID], filters: Optional[TrendFilter] = None
+    ) -> List[Trend]:
+        """
+        Retrieve multiple trends by ID in a single round-trip.
+
+        Args:
+            trend_ids: UUIDs of the trends, in the desired output order
+            filters: Optional hit post-filter: score range, last_updated date
+                range, keyword substrings in title or keywords, and sources
+                (other fields are ignored)
+
+        Returns:
+            Found trends matching the filters, ordered like ``trend_ids``
+        """
+        ...
+
+    async def get_last_updated(
+        self, trend_ids: List[UUID], filters: Optional[TrendFilter] = None
+    ) -> Dict[UUID, datetime]:
+        """
+        Get last_updated timestamps for the trends that exist and match filters.
+
+        Args:
+            trend_ids: UUIDs of the trends
+            filters: Optional hit post-filter, as for ``get_many``
+
+        Returns:
+            Dictionary mapping trend ID to its last_updated timestamp
+        """
+        ...
+
     async def search(self, filters: TrendFilter) -> List[Trend]:
         """
         Search trends with filters.
@@ -67,6 +115,41 @@ class TrendRepository(Protocol):
         """
         ...
 
+    async def search_page(
+        self, filters: TrendFilter, cursor: Optional[str] = None
+    ) -> Tuple[List[Trend], Optional[str]]:
+        """
+        Get one page of trends ordered by rank, using keyset pagination.
+
+        Args:
+            filters: Search filter criteria (``limit`` is the page size,
+                ``offset`` is ignored)
+            cursor: Cursor returned with the previous page
+
+        Returns:
+            Tuple of (trends, next page cursor or None on the last page)
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed
+        """
+        ...
+
+    async def search_text(
+        self, query: str, filters: Optional[TrendFilter] = None, limit: int = 20
+    ) -> List[Tuple[Trend, float]]:
+        """
+        Full-text search over trend titles, keywords and summaries.
+
+        Args:
+            query: Search text
+            filters: Optional filter criteria (pagination fields are ignored)
+            limit: Maximum results to return
+
+        Returns:
+            List of (trend, relevance) tuples, most relevant first
+        """
+        ...
+
     async def update(self, trend_id: UUID, updates: Dict[str, Any]) -> bool:
         """
         Update a trend.
@@ -123,6 +206,34 @@ class TrendRepository(Protocol):
         """
         ...
 
+    async def estimate_count(self, filters: Optional[TrendFilter] = None) -> int:
+        """
+        Estimate the number of trends matching filters without scanning them.
+
+        Args:
+            filters: Optional search filter criteria
+
+        Returns:
+            Estimated number of matching trends
+        """
+        ...
+
+    async def get_aggregate_stats(
+        self, date_from: Optional[datetime] = None, top_n: int = 10
+    ) -> Dict[str, Any]:
+        """
+        Compute trend statistics in the database.
+
+        Args:
+            date_from: Only include trends first seen at or after this time
+            top_n: Number of highest-scoring trends to include
+
+        Returns:
+            Dictionary with totals, breakdowns (by_category, by_state,
+            by_language, by_source), averages and top_trends
+        """
+        ...
+
     async def delete_old_trends(
         self,
         days: int,
@@ -148,6 +259,10 @@ class TopicRepository(Protocol):
         """Save a topic to the database."""
         ...
 
+    async def save_batch(self, topics: List[Topic]) -> List[UUID]:
+        """Save multiple topics in a batch, returning IDs in input order."""
+        ...
+
     async def get(self, topic_id: UUID) -> Optional[Topic]:
         """Retrieve a topic by ID."""
         ...
@@ -162,6 +277,16 @@ class TopicRepository(Protocol):
         """Search topics with filters."""
         ...
 
+    async def search_page(
+        self,
+        category: Optional[str] = None,
+        language: Optional[str] = None,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[Topic], Optional[str]]:
+        """Get one page of topics, most recently updated first, and the next page cursor."""
+        ...
+
     async def update(self, topic_id: UUID, updates: Dict[str, Any]) -> bool:
         """Update a topic."""
         ...
@@ -170,6 +295,16 @@ class TopicRepository(Protocol):
         """Delete a topic."""
         ...
 
+    async def search_text(
+        self,
+        query: str,
+        category: Optional[str] = None,
+        language: Optional[str] = None,
+        limit: int = 20,
+    ) -> List[Tuple[Topic, float]]:
+        """Full-text search over topics, returning (topic, relevance) tuples."""
+        ...
+
     async def get_by_keyword(self, keyword: str, limit: int = 10) -> List[Topic]:
         """Get topics containing a specific keyword."""
         ...
@@ -183,6 +318,12 @@ class TopicRepository(Protocol):
         """
         ...
 
+    async def estimate_count(
+        self, category: Optional[str] = None, language: Optional[str] = None
+    ) -> int:
+        """Estimate the number of topics matching filters without scanning them."""
+        ...
+
     async def get_items_by_topic(
         self,
         topic_id: UUID,
@@ -227,7 +368,7 @@ class ItemRepository(Protocol):
         ...
 
     async def save_batch(self, items: List[ProcessedItem]) -> List[UUID]:
-        """Save multiple items in a batch."""
+        """Save multiple items in a batch, returning IDs in input order."""
         ...
 
     async def get(self, item_id: UUID) -> Optional[ProcessedItem]:
@@ -244,6 +385,20 @@ class ItemRepository(Protocol):
         """Check if an item exists by source and source ID."""
         ...
 
+    async def get_recent_metrics(self, days: int = 7) -> List[Tuple[str, str, Metrics]]:
+        """Get (source, source_id, metrics) of recently collected items."""
+        ...
+
+    async def get_metrics_by_keys(
+        self, keys: List[Tuple[str, str]]
+    ) -> List[Tuple[str, str, Metrics]]:
+        """Get (source, source_id, metrics) of the stored items among (source, source_id) keys."""
+        ...
+
+    async def update_metrics_batch(self, items: List[ProcessedItem]) -> int:
+        """Update only the metrics of existing items, returning rows updated."""
+        ...
+
     async def delete_older_than(self, days: int) -> int:
         """Delete items older than specified days."""
         ...
@@ -348,6 +503,25 @@ class VectorRepository(Protocol):
         """Get total number of vectors in the collection."""
         ...
 
+    def scroll_iter(
+        self,
+        batch_size: int = 256,
+        filters: Optional[Dict[str, Any]] = None,
+        with_vectors: bool = True,
+    ) -> AsyncIterator[List[tuple[str, Optional[List[float]], Dict[str, Any]]]]:
+        """
+        Stream the collection one page at a time.
+
+        Args:
+            batch_size: Number of vectors per page
+            filters: Optional metadata filters
+            with_vectors: Whether to include vectors
+
+        Yields:
+            Lists of (id, vector, metadata) tuples
+        """
+        ...
+
 
 class CacheRepository(Protocol):
     """Interface for caching operations."""
@@ -383,6 +557,81 @@ class CacheRepository(Protocol):
         """
         ...
 
+    async def get_many(self, keys: List[str]) -> List[Optional[Any]]:
+        """Get multiple values in one round trip (None for misses)."""
+        ...
+
+    async def set_many(
+        self,
+        mapping: Dict[str, Any],
+        ttl_seconds: Optional[int] = None,
+    ) -> bool:
+        """Set multiple values with the same TTL in one round trip."""
+        ...
+
+    async def set_if_not_exists(
+        self,
+        key: str,
+        value: Any,
+        ttl_seconds: Optional[int] = None,
+    ) -> bool:
+        """Set a value only if the key is absent; True if it was set."""
+        ...
+
+    async def set_with_tags(
+        self,
+        key: str,
+        value: Any,
+        tags: List[str],
+        ttl_seconds: Optional[int] = None,
+        tag_ttl_seconds: int = 86400,
+        generations: Optional[List[int]] = None,
+    ) -> bool:
+        """Set a value and register its key under each tag.
+
+        If ``generations`` is given, the write is skipped (returns False)
+        when any tag was invalidated since those generations were read.
+        """
+        ...
+
+    async def get_tag_generations(self, tags: List[str]) -> List[int]:
+        """Get how many times each tag has been invalidated (0 if never)."""
+        ...
+
+    async def invalidate_tags(self, tags: List[str]) -> int:
+        """Delete all keys registered under the tags and bump their generations."""
+        ...
+
+    async def prefix_index_add(
+        self,
+        key: str,
+        entries: Dict[str, Tuple[str, float]],
+        top_k: int = 20,
+        max_prefix_length: int = 10,
+    ) -> int:
+        """Add member -> (text, weight) entries to an existing prefix index, keeping max weights."""
+        ...
+
+    async def prefix_index_replace(
+        self,
+        key: str,
+        entries: Dict[str, Tuple[str, float]],
+        top_k: int = 20,
+        max_prefix_length: int = 10,
+    ) -> int:
+        """Atomically replace the entries of a prefix index."""
+        ...
+
+    async def prefix_index_lookup(
+        self, key: str, prefix: str, limit: int, max_prefix_length: int = 10
+    ) -> Optional[List[Tuple[str, str, float]]]:
+        """Get the heaviest ``limit`` (member, text, weight) entries with a prefix; None if no index."""
+        ...
+
+    async def prefix_index_exists(self, key: str) -> bool:
+        """Check if a prefix index has been written."""
+        ...
+
     async def delete(self, key: str) -> bool:
         """Delete a key from cache."""
         ...
@@ -520,3 +769,9 @@ class NotFoundError(StorageError):
     """Exception when resource is not found."""
 
     pass
+
+
+class InvalidCursorError(StorageError):
+    """Exception when a pagination cursor is malformed or from another listing."""
+
+    pass
@@ -0,0 +1,55 @@
+"""
+Opaque cursors for keyset pagination.
+
+A cursor holds the sort key of the last row of a page. The next page is
+read with ``WHERE (sort key) after cursor`` instead of ``OFFSET``, so deep
+pages cost the same as the first and rows inserted between requests do
+not shift later pages.
+"""
+
+import base64
+import json
+from typing import Any, List
+
+from trend_agent.storage.interfaces import InvalidCursorError
+
+
+def encode_cursor(kind: str, values: List[Any]) -> str:
+    """
+    Encode a sort key as an opaque, URL-safe cursor.
+
+    Args:
+        kind: Listing the cursor belongs to (e.g. "trends")
+        values: JSON-serializable sort key of the last row
+
+    Returns:
+        Cursor string
+    """
+    payload = json.dumps([kind, values], separators=(",", ":"), default=str)
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(kind: str, cursor: str, size: int) -> List[Any]:
+    """
+    Decode a cursor created by ``encode_cursor``.
+
+    Args:
+        kind: Listing the cursor must belong to
+        cursor: Cursor string
+        size: Expected number of sort key values
+
+    Returns:
+        Sort key values
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed or belongs to another listing
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        cursor_kind, values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, TypeError, UnicodeError) as e:
+        raise InvalidCursorError(f"Invalid cursor: {e}") from e
+
+    if cursor_kind != kind or not isinstance(values, list) or len(values) != size:
+        raise InvalidCursorError(f"Invalid cursor for {kind}")
+    return values
@@ -8,8 +8,8 @@ for PostgreSQL database operations.
 import json
 import logging
 from datetime import datetime
-from typing import Any, Dict, List, Optional
-from uuid import UUID
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID, uuid4
 
 import asyncpg
 from asyncpg import Pool
@@ -18,11 +18,13 @@ from trend_agent.storage.interfaces import (
     BaseTrendRepository,
     ConnectionError,
     IntegrityError,
+    InvalidCursorError,
     ItemRepository,
     NotFoundError,
     StorageError,
     TopicRepository,
 )
+from trend_agent.storage.pagination import decode_cursor, encode_cursor
 from trend_agent.schemas import (
     Category,
     Metrics,
@@ -219,6 +221,350 @@ def _row_to_processed_item(row: asyncpg.Record) -> ProcessedItem:
     )
 
 
+# ============================================================================
+# Bulk Write Helpers
+# ============================================================================
+
+_TREND_COLUMNS = [
+    "id", "topic_id", "rank", "title", "summary", "key_points", "category",
+    "state", "score", "sources", "item_count", "velocity", "language",
+    "keywords", "related_trend_ids", "total_engagement",
+    "first_seen", "last_updated", "peak_engagement_at", "metadata",
+]
+_TREND_UPDATE_COLUMNS = [
+    "rank", "title", "summary", "key_points", "state", "score", "sources",
+    "item_count", "velocity", "keywords", "related_trend_ids",
+    "total_engagement", "peak_engagement_at", "metadata",
+]
+
+_TOPIC_COLUMNS = [
+    "id", "title", "summary", "category", "sources", "item_count",
+    "language", "keywords", "total_engagement", "first_seen",
+    "last_updated", "metadata",
+]
+_TOPIC_UPDATE_COLUMNS = [
+    "title", "summary", "sources", "item_count", "keywords",
+    "total_engagement", "metadata",
+]
+
+_ITEM_COLUMNS = [
+    "id", "source", "source_id", "url", "title", "title_normalized",
+    "description", "content", "content_normalized", "language",
+    "author", "category", "metrics", "published_at", "collected_at", "metadata",
+]
+_ITEM_UPDATE_COLUMNS = [
+    "title", "title_normalized", "description", "content",
+    "content_normalized", "category", "metrics", "metadata",
+]
+
+
+def _trend_to_record(trend: Trend) -> tuple:
+    """Convert Trend to a row tuple ordered like _TREND_COLUMNS."""
+    return (
+        trend.id or uuid4(),
+        trend.topic_id,
+        trend.rank,
+        trend.title,
+        trend.summary,
+        trend.key_points,
+        trend.category.value,
+        trend.state.value,
+        trend.score,
+        [s.value for s in trend.sources],
+        trend.item_count,
+        trend.velocity,
+        trend.language,
+        trend.keywords,
+        trend.related_trend_ids,
+        _metrics_to_jsonb(trend.total_engagement),
+        trend.first_seen,
+        trend.last_updated,
+        trend.peak_engagement_at,
+        json.dumps(trend.metadata),
+    )
+
+
+def _topic_to_record(topic: Topic) -> tuple:
+    """Convert Topic to a row tuple ordered like _TOPIC_COLUMNS."""
+    return (
+        topic.id or uuid4(),
+        topic.title,
+        topic.summary,
+        topic.category.value,
+        [s.value for s in topic.sources],
+        topic.item_count,
+        topic.language,
+        topic.keywords,
+        _metrics_to_jsonb(topic.total_engagement),
+        topic.first_seen,
+        topic.last_updated,
+        json.dumps(topic.metadata),
+    )
+
+
+def _item_to_record(item: ProcessedItem) -> tuple:
+    """Convert ProcessedItem to a row tuple ordered like _ITEM_COLUMNS."""
+    return (
+        item.id or uuid4(),
+        item.source.value,
+        item.source_id,
+        str(item.url),
+        item.title,
+        item.title_normalized,
+        item.description,
+        item.content,
+        item.content_normalized,
+        item.language,
+        item.author,
+        item.category.value if item.category else None,
+        _metrics_to_jsonb(item.metrics),
+        item.published_at,
+        item.collected_at,
+        json.dumps(item.metadata),
+    )
+
+
+async def _bulk_upsert(
+    conn: asyncpg.Connection,
+    table: str,
+    columns: List[str],
+    records: List[tuple],
+    conflict_columns: List[str],
+    update_columns: List[str],
+    returning: List[str],
+) -> List[asyncpg.Record]:
+    """
+    Upsert rows with COPY into a staging table and one INSERT ... SELECT.
+
+    Must be called inside a transaction on ``conn``; the staging table is
+    dropped on commit. Records must be unique on ``conflict_columns``,
+    otherwise PostgreSQL rejects the upsert.
+
+    Args:
+        conn: Connection with an open transaction
+        table: Target table name
+        columns: Column names, in record order
+        records: Row tuples
+        conflict_columns: Columns of the unique constraint to upsert on
+        update_columns: Columns overwritten when the row already exists
+        returning: Columns to return for each upserted row
+
+    Returns:
+        One record per upserted row (in no particular order)
+    """
+    staging = f"_staging_{table}"
+    column_list = ", ".join(columns)
+    update_list = ", ".join(f"{col} = EXCLUDED.{col}" for col in update_columns)
+
+    await conn.execute(
+        f"CREATE TEMP TABLE {staging} (LIKE {table} INCLUDING DEFAULTS) ON COMMIT DROP"
+    )
+    await conn.copy_records_to_table(staging, records=records, columns=columns)
+
+    return await conn.fetch(
+        f"""
+        INSERT INTO {table} ({column_list})
+        SELECT {column_list} FROM {staging}
+        ON CONFLICT ({", ".join(conflict_columns)}) DO UPDATE SET {update_list}
+        RETURNING {", ".join(returning)}
+        """
+    )
+
+
+def _dedupe_records(records: List[tuple], key_fn) -> List[tuple]:
+    """Keep the last record for each key, in first-seen key order."""
+    latest: Dict[Any, tuple] = {}
+    for record in records:
+        latest[key_fn(record)] = record
+    return list(latest.values())
+
+
+def _trend_filter_conditions(filters: TrendFilter, params: List[Any]) -> List[str]:
+    """
+    Build SQL WHERE conditions for a TrendFilter.
+
+    Appends the bind values to ``params`` and numbers placeholders after
+    any parameters already in it, so callers can prepend their own.
+
+    Args:
+        filters: Search filter criteria
+        params: Query parameters (extended in place)
+
+    Returns:
+        List of SQL conditions to AND together
+    """
+    conditions = []
+
+    def bind(value: Any) -> str:
+        params.append(value)
+        return f"${len(params)}"
+
+    if filters.category:
+        conditions.append(f"category = {bind(filters.category.value)}")
+
+    if filters.sources:
+        conditions.append(f"sources && {bind([s.value for s in filters.sources])}")
+
+    if filters.state:
+        conditions.append(f"state = {bind(filters.state.value)}")
+
+    if filters.min_score is not None:
+        conditions.append(f"score >= {bind(filters.min_score)}")
+
+    if filters.max_score is not None:
+        conditions.append(f"score <= {bind(filters.max_score)}")
+
+    if filters.language:
+        conditions.append(f"language = {bind(filters.language)}")
+
+    if filters.date_from:
+        conditions.append(f"first_seen >= {bind(filters.date_from)}")
+
+    if filters.date_to:
+        conditions.append(f"first_seen <= {bind(filters.date_to)}")
+
+    if filters.keywords:
+        conditions.append(f"keywords && {bind(filters.keywords)}")
+
+    return conditions
+
+
+def _trend_hit_filter_conditions(filters: TrendFilter, params: List[Any]) -> List[str]:
+    """
+    Build SQL WHERE conditions that post-filter semantic search hits.
+
+    Vector search already applies category, state and language, so only
+    the remaining criteria are checked here, with the semantics search
+    hydration has always had: score range, a ``last_updated`` date range,
+    case-insensitive keyword substrings in the title or any keyword, and
+    source overlap.
+
+    Args:
+        filters: Search filter criteria
+        params: Query parameters (extended in place)
+
+    Returns:
+        List of SQL conditions to AND together
+    """
+    conditions = []
+
+    def bind(value: Any) -> str:
+        params.append(value)
+        return f"${len(params)}"
+
+    if filters.min_score is not None:
+        conditions.append(f"score >= {bind(filters.min_score)}")
+
+    if filters.max_score is not None:
+        conditions.append(f"score <= {bind(filters.max_score)}")
+
+    if filters.date_from:
+        conditions.append(f"last_updated >= {bind(filters.date_from)}")
+
+    if filters.date_to:
+        conditions.append(f"last_updated <= {bind(filters.date_to)}")
+
+    if filters.keywords:
+        patterns = [f"%{_escape_like(kw)}%" for kw in filters.keywords]
+        conditions.append(
+            f"""EXISTS (
+                SELECT 1 FROM unnest({bind(patterns)}::text[]) AS kw(pattern)
+                WHERE title ILIKE kw.pattern
+                   OR EXISTS (
+                       SELECT 1 FROM unnest(keywords) AS tk(term)
+                       WHERE tk.term ILIKE kw.pattern
+                   )
+            )"""
+        )
+
+    if filters.sources:
+        conditions.append(f"sources && {bind([s.value for s in filters.sources])}")
+
+    return conditions
+
+
+def _escape_like(value: str) -> str:
+    """Escape LIKE wildcards so ``value`` matches literally."""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _topic_filter_conditions(
+    category: Optional[str], language: Optional[str]
+) -> Tuple[List[str], List[Any]]:
+    """
+    Build SQL WHERE conditions for topic category and language filters.
+
+    Args:
+        category: Optional category filter
+        language: Optional language filter
+
+    Returns:
+        Tuple of (conditions to AND together, bind values)
+    """
+    conditions: List[str] = []
+    params: List[Any] = []
+
+    if category:
+        params.append(category)
+        conditions.append(f"category = ${len(params)}")
+
+    if language:
+        params.append(language)
+        conditions.append(f"language = ${len(params)}")
+
+    return conditions, params
+
+
+# Full-text match and relevance for trends/topics, with the query text in $1
+# and ``tsq`` bound to websearch_to_tsquery('english', $1). The ``@@`` match
+# uses the search_vector GIN index; ``<%`` (word similarity) uses the title
+# trigram index and catches typos and partial words.
+_TEXT_MATCH_CONDITION = "(search_vector @@ tsq OR $1 <% title)"
+_TEXT_RELEVANCE = "ts_rank_cd(search_vector, tsq, 32) + word_similarity($1, title)"
+
+
+async def _estimate_count(
+    pool: Pool, table: str, conditions: List[str], params: List[Any]
+) -> int:
+    """
+    Estimate the row count of a table, optionally filtered.
+
+    Reads ``pg_class.reltuples`` for the whole table and the planner's
+    ``Plan Rows`` for a filtered query, both without touching the rows.
+    Falls back to an exact count until the table has been analyzed.
+
+    Args:
+        pool: Connection pool
+        table: Table name (trusted, not user input)
+        conditions: SQL conditions to AND together
+        params: Bind values for the conditions
+
+    Returns:
+        Estimated number of rows
+    """
+    try:
+        if not conditions:
+            estimate = await pool.fetchval(
+                "SELECT reltuples::BIGINT FROM pg_class WHERE oid = $1::regclass", table
+            )
+            # reltuples is -1 (or 0) until the first VACUUM/ANALYZE
+            if estimate is not None and estimate > 0:
+                return estimate
+            return await pool.fetchval(f"SELECT COUNT(*) FROM {table}")
+
+        where_clause = " AND ".join(conditions)
+        plan = await pool.fetchval(
+            f"EXPLAIN (FORMAT JSON) SELECT 1 FROM {table} WHERE {where_clause}", *params
+        )
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+    except Exception as e:
+        logger.error(f"Failed to estimate {table} count: {e}")
+        raise StorageError(f"Failed to estimate {table} count: {e}")
+
+
 # ============================================================================
 # Repository Implementations
 # ============================================================================
@@ -312,6 +658,45 @@ class PostgreSQLTrendRepository(BaseTrendRepository):
             logger.error(f"Failed to save trend: {e}")
             raise StorageError(f"Failed to save trend: {e}")
 
+    async def save_batch(self, trends: List[Trend]) -> List[UUID]:
+        """
+        Save multiple trends in a batch.
+
+        Rows are upserted on id with a single COPY and INSERT ... ON CONFLICT
+        on one connection and transaction. Trends without an ID are assigned
+        one client-side.
+
+        Args:
+            trends: List of trends to save
+
+        Returns:
+            List of saved trend IDs, in input order
+        """
+        if not trends:
+            return []
+
+        try:
+            records = [_trend_to_record(trend) for trend in trends]
+
+            async with self.pool.acquire() as conn:
+                async with conn.transaction():
+                    await _bulk_upsert(
+                        conn,
+                        "trends",
+                        _TREND_COLUMNS,
+                        _dedupe_records(records, lambda r: r[0]),
+                        conflict_columns=["id"],
+                        update_columns=_TREND_UPDATE_COLUMNS,
+                        returning=["id"],
+                    )
+
+            logger.debug(f"Saved batch of {len(records)} trends")
+            return [record[0] for record in records]
+
+        except Exception as e:
+            logger.error(f"Failed to save trend batch: {e}")
+            raise StorageError(f"Failed to save trend batch: {e}")
+
     async def get(self, trend_id: UUID) -> Optional[Trend]:
         """
         Retrieve a trend by ID.
@@ -335,74 +720,112 @@ class PostgreSQLTrendRepository(BaseTrendRepository):
             logger.error(f"Failed to get trend {trend_id}: {e}")
             raise StorageError(f"Failed to get trend: {e}")
 
-    async def search(self, filters: TrendFilter) -> List[Trend]:
+    async def get_many(
+        self,
+        trend_ids: List[UUID],
+        filters: Optional[TrendFilter] = None,
+    ) -> List[Trend]:
         """
-        Search trends with filters.
+        Retrieve multiple trends by ID in a single query.
+
+        Results keep the order of ``trend_ids``. Missing IDs and trends that
+        do not match ``filters`` are left out. Filters are applied like a
+        post-filter on semantic search hits (see
+        ``_trend_hit_filter_conditions``); pagination fields are ignored.
 
         Args:
-            filters: Search filter criteria
+            trend_ids: UUIDs of the trends, in the desired output order
+            filters: Optional filter criteria applied in SQL
 
         Returns:
-            List of matching trends
+            List of found trends, ordered like ``trend_ids``
         """
+        if not trend_ids:
+            return []
+
         try:
-            # Build dynamic query based on filters
-            conditions = []
-            params = []
-            param_count = 0
+            params: List[Any] = [list(trend_ids)]
+            conditions = ["t.id = ids.id"]
+            if filters:
+                conditions.extend(_trend_hit_filter_conditions(filters, params))
 
-            if filters.category:
-                param_count += 1
-                conditions.append(f"category = ${param_count}")
-                params.append(filters.category.value)
+            query = f"""
+                SELECT t.*
+                FROM unnest($1::uuid[]) WITH ORDINALITY AS ids(id, position)
+                JOIN trends t ON {" AND ".join(conditions)}
+                ORDER BY ids.position
+            """
+            rows = await self.pool.fetch(query, *params)
 
-            if filters.sources:
-                param_count += 1
-                source_values = [s.value for s in filters.sources]
-                conditions.append(f"sources && ${param_count}")
-                params.append(source_values)
+            # Repeated IDs only need to be returned once
+            trends = []
+            seen = set()
+            for row in rows:
+                if row["id"] not in seen:
+                    seen.add(row["id"])
+                    trends.append(_row_to_trend(row))
+            return trends
 
-            if filters.state:
-                param_count += 1
-                conditions.append(f"state = ${param_count}")
-                params.append(filters.state.value)
+        except Exception as e:
+            logger.error(f"Failed to get {len(trend_ids)} trends: {e}")
+            raise StorageError(f"Failed to get trends: {e}")
 
-            if filters.min_score is not None:
-                param_count += 1
-                conditions.append(f"score >= ${param_count}")
-                params.append(filters.min_score)
+    async def get_last_updated(
+        self,
+        trend_ids: List[UUID],
+        filters: Optional[TrendFilter] = None,
+    ) -> Dict[UUID, datetime]:
+        """
+        Get the last_updated timestamp of multiple trends.
 
-            if filters.max_score is not None:
-                param_count += 1
-                conditions.append(f"score <= ${param_count}")
-                params.append(filters.max_score)
+        A light-weight version check for callers that cache hydrated
+        trends: only IDs that exist and match ``filters`` (with the same
+        semantics as ``get_many``) are returned.
 
-            if filters.language:
-                param_count += 1
-                conditions.append(f"language = ${param_count}")
-                params.append(filters.language)
+        Args:
+            trend_ids: UUIDs of the trends
+            filters: Optional filter criteria applied in SQL
 
-            if filters.date_from:
-                param_count += 1
-                conditions.append(f"first_seen >= ${param_count}")
-                params.append(filters.date_from)
+        Returns:
+            Dictionary mapping trend ID to its last_updated timestamp
+        """
+        if not trend_ids:
+            return {}
 
-            if filters.date_to:
-                param_count += 1
-                conditions.append(f"first_seen <= ${param_count}")
-                params.append(filters.date_to)
+        try:
+            params: List[Any] = [list(trend_ids)]
+            conditions = ["id = ANY($1::uuid[])"]
+            if filters:
+                conditions.extend(_trend_hit_filter_conditions(filters, params))
 
-            if filters.keywords:
-                param_count += 1
-                conditions.append(f"keywords && ${param_count}")
-                params.append(filters.keywords)
+            query = f"SELECT id, last_updated FROM trends WHERE {' AND '.join(conditions)}"
+            rows = await self.pool.fetch(query, *params)
+            return {row["id"]: row["last_updated"] for row in rows}
+
+        except Exception as e:
+            logger.error(f"Failed to get versions of {len(trend_ids)} trends: {e}")
+            raise StorageError(f"Failed to get trend versions: {e}")
+
+    async def search(self, filters: TrendFilter) -> List[Trend]:
+        """
+        Search trends with filters.
+
+        Args:
+            filters: Search filter criteria
+
+        Returns:
+            List of matching trends
+        """
+        try:
+            params: List[Any] = []
+            conditions = _trend_filter_conditions(filters, params)
 
             where_clause = " AND ".join(conditions) if conditions else "TRUE"
             query = f"""
                 SELECT * FROM trends
                 WHERE {where_clause}
                 ORDER BY rank, score DESC
-                LIMIT ${param_count + 1} OFFSET ${param_count + 2}
+                LIMIT ${len(params) + 1} OFFSET ${len(params) + 2}
             """
             params.extend([filters.limit, filters.offset])
 
@@ -413,6 +836,105 @@ class PostgreSQLTrendRepository(BaseTrendRepository):
             logger.error(f"Failed to search trends: {e}")
             raise StorageError(f"Failed to search trends: {e}")
 
+    async def search_page(
+        self, filters: TrendFilter, cursor: Optional[str] = None
+    ) -> Tuple[List[Trend], Optional[str]]:
+        """
+        Get one page of trends ordered by rank, using keyset pagination.
+
+        Rows are ordered by ``(rank, score DESC, id)`` and the next page
+        starts after the last row of this one, so each page is an index
+        range scan regardless of depth. ``filters.offset`` is ignored.
+
+        Args:
+            filters: Search filter criteria (``limit`` is the page size)
+            cursor: Cursor returned with the previous page
+
+        Returns:
+            Tuple of (trends, next page cursor or None on the last page)
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed
+        """
+        params: List[Any] = []
+        conditions = _trend_filter_conditions(filters, params)
+
+        if cursor:
+            rank, score, trend_id = decode_cursor("trends", cursor, 3)
+            try:
+                params.extend([int(rank), float(score), UUID(str(trend_id))])
+            except (TypeError, ValueError) as e:
+                raise InvalidCursorError(f"Invalid cursor: {e}") from e
+            r, s, i = (f"${len(params) - n}" for n in (2, 1, 0))
+            # rank >= ... lets the planner bound the index scan
+            conditions.append(
+                f"rank >= {r} AND (rank > {r} OR score < {s} "
+                f"OR (score = {s} AND id > {i}))"
+            )
+
+        try:
+            where_clause = " AND ".join(conditions) if conditions else "TRUE"
+            query = f"""
+                SELECT * FROM trends
+                WHERE {where_clause}
+                ORDER BY rank, score DESC, id
+                LIMIT ${len(params) + 1}
+            """
+            # One extra row tells whether another page follows
+            params.append(filters.limit + 1)
+
+            rows = await self.pool.fetch(query, *params)
+
+        except Exception as e:
+            logger.error(f"Failed to get trend page: {e}")
+            raise StorageError(f"Failed to get trend page: {e}")
+
+        trends = [_row_to_trend(row) for row in rows[: filters.limit]]
+        next_cursor = None
+        if len(rows) > filters.limit:
+            last = trends[-1]
+            next_cursor = encode_cursor("trends", [last.rank, last.score, str(last.id)])
+        return trends, next_cursor
+
+    async def search_text(
+        self, query: str, filters: Optional[TrendFilter] = None, limit: int = 20
+    ) -> List[Tuple[Trend, float]]:
+        """
+        Full-text search over trend titles, keywords and summaries.
+
+        Ranked with ``ts_rank_cd`` over the weighted ``search_vector``
+        (title > keywords > summary) plus a title similarity boost; both
+        matches are served by GIN indexes.
+
+        Args:
+            query: Search text (web search syntax: "quoted phrase", or, -term)
+            filters: Optional filter criteria (pagination fields are ignored)
+            limit: Maximum results to return
+
+        Returns:
+            List of (trend, relevance) tuples, most relevant first
+        """
+        try:
+            params: List[Any] = [query]
+            conditions = [_TEXT_MATCH_CONDITION]
+            if filters:
+                conditions.extend(_trend_filter_conditions(filters, params))
+            params.append(limit)
+
+            sql = f"""
+                SELECT trends.*, {_TEXT_RELEVANCE} AS relevance
+                FROM trends, websearch_to_tsquery('english', $1) AS tsq
+                WHERE {' AND '.join(conditions)}
+                ORDER BY relevance DESC, score DESC
+                LIMIT ${len(params)}
+            """
+            rows = await self.pool.fetch(sql, *params)
+            return [(_row_to_trend(row), row["relevance"]) for row in rows]
+
+        except Exception as e:
+            logger.error(f"Failed to text-search trends for '{query}': {e}")
+            raise StorageError(f"Failed to text-search trends: {e}")
+
     async def update(self, trend_id: UUID, updates: Dict[str, Any]) -> bool:
         """
         Update a trend.
@@ -546,60 +1068,151 @@ class PostgreSQLTrendRepository(BaseTrendRepository):
                 query = "SELECT COUNT(*) FROM trends"
                 return await self.pool.fetchval(query)
 
-            # Build dynamic query based on filters (same logic as search)
-            conditions = []
-            params = []
-            param_count = 0
+            # Same conditions as search
+            params: List[Any] = []
+            conditions = _trend_filter_conditions(filters, params)
 
-            if filters.category:
-                param_count += 1
-                conditions.append(f"category = ${param_count}")
-                params.append(filters.category.value)
+            where_clause = " AND ".join(conditions) if conditions else "TRUE"
+            query = f"SELECT COUNT(*) FROM trends WHERE {where_clause}"
 
-            if filters.sources:
-                param_count += 1
-                source_values = [s.value for s in filters.sources]
-                conditions.append(f"sources && ${param_count}")
-                params.append(source_values)
+            return await self.pool.fetchval(query, *params)
 
-            if filters.state:
-                param_count += 1
-                conditions.append(f"state = ${param_count}")
-                params.append(filters.state.value)
+        except Exception as e:
+            logger.error(f"Failed to count trends: {e}")
+            raise StorageError(f"Failed to count trends: {e}")
 
-            if filters.min_score is not None:
-                param_count += 1
-                conditions.append(f"score >= ${param_count}")
-                params.append(filters.min_score)
+    async def estimate_count(self, filters: Optional[TrendFilter] = None) -> int:
+        """
+        Estimate the number of trends matching filters without scanning them.
 
-            if filters.max_score is not None:
-                param_count += 1
-                conditions.append(f"score <= ${param_count}")
-                params.append(filters.max_score)
+        Uses the table statistics when unfiltered and the planner's row
+        estimate otherwise. Suited to list totals; use ``count`` when an
+        exact number is needed.
 
-            if filters.language:
-                param_count += 1
-                conditions.append(f"language = ${param_count}")
-                params.append(filters.language)
+        Args:
+            filters: Optional search filter criteria
 
-            if filters.date_from:
-                param_count += 1
-                conditions.append(f"first_seen >= ${param_count}")
-                params.append(filters.date_from)
+        Returns:
+            Estimated number of matching trends
+        """
+        params: List[Any] = []
+        conditions = _trend_filter_conditions(filters, params) if filters else []
+        return await _estimate_count(self.pool, "trends", conditions, params)
 
-            if filters.date_to:
-                param_count += 1
-                conditions.append(f"first_seen <= ${param_count}")
-                params.append(filters.date_to)
+    async def get_aggregate_stats(
+        self,
+        date_from: Optional[datetime] = None,
+        top_n: int = 10,
+    ) -> Dict[str, Any]:
+        """
+        Compute trend statistics with SQL aggregation.
 
-            where_clause = " AND ".join(conditions) if conditions else "TRUE"
-            query = f"SELECT COUNT(*) FROM trends WHERE {where_clause}"
+        Counts, breakdowns and averages are computed by PostgreSQL
+        (``GROUP BY GROUPING SETS`` and ``unnest(sources)``), so memory use
+        does not grow with the size of the trends table.
 
-            return await self.pool.fetchval(query, *params)
+        Args:
+            date_from: Only include trends first seen at or after this time
+            top_n: Number of highest-scoring trends to include
+
+        Returns:
+            Dictionary with totals, breakdowns by category/state/language/
+            source, averages, average engagement and the top trends
+        """
+        try:
+            where_clause = "first_seen >= $1" if date_from else "$1::timestamptz IS NULL"
+
+            totals_query = f"""
+                SELECT
+                    COUNT(*) AS total_trends,
+                    COUNT(DISTINCT topic_id) AS total_topics,
+                    COALESCE(SUM(item_count), 0) AS total_items,
+                    COALESCE(AVG(score), 0) AS avg_score,
+                    COALESCE(AVG(velocity), 0) AS avg_velocity,
+                    COALESCE(AVG(item_count), 0) AS avg_item_count,
+                    COALESCE(AVG((total_engagement->>'upvotes')::float), 0) AS avg_upvotes,
+                    COALESCE(AVG((total_engagement->>'comments')::float), 0) AS avg_comments,
+                    COALESCE(AVG((total_engagement->>'views')::float), 0) AS avg_views,
+                    COALESCE(AVG((total_engagement->>'score')::float), 0) AS avg_engagement_score
+                FROM trends
+                WHERE {where_clause}
+            """
+            breakdown_query = f"""
+                SELECT
+                    category::text AS category,
+                    state::text AS state,
+                    COALESCE(language, 'unknown') AS language,
+                    GROUPING(category, state, COALESCE(language, 'unknown')) AS grouping_id,
+                    COUNT(*) AS count
+                FROM trends
+                WHERE {where_clause}
+                GROUP BY GROUPING SETS ((category), (state), (COALESCE(language, 'unknown')))
+            """
+            source_query = f"""
+                SELECT source::text AS source, COUNT(*) AS count
+                FROM trends, unnest(sources) AS source
+                WHERE {where_clause}
+                GROUP BY source
+            """
+            top_query = f"""
+                SELECT id, title, score, category, state
+                FROM trends
+                WHERE {where_clause}
+                ORDER BY score DESC
+                LIMIT $2
+            """
+
+            async with self.pool.acquire() as conn:
+                totals = await conn.fetchrow(totals_query, date_from)
+                breakdown_rows = await conn.fetch(breakdown_query, date_from)
+                source_rows = await conn.fetch(source_query, date_from)
+                top_rows = await conn.fetch(top_query, date_from, top_n)
+
+            # GROUPING() bitmask: 0b011 -> grouped by category,
+            # 0b101 -> by state, 0b110 -> by language
+            by_category: Dict[str, int] = {}
+            by_state: Dict[str, int] = {}
+            by_language: Dict[str, int] = {}
+            for row in breakdown_rows:
+                if row["grouping_id"] == 0b011:
+                    by_category[row["category"]] = row["count"]
+                elif row["grouping_id"] == 0b101:
+                    by_state[row["state"]] = row["count"]
+                else:
+                    by_language[row["language"]] = row["count"]
+
+            return {
+                "total_trends": totals["total_trends"],
+                "total_topics": totals["total_topics"],
+                "total_items": int(totals["total_items"]),
+                "by_category": by_category,
+                "by_state": by_state,
+                "by_language": by_language,
+                "by_source": {row["source"]: row["count"] for row in source_rows},
+                "avg_score": float(totals["avg_score"]),
+                "avg_velocity": float(totals["avg_velocity"]),
+                "avg_item_count": float(totals["avg_item_count"]),
+                "avg_engagement": {
+                    "upvotes": float(totals["avg_upvotes"]),
+                    "comments": float(totals["avg_comments"]),
+                    "views": float(totals["avg_views"]),
+                    "score": float(totals["avg_engagement_score"]),
+                },
+                "top_trends": [
+                    {
+                        "id": str(row["id"]),
+                        "title": row["title"],
+                        "score": row["score"],
+                        "category": row["category"],
+                        "state": row["state"],
+                    }
+                    for row in top_rows
+                ],
+            }
 
         except Exception as e:
-            logger.error(f"Failed to count trends: {e}")
-            raise StorageError(f"Failed to count trends: {e}")
+            logger.error(f"Failed to aggregate trend stats: {e}")
+            raise StorageError(f"Failed to aggregate trend stats: {e}")
 
     async def delete_old_trends(
         self,
@@ -716,6 +1329,45 @@ class PostgreSQLTopicRepository:
             logger.error(f"Failed to save topic: {e}")
             raise StorageError(f"Failed to save topic: {e}")
 
+    async def save_batch(self, topics: List[Topic]) -> List[UUID]:
+        """
+        Save multiple topics in a batch.
+
+        Rows are upserted on id with a single COPY and INSERT ... ON CONFLICT
+        on one connection and transaction. Topics without an ID are assigned
+        one client-side.
+
+        Args:
+            topics: List of topics to save
+
+        Returns:
+            List of saved topic IDs, in input order
+        """
+        if not topics:
+            return []
+
+        try:
+            records = [_topic_to_record(topic) for topic in topics]
+
+            async with self.pool.acquire() as conn:
+                async with conn.transaction():
+                    await _bulk_upsert(
+                        conn,
+                        "topics",
+                        _TOPIC_COLUMNS,
+                        _dedupe_records(records, lambda r: r[0]),
+                        conflict_columns=["id"],
+                        update_columns=_TOPIC_UPDATE_COLUMNS,
+                        returning=["id"],
+                    )
+
+            logger.debug(f"Saved batch of {len(records)} topics")
+            return [record[0] for record in records]
+
+        except Exception as e:
+            logger.error(f"Failed to save topic batch: {e}")
+            raise StorageError(f"Failed to save topic batch: {e}")
+
     async def get(self, topic_id: UUID) -> Optional[Topic]:
         """
         Retrieve a topic by ID.
@@ -759,19 +1411,8 @@ class PostgreSQLTopicRepository:
             List of matching topics
         """
         try:
-            conditions = []
-            params = []
-            param_count = 0
-
-            if category:
-                param_count += 1
-                conditions.append(f"category = ${param_count}")
-                params.append(category)
-
-            if language:
-                param_count += 1
-                conditions.append(f"language = ${param_count}")
-                params.append(language)
+            conditions, params = _topic_filter_conditions(category, language)
+            param_count = len(params)
 
             where_clause = " AND ".join(conditions) if conditions else "TRUE"
             query = f"""
@@ -789,6 +1430,66 @@ class PostgreSQLTopicRepository:
             logger.error(f"Failed to search topics: {e}")
             raise StorageError(f"Failed to search topics: {e}")
 
+    async def search_page(
+        self,
+        category: Optional[str] = None,
+        language: Optional[str] = None,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[Topic], Optional[str]]:
+        """
+        Get one page of topics, most recently updated first, using keyset pagination.
+
+        Rows are ordered by ``(last_updated, id)`` descending and the next
+        page starts after the last row of this one, so each page is an
+        index range scan regardless of depth.
+
+        Args:
+            category: Optional category filter
+            language: Optional language filter
+            limit: Page size
+            cursor: Cursor returned with the previous page
+
+        Returns:
+            Tuple of (topics, next page cursor or None on the last page)
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed
+        """
+        conditions, params = _topic_filter_conditions(category, language)
+
+        if cursor:
+            last_updated, topic_id = decode_cursor("topics", cursor, 2)
+            try:
+                params.extend([datetime.fromisoformat(last_updated), UUID(str(topic_id))])
+            except (TypeError, ValueError) as e:
+                raise InvalidCursorError(f"Invalid cursor: {e}") from e
+            conditions.append(f"(last_updated, id) < (${len(params) - 1}, ${len(params)})")
+
+        try:
+            where_clause = " AND ".join(conditions) if conditions else "TRUE"
+            query = f"""
+                SELECT * FROM topics
+                WHERE {where_clause}
+                ORDER BY last_updated DESC, id DESC
+                LIMIT ${len(params) + 1}
+            """
+            # One extra row tells whether another page follows
+            params.append(limit + 1)
+
+            rows = await self.pool.fetch(query, *params)
+
+        except Exception as e:
+            logger.error(f"Failed to get topic page: {e}")
+            raise StorageError(f"Failed to get topic page: {e}")
+
+        topics = [_row_to_topic(row) for row in rows[:limit]]
+        next_cursor = None
+        if len(rows) > limit:
+            last = topics[-1]
+            next_cursor = encode_cursor("topics", [last.last_updated.isoformat(), str(last.id)])
+        return topics, next_cursor
+
     async def update(self, topic_id: UUID, updates: Dict[str, Any]) -> bool:
         """
         Update a topic.
@@ -858,32 +1559,64 @@ class PostgreSQLTopicRepository:
             logger.error(f"Failed to delete topic {topic_id}: {e}")
             raise StorageError(f"Failed to delete topic: {e}")
 
-    async def get_by_keyword(self, keyword: str, limit: int = 10) -> List[Topic]:
+    async def search_text(
+        self,
+        query: str,
+        category: Optional[str] = None,
+        language: Optional[str] = None,
+        limit: int = 20,
+    ) -> List[Tuple[Topic, float]]:
         """
-        Get topics containing a specific keyword.
+        Full-text search over topic titles, keywords and summaries.
+
+        Ranked like ``PostgreSQLTrendRepository.search_text``.
 
         Args:
-            keyword: Keyword to search for
+            query: Search text (web search syntax: "quoted phrase", or, -term)
+            category: Optional category filter
+            language: Optional language filter
             limit: Maximum results to return
 
         Returns:
-            List of matching topics
+            List of (topic, relevance) tuples, most relevant first
         """
         try:
-            query = """
-                SELECT * FROM topics
-                WHERE $1 = ANY(keywords)
-                   OR title ILIKE '%' || $1 || '%'
-                   OR summary ILIKE '%' || $1 || '%'
-                ORDER BY last_updated DESC
-                LIMIT $2
+            params: List[Any] = [query]
+            conditions = [_TEXT_MATCH_CONDITION]
+            if category:
+                params.append(category)
+                conditions.append(f"category = ${len(params)}")
+            if language:
+                params.append(language)
+                conditions.append(f"language = ${len(params)}")
+            params.append(limit)
+
+            sql = f"""
+                SELECT topics.*, {_TEXT_RELEVANCE} AS relevance
+                FROM topics, websearch_to_tsquery('english', $1) AS tsq
+                WHERE {' AND '.join(conditions)}
+                ORDER BY relevance DESC, last_updated DESC
+                LIMIT ${len(params)}
             """
-            rows = await self.pool.fetch(query, keyword, limit)
-            return [_row_to_topic(row) for row in rows]
+            rows = await self.pool.fetch(sql, *params)
+            return [(_row_to_topic(row), row["relevance"]) for row in rows]
 
         except Exception as e:
-            logger.error(f"Failed to search topics by keyword '{keyword}': {e}")
-            raise StorageError(f"Failed to search topics by keyword: {e}")
+            logger.error(f"Failed to text-search topics for '{query}': {e}")
+            raise StorageError(f"Failed to text-search topics: {e}")
+
+    async def get_by_keyword(self, keyword: str, limit: int = 10) -> List[Topic]:
+        """
+        Get topics matching a keyword, most relevant first.
+
+        Args:
+            keyword: Keyword to search for
+            limit: Maximum results to return
+
+        Returns:
+            List of matching topics
+        """
+        return [topic for topic, _ in await self.search_text(keyword, limit=limit)]
 
     async def count(self) -> int:
         """
@@ -900,6 +1633,22 @@ class PostgreSQLTopicRepository:
             logger.error(f"Failed to count topics: {e}")
             raise StorageError(f"Failed to count topics: {e}")
 
+    async def estimate_count(
+        self, category: Optional[str] = None, language: Optional[str] = None
+    ) -> int:
+        """
+        Estimate the number of topics matching filters without scanning them.
+
+        Args:
+            category: Optional category filter
+            language: Optional language filter
+
+        Returns:
+            Estimated number of matching topics
+        """
+        conditions, params = _topic_filter_conditions(category, language)
+        return await _estimate_count(self.pool, "topics", conditions, params)
+
     async def get_items_by_topic(
         self,
         topic_id: UUID,
@@ -1048,20 +1797,38 @@ class PostgreSQLItemRepository:
         """
         Save multiple items in a batch.
 
+        Rows are upserted on (source, source_id) with a single COPY and
+        INSERT ... ON CONFLICT on one connection and transaction. If the
+        batch repeats a (source, source_id), the last occurrence wins.
+
         Args:
             items: List of items to save
 
         Returns:
-            List of saved item IDs
+            List of saved item IDs, in input order (existing rows keep
+            their database ID)
         """
+        if not items:
+            return []
+
         try:
-            # Use executemany for batch insert
-            item_ids = []
+            records = [_item_to_record(item) for item in items]
+            unique_records = _dedupe_records(records, lambda r: (r[1], r[2]))
+
             async with self.pool.acquire() as conn:
                 async with conn.transaction():
-                    for item in items:
-                        item_id = await self.save(item)
-                        item_ids.append(item_id)
+                    rows = await _bulk_upsert(
+                        conn,
+                        "processed_items",
+                        _ITEM_COLUMNS,
+                        unique_records,
+                        conflict_columns=["source", "source_id"],
+                        update_columns=_ITEM_UPDATE_COLUMNS,
+                        returning=["id", "source::text AS source", "source_id"],
+                    )
+
+            ids_by_key = {(row["source"], row["source_id"]): row["id"] for row in rows}
+            item_ids = [ids_by_key[(r[1], r[2])] for r in records]
 
             logger.debug(f"Saved batch of {len(item_ids)} items")
             return item_ids
@@ -1138,6 +1905,111 @@ class PostgreSQLItemRepository:
             logger.error(f"Failed to check item existence {source}/{source_id}: {e}")
             raise StorageError(f"Failed to check item existence: {e}")
 
+    async def get_recent_metrics(self, days: int = 7) -> List[Tuple[str, str, Metrics]]:
+        """
+        Get (source, source_id, metrics) of recently collected items.
+
+        Used to warm ingest-time duplicate filters without loading rows.
+
+        Args:
+            days: Only items collected within this many days
+
+        Returns:
+            List of (source, source_id, metrics) tuples
+        """
+        try:
+            query = """
+                SELECT source::text AS source, source_id, metrics
+                FROM processed_items
+                WHERE collected_at > NOW() - make_interval(days => $1)
+            """
+            rows = await self.pool.fetch(query, days)
+            return [
+                (row["source"], row["source_id"], _jsonb_to_metrics(row["metrics"]))
+                for row in rows
+            ]
+
+        except Exception as e:
+            logger.error(f"Failed to get recent item metrics: {e}")
+            raise StorageError(f"Failed to get recent item metrics: {e}")
+
+    async def get_metrics_by_keys(
+        self, keys: List[Tuple[str, str]]
+    ) -> List[Tuple[str, str, Metrics]]:
+        """
+        Get (source, source_id, metrics) of the stored items among keys.
+
+        One SELECT joined against unnest() of the keys; keys without a row
+        are left out.
+
+        Args:
+            keys: (source, source_id) pairs
+
+        Returns:
+            List of (source, source_id, metrics) tuples
+        """
+        if not keys:
+            return []
+
+        try:
+            query = """
+                SELECT p.source::text AS source, p.source_id, p.metrics
+                FROM processed_items AS p
+                JOIN unnest($1::text[], $2::text[]) AS k(source, source_id)
+                    ON p.source = k.source::source_type AND p.source_id = k.source_id
+            """
+            rows = await self.pool.fetch(
+                query,
+                [source for source, _ in keys],
+                [source_id for _, source_id in keys],
+            )
+            return [
+                (row["source"], row["source_id"], _jsonb_to_metrics(row["metrics"]))
+                for row in rows
+            ]
+
+        except Exception as e:
+            logger.error(f"Failed to get item metrics by key: {e}")
+            raise StorageError(f"Failed to get item metrics by key: {e}")
+
+    async def update_metrics_batch(self, items: List[ProcessedItem]) -> int:
+        """
+        Update only the metrics of existing items.
+
+        One UPDATE ... FROM unnest() keyed on (source, source_id); cheaper
+        than a full upsert when nothing but engagement changed.
+
+        Args:
+            items: Items carrying the new metrics
+
+        Returns:
+            Number of rows updated
+        """
+        if not items:
+            return 0
+
+        try:
+            query = """
+                UPDATE processed_items AS p
+                SET metrics = u.metrics::jsonb
+                FROM unnest($1::text[], $2::text[], $3::text[]) AS u(source, source_id, metrics)
+                WHERE p.source = u.source::source_type AND p.source_id = u.source_id
+            """
+            result = await self.pool.execute(
+                query,
+                [item.source.value for item in items],
+                [item.source_id for item in items],
+                [_metrics_to_jsonb(item.metrics) for item in items],
+            )
+            updated = int(result.split()[-1])
+
+            logger.debug(f"Updated metrics of {updated} items")
+            return updated
+
+        except Exception as e:
+            logger.error(f"Failed to update item metrics: {e}")
+            raise StorageError(f"Failed to update item metrics: {e}")
+
     async def delete_older_than(self, days: int) -> int:
         """
         Delete items older than specified days.
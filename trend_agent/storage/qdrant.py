@@ -2,16 +2,18 @@
 Qdrant vector database repository implementation.
 
 This module provides a Qdrant-based implementation of the VectorRepository
-interface for storing and searching vector embeddings.
+interface for storing and searching vector embeddings. All calls go through
+the async Qdrant client, so vector queries never block the event loop.
 """
 
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 from uuid import UUID
 
-from qdrant_client import QdrantClient
+import httpx
+from qdrant_client import AsyncQdrantClient
 from qdrant_client.http import models
-from qdrant_client.http.exceptions import UnexpectedResponse
+from qdrant_client.http.exceptions import ResponseHandlingException, UnexpectedResponse
 from qdrant_client.http.models import (
     Distance,
     FieldCondition,
@@ -36,7 +38,8 @@ class QdrantVectorRepository(BaseVectorRepository):
     Qdrant implementation of VectorRepository.
 
     This implementation uses Qdrant vector database for efficient similarity
-    search on high-dimensional embeddings.
+    search on high-dimensional embeddings. Requests share one keep-alive
+    HTTP connection pool of ``pool_size`` connections.
     """
 
     def __init__(
@@ -48,6 +51,7 @@ class QdrantVectorRepository(BaseVectorRepository):
         distance_metric: str = "Cosine",
         api_key: Optional[str] = None,
         timeout: int = 30,
+        pool_size: int = 20,
     ):
         """
         Initialize Qdrant vector repository.
@@ -60,6 +64,7 @@ class QdrantVectorRepository(BaseVectorRepository):
             distance_metric: Distance metric (Cosine, Euclid, Dot)
             api_key: Optional API key for authentication
             timeout: Request timeout in seconds
+            pool_size: Maximum pooled HTTP connections to Qdrant
         """
         self.host = host
         self.port = port
@@ -67,22 +72,23 @@ class QdrantVectorRepository(BaseVectorRepository):
         self.vector_size = vector_size
         self.distance_metric = distance_metric
         self.timeout = timeout
+        self._collection_ready = False
 
         try:
-            # Initialize Qdrant client
-            if api_key:
-                self.client = QdrantClient(
-                    host=host,
-                    port=port,
-                    api_key=api_key,
-                    timeout=timeout,
-                )
-            else:
-                self.client = QdrantClient(
-                    host=host,
-                    port=port,
-                    timeout=timeout,
-                )
+            # Initialize async Qdrant client; keep-alive is set explicitly
+            # because the client disables it for localhost by default, and
+            # the version check is skipped since it is a blocking request
+            self.client = AsyncQdrantClient(
+                host=host,
+                port=port,
+                api_key=api_key,
+                timeout=timeout,
+                check_compatibility=False,
+                limits=httpx.Limits(
+                    max_connections=pool_size,
+                    max_keepalive_connections=pool_size,
+                ),
+            )
 
             logger.info(f"Connected to Qdrant at {host}:{port}")
 
@@ -95,9 +101,13 @@ class QdrantVectorRepository(BaseVectorRepository):
         Ensure the collection exists, create it if it doesn't.
 
         This is called automatically by operations that need the collection.
+        The check runs once per repository instance.
         """
+        if self._collection_ready:
+            return
+
         try:
-            collections = self.client.get_collections().collections
+            collections = (await self.client.get_collections()).collections
             collection_exists = any(
                 c.name == self.collection_name for c in collections
             )
@@ -111,7 +121,7 @@ class QdrantVectorRepository(BaseVectorRepository):
                 }
                 distance = distance_map.get(self.distance_metric, Distance.COSINE)
 
-                self.client.create_collection(
+                await self.client.create_collection(
                     collection_name=self.collection_name,
                     vectors_config=VectorParams(
                         size=self.vector_size,
@@ -120,6 +130,8 @@ class QdrantVectorRepository(BaseVectorRepository):
                 )
                 logger.info(f"Created Qdrant collection: {self.collection_name}")
 
+            self._collection_ready = True
+
         except Exception as e:
             logger.error(f"Failed to ensure collection exists: {e}")
             raise StorageError(f"Collection initialization failed: {e}")
@@ -162,7 +174,7 @@ class QdrantVectorRepository(BaseVectorRepository):
             )
 
             # Upsert the point
-            self.client.upsert(
+            await self.client.upsert(
                 collection_name=self.collection_name,
                 points=[point],
             )
@@ -218,8 +230,8 @@ class QdrantVectorRepository(BaseVectorRepository):
                 logger.warning("No valid vectors to upsert in batch")
                 return False
 
-            # Batch upsert - Qdrant handles this efficiently
-            self.client.upsert(
+            # Batch upsert; concurrent batches overlap their network time
+            await self.client.upsert(
                 collection_name=self.collection_name,
                 points=points,
             )
@@ -229,7 +241,10 @@ class QdrantVectorRepository(BaseVectorRepository):
 
         except Exception as e:
             logger.error(f"Failed to batch upsert vectors: {e}")
-            raise StorageError(f"Batch vector upsert failed: {e}")
+            if _is_transport_error(e):
+                # Server unreachable or overloaded: retrying smaller batches won't help
+                raise ConnectionError(f"Batch vector upsert failed: {e}") from e
+            raise StorageError(f"Batch vector upsert failed: {e}") from e
 
     async def search(
         self,
@@ -263,34 +278,19 @@ class QdrantVectorRepository(BaseVectorRepository):
                     f"Query vector dimension {len(vector)} does not match expected {self.vector_size}"
                 )
 
-            # Build filter conditions if provided
-            query_filter = None
-            if filters:
-                # Convert dict filters to Qdrant Filter
-                conditions = []
-                for key, value in filters.items():
-                    conditions.append(
-                        FieldCondition(
-                            key=key,
-                            match=MatchValue(value=value),
-                        )
-                    )
-
-                if conditions:
-                    query_filter = Filter(must=conditions)
-
             # Execute search
-            search_result = self.client.search(
+            response = await self.client.query_points(
                 collection_name=self.collection_name,
-                query_vector=vector,
+                query=vector,
                 limit=limit,
-                query_filter=query_filter,
+                query_filter=_build_filter(filters),
                 score_threshold=min_score,
+                with_payload=True,
             )
 
             # Convert results to VectorMatch objects
             matches = []
-            for hit in search_result:
+            for hit in response.points:
                 match = VectorMatch(
                     id=str(hit.id),
                     score=hit.score,
@@ -328,7 +328,7 @@ class QdrantVectorRepository(BaseVectorRepository):
             await self._ensure_collection_exists()
 
             # Retrieve the point by ID
-            points = self.client.retrieve(
+            points = await self.client.retrieve(
                 collection_name=self.collection_name,
                 ids=[id],
                 with_vectors=True,
@@ -371,7 +371,7 @@ class QdrantVectorRepository(BaseVectorRepository):
             await self._ensure_collection_exists()
 
             # Delete the point
-            self.client.delete(
+            await self.client.delete(
                 collection_name=self.collection_name,
                 points_selector=models.PointIdsList(
                     points=[id],
@@ -400,7 +400,7 @@ class QdrantVectorRepository(BaseVectorRepository):
             await self._ensure_collection_exists()
 
             # Get collection info
-            collection_info = self.client.get_collection(
+            collection_info = await self.client.get_collection(
                 collection_name=self.collection_name
             )
 
@@ -426,7 +426,8 @@ class QdrantVectorRepository(BaseVectorRepository):
             StorageError: If deletion fails
         """
         try:
-            self.client.delete_collection(collection_name=self.collection_name)
+            await self.client.delete_collection(collection_name=self.collection_name)
+            self._collection_ready = False
             logger.info(f"Deleted Qdrant collection: {self.collection_name}")
             return True
 
@@ -461,7 +462,7 @@ class QdrantVectorRepository(BaseVectorRepository):
             schema_type = schema_map.get(field_type, models.PayloadSchemaType.KEYWORD)
 
             # Create index
-            self.client.create_payload_index(
+            await self.client.create_payload_index(
                 collection_name=self.collection_name,
                 field_name=field_name,
                 field_schema=schema_type,
@@ -475,68 +476,143 @@ class QdrantVectorRepository(BaseVectorRepository):
             logger.error(f"Failed to create payload index: {e}")
             raise StorageError(f"Payload index creation failed: {e}")
 
-    async def scroll_all(
+    async def delete_batch(self, ids: List[str]) -> int:
+        """
+        Delete vectors by ID in one request.
+
+        Args:
+            ids: Vector identifiers
+
+        Returns:
+            Number of IDs submitted for deletion
+
+        Raises:
+            StorageError: If deletion fails
+        """
+        if not ids:
+            return 0
+
+        try:
+            await self._ensure_collection_exists()
+
+            await self.client.delete(
+                collection_name=self.collection_name,
+                points_selector=models.PointIdsList(points=ids),
+            )
+
+            logger.debug(f"Deleted {len(ids)} vectors from Qdrant")
+            return len(ids)
+
+        except Exception as e:
+            logger.error(f"Failed to delete {len(ids)} vectors: {e}")
+            raise StorageError(f"Batch vector deletion failed: {e}")
+
+    async def scroll_iter(
         self,
-        batch_size: int = 100,
+        batch_size: int = 256,
         filters: Optional[Dict[str, Any]] = None,
-    ) -> List[tuple[str, List[float], Dict[str, Any]]]:
+        with_vectors: bool = True,
+    ) -> AsyncIterator[List[tuple[str, Optional[List[float]], Dict[str, Any]]]]:
         """
-        Scroll through all vectors in the collection.
+        Stream the collection one page at a time.
 
-        Useful for batch processing or migration.
+        Only one page is held in memory, so jobs that walk every vector
+        (cleanup, re-indexing) run in constant memory.
 
         Args:
-            batch_size: Number of vectors to fetch per batch
+            batch_size: Number of vectors per page
             filters: Optional metadata filters
+            with_vectors: Whether to fetch vectors (False returns None
+                vectors and is much cheaper when only IDs/payloads are needed)
 
-        Returns:
-            List of (id, vector, metadata) tuples
+        Yields:
+            Lists of (id, vector, metadata) tuples
 
         Raises:
             StorageError: If scroll fails
         """
         try:
-            # Ensure collection exists
             await self._ensure_collection_exists()
-
-            # Build filter if provided
-            query_filter = None
-            if filters:
-                conditions = []
-                for key, value in filters.items():
-                    conditions.append(
-                        FieldCondition(
-                            key=key,
-                            match=MatchValue(value=value),
-                        )
-                    )
-                if conditions:
-                    query_filter = Filter(must=conditions)
-
-            # Scroll through all points
-            all_vectors = []
+            query_filter = _build_filter(filters)
             offset = None
 
             while True:
-                result, offset = self.client.scroll(
+                points, offset = await self.client.scroll(
                     collection_name=self.collection_name,
                     limit=batch_size,
                     offset=offset,
-                    with_vectors=True,
+                    with_vectors=with_vectors,
                     with_payload=True,
                     scroll_filter=query_filter,
                 )
 
-                for point in result:
-                    all_vectors.append((str(point.id), point.vector, point.payload or {}))
+                if points:
+                    yield [
+                        (str(point.id), point.vector if with_vectors else None, point.payload or {})
+                        for point in points
+                    ]
 
-                # Break if no more results
+                # Stop when there are no more pages
                 if offset is None:
                     break
 
-            logger.info(f"Scrolled {len(all_vectors)} vectors from Qdrant")
-            return all_vectors
-
+        except StorageError:
+            raise
         except Exception as e:
             logger.error(f"Failed to scroll vectors: {e}")
             raise StorageError(f"Vector scroll failed: {e}")
+
+    async def scroll_all(
+        self,
+        batch_size: int = 100,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[tuple[str, List[float], Dict[str, Any]]]:
+        """
+        Scroll through all vectors in the collection.
+
+        Loads the whole collection into memory; prefer scroll_iter() for
+        large collections.
+
+        Args:
+            batch_size: Number of vectors to fetch per batch
+            filters: Optional metadata filters
+
+        Returns:
+            List of (id, vector, metadata) tuples
+
+        Raises:
+            StorageError: If scroll fails
+        """
+        all_vectors = []
+        async for page in self.scroll_iter(batch_size=batch_size, filters=filters):
+            all_vectors.extend(page)
+
+        logger.info(f"Scrolled {len(all_vectors)} vectors from Qdrant")
+        return all_vectors
+
+    async def close(self) -> None:
+        """Close the client and its connection pool."""
+        await self.client.close()
+
+
+def _build_filter(filters: Optional[Dict[str, Any]]) -> Optional[Filter]:
+    """Convert exact-match metadata filters to a Qdrant Filter."""
+    if not filters:
+        return None
+
+    conditions = [
+        FieldCondition(key=key, match=MatchValue(value=value))
+        for key, value in filters.items()
+    ]
+    return Filter(must=conditions)
+
+
+def _is_transport_error(error: Exception) -> bool:
+    """Whether an error means Qdrant was unreachable or overloaded, not that the request was bad."""
+    if isinstance(error, UnexpectedResponse):
+        return error.status_code is not None and (
+            error.status_code >= 500 or error.status_code == 429
+        )
+    return isinstance(
+        error, (ResponseHandlingException, httpx.TransportError, OSError, TimeoutError)
+    )
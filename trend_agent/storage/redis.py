@@ -5,14 +5,15 @@ This module provides a Redis-based implementation of the CacheRepository
 interface for high-performance caching operations.
 """
 
+import heapq
 import json
 import logging
 import pickle
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import redis.asyncio as aioredis
 from redis.asyncio import Redis
-from redis.exceptions import RedisError
+from redis.exceptions import RedisError, WatchError
 
 from trend_agent.storage.interfaces import ConnectionError, StorageError
 
@@ -27,6 +28,31 @@ class RedisCacheRepository:
     optional TTL (time-to-live) support.
     """
 
+    # How long a tag's invalidation counter outlives its last invalidation
+    GENERATION_TTL_SECONDS = 86400
+
+    # How long readers may keep using a replaced prefix index version
+    PREFIX_INDEX_RETIRE_SECONDS = 60
+
+    # Entries (or retired keys) per pipeline when rebuilding a prefix index
+    PREFIX_INDEX_CHUNK_SIZE = 1000
+
+    # Attempts of an index update racing with rebuilds
+    PREFIX_INDEX_MAX_ATTEMPTS = 5
+
+    # Raise each member's weight, and its display text with it, only if the
+    # new weight is higher. ARGV holds (member, text, weight) triples.
+    PREFIX_ENTRY_SCRIPT = """
+for i = 1, #ARGV, 3 do
+    local current = redis.call('ZSCORE', KEYS[1], ARGV[i])
+    if not current or tonumber(current) < tonumber(ARGV[i + 2]) then
+        redis.call('ZADD', KEYS[1], ARGV[i + 2], ARGV[i])
+        redis.call('HSET', KEYS[2], ARGV[i], ARGV[i + 1])
+    end
+end
+return 0
+"""
+
     def __init__(
         self,
         host: str = "localhost",
@@ -60,6 +86,7 @@ class RedisCacheRepository:
         self.decode_responses = decode_responses
         self.max_connections = max_connections
         self._client: Optional[Redis] = None
+        self._prefix_script = None
 
     async def connect(self) -> Redis:
         """
@@ -98,6 +125,7 @@ class RedisCacheRepository:
         if self._client is not None:
             await self._client.close()
             self._client = None
+            self._prefix_script = None
             logger.info("Redis connection closed")
 
     @property
@@ -209,6 +237,531 @@ class RedisCacheRepository:
             logger.error(f"Failed to set cache key '{key}': {e}")
             raise StorageError(f"Cache set failed: {e}")
 
+    async def get_many(self, keys: List[str]) -> List[Optional[Any]]:
+        """
+        Get multiple values from cache in one round trip (MGET).
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Cached values in key order (None for misses)
+
+        Raises:
+            StorageError: If retrieval fails
+        """
+        if not keys:
+            return []
+
+        try:
+            data = await self.client.mget(keys)
+            values = [self._deserialize(item) for item in data]
+
+            hits = sum(1 for value in values if value is not None)
+            logger.debug(f"Cache MGET: {hits}/{len(keys)} hits")
+            return values
+
+        except RedisError as e:
+            logger.error(f"Failed to get {len(keys)} cache keys: {e}")
+            raise StorageError(f"Cache batch retrieval failed: {e}")
+
+    async def set_many(
+        self,
+        mapping: Dict[str, Any],
+        ttl_seconds: Optional[int] = None,
+    ) -> bool:
+        """
+        Set multiple values in cache in one pipelined round trip.
+
+        Args:
+            mapping: Dictionary of key -> value
+            ttl_seconds: Time-to-live in seconds (None = use default)
+
+        Returns:
+            True if successful
+
+        Raises:
+            StorageError: If set operation fails
+        """
+        if not mapping:
+            return True
+
+        try:
+            ttl = ttl_seconds if ttl_seconds is not None else self.default_ttl
+
+            async with self.client.pipeline(transaction=False) as pipe:
+                for key, value in mapping.items():
+                    data = self._serialize(value)
+                    if ttl > 0:
+                        pipe.setex(key, ttl, data)
+                    else:
+                        pipe.set(key, data)
+                await pipe.execute()
+
+            logger.debug(f"Cached {len(mapping)} keys with TTL={ttl}s")
+            return True
+
+        except RedisError as e:
+            logger.error(f"Failed to set {len(mapping)} cache keys: {e}")
+            raise StorageError(f"Cache batch set failed: {e}")
+
+    async def set_if_not_exists(
+        self,
+        key: str,
+        value: Any,
+        ttl_seconds: Optional[int] = None,
+    ) -> bool:
+        """
+        Set a value only if the key does not exist (SET NX).
+
+        Useful as a short-lived lock, e.g. to let one worker refresh an
+        expired cache entry.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl_seconds: Time-to-live in seconds (None = use default)
+
+        Returns:
+            True if the key was set, False if it already existed
+
+        Raises:
+            StorageError: If set operation fails
+        """
+        try:
+            ttl = ttl_seconds if ttl_seconds is not None else self.default_ttl
+            result = await self.client.set(
+                key, self._serialize(value), ex=ttl if ttl > 0 else None, nx=True
+            )
+            return bool(result)
+
+        except RedisError as e:
+            logger.error(f"Failed to set cache key '{key}' (NX): {e}")
+            raise StorageError(f"Cache set failed: {e}")
+
+    async def set_with_tags(
+        self,
+        key: str,
+        value: Any,
+        tags: List[str],
+        ttl_seconds: Optional[int] = None,
+        tag_ttl_seconds: int = 86400,
+        generations: Optional[List[int]] = None,
+    ) -> bool:
+        """
+        Set a value and register its key in one Redis set per tag.
+
+        Tag sets let ``invalidate_tags`` delete exactly the keys that depend
+        on changed data, without scanning the keyspace.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            tags: Tags the value depends on
+            ttl_seconds: Time-to-live in seconds (None = use default)
+            tag_ttl_seconds: Time-to-live of the tag sets (should exceed
+                the TTL of every tagged key)
+            generations: Tag generations read (``get_tag_generations``)
+                before the value was computed. If given, the write is
+                skipped when any tag was invalidated since then.
+
+        Returns:
+            True if the value was written, False if it was skipped because
+            a tag was invalidated
+
+        Raises:
+            StorageError: If set operation fails
+        """
+        try:
+            ttl = ttl_seconds if ttl_seconds is not None else self.default_ttl
+            data = self._serialize(value)
+
+            async with self.client.pipeline(transaction=generations is not None) as pipe:
+                if generations is not None:
+                    gen_keys = [self._generation_key(tag) for tag in tags]
+                    if gen_keys:
+                        await pipe.watch(*gen_keys)
+                        current = await pipe.mget(gen_keys)
+                        if [int(g or 0) for g in current] != list(generations):
+                            logger.debug(f"Skipped caching '{key}': tags invalidated")
+                            return False
+                    pipe.multi()
+
+                if ttl > 0:
+                    pipe.setex(key, ttl, data)
+                else:
+                    pipe.set(key, data)
+                for tag in tags:
+                    tag_key = self._tag_key(tag)
+                    pipe.sadd(tag_key, key)
+                    pipe.expire(tag_key, tag_ttl_seconds)
+                await pipe.execute()
+
+            logger.debug(f"Cached key '{key}' with TTL={ttl}s and {len(tags)} tags")
+            return True
+
+        except WatchError:
+            logger.debug(f"Skipped caching '{key}': tags invalidated during write")
+            return False
+
+        except RedisError as e:
+            logger.error(f"Failed to set cache key '{key}' with tags: {e}")
+            raise StorageError(f"Cache set failed: {e}")
+
+    async def get_tag_generations(self, tags: List[str]) -> List[int]:
+        """
+        Get how many times each tag has been invalidated.
+
+        Callers read the generations before computing a value and pass them
+        to ``set_with_tags`` so a value computed from data that changed in
+        the meantime is not cached.
+
+        Args:
+            tags: Tags to look up
+
+        Returns:
+            Generation of each tag, in input order (0 if never invalidated)
+
+        Raises:
+            StorageError: If retrieval fails
+        """
+        if not tags:
+            return []
+
+        try:
+            values = await self.client.mget([self._generation_key(tag) for tag in tags])
+            return [int(value or 0) for value in values]
+
+        except RedisError as e:
+            logger.error(f"Failed to get tag generations: {e}")
+            raise StorageError(f"Cache retrieval failed: {e}")
+
+    async def invalidate_tags(self, tags: List[str]) -> int:
+        """
+        Delete every key registered under the given tags.
+
+        Costs two round trips and O(tags + tagged keys) work in Redis,
+        independent of the total number of keys.
+
+        Also bumps each tag's generation, so values computed before the
+        invalidation are not cached afterwards (see ``set_with_tags``).
+
+        Args:
+            tags: Tags to invalidate
+
+        Returns:
+            Number of cached keys deleted
+
+        Raises:
+            StorageError: If invalidation fails
+        """
+        if not tags:
+            return 0
+
+        try:
+            tag_keys = [self._tag_key(tag) for tag in tags]
+
+            async with self.client.pipeline(transaction=False) as pipe:
+                for tag_key in tag_keys:
+                    pipe.smembers(tag_key)
+                members = await pipe.execute()
+
+            keys = set()
+            for tag_members in members:
+                keys.update(tag_members)
+
+            async with self.client.pipeline(transaction=False) as pipe:
+                if keys:
+                    pipe.delete(*keys)
+                pipe.delete(*tag_keys)
+                for tag in tags:
+                    gen_key = self._generation_key(tag)
+                    pipe.incr(gen_key)
+                    pipe.expire(gen_key, self.GENERATION_TTL_SECONDS)
+                results = await pipe.execute()
+            deleted = results[0] if keys else 0
+
+            logger.debug(f"Invalidated {deleted} keys for {len(tags)} tags")
+            return deleted
+
+        except RedisError as e:
+            logger.error(f"Failed to invalidate cache tags {tags}: {e}")
+            raise StorageError(f"Cache invalidation failed: {e}")
+
+    def _tag_key(self, tag: str) -> str:
+        """Get the Redis key of a tag set."""
+        return f"cache:tag:{tag}"
+
+    def _generation_key(self, tag: str) -> str:
+        """Get the Redis key of a tag's invalidation counter."""
+        return f"cache:gen:{tag}"
+
+    async def prefix_index_add(
+        self,
+        key: str,
+        entries: Dict[str, Tuple[str, float]],
+        top_k: int = 20,
+        max_prefix_length: int = 10,
+    ) -> int:
+        """
+        Add entries to a weighted prefix index.
+
+        Every prefix of a member up to ``max_prefix_length`` characters has
+        a sorted set of its ``top_k`` heaviest members, so a lookup reads
+        the best completions directly instead of scanning matches. Longer
+        prefixes are answered from a lexicographic set of all members.
+
+        A member's weight only ever increases, and its display text is
+        replaced only together with its weight, so concurrent writers keep
+        the text of the heaviest entry.
+
+        Nothing is written if the index does not exist, so a flushed index
+        is not replaced by a partial one; (re)build it with
+        ``prefix_index_replace``.
+
+        Args:
+            key: Index key
+            entries: Member -> (display text, weight)
+            top_k: Members kept per prefix
+            max_prefix_length: Longest prefix with a top-k set
+
+        Returns:
+            Number of entries written (0 if the index does not exist)
+
+        Raises:
+            StorageError: If the write fails
+        """
+        if not entries:
+            return 0
+
+        version_key = self._prefix_version_key(key)
+        try:
+            for _ in range(self.PREFIX_INDEX_MAX_ATTEMPTS):
+                try:
+                    async with self.client.pipeline(transaction=True) as pipe:
+                        # A rebuild switching versions makes the write retry
+                        # against the new version
+                        await pipe.watch(version_key)
+                        version = await pipe.get(version_key)
+                        if version is None:
+                            return 0
+                        pipe.multi()
+                        await self._queue_prefix_entries(
+                            pipe, self._prefix_base(key, version), entries, top_k, max_prefix_length
+                        )
+                        await pipe.execute()
+                    return len(entries)
+                except WatchError:
+                    logger.debug(f"Prefix index '{key}' switched versions, retrying add")
+
+            raise StorageError(f"Prefix index '{key}' kept switching versions during add")
+
+        except RedisError as e:
+            logger.error(f"Failed to add {len(entries)} entries to prefix index '{key}': {e}")
+            raise StorageError(f"Prefix index update failed: {e}")
+
+    async def prefix_index_replace(
+        self,
+        key: str,
+        entries: Dict[str, Tuple[str, float]],
+        top_k: int = 20,
+        max_prefix_length: int = 10,
+    ) -> int:
+        """
+        Atomically replace the contents of a weighted prefix index.
+
+        The new index is written under a new version and published by
+        switching the version pointer, so readers never see a partial
+        index. Keys of the previous version expire shortly after.
+
+        Args:
+            key: Index key
+            entries: Member -> (display text, weight)
+            top_k: Members kept per prefix
+            max_prefix_length: Longest prefix with a top-k set
+
+        Returns:
+            Number of members in the new index
+
+        Raises:
+            StorageError: If the write fails
+        """
+        version = None
+        try:
+            version = await self.client.incr(self._prefix_counter_key(key))
+            base = self._prefix_base(key, version)
+
+            items = sorted(entries.items())
+            for start in range(0, len(items), self.PREFIX_INDEX_CHUNK_SIZE):
+                chunk = dict(items[start:start + self.PREFIX_INDEX_CHUNK_SIZE])
+                async with self.client.pipeline(transaction=False) as pipe:
+                    await self._queue_prefix_entries(pipe, base, chunk, top_k, max_prefix_length)
+                    await pipe.execute()
+
+            previous = await self.client.set(self._prefix_version_key(key), version, get=True)
+            if previous is not None:
+                await self._retire_prefix_version(key, previous)
+
+            logger.debug(f"Rebuilt prefix index '{key}' with {len(entries)} entries")
+            return len(entries)
+
+        except RedisError as e:
+            logger.error(f"Failed to rebuild prefix index '{key}': {e}")
+            if version is not None:
+                try:
+                    await self._retire_prefix_version(key, version)
+                except RedisError:
+                    pass
+            raise StorageError(f"Prefix index rebuild failed: {e}")
+
+    async def prefix_index_lookup(
+        self, key: str, prefix: str, limit: int, max_prefix_length: int = 10
+    ) -> Optional[List[Tuple[str, str, float]]]:
+        """
+        Get the heaviest index members starting with a prefix.
+
+        Prefixes up to ``max_prefix_length`` characters read their top-k
+        set (O(log n + limit)); longer prefixes read every matching member.
+
+        Args:
+            key: Index key
+            prefix: Member prefix
+            limit: Maximum members to return (at most the index's top_k
+                for short prefixes)
+            max_prefix_length: Longest prefix with a top-k set (as written)
+
+        Returns:
+            List of (member, display text, weight), heaviest first, or
+            None if the index does not exist (never written, or flushed)
+
+        Raises:
+            StorageError: If the lookup fails
+        """
+        try:
+            version = await self.client.get(self._prefix_version_key(key))
+            if version is None:
+                return None
+            base = self._prefix_base(key, version)
+
+            if len(prefix) <= max_prefix_length:
+                scored = await self.client.zrange(
+                    f"{base}:top:{prefix}", 0, limit - 1, withscores=True
+                )
+                members = [member for member, _ in scored]
+                weights = [-score for _, score in scored]
+                texts = await self.client.hmget(f"{base}:text", members) if members else []
+            else:
+                low = b"[" + prefix.encode(self.encoding)
+                members = await self.client.zrangebylex(f"{base}:lex", low, low + b"\xff")
+                if not members:
+                    return []
+                async with self.client.pipeline(transaction=False) as pipe:
+                    pipe.zmscore(f"{base}:weight", members)
+                    pipe.hmget(f"{base}:text", members)
+                    weights, texts = await pipe.execute()
+
+            results = [
+                (self._decode(member), self._decode(text), weight)
+                for member, text, weight in zip(members, texts, weights)
+                if text is not None and weight is not None
+            ]
+            results.sort(key=lambda result: (-result[2], result[0]))
+            return results[:limit]
+
+        except RedisError as e:
+            logger.error(f"Failed to read prefix index '{key}' for prefix '{prefix}': {e}")
+            raise StorageError(f"Prefix index lookup failed: {e}")
+
+    async def prefix_index_exists(self, key: str) -> bool:
+        """
+        Check if a prefix index has been written.
+
+        Args:
+            key: Index key
+
+        Returns:
+            True if the index exists (it may be empty)
+
+        Raises:
+            StorageError: If the check fails
+        """
+        try:
+            return await self.client.exists(self._prefix_version_key(key)) > 0
+        except RedisError as e:
+            logger.error(f"Failed to check prefix index '{key}': {e}")
+            raise StorageError(f"Prefix index check failed: {e}")
+
+    async def _queue_prefix_entries(
+        self,
+        pipe,
+        base: str,
+        entries: Dict[str, Tuple[str, float]],
+        top_k: int,
+        max_prefix_length: int,
+    ) -> None:
+        """Queue the writes of prefix index entries on a pipeline."""
+        args = []
+        for member, (text, weight) in entries.items():
+            args.extend([member, text, repr(weight)])
+        await self._prefix_entry_script(
+            keys=[f"{base}:weight", f"{base}:text"], args=args, client=pipe
+        )
+        pipe.zadd(f"{base}:lex", {member: 0 for member in entries})
+
+        # Top-k sets are scored by negated weight, so ZRANGE returns the
+        # heaviest first and ties in member order
+        candidates: Dict[str, List[Tuple[float, str]]] = {}
+        for member, (_, weight) in entries.items():
+            for prefix in _prefixes(member, max_prefix_length):
+                candidates.setdefault(prefix, []).append((-weight, member))
+
+        for prefix, scored in candidates.items():
+            top_key = f"{base}:top:{prefix}"
+            best = heapq.nsmallest(top_k, scored)
+            pipe.zadd(top_key, {member: score for score, member in best}, lt=True)
+            pipe.zremrangebyrank(top_key, top_k, -1)
+        if candidates:
+            pipe.sadd(f"{base}:prefixes", *candidates)
+
+    async def _retire_prefix_version(self, key: str, version: Any) -> None:
+        """Expire the keys of a replaced prefix index version."""
+        base = self._prefix_base(key, version)
+        ttl = self.PREFIX_INDEX_RETIRE_SECONDS
+
+        async with self.client.pipeline(transaction=False) as pipe:
+            queued = 0
+            async for prefix in self.client.sscan_iter(f"{base}:prefixes", count=1000):
+                pipe.expire(f"{base}:top:{self._decode(prefix)}", ttl)
+                queued += 1
+                if queued % self.PREFIX_INDEX_CHUNK_SIZE == 0:
+                    await pipe.execute()
+            for suffix in ("lex", "weight", "text", "prefixes"):
+                pipe.expire(f"{base}:{suffix}", ttl)
+            await pipe.execute()
+
+    @property
+    def _prefix_entry_script(self):
+        """Registered script that raises member weights and texts."""
+        if self._prefix_script is None:
+            self._prefix_script = self.client.register_script(self.PREFIX_ENTRY_SCRIPT)
+        return self._prefix_script
+
+    def _prefix_base(self, key: str, version: Any) -> str:
+        """Get the key prefix of one version of a prefix index."""
+        return f"{key}:v{int(version)}"
+
+    def _prefix_version_key(self, key: str) -> str:
+        """Get the Redis key holding a prefix index's current version."""
+        return f"{key}:version"
+
+    def _prefix_counter_key(self, key: str) -> str:
+        """Get the Redis key allocating a prefix index's versions."""
+        return f"{key}:versions"
+
+    def _decode(self, value: Any) -> Any:
+        """Decode a bytes response to str."""
+        return value.decode(self.encoding) if isinstance(value, bytes) else value
+
     async def delete(self, key: str) -> bool:
         """
         Delete a key from cache.
@@ -608,11 +1161,16 @@ class RedisCacheRepository:
         Raises:
             StorageError: If retrieval fails
 
-        Warning:
-            Use with caution on large databases - this is a blocking operation!
+        Note:
+            Uses incremental SCAN rather than KEYS, so Redis is not blocked,
+            but the cost is still proportional to the size of the keyspace.
+            Prefer tag-based invalidation (``invalidate_tags``) for caches.
         """
         try:
-            keys = await self.client.keys(pattern)
+            # SCAN may return a key more than once
+            keys = list(dict.fromkeys(
+                [key async for key in self.client.scan_iter(match=pattern, count=1000)]
+            ))
 
             # Decode bytes to strings if needed
             if keys and isinstance(keys[0], bytes):
@@ -654,3 +1212,8 @@ class RedisCacheRepository:
         except RedisError as e:
             logger.error(f"Failed to delete keys matching '{pattern}': {e}")
             raise StorageError(f"Pattern deletion failed: {e}")
+
+
+def _prefixes(member: str, max_length: int) -> List[str]:
+    """Prefixes of a member that get a top-k set."""
+    return [member[:length] for length in range(1, min(len(member), max_length) + 1)]
@@ -0,0 +1,314 @@
+"""
+Tagged response cache with stale-while-revalidate.
+
+This module provides the cache layer shared by the API routers: stable
+content-hashed keys, tag sets for targeted invalidation when trends and
+topics change, and stale-while-revalidate so an expired entry is refreshed
+by one background task instead of every concurrent request.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Set
+
+from trend_agent.storage.interfaces import CacheRepository
+
+logger = logging.getLogger(__name__)
+
+# Tags shared by the API routers and the code that writes trends/topics
+TRENDS_LIST_TAG = "trends:list"
+TRENDS_STATS_TAG = "trends:stats"
+TOPICS_LIST_TAG = "topics:list"
+
+
+def trend_tag(trend_id: Any) -> str:
+    """Get the tag of a single trend."""
+    return f"trend:{trend_id}"
+
+
+def topic_tag(topic_id: Any) -> str:
+    """Get the tag of a single topic."""
+    return f"topic:{topic_id}"
+
+
+def category_tag(category: Any) -> str:
+    """Get the tag of a category (accepts Category enums or strings)."""
+    return f"category:{getattr(category, 'value', category)}"
+
+
+def trend_change_tags(trends: Iterable[Any], trend_ids: Iterable[Any] = ()) -> List[str]:
+    """
+    Get the tags to invalidate after trends were created or updated.
+
+    Args:
+        trends: Saved trends
+        trend_ids: IDs returned by ``save_batch`` (covers trends that were
+            saved without an ID and got one assigned)
+
+    Returns:
+        List of tags (lists, stats, per-trend and per-category)
+    """
+    tags = {TRENDS_LIST_TAG, TRENDS_STATS_TAG}
+    tags.update(trend_tag(trend_id) for trend_id in trend_ids)
+    for trend in trends:
+        if trend.id is not None:
+            tags.add(trend_tag(trend.id))
+        tags.add(category_tag(trend.category))
+    return sorted(tags)
+
+
+def topic_change_tags(topics: Iterable[Any], topic_ids: Iterable[Any] = ()) -> List[str]:
+    """
+    Get the tags to invalidate after topics were created or updated.
+
+    Args:
+        topics: Saved topics
+        topic_ids: IDs returned by ``save_batch``
+
+    Returns:
+        List of tags (topic list and per-topic)
+    """
+    tags = {TOPICS_LIST_TAG}
+    tags.update(topic_tag(topic_id) for topic_id in topic_ids)
+    for topic in topics:
+        if topic.id is not None:
+            tags.add(topic_tag(topic.id))
+    return sorted(tags)
+
+
+def stable_cache_key(prefix: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Build a cache key that is identical across processes.
+
+    Unlike ``hash()``, which is salted per interpreter, the key is a
+    SHA-256 of the canonical JSON of the parameters.
+
+    Args:
+        prefix: Key prefix (e.g. "trends:list")
+        params: Parameters the cached value depends on
+
+    Returns:
+        Cache key string
+    """
+    canonical = json.dumps(params or {}, sort_keys=True, default=str, separators=(",", ":"))
+    digest = hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:32]
+    return f"{prefix}:{digest}"
+
+
+def create_response_cache_repository() -> CacheRepository:
+    """
+    Create the Redis repository the API caches responses in.
+
+    Writers that invalidate cached responses or update the suggestion
+    index must use the same Redis instance as the API, so both build it
+    from the same environment (REDIS_HOST, REDIS_PORT, REDIS_PASSWORD).
+    The caller must ``connect()`` it.
+
+    Returns:
+        Unconnected RedisCacheRepository
+    """
+    from trend_agent.storage.redis import RedisCacheRepository
+
+    return RedisCacheRepository(
+        host=os.getenv("REDIS_HOST", "localhost"),
+        port=int(os.getenv("REDIS_PORT", "6380")),
+        password=os.getenv("REDIS_PASSWORD", None),
+        default_ttl=3600,
+    )
+
+
+class ResponseCache:
+    """
+    Tagged cache with stale-while-revalidate on top of a CacheRepository.
+
+    Entries are stored as ``{"value": ..., "fresh_until": <epoch>}`` and kept
+    in Redis for ``ttl_seconds + stale_seconds``. Within the stale window the
+    cached value is returned immediately and one background task (guarded
+    by a short Redis lock) recomputes it.
+
+    Invalidation bumps a generation counter per tag. Tag generations are
+    read before a value is computed and the value is only stored if none
+    of them changed, so a refresh that raced with an invalidation cannot
+    write back data from before the change.
+
+    Example:
+        ```python
+        response_cache = ResponseCache(redis_repo)
+        data = await response_cache.get_or_set(
+            stable_cache_key("trends:list", filters.dict()),
+            compute=lambda: build_response(),
+            ttl_seconds=300,
+            tags=[TRENDS_LIST_TAG],
+        )
+
+        # After new trends are saved
+        await response_cache.invalidate(trend_change_tags(trends))
+        ```
+    """
+
+    # Strong references to background refreshes (shared by all instances)
+    _refresh_tasks: Set[asyncio.Task] = set()
+
+    def __init__(
+        self,
+        cache_repo: Optional[CacheRepository],
+        stale_seconds: int = 60,
+        lock_seconds: int = 30,
+    ):
+        """
+        Initialize response cache.
+
+        Args:
+            cache_repo: Cache repository (None disables caching)
+            stale_seconds: How long an expired entry may still be served
+                while it is refreshed in the background
+            lock_seconds: Maximum duration of a background refresh lock
+        """
+        self._cache_repo = cache_repo
+        self._stale_seconds = stale_seconds
+        self._lock_seconds = lock_seconds
+
+    async def get_or_set(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Any]],
+        ttl_seconds: int,
+        tags: Iterable[str] = (),
+    ) -> Any:
+        """
+        Get a cached value, computing and caching it when missing.
+
+        Args:
+            key: Cache key (see ``stable_cache_key``)
+            compute: Coroutine function producing the value
+            ttl_seconds: Freshness period in seconds
+            tags: Tags used for invalidation
+
+        Returns:
+            The cached or freshly computed value
+        """
+        tags = list(tags)
+        if self._cache_repo is None:
+            return await compute()
+
+        try:
+            entry = await self._cache_repo.get(key)
+        except Exception as e:
+            logger.warning(f"Response cache read failed for '{key}': {e}")
+            entry = None
+
+        if isinstance(entry, dict) and "fresh_until" in entry:
+            if entry["fresh_until"] <= time.time():
+                await self._schedule_refresh(key, compute, ttl_seconds, tags)
+            return entry["value"]
+
+        generations = await self._generations(tags)
+        value = await compute()
+        await self._store(key, value, ttl_seconds, tags, generations)
+        return value
+
+    async def invalidate(self, tags: Iterable[str]) -> int:
+        """
+        Delete every cached entry registered under the given tags.
+
+        Args:
+            tags: Tags to invalidate
+
+        Returns:
+            Number of cache entries deleted (0 if caching is disabled)
+        """
+        tags = list(tags)
+        if self._cache_repo is None or not tags:
+            return 0
+
+        try:
+            deleted = await self._cache_repo.invalidate_tags(tags)
+            logger.info(f"Invalidated {deleted} cached responses ({len(tags)} tags)")
+            return deleted
+        except Exception as e:
+            logger.warning(f"Response cache invalidation failed: {e}")
+            return 0
+
+    async def _generations(self, tags: List[str]) -> Optional[List[int]]:
+        """Read tag generations before computing a value (None if unavailable)."""
+        try:
+            return await self._cache_repo.get_tag_generations(tags)
+        except Exception as e:
+            logger.warning(f"Response cache generation read failed: {e}")
+            return None
+
+    async def _store(
+        self,
+        key: str,
+        value: Any,
+        ttl_seconds: int,
+        tags: List[str],
+        generations: Optional[List[int]],
+    ) -> None:
+        """Write an entry unless its tags were invalidated while it was computed."""
+        if generations is None:
+            # Cannot tell whether the value is still current
+            return
+
+        entry = {"value": value, "fresh_until": time.time() + ttl_seconds}
+        try:
+            stored = await self._cache_repo.set_with_tags(
+                key,
+                entry,
+                tags,
+                ttl_seconds=ttl_seconds + self._stale_seconds,
+                tag_ttl_seconds=max(86400, ttl_seconds + self._stale_seconds),
+                generations=generations,
+            )
+            if not stored:
+                logger.debug(f"Not caching '{key}': invalidated while computing")
+        except Exception as e:
+            logger.warning(f"Response cache write failed for '{key}': {e}")
+
+    async def _schedule_refresh(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Any]],
+        ttl_seconds: int,
+        tags: List[str],
+    ) -> None:
+        """Start a background refresh unless another worker holds the lock."""
+        try:
+            acquired = await self._cache_repo.set_if_not_exists(
+                f"{key}:refresh", 1, ttl_seconds=self._lock_seconds
+            )
+        except Exception as e:
+            logger.warning(f"Response cache refresh lock failed for '{key}': {e}")
+            return
+
+        if not acquired:
+            return
+
+        task = asyncio.create_task(self._refresh(key, compute, ttl_seconds, tags))
+        self._refresh_tasks.add(task)
+        task.add_done_callback(self._refresh_tasks.discard)
+
+    async def _refresh(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Any]],
+        ttl_seconds: int,
+        tags: List[str],
+    ) -> None:
+        """Recompute an entry in the background."""
+        try:
+            generations = await self._generations(tags)
+            value = await compute()
+            await self._store(key, value, ttl_seconds, tags, generations)
+            logger.debug(f"Refreshed stale cache entry '{key}'")
+        except Exception as e:
+            logger.warning(f"Background refresh of '{key}' failed: {e}")
+        finally:
+            try:
+                await self._cache_repo.delete(f"{key}:refresh")
+            except Exception:
+                pass
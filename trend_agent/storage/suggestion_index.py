@@ -0,0 +1,365 @@
+"""
+Prefix index for search autocomplete.
+
+Normalized trend titles and keywords are kept in a weighted prefix index:
+every short prefix has a list of its heaviest completions (Redis sorted
+sets, mirrored in process), so a suggestion lookup reads the best matches
+directly instead of scanning trends. The index is updated when trends are
+persisted and rebuilt from the live trends periodically.
+"""
+
+import asyncio
+import bisect
+import heapq
+import logging
+import math
+import unicodedata
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from trend_agent.schemas import Trend, TrendFilter, TrendState
+from trend_agent.storage.interfaces import CacheRepository, TrendRepository
+
+logger = logging.getLogger(__name__)
+
+# Member -> (display text, weight)
+SuggestionEntries = Dict[str, Tuple[str, float]]
+
+
+def normalize_suggestion(text: str) -> str:
+    """
+    Normalize a title, keyword or typed prefix for prefix matching.
+
+    Args:
+        text: Raw text
+
+    Returns:
+        NFKC-normalized, case-folded text with collapsed whitespace
+    """
+    return " ".join(unicodedata.normalize("NFKC", text).casefold().split())
+
+
+class SuggestionIndex:
+    """
+    Weighted prefix index of trend titles and keywords.
+
+    Each entry's weight combines trend score and recency as
+    ``log(1 + score) + ln(2) * last_updated / half_life``. Ordering by this
+    weight is the same as ordering by score decayed with the given half
+    life, at any point in time, so stored weights never need refreshing.
+    A term shared by several trends keeps its highest weight.
+
+    Each prefix of up to ``max_prefix_length`` characters keeps its
+    ``top_k`` heaviest entries, so a lookup is O(log n + limit) however
+    many terms share the prefix; longer prefixes, which match few terms,
+    rank all their matches. The Redis index is shared by all processes;
+    the in-process copy serves lookups when Redis is not configured,
+    fails or has lost the index (e.g. after a flush or eviction), in
+    which case it is also written back to Redis.
+
+    Example:
+        ```python
+        index = SuggestionIndex(cache_repo=redis_repo)
+        await index.ensure_loaded(trend_repo)
+        suggestions = await index.suggest("open", limit=10)
+
+        # After new trends are saved
+        await index.add_trends(trends)
+        ```
+    """
+
+    def __init__(
+        self,
+        cache_repo: Optional[CacheRepository] = None,
+        key: str = "suggest:trends",
+        top_k: int = 20,
+        max_prefix_length: int = 10,
+        half_life_hours: float = 48.0,
+        live_days: int = 7,
+        max_trends: int = 5000,
+        max_term_length: int = 200,
+    ):
+        """
+        Initialize suggestion index.
+
+        Args:
+            cache_repo: Optional Redis cache repository
+            key: Redis key of the index
+            top_k: Entries kept per prefix (the largest useful lookup limit)
+            max_prefix_length: Longest prefix with its own top-k list
+            half_life_hours: Hours after which a trend's weight counts half
+            live_days: Days of trends loaded when (re)building from the database
+            max_trends: Maximum trends loaded when (re)building
+            max_term_length: Longer titles and keywords are not indexed
+        """
+        self._cache_repo = cache_repo
+        self._key = key
+        self._top_k = top_k
+        self._max_prefix_length = max_prefix_length
+        self._decay_per_second = math.log(2) / (half_life_hours * 3600)
+        self._live_days = live_days
+        self._max_trends = max_trends
+        self._max_term_length = max_term_length
+
+        # In-process index: entries, sorted members (for long prefixes)
+        # and the heaviest members of each short prefix
+        self._members: List[str] = []
+        self._entries: SuggestionEntries = {}
+        self._top: Dict[str, List[str]] = {}
+        self._loaded = False
+        self._load_lock = asyncio.Lock()
+        self._seed_task: Optional[asyncio.Task] = None
+
+        # Stats
+        self._lookups: Dict[str, int] = {"redis": 0, "memory": 0}
+        self._redis_errors = 0
+
+    def build_entries(self, trends: Iterable[Trend]) -> SuggestionEntries:
+        """
+        Build index entries for the titles and keywords of trends.
+
+        Dead trends are skipped.
+
+        Args:
+            trends: Trends to index
+
+        Returns:
+            Dictionary of normalized member -> (display text, weight)
+        """
+        entries: SuggestionEntries = {}
+        for trend in trends:
+            if trend.state == TrendState.DEAD:
+                continue
+            weight = self._weight(trend)
+            for text in [trend.title, *trend.keywords]:
+                member = normalize_suggestion(text)
+                if not member or len(member) > self._max_term_length:
+                    continue
+                if member not in entries or entries[member][1] < weight:
+                    entries[member] = (text.strip(), weight)
+        return entries
+
+    async def add_trends(self, trends: Iterable[Trend]) -> int:
+        """
+        Index newly persisted or updated trends.
+
+        If Redis has no index, the entries only reach it with the next
+        seed or rebuild.
+
+        Args:
+            trends: Saved trends
+
+        Returns:
+            Number of entries written
+        """
+        entries = self.build_entries(trends)
+        if not entries:
+            return 0
+
+        self._merge_local(entries)
+        if self._cache_repo is not None:
+            try:
+                written = await self._cache_repo.prefix_index_add(
+                    self._key, entries, self._top_k, self._max_prefix_length
+                )
+                if not written and self._loaded:
+                    # No index in Redis: seed it with the merged local index
+                    await self._seed_redis()
+            except Exception as e:
+                self._redis_errors += 1
+                logger.warning(f"Failed to update suggestion index in Redis: {e}")
+
+        return len(entries)
+
+    async def rebuild(self, trends: Iterable[Trend]) -> int:
+        """
+        Replace the index with the entries of the given trends.
+
+        Drops terms of trends that died or were deleted since the last
+        rebuild.
+
+        Args:
+            trends: All live trends
+
+        Returns:
+            Number of entries in the new index
+        """
+        entries = self.build_entries(trends)
+
+        self._replace_local(entries)
+        if self._cache_repo is not None:
+            try:
+                await self._cache_repo.prefix_index_replace(
+                    self._key, entries, self._top_k, self._max_prefix_length
+                )
+            except Exception as e:
+                self._redis_errors += 1
+                logger.warning(f"Failed to rebuild suggestion index in Redis: {e}")
+
+        logger.info(f"Rebuilt suggestion index with {len(entries)} entries")
+        return len(entries)
+
+    async def load_live_trends(self, trend_repo: TrendRepository) -> List[Trend]:
+        """
+        Load the trends the index should cover.
+
+        Args:
+            trend_repo: Trend repository
+
+        Returns:
+            Trends first seen within ``live_days``
+        """
+        date_from = datetime.utcnow() - timedelta(days=self._live_days)
+        return await trend_repo.search(TrendFilter(date_from=date_from, limit=self._max_trends))
+
+    async def ensure_loaded(self, trend_repo: TrendRepository) -> None:
+        """
+        Load the in-process index once, seeding Redis if it has no index yet.
+
+        Args:
+            trend_repo: Trend repository to load live trends from
+        """
+        if self._loaded:
+            return
+
+        async with self._load_lock:
+            if self._loaded:
+                return
+
+            entries = self.build_entries(await self.load_live_trends(trend_repo))
+            self._replace_local(entries)
+            await self._seed_redis()
+
+            self._loaded = True
+            logger.info(f"Loaded suggestion index with {len(entries)} entries")
+
+    async def suggest(self, prefix: str, limit: int = 10) -> List[str]:
+        """
+        Get the heaviest titles and keywords starting with a prefix.
+
+        Args:
+            prefix: Partial query typed by the user
+            limit: Maximum suggestions to return (at most ``top_k``)
+
+        Returns:
+            Display texts of matching titles and keywords, heaviest first
+        """
+        normalized = normalize_suggestion(prefix)
+        if not normalized:
+            return []
+
+        limit = min(limit, self._top_k)
+        matches = None
+        if self._cache_repo is not None:
+            try:
+                matches = await self._cache_repo.prefix_index_lookup(
+                    self._key, normalized, limit, self._max_prefix_length
+                )
+                if matches is not None:
+                    self._lookups["redis"] += 1
+                elif self._loaded:
+                    # Index lost in Redis (flushed or evicted): serve
+                    # locally and write it back
+                    self._start_seed()
+            except Exception as e:
+                self._redis_errors += 1
+                logger.warning(f"Suggestion lookup in Redis failed, using local index: {e}")
+
+        if matches is None:
+            matches = self._local_lookup(normalized, limit)
+            self._lookups["memory"] += 1
+
+        return [text for _, text, _ in matches]
+
+    def get_stats(self) -> Dict[str, object]:
+        """
+        Get index statistics.
+
+        Returns:
+            Dictionary with local entry count, lookups per tier and Redis errors
+        """
+        return {
+            "local_entries": len(self._members),
+            "lookups": dict(self._lookups),
+            "redis_errors": self._redis_errors,
+        }
+
+    async def _seed_redis(self) -> None:
+        """Write the in-process index to Redis unless Redis already has one."""
+        if self._cache_repo is None:
+            return
+        try:
+            if not await self._cache_repo.prefix_index_exists(self._key):
+                await self._cache_repo.prefix_index_replace(
+                    self._key, self._entries, self._top_k, self._max_prefix_length
+                )
+                logger.info(f"Seeded suggestion index in Redis with {len(self._entries)} entries")
+        except Exception as e:
+            self._redis_errors += 1
+            logger.warning(f"Failed to seed suggestion index in Redis: {e}")
+
+    def _start_seed(self) -> None:
+        """Seed Redis in the background, at most one seed at a time."""
+        if self._seed_task is None or self._seed_task.done():
+            self._seed_task = asyncio.create_task(self._seed_redis())
+
+    def _weight(self, trend: Trend) -> float:
+        """Score-and-recency weight of a trend's entries."""
+        last_updated = trend.last_updated
+        if last_updated.tzinfo is None:
+            last_updated = last_updated.replace(tzinfo=timezone.utc)
+        return math.log1p(max(trend.score, 0.0)) + self._decay_per_second * last_updated.timestamp()
+
+    def _local_lookup(self, prefix: str, limit: int) -> List[Tuple[str, str, float]]:
+        """Heaviest entries starting with a prefix from the in-process index."""
+        if len(prefix) <= self._max_prefix_length:
+            members = self._top.get(prefix, [])[:limit]
+        else:
+            start = bisect.bisect_left(self._members, prefix)
+            members = []
+            for member in self._members[start:]:
+                if not member.startswith(prefix):
+                    break
+                members.append(member)
+            members = sorted(members, key=self._rank)[:limit]
+        return [(member, *self._entries[member]) for member in members]
+
+    def _merge_local(self, entries: SuggestionEntries) -> None:
+        """Merge entries into the in-process index, keeping the highest weight."""
+        for member, (text, weight) in entries.items():
+            current = self._entries.get(member)
+            if current is None:
+                bisect.insort(self._members, member)
+            elif current[1] >= weight:
+                continue
+            self._entries[member] = (text, weight)
+
+            for prefix in self._prefixes(member):
+                top = self._top.setdefault(prefix, [])
+                if member in top:
+                    top.remove(member)
+                bisect.insort(top, member, key=self._rank)
+                del top[self._top_k:]
+
+    def _replace_local(self, entries: SuggestionEntries) -> None:
+        """Replace the in-process index."""
+        self._entries = dict(entries)
+        self._members = sorted(entries)
+
+        candidates: Dict[str, List[str]] = {}
+        for member in self._members:
+            for prefix in self._prefixes(member):
+                candidates.setdefault(prefix, []).append(member)
+        self._top = {
+            prefix: heapq.nsmallest(self._top_k, members, key=self._rank)
+            for prefix, members in candidates.items()
+        }
+
+    def _prefixes(self, member: str) -> List[str]:
+        """Prefixes of a member that keep a top-k list."""
+        longest = min(len(member), self._max_prefix_length)
+        return [member[:length] for length in range(1, longest + 1)]
+
+    def _rank(self, member: str) -> Tuple[float, str]:
+        """Sort key of an entry: heaviest first, ties in member order."""
+        return (-self._entries[member][1], member)
@@ -0,0 +1,243 @@
+"""
+Buffered vector ingest writer.
+
+This module provides a writer that groups vector points into batches and
+sends them to a vector repository with bounded concurrency, retrying failed
+batches by splitting them so one bad point cannot sink its neighbours.
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict, Iterable, List, Set, Tuple
+
+from trend_agent.observability.metrics import (
+    record_vector_batch_split,
+    record_vector_points,
+)
+from trend_agent.storage.interfaces import ConnectionError as StorageConnectionError
+from trend_agent.storage.interfaces import VectorRepository
+
+logger = logging.getLogger(__name__)
+
+VectorPoint = Tuple[str, List[float], Dict[str, Any]]
+
+
+class VectorIngestWriter:
+    """
+    Buffered, concurrent writer on top of ``VectorRepository.upsert_batch``.
+
+    Points are buffered until ``batch_size`` is reached, then the batch is
+    dispatched in the background. At most ``max_concurrency`` batches are in
+    flight; ``add`` waits when that limit is reached (backpressure).
+
+    A batch whose upsert is rejected is split in half and each half is
+    retried, recursively, down to single points. Transport errors (server
+    unreachable, timeouts) are not caused by the points, so the whole batch
+    is retried with exponential backoff instead and fails as a unit once
+    ``max_retries`` is exhausted. Points whose dimension does not match the
+    repository's ``vector_size`` are failed without being sent. Points that
+    cannot be written are recorded in ``failed_ids`` instead of raising.
+
+    Example:
+        ```python
+        async with VectorIngestWriter(vector_repo, batch_size=256) as writer:
+            for item in items:
+                await writer.add(str(item.id), item.embedding, {"title": item.title})
+
+        print(writer.get_stats())
+        ```
+    """
+
+    def __init__(
+        self,
+        vector_repo: VectorRepository,
+        batch_size: int = 256,
+        max_concurrency: int = 4,
+        max_retries: int = 3,
+        retry_delay: float = 0.5,
+    ):
+        """
+        Initialize vector ingest writer.
+
+        Args:
+            vector_repo: Vector repository providing ``upsert_batch``
+            batch_size: Points per upsert request
+            max_concurrency: Maximum batches in flight at once
+            max_retries: Retries of a batch after transport errors
+            retry_delay: Delay before the first retry in seconds (doubles each retry)
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be positive")
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be positive")
+
+        self._vector_repo = vector_repo
+        self._vector_size = getattr(vector_repo, "vector_size", None)
+        self._batch_size = batch_size
+        self._max_retries = max_retries
+        self._retry_delay = retry_delay
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._buffer: List[VectorPoint] = []
+        self._tasks: Set[asyncio.Task] = set()
+
+        # Stats
+        self._written = 0
+        self._batches = 0
+        self._splits = 0
+        self._retries = 0
+        self._failed_ids: List[str] = []
+
+    @property
+    def failed_ids(self) -> List[str]:
+        """Get IDs of points that could not be written."""
+        return list(self._failed_ids)
+
+    async def add(self, id: str, vector: List[float], metadata: Dict[str, Any]) -> None:
+        """
+        Buffer a point, dispatching a batch when the buffer is full.
+
+        Args:
+            id: Point identifier
+            vector: Embedding vector
+            metadata: Point payload
+        """
+        self._buffer.append((id, vector, metadata))
+        if len(self._buffer) >= self._batch_size:
+            await self._dispatch()
+
+    async def add_many(self, points: Iterable[VectorPoint]) -> None:
+        """
+        Buffer multiple points.
+
+        Args:
+            points: (id, vector, metadata) tuples
+        """
+        for id, vector, metadata in points:
+            await self.add(id, vector, metadata)
+
+    async def flush(self) -> None:
+        """Dispatch any buffered points and wait for all in-flight batches."""
+        if self._buffer:
+            await self._dispatch()
+        if self._tasks:
+            await asyncio.gather(*list(self._tasks))
+
+    async def close(self) -> Dict[str, Any]:
+        """
+        Flush the writer.
+
+        Returns:
+            Writer statistics (see ``get_stats``)
+        """
+        await self.flush()
+        return self.get_stats()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get writer statistics.
+
+        Returns:
+            Dictionary with points written/failed, batch, split and retry counts
+        """
+        return {
+            "points_written": self._written,
+            "points_failed": len(self._failed_ids),
+            "batches": self._batches,
+            "splits": self._splits,
+            "retries": self._retries,
+        }
+
+    async def __aenter__(self) -> "VectorIngestWriter":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.flush()
+
+    async def _dispatch(self) -> None:
+        """Start a background upsert for the current buffer."""
+        batch = self._buffer
+        self._buffer = []
+
+        # Wait for a free slot before starting, so callers feel backpressure
+        await self._semaphore.acquire()
+        task = asyncio.create_task(self._run_batch(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(self, batch: List[VectorPoint]) -> None:
+        """Write a batch and release its concurrency slot."""
+        try:
+            if self._vector_size is not None:
+                batch = self._drop_mismatched(batch)
+            if batch:
+                await self._write(batch)
+        finally:
+            self._semaphore.release()
+
+    def _drop_mismatched(self, batch: List[VectorPoint]) -> List[VectorPoint]:
+        """Fail points whose dimension the repository would silently skip."""
+        valid = [point for point in batch if len(point[1]) == self._vector_size]
+        if len(valid) < len(batch):
+            rejected = [point[0] for point in batch if len(point[1]) != self._vector_size]
+            logger.warning(
+                f"Rejected {len(rejected)} vectors with dimension other than {self._vector_size}"
+            )
+            self._fail(rejected)
+        return valid
+
+    async def _write(self, batch: List[VectorPoint]) -> None:
+        """Upsert a batch, retrying transport errors and splitting it on rejection."""
+        self._batches += 1
+        try:
+            written = await self._upsert_with_retry(batch)
+        except (StorageConnectionError, OSError, TimeoutError) as e:
+            logger.warning(
+                f"Vector batch of {len(batch)} failed after {self._max_retries} retries: {e}"
+            )
+            self._fail([point[0] for point in batch])
+            return
+        except Exception as e:
+            if len(batch) == 1:
+                point_id = batch[0][0]
+                logger.warning(f"Failed to upsert vector {point_id}: {e}")
+                self._fail([point_id])
+                return
+
+            logger.info(f"Vector batch of {len(batch)} failed ({e}), retrying in halves")
+            self._splits += 1
+            record_vector_batch_split()
+
+            middle = len(batch) // 2
+            await self._write(batch[:middle])
+            await self._write(batch[middle:])
+            return
+
+        if written is False:
+            # Repository rejected every point
+            self._fail([point[0] for point in batch])
+            return
+
+        self._written += len(batch)
+        record_vector_points("written", len(batch))
+
+    async def _upsert_with_retry(self, batch: List[VectorPoint]) -> bool:
+        """Upsert a batch, backing off and retrying on transport errors."""
+        delay = self._retry_delay
+        for attempt in range(self._max_retries + 1):
+            try:
+                return await self._vector_repo.upsert_batch(batch)
+            except (StorageConnectionError, OSError, TimeoutError) as e:
+                if attempt == self._max_retries:
+                    raise
+                logger.info(
+                    f"Vector batch of {len(batch)} hit a transport error ({e}), "
+                    f"retrying in {delay}s"
+                )
+                self._retries += 1
+                await asyncio.sleep(delay)
+                delay *= 2
+
+    def _fail(self, point_ids: List[str]) -> None:
+        """Record points that could not be written."""
+        self._failed_ids.extend(point_ids)
+        record_vector_points("failed", len(point_ids))
@@ -16,6 +16,9 @@ from trend_agent.schemas import RawItem, SourceType
 
 logger = logging.getLogger(__name__)
 
+# Seen-item filter shared by collection tasks in this worker process
+_seen_filter = None
+
 
 class CollectionTask(Task):
     """Base class for collection tasks with error handling."""
@@ -198,23 +201,36 @@ async def _collect_from_plugin_async(plugin_name: str) -> Dict[str, Any]:
     try:
         from trend_agent.ingestion.converters import batch_raw_to_processed
 
+        from trend_agent.ingestion.seen_filter import SeenItemFilter, save_collected_items
+
+        global _seen_filter
+
         item_repo = PostgreSQLItemRepository(db_pool.pool)
-        saved_count = 0
+
+        # Skip items stored by earlier runs unless their metrics changed
+        if _seen_filter is None and os.getenv("SEEN_ITEM_FILTER", "true").lower() in ("true", "1", "yes"):
+            _seen_filter = SeenItemFilter(item_repo=item_repo)
 
         # Convert RawItems to ProcessedItems with minimal processing
         # Full processing will happen later in the processing pipeline
         processed_items = batch_raw_to_processed(raw_items)
 
-        for processed_item in processed_items:
-            await item_repo.save(processed_item)
-            saved_count += 1
+        partition = await save_collected_items(
+            item_repo, processed_items, seen_filter=_seen_filter, plugin_name=plugin_name
+        )
+
+        # Items are stored: let the plugin advance its feed watermarks
+        await plugin.on_saved(raw_items)
 
         duration = (datetime.utcnow() - start_time).total_seconds()
 
         return {
             "plugin_name": plugin_name,
             "items_collected": len(raw_items),
-            "items_saved": saved_count,
+            "items_saved": len(partition.new) + len(partition.changed),
+            "items_metrics_updated": len(partition.changed),
+            "items_skipped": len(partition.unchanged),
+            "skip_ratio": round(partition.skip_ratio, 4),
             "duration_seconds": duration,
             "timestamp": datetime.utcnow().isoformat(),
         }
@@ -16,6 +16,33 @@ from trend_agent.schemas import ProcessedItem, Trend, Topic
 
 logger = logging.getLogger(__name__)
 
+# CPU executor shared by every task in this worker process (workers stay warm)
+_cpu_executor = None
+
+
+def _get_cpu_executor():
+    """
+    Get the worker-wide CPU executor, if PIPELINE_CPU_WORKERS is set.
+
+    Returns:
+        CPUExecutor, or None to run CPU-bound stages on the event loop
+    """
+    global _cpu_executor
+    import os
+
+    workers = int(os.getenv("PIPELINE_CPU_WORKERS", "0"))
+    if workers <= 0:
+        return None
+
+    if _cpu_executor is None:
+        from trend_agent.processing.cpu_executor import CPUExecutor
+
+        _cpu_executor = CPUExecutor(
+            max_workers=workers,
+            chunk_size=int(os.getenv("PIPELINE_CPU_CHUNK_SIZE", "64")),
+        )
+    return _cpu_executor
+
 
 class ProcessingTask(Task):
     """Base class for processing tasks with error handling."""
@@ -82,6 +109,7 @@ async def _process_pending_items_async(limit: int) -> Dict[str, Any]:
         PostgreSQLTopicRepository,
     )
     from trend_agent.storage.qdrant import QdrantVectorRepository
+    from trend_agent.storage.vector_writer import VectorIngestWriter
     from trend_agent.processing import create_standard_pipeline
     import os
 
@@ -145,18 +173,81 @@ async def _process_pending_items_async(limit: int) -> Dict[str, Any]:
             collection_name="trend_items"
         )
 
-        # Create and run pipeline with translation support
+        # Shared embedding cache (Redis-backed when real services are configured)
+        from trend_agent.processing.embedding_cache import EmbeddingCache
+
+        embedding_cache_repo = None
+        if service_factory:
+            try:
+                embedding_cache_repo = service_factory.get_redis_repository()
+                await embedding_cache_repo.connect()
+            except Exception as e:
+                logger.warning(f"Redis not available for embedding cache: {e}")
+                embedding_cache_repo = None
+        embedding_cache = EmbeddingCache(embedding_service, cache_repo=embedding_cache_repo)
+
+        # Optional spaCy NER; results are cached in Redis by text hash
+        entity_extractor = None
+        if os.getenv("ENABLE_ENTITY_EXTRACTION", "false").lower() in ("true", "1", "yes"):
+            from trend_agent.processing.entities import EntityExtractor
+
+            entity_extractor = EntityExtractor(
+                spacy_model=os.getenv("SPACY_MODEL", "en_core_web_sm"),
+                n_process=int(os.getenv("SPACY_N_PROCESS", "1")),
+                cache_repo=embedding_cache_repo,
+            )
+
+        # Known topics persist in Redis so new items join them instead of
+        # every run re-clustering from scratch
+        topic_index = None
+        if os.getenv("INCREMENTAL_CLUSTERING", "true").lower() in ("true", "1", "yes"):
+            from trend_agent.processing.topic_index import TopicIndex
+
+            topic_index = TopicIndex(cache_repo=embedding_cache_repo)
+
+        # Optional article fetching for items collected without content
+        content_fetcher = None
+        if os.getenv("FETCH_ARTICLE_CONTENT", "false").lower() in ("true", "1", "yes"):
+            from trend_agent.processing.content_fetcher import ContentFetchService
+
+            content_fetcher = ContentFetchService(cache_repo=embedding_cache_repo)
+
+        # Optional LLM key points for ranked trends, with concurrency and
+        # request rate sized for the configured provider
+        key_point_extractor = None
+        if use_real_services and os.getenv("ENABLE_KEY_POINTS", "false").lower() in ("true", "1", "yes"):
+            from trend_agent.services.key_points import get_key_point_extractor
+
+            key_point_extractor = get_key_point_extractor(
+                llm_service, item_repo=item_repo, provider=llm_provider
+            )
+
+        # Create and run pipeline with translation support; per-item stages
+        # stream in micro-batches unless PIPELINE_STREAMING is disabled
+        from trend_agent.schemas import PipelineConfig
+
+        pipeline_config = PipelineConfig(
+            streaming=os.getenv("PIPELINE_STREAMING", "true").lower() in ("true", "1", "yes"),
+            stream_batch_size=int(os.getenv("PIPELINE_STREAM_BATCH_SIZE", "256")),
+        )
         pipeline = create_standard_pipeline(
             embedding_service,
             llm_service,
-            translation_manager=translation_manager
+            config=pipeline_config,
+            translation_manager=translation_manager,
+            embedding_cache=embedding_cache,
+            cpu_executor=_get_cpu_executor(),
+            entity_extractor=entity_extractor,
+            topic_index=topic_index,
+            content_fetcher=content_fetcher,
+            key_point_extractor=key_point_extractor,
         )
         start_time = datetime.utcnow()
 
-        # Convert ProcessedItems to RawItems for pipeline
+        # Convert ProcessedItems to RawItems for pipeline (lazily when streaming)
         from trend_agent.schemas import RawItem, SourceType
 
-        raw_items = [
+        raw_items = (
             RawItem(
                 source=item.source,
                 source_id=item.source_id,
@@ -171,41 +262,47 @@ async def _process_pending_items_async(limit: int) -> Dict[str, Any]:
                 metadata=item.metadata,
             )
             for item in pending_items[:limit]
-        ]
+        )
+        if not pipeline_config.streaming:
+            raw_items = list(raw_items)
 
-        pipeline_result = await pipeline.run(raw_items)
+        try:
+            pipeline_result = await pipeline.run(raw_items)
+        finally:
+            if content_fetcher is not None:
+                await content_fetcher.close()
 
         # Extract processed items with enrichments from pipeline
         # Pipeline stores processed items in metadata
         processed_with_enrichments = pipeline_result.metadata.get('processed_items', [])
 
         # Update items in database with enriched data (normalized text, language, category, etc.)
-        items_updated = 0
-        embeddings_saved = 0
-
-        for enriched_item in processed_with_enrichments:
-            # Update the item in the database with enriched data
-            await item_repo.save(enriched_item)
-            items_updated += 1
-
-            # Save embeddings to Qdrant if available
-            if enriched_item.embedding:
-                try:
-                    await vector_repo.upsert(
-                        id=str(enriched_item.id),
-                        vector=enriched_item.embedding,
-                        payload={
+        # in one bulk upsert; existing rows keep their database IDs
+        item_ids = await item_repo.save_batch(processed_with_enrichments)
+        for enriched_item, item_id in zip(processed_with_enrichments, item_ids):
+            enriched_item.id = item_id
+        items_updated = len(item_ids)
+
+        # Save embeddings to Qdrant in batches
+        async with VectorIngestWriter(vector_repo) as vector_writer:
+            for enriched_item in processed_with_enrichments:
+                if enriched_item.embedding:
+                    await vector_writer.add(
+                        str(enriched_item.id),
+                        enriched_item.embedding,
+                        {
                             "source": enriched_item.source.value,
                             "source_id": enriched_item.source_id,
                             "title": enriched_item.title,
                             "language": enriched_item.language,
                             "category": enriched_item.category.value if enriched_item.category else None,
                             "published_at": enriched_item.published_at.isoformat(),
-                        }
+                        },
                     )
-                    embeddings_saved += 1
-                except Exception as e:
-                    logger.warning(f"Failed to save embedding for item {enriched_item.id}: {e}")
+
+        embeddings_saved = vector_writer.get_stats()["points_written"]
+        if vector_writer.failed_ids:
+            logger.warning(f"Failed to save {len(vector_writer.failed_ids)} embeddings")
 
         # Extract trends from pipeline result
         trends: List[Trend] = pipeline_result.metadata.get("trends", [])
@@ -215,18 +312,57 @@ async def _process_pending_items_async(limit: int) -> Dict[str, Any]:
         trend_repo = PostgreSQLTrendRepository(db_pool.pool)
         topic_repo = PostgreSQLTopicRepository(db_pool.pool)
 
-        trends_saved = 0
-        topics_saved = 0
-
-        # Save topics first
+        # Save topics first (trends reference them); topics that gained items
+        # from this run are updated in place, the rest are inserted
+        new_topics = [t for t in topics if not t.metadata.get("is_existing_topic")]
+        topics_updated = 0
         for topic in topics:
-            await topic_repo.save(topic)
-            topics_saved += 1
+            if not topic.metadata.get("is_existing_topic"):
+                continue
+            updated = await topic_repo.update(
+                topic.id,
+                {
+                    "item_count": topic.item_count,
+                    "total_engagement": topic.total_engagement,
+                    "sources": topic.sources,
+                    "last_updated": topic.last_updated,
+                    "metadata": topic.metadata,
+                },
+            )
+            if updated:
+                topics_updated += 1
+            else:
+                # Row is gone (e.g. cleaned up); insert it again
+                new_topics.append(topic)
+
+        topic_ids = await topic_repo.save_batch(new_topics)
+        topics_saved = len(topic_ids)
+
+        # Save trends (save_batch assigns IDs to trends that have none)
+        trend_ids = await trend_repo.save_batch(trends)
+        trends_saved = len(trend_ids)
+
+        # Drop cached API responses that depend on the saved trends/topics and
+        # index the trends for search suggestions, in the API's Redis
+        from trend_agent.storage.response_cache import (
+            ResponseCache,
+            create_response_cache_repository,
+            topic_change_tags,
+            trend_change_tags,
+        )
+        from trend_agent.storage.suggestion_index import SuggestionIndex
 
-        # Save trends
-        for trend in trends:
-            await trend_repo.save(trend)
-            trends_saved += 1
+        response_cache_repo = create_response_cache_repository()
+        try:
+            await response_cache_repo.connect()
+            await ResponseCache(response_cache_repo).invalidate(
+                trend_change_tags(trends, trend_ids) + topic_change_tags(topics, topic_ids)
+            )
+            await SuggestionIndex(response_cache_repo).add_trends(trends)
+        except Exception as e:
+            logger.warning(f"Could not update cached API responses: {e}")
+        finally:
+            await response_cache_repo.close()
 
         duration = (datetime.utcnow() - start_time).total_seconds()
 
@@ -235,8 +371,10 @@ async def _process_pending_items_async(limit: int) -> Dict[str, Any]:
             "items_updated": items_updated,
             "embeddings_saved": embeddings_saved,
             "topics_created": topics_saved,
+            "topics_updated": topics_updated,
             "trends_created": trends_saved,
             "duration_seconds": duration,
+            "embedding_cache": embedding_cache.get_stats(),
             "timestamp": datetime.utcnow().isoformat(),
             "pipeline_status": pipeline_result.status.value,
         }
@@ -370,10 +508,12 @@ async def _generate_embeddings_async(item_ids: Optional[List[str]], limit: int)
         PostgreSQLItemRepository,
     )
     from trend_agent.storage.qdrant import QdrantVectorRepository
+    from trend_agent.storage.vector_writer import VectorIngestWriter
     import os
 
     # Check if we should use real AI services
     use_real_services = os.getenv("USE_REAL_AI_SERVICES", "false").lower() in ("true", "1", "yes")
+    service_factory = None
 
     # Connect to databases
     db_pool = PostgreSQLConnectionPool(
@@ -417,26 +557,25 @@ async def _generate_embeddings_async(item_ids: Optional[List[str]], limit: int)
             embedding_service = MockEmbeddingService()
             service_factory = None
 
-        embeddings_created = 0
-
-        for item in items[:limit]:
-            # Generate embedding
-            text = f"{item.title} {item.description or ''}"
-            embedding = await embedding_service.generate_embedding(text)
-
-            # Store in vector database
-            await vector_repo.upsert(
-                id=str(item.id),
-                vector=embedding,
-                metadata={
-                    "item_id": str(item.id),
-                    "source": item.source.value,
-                    "category": item.category.value if item.category else None,
-                    "language": item.language,
-                },
-            )
-
-            embeddings_created += 1
+        # Generate embeddings in one batch and store them in batches
+        items = items[:limit]
+        texts = [f"{item.title} {item.description or ''}" for item in items]
+        embeddings = await embedding_service.embed_batch(texts)
+
+        async with VectorIngestWriter(vector_repo) as vector_writer:
+            for item, embedding in zip(items, embeddings):
+                await vector_writer.add(
+                    str(item.id),
+                    embedding,
+                    {
+                        "item_id": str(item.id),
+                        "source": item.source.value,
+                        "category": item.category.value if item.category else None,
+                        "language": item.language,
+                    },
+                )
+
+        embeddings_created = vector_writer.get_stats()["points_written"]
 
         return {
             "embeddings_created": embeddings_created,
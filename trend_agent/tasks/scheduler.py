@@ -9,6 +9,7 @@ import asyncio
 import logging
 from typing import Dict, Any, List
 from datetime import datetime, timedelta
+from uuid import UUID
 
 from trend_agent.tasks import app
 
@@ -319,7 +320,21 @@ async def _cleanup_old_data_async(days: int) -> Dict[str, Any]:
         pipeline_runs_deleted = await _cleanup_pipeline_runs(db_pool.pool, days)
 
         # Clean up orphaned embeddings (items/trends that no longer exist)
-        embeddings_cleaned = await _cleanup_orphaned_embeddings(db_pool.pool)
+        from trend_agent.storage.qdrant import QdrantVectorRepository
+
+        vector_repos = [
+            QdrantVectorRepository(
+                host=os.getenv("QDRANT_HOST", "localhost"),
+                port=int(os.getenv("QDRANT_PORT", "6333")),
+                collection_name=collection_name,
+            )
+            for collection_name in ("trend_items", "trend_embeddings")
+        ]
+        try:
+            embeddings_cleaned = await _cleanup_orphaned_embeddings(db_pool.pool, vector_repos)
+        finally:
+            for vector_repo in vector_repos:
+                await vector_repo.close()
 
         return {
             "items_deleted": items_deleted,
@@ -364,50 +379,56 @@ async def _cleanup_pipeline_runs(pool, days: int) -> int:
         return 0
 
 
-async def _cleanup_orphaned_embeddings(pool) -> int:
+async def _cleanup_orphaned_embeddings(pool, vector_repos, batch_size: int = 500) -> int:
     """
     Clean up orphaned vector embeddings.
 
-    Removes embeddings for items/trends that no longer exist in the database.
+    Streams each collection page by page (IDs and payloads only) and
+    removes points whose ID is neither a stored item nor a trend, so the
+    job runs in constant memory however large the collections grow.
 
     Args:
         pool: Database connection pool
+        vector_repos: Vector repositories (one per collection) to clean
+        batch_size: Points checked per page
 
     Returns:
         Number of embeddings cleaned
     """
-    try:
-        # Find orphaned item embeddings
-        query = """
-            SELECT id FROM vectors
-            WHERE id LIKE 'item:%'
-            AND substring(id from 6)::uuid NOT IN (SELECT id::text FROM processed_items)
-        """
-        orphaned_items = await pool.fetch(query)
+    query = """
+        SELECT u.id::text AS id
+        FROM unnest($1::uuid[]) AS u(id)
+        WHERE NOT EXISTS (SELECT 1 FROM processed_items p WHERE p.id = u.id)
+        AND NOT EXISTS (SELECT 1 FROM trends t WHERE t.id = u.id)
+    """
 
-        # Find orphaned trend embeddings
-        query2 = """
-            SELECT id FROM vectors
-            WHERE id LIKE 'trend:%'
-            AND substring(id from 7)::uuid NOT IN (SELECT id::text FROM trends)
-        """
-        orphaned_trends = await pool.fetch(query2)
+    total_orphaned = 0
+    for vector_repo in vector_repos:
+        try:
+            async for page in vector_repo.scroll_iter(batch_size=batch_size, with_vectors=False):
+                page_ids = []
+                for point_id, _, _ in page:
+                    try:
+                        page_ids.append(UUID(point_id))
+                    except ValueError:
+                        continue  # Not a UUID, so not an item or trend ID
+
+                if not page_ids:
+                    continue
 
-        total_orphaned = len(orphaned_items) + len(orphaned_trends)
+                orphaned_ids = [row["id"] for row in await pool.fetch(query, page_ids)]
+                total_orphaned += await vector_repo.delete_batch(orphaned_ids)
 
-        if total_orphaned > 0:
-            # Delete orphaned embeddings
-            all_orphaned_ids = [row["id"] for row in orphaned_items + orphaned_trends]
-            delete_query = "DELETE FROM vectors WHERE id = ANY($1)"
-            await pool.execute(delete_query, all_orphaned_ids)
-            logger.info(f"Cleaned up {total_orphaned} orphaned embeddings")
+        except Exception as e:
+            # Qdrant might be unavailable; other collections are still cleaned
+            logger.warning(
+                f"Could not cleanup orphaned embeddings in {vector_repo.collection_name}: {e}"
+            )
 
-        return total_orphaned
+    if total_orphaned > 0:
+        logger.info(f"Cleaned up {total_orphaned} orphaned embeddings")
 
-    except Exception as e:
-        # Vectors table might not exist or might be in Qdrant only
-        logger.warning(f"Could not cleanup orphaned embeddings: {e}")
-        return 0
+    return total_orphaned
 
 
 @app.task(name="trend_agent.tasks.scheduler.update_plugin_health_task")
@@ -537,7 +558,6 @@ async def _generate_analytics_async() -> Dict[str, Any]:
         PostgreSQLItemRepository,
     )
     from trend_agent.storage.redis import RedisCacheRepository
-    from trend_agent.schemas import TrendFilter
     import os
     import json
 
@@ -566,65 +586,26 @@ async def _generate_analytics_async() -> Dict[str, Any]:
         topic_repo = PostgreSQLTopicRepository(db_pool.pool)
         item_repo = PostgreSQLItemRepository(db_pool.pool)
 
-        # Get trends from last 7 days
+        # Aggregate trends from last 7 days in the database
         cutoff = datetime.utcnow() - timedelta(days=7)
-        filters = TrendFilter(date_from=cutoff, limit=10000)
-        trends = await trend_repo.search(filters)
+        stats = await trend_repo.get_aggregate_stats(date_from=cutoff, top_n=10)
 
-        # Calculate trend analytics
         analytics = {
             "period": "7_days",
             "generated_at": datetime.utcnow().isoformat(),
-            "total_trends": len(trends),
+            "total_trends": stats["total_trends"],
             "total_topics": await topic_repo.count(),
             "total_items": await item_repo.count(),
-            "categories": {},
-            "sources": {},
-            "states": {},
-            "languages": {},
-            "avg_score": 0.0,
-            "avg_velocity": 0.0,
-            "avg_item_count": 0.0,
-            "top_trends": [],
+            "categories": stats["by_category"],
+            "sources": stats["by_source"],
+            "states": stats["by_state"],
+            "languages": stats["by_language"],
+            "avg_score": stats["avg_score"],
+            "avg_velocity": stats["avg_velocity"],
+            "avg_item_count": stats["avg_item_count"],
+            "top_trends": stats["top_trends"],
         }
 
-        if trends:
-            # Count by category
-            for trend in trends:
-                cat = trend.category.value
-                analytics["categories"][cat] = analytics["categories"].get(cat, 0) + 1
-
-                # Count by state
-                state = trend.state.value
-                analytics["states"][state] = analytics["states"].get(state, 0) + 1
-
-                # Count by language
-                lang = trend.language or "unknown"
-                analytics["languages"][lang] = analytics["languages"].get(lang, 0) + 1
-
-                # Count by source
-                for source in trend.sources:
-                    src = source.value
-                    analytics["sources"][src] = analytics["sources"].get(src, 0) + 1
-
-            # Calculate averages
-            analytics["avg_score"] = sum(t.score for t in trends) / len(trends)
-            analytics["avg_velocity"] = sum(t.velocity for t in trends) / len(trends)
-            analytics["avg_item_count"] = sum(t.item_count for t in trends) / len(trends)
-
-            # Get top 10 trends by score
-            top_trends_data = sorted(trends, key=lambda t: t.score, reverse=True)[:10]
-            analytics["top_trends"] = [
-                {
-                    "id": str(t.id),
-                    "title": t.title,
-                    "score": t.score,
-                    "category": t.category.value,
-                    "state": t.state.value,
-                }
-                for t in top_trends_data
-            ]
-
         # Store analytics in Redis cache (24 hour TTL)
         if redis:
             try:
@@ -867,6 +848,9 @@ async def _update_trend_states_async() -> Dict[str, Any]:
         # Bulk update states
         stats = await state_service.bulk_update_states(active_trends)
 
+        # Rebuild search suggestions from the live trends (drops dead ones)
+        suggestions_indexed = await _rebuild_suggestion_index(trends)
+
         # Add state breakdown
         state_counts = {}
         for trend in trends:
@@ -880,6 +864,7 @@ async def _update_trend_states_async() -> Dict[str, Any]:
             "unchanged": stats["unchanged"],
             "errors": stats["errors"],
             "state_breakdown": state_counts,
+            "suggestions_indexed": suggestions_indexed,
             "timestamp": datetime.utcnow().isoformat(),
         }
 
@@ -887,6 +872,31 @@ async def _update_trend_states_async() -> Dict[str, Any]:
         await db_pool.close()
 
 
+async def _rebuild_suggestion_index(trends) -> int:
+    """
+    Rebuild the shared search suggestion index in Redis.
+
+    Args:
+        trends: Live trends to index (dead trends are skipped)
+
+    Returns:
+        Number of indexed titles and keywords (0 if Redis is unavailable)
+    """
+    from trend_agent.storage.response_cache import create_response_cache_repository
+    from trend_agent.storage.suggestion_index import SuggestionIndex
+
+    # Same Redis instance the API serves suggestions from
+    cache_repo = create_response_cache_repository()
+    try:
+        await cache_repo.connect()
+        return await SuggestionIndex(cache_repo).rebuild(trends)
+    except Exception as e:
+        logger.warning(f"Could not rebuild search suggestion index: {e}")
+        return 0
+    finally:
+        await cache_repo.close()
+
+
 # Utility functions
 
 def get_scheduler_status() -> Dict[str, Any]:
@@ -406,19 +406,27 @@ class PersistTrendsStep(WorkflowStep):
     """
     Persist trends to database.
 
+    Trends are saved to PostgreSQL in one batch; trends that carry an
+    embedding are also written to the vector database in batches.
+
     Inputs:
         - trends: List of Trends
 
     Outputs:
         - saved_count: Number of trends saved
+        - embeddings_saved: Number of trend embeddings written
     """
 
     def __init__(
         self,
         name: str = "persist_trends",
         description: str = "Save trends to database",
+        vector_batch_size: int = 256,
+        vector_concurrency: int = 4,
     ):
         super().__init__(name, description, retry_count=2)
+        self.vector_batch_size = vector_batch_size
+        self.vector_concurrency = vector_concurrency
 
     async def execute(self, context: WorkflowContext) -> StepResult:
         """Execute trend persistence."""
@@ -428,29 +436,67 @@ class PersistTrendsStep(WorkflowStep):
             if not trends:
                 return StepResult(
                     status=StepStatus.COMPLETED,
-                    outputs={"saved_count": 0},
+                    outputs={"saved_count": 0, "embeddings_saved": 0},
                 )
 
-            from trend_agent.storage.postgres import PostgreSQLConnectionPool
-            from trend_agent.storage.repositories.trends import TrendRepository
+            from trend_agent.storage.postgres import (
+                PostgreSQLConnectionPool,
+                PostgreSQLTrendRepository,
+            )
+            from trend_agent.storage.qdrant import QdrantVectorRepository
+            from trend_agent.storage.vector_writer import VectorIngestWriter
 
-            # Initialize repository
+            # Save trends
             db_pool = PostgreSQLConnectionPool()
             await db_pool.connect()
-
-            trend_repo = TrendRepository(db_pool)
-
-            # Save trends
-            saved_count = 0
-            for trend in trends:
-                await trend_repo.save(trend)
-                saved_count += 1
-
-            logger.info(f"Saved {saved_count} trends to database")
+            try:
+                trend_repo = PostgreSQLTrendRepository(db_pool.pool)
+                trend_ids = await trend_repo.save_batch(trends)
+            finally:
+                await db_pool.close()
+
+            saved_count = len(trend_ids)
+
+            await self._update_trend_caches(trend_ids, trends)
+
+            # Save trend embeddings
+            embeddings_saved = 0
+            embedded = [
+                (trend_id, trend)
+                for trend_id, trend in zip(trend_ids, trends)
+                if trend.embedding
+            ]
+            if embedded:
+                vector_repo = QdrantVectorRepository(
+                    collection_name="trend_embeddings",
+                    vector_size=len(embedded[0][1].embedding),
+                )
+                async with VectorIngestWriter(
+                    vector_repo,
+                    batch_size=self.vector_batch_size,
+                    max_concurrency=self.vector_concurrency,
+                ) as vector_writer:
+                    for trend_id, trend in embedded:
+                        await vector_writer.add(
+                            str(trend_id),
+                            trend.embedding,
+                            {
+                                "category": trend.category.value,
+                                "state": trend.state.value,
+                                "language": trend.language,
+                                "title": trend.title,
+                            },
+                        )
+                embeddings_saved = vector_writer.get_stats()["points_written"]
+
+            logger.info(
+                f"Saved {saved_count} trends to database "
+                f"({embeddings_saved} embeddings)"
+            )
 
             return StepResult(
                 status=StepStatus.COMPLETED,
-                outputs={"saved_count": saved_count},
+                outputs={"saved_count": saved_count, "embeddings_saved": embeddings_saved},
             )
 
         except Exception as e:
@@ -459,3 +505,22 @@ class PersistTrendsStep(WorkflowStep):
                 status=StepStatus.FAILED,
                 error=str(e),
             )
+
+    async def _update_trend_caches(self, trend_ids, trends: List[Trend]) -> None:
+        """Drop cached API responses of the saved trends and index them for suggestions."""
+        from trend_agent.storage.response_cache import (
+            ResponseCache,
+            create_response_cache_repository,
+            trend_change_tags,
+        )
+        from trend_agent.storage.suggestion_index import SuggestionIndex
+
+        cache_repo = create_response_cache_repository()
+        try:
+            await cache_repo.connect()
+            await ResponseCache(cache_repo).invalidate(trend_change_tags(trends, trend_ids))
+            await SuggestionIndex(cache_repo).add_trends(trends)
+        except Exception as e:
+            logger.warning(f"Could not update cached trend responses: {e}")
+        finally:
+            await cache_repo.close()
@@ -0,0 +1,200 @@
+"""
+Indexed keyword include/exclude filtering for collected topics.
+
+Include and exclude keyword lists are translated into one full-text query
+served by an index, instead of an ``icontains`` scan per keyword and field:
+
+- PostgreSQL: a single ``tsquery`` (``included && !!excluded``) matched
+  against a GIN expression index on ``to_tsvector('simple', ...)``.
+  Keywords match whole words, and multi-word keywords match as phrases.
+- SQLite: a single FTS5 ``MATCH`` expression against a trigram index kept
+  in sync by triggers. Keywords match case-insensitive substrings, like
+  ``icontains``.
+
+Both indexes are created by migration 0015. Other backends, other models,
+and keywords the index cannot serve (fewer than 3 characters on SQLite)
+use the ``icontains`` filters.
+
+Note: on SQLite, a later migration that rebuilds the collectedtopic table
+drops the sync triggers; the filter then falls back to ``icontains`` until
+migration 0015 is re-applied.
+"""
+
+import logging
+from typing import Dict, List, Sequence
+
+from django.db import connections
+from django.db.models import BooleanField, Q, QuerySet
+from django.db.models.expressions import RawSQL
+
+logger = logging.getLogger(__name__)
+
+TOPIC_TABLE = 'trends_viewer_collectedtopic'
+FTS_TABLE = 'trends_viewer_collectedtopic_fts'
+FTS_TRIGGERS = (f'{FTS_TABLE}_ai', f'{FTS_TABLE}_ad', f'{FTS_TABLE}_au')
+
+# Fields covered by the indexes (FTS5 columns on SQLite)
+INDEXED_FIELDS = ('title', 'description', 'content')
+
+# Field lists with a PostgreSQL GIN expression index (see migration 0015)
+POSTGRES_INDEXED_FIELD_SETS = (
+    ('title', 'description', 'content'),
+    ('title', 'description'),
+)
+
+# Trigram tokenizer cannot match shorter substrings
+FTS_MIN_KEYWORD_LENGTH = 3
+
+# Database alias -> whether the SQLite FTS index is installed
+_fts_available: Dict[str, bool] = {}
+
+
+def topic_tsvector_sql(field_names: Sequence[str]) -> str:
+    """
+    Build the PostgreSQL ``tsvector`` expression for topic fields.
+
+    Must stay identical to the indexed expressions of migration 0015, or
+    the planner cannot use the indexes.
+
+    Args:
+        field_names: Fields to search
+
+    Returns:
+        SQL expression
+    """
+    document = " || ' ' || ".join(f'"{TOPIC_TABLE}"."{field}"' for field in field_names)
+    return f"to_tsvector('simple', {document})"
+
+
+def filter_topics_by_keywords(
+    queryset: QuerySet,
+    include: List[str],
+    exclude: List[str],
+    field_names: Sequence[str],
+) -> QuerySet:
+    """
+    Keep topics matching any include keyword and no exclude keyword.
+
+    Args:
+        queryset: Queryset to filter
+        include: Keywords of which at least one must match (OR)
+        exclude: Keywords of which none may match
+        field_names: Fields to search
+
+    Returns:
+        Filtered queryset
+    """
+    include = [kw for kw in include if kw.strip()]
+    exclude = [kw for kw in exclude if kw.strip()]
+    if not include and not exclude:
+        return queryset
+
+    vendor = connections[queryset.db].vendor
+    indexable = (
+        queryset.model._meta.db_table == TOPIC_TABLE
+        and set(field_names) <= set(INDEXED_FIELDS)
+    )
+
+    if indexable and vendor == 'postgresql':
+        return _filter_tsquery(queryset, include, exclude, field_names)
+
+    if (
+        indexable
+        and vendor == 'sqlite'
+        and all(len(kw.strip()) >= FTS_MIN_KEYWORD_LENGTH for kw in include + exclude)
+        and _sqlite_fts_available(queryset.db)
+    ):
+        return _filter_fts5(queryset, include, exclude, field_names)
+
+    return filter_icontains(queryset, include, exclude, field_names)
+
+
+def filter_icontains(
+    queryset: QuerySet,
+    include: List[str],
+    exclude: List[str],
+    field_names: Sequence[str],
+) -> QuerySet:
+    """
+    Unindexed keyword filtering with ``icontains`` on every field.
+
+    Args:
+        queryset: Queryset to filter
+        include: Keywords of which at least one must match (OR)
+        exclude: Keywords of which none may match
+        field_names: Fields to search
+
+    Returns:
+        Filtered queryset
+    """
+    if include:
+        q_include = Q()
+        for keyword in include:
+            for field in field_names:
+                q_include |= Q(**{f'{field}__icontains': keyword})
+        queryset = queryset.filter(q_include)
+
+    if exclude:
+        q_exclude = Q()
+        for keyword in exclude:
+            for field in field_names:
+                q_exclude |= Q(**{f'{field}__icontains': keyword})
+        queryset = queryset.exclude(q_exclude)
+
+    return queryset
+
+
+def _filter_tsquery(queryset, include, exclude, field_names):
+    """Filter with one tsquery against the GIN-indexed tsvector expression."""
+    params: List[str] = []
+
+    def any_phrase(keywords: List[str]) -> str:
+        params.extend(keywords)
+        return ' || '.join(["phraseto_tsquery('simple', %s)"] * len(keywords))
+
+    parts = []
+    if include:
+        parts.append(f'({any_phrase(include)})')
+    if exclude:
+        parts.append(f'!!({any_phrase(exclude)})')
+
+    condition = f"{topic_tsvector_sql(field_names)} @@ ({' && '.join(parts)})"
+    return queryset.filter(RawSQL(condition, params, output_field=BooleanField()))
+
+
+def _filter_fts5(queryset, include, exclude, field_names):
+    """Filter with one FTS5 MATCH expression against the trigram index."""
+    columns = '{' + ' '.join(field_names) + '}'
+    subquery = f'SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s'
+
+    if include:
+        match = f'{columns} : ({_fts_any(include)})'
+        if exclude:
+            match = f'{columns} : (({_fts_any(include)}) NOT ({_fts_any(exclude)}))'
+        condition = f'"{TOPIC_TABLE}"."id" IN ({subquery})'
+    else:
+        # FTS5 has no unary NOT: drop the rows matching any excluded keyword
+        match = f'{columns} : ({_fts_any(exclude)})'
+        condition = f'"{TOPIC_TABLE}"."id" NOT IN ({subquery})'
+
+    return queryset.filter(RawSQL(condition, [match], output_field=BooleanField()))
+
+
+def _fts_any(keywords: List[str]) -> str:
+    """FTS5 expression matching any keyword as a quoted string."""
+    return ' OR '.join('"' + kw.strip().replace('"', '""') + '"' for kw in keywords)
+
+
+def _sqlite_fts_available(alias: str) -> bool:
+    """Whether the FTS5 table and its sync triggers exist (checked once per alias)."""
+    if alias not in _fts_available:
+        names = (FTS_TABLE, *FTS_TRIGGERS)
+        with connections[alias].cursor() as cursor:
+            cursor.execute(
+                f"SELECT COUNT(*) FROM sqlite_master WHERE name IN ({', '.join(['%s'] * len(names))})",
+                list(names),
+            )
+            _fts_available[alias] = cursor.fetchone()[0] == len(names)
+        if not _fts_available[alias]:
+            logger.warning('Topic keyword index not installed; using unindexed keyword filtering')
+    return _fts_available[alias]
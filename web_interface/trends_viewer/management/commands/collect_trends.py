@@ -11,7 +11,7 @@ from trend_agent.processing.normalize import normalize
 from trend_agent.processing.deduplicate import deduplicate
 from trend_agent.processing.cluster import cluster as cluster_topics
 from trend_agent.processing.rank import rank_topics, rank_clusters
-from trend_agent.processing.content_fetcher import fetch_content_for_topic
+from trend_agent.processing.content_fetcher import ContentFetchService, fetch_content_for_topics
 from trend_agent.llm.summarizer import summarize_single_topic, summarize_topics_batch
 from trend_agent.categories import load_categories
 from trend_agent.config import is_source_diversity_enabled, get_max_percentage_per_source
@@ -373,12 +373,15 @@ class Command(BaseCommand):
         self.stdout.write(f'📦 Using all {len(ranked_clusters)} category clusters')
         top_clusters = ranked_clusters
 
-        # Step 7: Fetch full content for selected topics
+        # Step 7: Fetch full content for selected topics (concurrently, pooled per host)
         self.stdout.write('📥 Fetching full content for topics...')
-        for idx, topic in enumerate(selected_topics, 1):
-            if idx % 10 == 0:
-                self.stdout.write(f'   Fetched {idx}/{len(selected_topics)} topics...')
-            topic.content = await fetch_content_for_topic(topic)
+        idx = 0
+        async with ContentFetchService() as content_fetcher:
+            async for topic, content in fetch_content_for_topics(selected_topics, content_fetcher):
+                topic.content = content
+                idx += 1
+                if idx % 10 == 0:
+                    self.stdout.write(f'   Fetched {idx}/{len(selected_topics)} topics...')
 
         self.stdout.write(f'✅ Content fetched for {len(selected_topics)} topics')
 
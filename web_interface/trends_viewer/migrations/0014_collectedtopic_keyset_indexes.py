@@ -0,0 +1,30 @@
+# Generated manually on 2026-10-16
+# Indexes for keyset pagination of the filtered topic list
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('trends_viewer', '0013_normalize_language_codes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='collectedtopic',
+            index=models.Index(fields=['timestamp', 'id'], name='trends_view_timesta_a3bd4e_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='collectedtopic',
+            index=models.Index(fields=['upvotes', 'id'], name='trends_view_upvotes_b1a6ec_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='collectedtopic',
+            index=models.Index(fields=['comments', 'id'], name='trends_view_comment_694222_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='collectedtopic',
+            index=models.Index(fields=['score', 'id'], name='trends_view_score_3764e2_idx'),
+        ),
+    ]
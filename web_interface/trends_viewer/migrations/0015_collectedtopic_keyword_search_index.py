@@ -0,0 +1,94 @@
+# Generated manually on 2026-10-16
+# Full-text indexes for keyword include/exclude filtering (see keyword_search.py)
+
+from django.db import migrations
+
+TABLE = 'trends_viewer_collectedtopic'
+FTS_TABLE = 'trends_viewer_collectedtopic_fts'
+
+# Expressions must match keyword_search.topic_tsvector_sql()
+POSTGRES_INDEXES = {
+    'trends_view_kw_tdc_gin': "to_tsvector('simple', title || ' ' || description || ' ' || content)",
+    'trends_view_kw_td_gin': "to_tsvector('simple', title || ' ' || description)",
+}
+
+SQLITE_CREATE = [
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+        title, description, content,
+        content='{TABLE}', content_rowid='id', tokenize='trigram'
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON {TABLE} BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, title, description, content)
+        VALUES (new.id, new.title, new.description, new.content);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON {TABLE} BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, description, content)
+        VALUES ('delete', old.id, old.title, old.description, old.content);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au AFTER UPDATE OF title, description, content ON {TABLE} BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, description, content)
+        VALUES ('delete', old.id, old.title, old.description, old.content);
+        INSERT INTO {FTS_TABLE}(rowid, title, description, content)
+        VALUES (new.id, new.title, new.description, new.content);
+    END
+    """,
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')",
+]
+
+SQLITE_DROP = [
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_ai",
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_ad",
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_au",
+    f"DROP TABLE IF EXISTS {FTS_TABLE}",
+]
+
+
+def create_keyword_index(apps, schema_editor):
+    """Create the GIN (PostgreSQL) or FTS5 trigram (SQLite) keyword index."""
+    vendor = schema_editor.connection.vendor
+
+    if vendor == 'postgresql':
+        for name, expression in POSTGRES_INDEXES.items():
+            schema_editor.execute(
+                f"CREATE INDEX IF NOT EXISTS {name} ON {TABLE} USING GIN (({expression}))"
+            )
+    elif vendor == 'sqlite':
+        try:
+            for statement in SQLITE_CREATE:
+                schema_editor.execute(statement)
+        except Exception as e:
+            # SQLite built without FTS5 or older than 3.34 (no trigram tokenizer):
+            # keyword filtering stays unindexed
+            print(f"\n  Skipping keyword index: {e}")
+            for statement in SQLITE_DROP:
+                schema_editor.execute(statement)
+
+
+def drop_keyword_index(apps, schema_editor):
+    """Drop the keyword index."""
+    vendor = schema_editor.connection.vendor
+
+    if vendor == 'postgresql':
+        for name in POSTGRES_INDEXES:
+            schema_editor.execute(f"DROP INDEX IF EXISTS {name}")
+    elif vendor == 'sqlite':
+        for statement in SQLITE_DROP:
+            schema_editor.execute(statement)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('trends_viewer', '0014_collectedtopic_keyset_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_keyword_index, drop_keyword_index),
+    ]
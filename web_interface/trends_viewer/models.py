@@ -55,6 +55,15 @@ class CollectedTopic(models.Model):
     class Meta:
         ordering = ['-timestamp']
 
+        # Keyset pagination indexes: one per sort option, ending in the
+        # primary key tie-breaker (scanned backwards for descending order)
+        indexes = [
+            models.Index(fields=['timestamp', 'id']),
+            models.Index(fields=['upvotes', 'id']),
+            models.Index(fields=['comments', 'id']),
+            models.Index(fields=['score', 'id']),
+        ]
+
     def __str__(self):
         return f"{self.source}: {self.title[:50]}"
 
@@ -0,0 +1,181 @@
+"""
+Keyset (cursor) pagination for the infinite-scroll views.
+
+Pages are fetched with ``WHERE (sort_field, id) < last seen row`` instead of
+``OFFSET``, so loading page 50 costs the same as page 1, and totals come from
+a cached or estimated count instead of a ``COUNT(*)`` per page.
+"""
+
+import base64
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import Any, List, Optional
+
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import Q, QuerySet
+
+
+class InvalidCursor(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+@dataclass
+class KeysetPage:
+    """
+    One page of a keyset-paginated queryset.
+
+    Mirrors the parts of Django's ``Page`` the templates use, without page
+    numbers: ``next_cursor`` continues after the last row of this page.
+    """
+
+    object_list: List[Any]
+    next_cursor: Optional[str]
+    count: int = 0
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+
+def _cursor_value(value: Any) -> str:
+    """JSON fallback for sort values; keeps full datetime precision."""
+    # DjangoJSONEncoder truncates to milliseconds, which would skip rows
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    return str(value)
+
+
+def encode_cursor(values: List[Any]) -> str:
+    """
+    Encode the sort key of a row as an opaque, URL-safe cursor.
+
+    Args:
+        values: Sort field value and primary key of the last row
+
+    Returns:
+        Cursor string
+    """
+    payload = json.dumps(values, default=_cursor_value, separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor: str) -> List[Any]:
+    """
+    Decode a cursor created by ``encode_cursor``.
+
+    Args:
+        cursor: Cursor string
+
+    Returns:
+        List of encoded values
+
+    Raises:
+        InvalidCursor: If the cursor is malformed
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+    except (ValueError, UnicodeError) as e:
+        raise InvalidCursor(f'Invalid cursor: {e}') from e
+
+    if not isinstance(values, list) or len(values) != 2:
+        raise InvalidCursor('Invalid cursor: expected [value, id]')
+    return values
+
+
+def keyset_paginate(
+    queryset: QuerySet,
+    ordering: str,
+    page_size: int,
+    cursor: Optional[str] = None,
+) -> KeysetPage:
+    """
+    Get one page of a queryset ordered by ``(ordering, pk)``.
+
+    The primary key breaks ties in the same direction as ``ordering``, so
+    rows with equal sort values are neither skipped nor repeated.
+
+    Args:
+        queryset: Filtered queryset
+        ordering: Sort field, prefixed with '-' for descending (e.g. '-timestamp')
+        page_size: Rows per page
+        cursor: Cursor of the previous page (None for the first page)
+
+    Returns:
+        KeysetPage with up to ``page_size`` rows
+
+    Raises:
+        InvalidCursor: If the cursor is malformed
+    """
+    descending = ordering.startswith('-')
+    field_name = ordering.lstrip('-')
+    lookup = 'lt' if descending else 'gt'
+    pk_ordering = '-pk' if descending else 'pk'
+
+    page_queryset = queryset.order_by(ordering, pk_ordering)
+    if cursor:
+        raw_value, raw_pk = decode_cursor(cursor)
+        model_field = queryset.model._meta.get_field(field_name)
+        try:
+            value = model_field.to_python(raw_value)
+            pk = queryset.model._meta.pk.to_python(raw_pk)
+        except Exception as e:
+            raise InvalidCursor(f'Invalid cursor: {e}') from e
+        page_queryset = page_queryset.filter(
+            Q(**{f'{field_name}__{lookup}': value})
+            | Q(**{field_name: value, f'pk__{lookup}': pk})
+        )
+
+    # One extra row tells whether another page follows
+    rows = list(page_queryset[:page_size + 1])
+    next_cursor = None
+    if len(rows) > page_size:
+        rows = rows[:page_size]
+        last = rows[-1]
+        next_cursor = encode_cursor([getattr(last, field_name), last.pk])
+
+    return KeysetPage(object_list=rows, next_cursor=next_cursor)
+
+
+def estimated_count(queryset: QuerySet, timeout: int = 300) -> int:
+    """
+    Count rows without a ``COUNT(*)`` on every request.
+
+    Unfiltered PostgreSQL tables use the planner statistics
+    (``pg_class.reltuples``). Other querysets are counted once and cached
+    for ``timeout`` seconds per distinct query.
+
+    Args:
+        queryset: Queryset to count
+        timeout: Cache lifetime of exact counts in seconds
+
+    Returns:
+        Estimated number of rows
+    """
+    if connection.vendor == 'postgresql' and not queryset.query.where:
+        with connection.cursor() as db_cursor:
+            db_cursor.execute(
+                'SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass',
+                [queryset.model._meta.db_table],
+            )
+            row = db_cursor.fetchone()
+        # reltuples is -1 (or 0) until the table is first analyzed
+        if row and row[0] > 0:
+            return row[0]
+
+    sql, params = queryset.order_by().query.sql_with_params()
+    digest = hashlib.sha256(f'{sql}|{params}'.encode('utf-8')).hexdigest()[:32]
+    cache_key = f'estimated_count:{queryset.model._meta.db_table}:{digest}'
+
+    count = cache.get(cache_key)
+    if count is None:
+        count = queryset.count()
+        cache.set(cache_key, count, timeout)
+    return count
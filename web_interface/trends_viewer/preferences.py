@@ -176,6 +176,10 @@ class PreferenceManager:
         """
         Apply keyword filtering to a queryset.
 
+        Include keywords are ORed and exclude keywords are all rejected.
+        On collected topics both lists become a single full-text query
+        served by the keyword index (see ``keyword_search``).
+
         Args:
             queryset: Django queryset to filter
             field_names: List of field names to search (default: ['title', 'description'])
@@ -183,30 +187,18 @@ class PreferenceManager:
         Returns:
             Filtered queryset
         """
-        from django.db.models import Q
+        from .keyword_search import filter_topics_by_keywords
 
         if field_names is None:
             field_names = ['title', 'description']
 
         prefs = self.get_preferences()
-
-        # Include keywords (OR logic)
-        include_keywords = prefs.get('keywords_include', [])
-        if include_keywords:
-            q_include = Q()
-            for keyword in include_keywords:
-                for field in field_names:
-                    q_include |= Q(**{f'{field}__icontains': keyword})
-            queryset = queryset.filter(q_include)
-
-        # Exclude keywords (AND logic)
-        exclude_keywords = prefs.get('keywords_exclude', [])
-        if exclude_keywords:
-            for keyword in exclude_keywords:
-                for field in field_names:
-                    queryset = queryset.exclude(**{f'{field}__icontains': keyword})
-
-        return queryset
+        return filter_topics_by_keywords(
+            queryset,
+            include=prefs.get('keywords_include', []),
+            exclude=prefs.get('keywords_exclude', []),
+            field_names=field_names,
+        )
 
     def get_sort_params(self) -> tuple[str, str]:
         """
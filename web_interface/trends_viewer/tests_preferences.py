@@ -5,12 +5,17 @@ Tests the PreferenceManager, filtered views, and AJAX endpoints.
 """
 
 from datetime import datetime, timedelta
+from unittest import skipUnless
+
+from django.db import connection
 from django.test import TestCase, RequestFactory, Client
+from django.utils import timezone
 from django.contrib.sessions.middleware import SessionMiddleware
 from django.urls import reverse
 
 from .preferences import PreferenceManager, get_available_sources, get_available_languages
 from .models import CollectedTopic, TrendCluster, CollectionRun
+from .keyword_search import FTS_TABLE, filter_icontains
 
 
 class PreferenceManagerTestCase(TestCase):
@@ -267,6 +272,113 @@ class FilteredViewsTestCase(TestCase):
         self.assertTrue(response.context['is_paginated'])
         self.assertEqual(len(response.context['topics']), 50)  # Default page size
 
+    def test_cursor_pagination_walks_all_topics_once(self):
+        """Test infinite-scroll cursors return every topic exactly once, even with tied sort values."""
+        same_time = datetime.now()
+        for i in range(25):
+            CollectedTopic.objects.create(
+                collection_run=self.run,
+                title=f'Cursor Test {i}',
+                source='reddit',
+                url=f'http://example.com/cursor/{i}',
+                timestamp=same_time,
+                language='en',
+            )
+
+        url = reverse('trends_viewer:filtered_topics')
+        response = self.client.get(url)
+        seen = [topic.id for topic in response.context['topics']]
+        cursor = response.context['page_obj'].next_cursor
+        total_count = response.context['page_obj'].count
+
+        while cursor:
+            response = self.client.get(
+                url, {'cursor': cursor}, HTTP_X_REQUESTED_WITH='XMLHttpRequest'
+            )
+            data = response.json()
+            seen.extend(topic['id'] for topic in data['topics'])
+            self.assertEqual(data['has_next'], data['next_cursor'] is not None)
+            cursor = data['next_cursor']
+
+        self.assertEqual(len(seen), len(set(seen)))
+        self.assertEqual(len(seen), total_count)
+        self.assertGreaterEqual(len(seen), 25)
+
+    def test_invalid_cursor_returns_404(self):
+        """Test a malformed cursor is rejected."""
+        response = self.client.get(reverse('trends_viewer:filtered_topics'), {'cursor': 'not-a-cursor'})
+        self.assertEqual(response.status_code, 404)
+
+
+@skipUnless(connection.vendor == 'sqlite', 'Checks the SQLite FTS5 keyword index')
+class KeywordIndexTestCase(TestCase):
+    """Test indexed keyword include/exclude filtering."""
+
+    def setUp(self):
+        """Create topics and a request with session."""
+        request = RequestFactory().get('/')
+        SessionMiddleware(lambda x: None).process_request(request)
+        request.session.save()
+        self.manager = PreferenceManager(request)
+
+        run = CollectionRun.objects.create(status='completed')
+        titles = ['OpenAI releases model', 'Chip export rules', 'OpenAI chip deal', '世界新闻 today']
+        for i, title in enumerate(titles):
+            CollectedTopic.objects.create(
+                collection_run=run,
+                title=title,
+                description='',
+                source='reddit',
+                url=f'http://example.com/kw/{i}',
+                timestamp=timezone.now(),
+            )
+
+    def _filtered_titles(self, include, exclude):
+        self.manager.update_preferences({'keywords_include': include, 'keywords_exclude': exclude})
+        queryset = self.manager.filter_by_keywords(CollectedTopic.objects.all())
+        return queryset, set(queryset.values_list('title', flat=True))
+
+    def test_matches_icontains_semantics(self):
+        """Test the index returns what per-keyword icontains filters return."""
+        cases = [
+            (['openai', '世界新'], ['CHIP']),
+            (['openai'], []),
+            ([], ['chip']),
+            (['ai'], ['rules']),  # Too short for the trigram index: unindexed path
+        ]
+        for include, exclude in cases:
+            _, titles = self._filtered_titles(include, exclude)
+            expected = set(filter_icontains(
+                CollectedTopic.objects.all(), include, exclude, ['title', 'description']
+            ).values_list('title', flat=True))
+            self.assertEqual(titles, expected, (include, exclude))
+
+        _, titles = self._filtered_titles(['openai', '世界新'], ['chip'])
+        self.assertEqual(titles, {'OpenAI releases model', '世界新闻 today'})
+
+    def test_index_follows_updates_and_deletes(self):
+        """Test the triggers keep the index in sync with the topic table."""
+        CollectedTopic.objects.filter(title='Chip export rules').update(title='OpenAI export rules')
+        CollectedTopic.objects.filter(title='OpenAI releases model').delete()
+
+        _, titles = self._filtered_titles(['openai'], [])
+        self.assertEqual(titles, {'OpenAI export rules', 'OpenAI chip deal'})
+
+    def test_query_plan_uses_keyword_index(self):
+        """Test include/exclude keywords become one MATCH served by the FTS index."""
+        queryset, _ = self._filtered_titles(['openai', '世界新'], ['chip'])
+        sql, params = queryset.order_by().query.sql_with_params()
+
+        self.assertEqual(sql.count(' MATCH '), 1)
+        self.assertNotIn('LIKE', sql)
+        with connection.cursor() as cursor:
+            cursor.execute(f'EXPLAIN QUERY PLAN {sql}', params)
+            plan = ' | '.join(row[-1] for row in cursor.fetchall())
+
+        self.assertIn(f'SCAN {FTS_TABLE} VIRTUAL TABLE INDEX', plan)
+        self.assertIn('USING INTEGER PRIMARY KEY', plan)
+        self.assertNotIn('SCAN trends_viewer_collectedtopic ', plan + ' ')
+
 
 class AjaxEndpointsTestCase(TestCase):
     """Test AJAX endpoints for preference management."""
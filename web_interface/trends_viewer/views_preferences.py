@@ -9,11 +9,12 @@ stored in Django session and applied to database queries.
 import logging
 from django.shortcuts import render, get_object_or_404
 from django.views.generic import ListView
-from django.http import JsonResponse, HttpRequest
+from django.http import Http404, JsonResponse, HttpRequest
 from django.db.models import Q, Count, Max
 from typing import Dict, Any
 
 from .models import CollectionRun, CollectedTopic, TrendCluster
+from .pagination import InvalidCursor, estimated_count, keyset_paginate
 from .preferences import (
     PreferenceManager,
     get_available_sources,
@@ -76,6 +77,34 @@ class FilteredTopicListView(ListView):
 
         return queryset
 
+    def paginate_queryset(self, queryset, page_size):
+        """
+        Paginate by cursor instead of page number.
+
+        Each page continues after the last row of the previous one
+        (``?cursor=``), so infinite scroll stays as fast on page 50 as on
+        page 1. The total comes from a cached or estimated count.
+
+        Returns:
+            Tuple of (paginator, page, object_list, is_paginated) as ListView expects
+
+        Raises:
+            Http404: If the cursor is invalid
+        """
+        sort_field, _ = PreferenceManager(self.request).get_sort_params()
+        try:
+            page = keyset_paginate(
+                queryset,
+                ordering=sort_field,
+                page_size=page_size,
+                cursor=self.request.GET.get('cursor') or None,
+            )
+        except InvalidCursor as e:
+            raise Http404(str(e))
+
+        page.count = estimated_count(queryset)
+        return None, page, page.object_list, True
+
     def _update_preferences_from_request(self, pref_manager: PreferenceManager):
         """
         Update preferences from request parameters.
@@ -206,7 +235,8 @@ class FilteredTopicListView(ListView):
         For infinite scroll, returns JSON with:
         - topics: list of topic data
         - has_next: boolean
-        - next_page: int or null
+        - next_cursor: cursor for the next page or null
+        - total_count: estimated number of matching topics
         """
         # Check if this is an AJAX request
         is_ajax = self.request.headers.get('X-Requested-With') == 'XMLHttpRequest'
@@ -235,10 +265,8 @@ class FilteredTopicListView(ListView):
                 'success': True,
                 'topics': topics_data,
                 'has_next': page_obj.has_next(),
-                'next_page': page_obj.next_page_number() if page_obj.has_next() else None,
-                'current_page': page_obj.number,
-                'total_pages': page_obj.paginator.num_pages,
-                'total_count': page_obj.paginator.count,
+                'next_cursor': page_obj.next_cursor,
+                'total_count': page_obj.count,
             })
 
         # Regular HTML response